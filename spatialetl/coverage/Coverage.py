@@ -15,12 +15,22 @@
 #
 from __future__ import division, print_function, absolute_import
 
+import hashlib
+import os
+
 import numpy as np
 from array_split import shape_split
 from mpi4py import MPI
 
+from spatialetl.coverage.io.CachedCoverageReader import CachedCoverageReader
 from spatialetl.exception.NotFoundInRankError import NotFoundInRankError
-from spatialetl.operator.interpolator.InterpolatorCore import resample_2d_to_grid
+from spatialetl.operator.interpolator.InterpolatorCore import apply_2d_interpolation_weights
+from spatialetl.operator.interpolator.InterpolatorCore import compute_2d_interpolation_weights
+from spatialetl.operator.interpolator.InterpolatorCore import load_2d_interpolation_weights
+from spatialetl.operator.interpolator.InterpolatorCore import load_scrip_remap_file
+from spatialetl.operator.interpolator.InterpolatorCore import save_2d_interpolation_weights
+from spatialetl.operator.interpolator.InterpolatorCore import save_scrip_remap_file
+from spatialetl.utils.SpatialIndex import get_spatial_index
 from spatialetl.utils.distance import distance_on_unit_sphere
 from spatialetl.utils.logger import logging
 
@@ -40,10 +50,17 @@ Soit l'axe y en premier puis l'axe x. Exemple : [y,x]
 """
 
     HORIZONTAL_INTERPOLATION_METHOD = "linear"
+    # Méthodes dont les poids sont enregistrés dans un fichier de remapping SCRIP
+    REMAP_METHODS = ["bilinear", "conservative"]
     HORIZONTAL_OVERLAPING_SIZE = 2
+    SPATIAL_INDEX_DIRECTORY = None
+    INTERPOLATION_WEIGHTS_DIRECTORY = None
+    LAYER_CACHE_SIZE = 256 * 1024 * 1024 # bytes
 
     def __init__(self, myReader,bbox=None,resolution_x=None,resolution_y=None):
         self.reader = myReader;
+        self.spatial_indexes = {}
+        self.interpolation_weights = {}
         # MPI
         self.map_mpi = None
         self.comm = MPI.COMM_WORLD
@@ -457,11 +474,111 @@ Soit l'axe y en premier puis l'axe x. Exemple : [y,x]
             else:
                 return self.target_global_axis_y[self.map_mpi[self.rank]["dst_global_y"],self.map_mpi[self.rank]["dst_global_x"]]
         
+    def get_spatial_index(self, only_mask_value=True):
+        """Retourne l'index spatial des point de la grille source du rang courant. L'index est construit une seule
+    fois par fichier de grille puis partagé. Si Coverage.SPATIAL_INDEX_DIRECTORY est renseigné, l'index est
+    également enregistré sur disque et relu lors des traitements suivants.
+    @param only_mask_value: si vrai, seuls les point de mer (masque = 1) sont indexés.
+    @return: un SpatialIndex."""
+
+        if only_mask_value not in self.spatial_indexes:
+            self.spatial_indexes[only_mask_value] = get_spatial_index(self.reader,
+                                                                      self.map_mpi[self.rank]["src_global_x"].start,
+                                                                      self.map_mpi[self.rank]["src_global_x"].stop,
+                                                                      self.map_mpi[self.rank]["src_global_y"].start,
+                                                                      self.map_mpi[self.rank]["src_global_y"].stop,
+                                                                      only_mask_value=only_mask_value,
+                                                                      directory=Coverage.SPATIAL_INDEX_DIRECTORY)
+
+        return self.spatial_indexes[only_mask_value]
+
+    def enable_layer_cache(self, cache_size=None):
+        """Active le cache des couches lues entre la couverture et son lecteur. Une couche (variable, t, z, hyperslab)
+    n'est alors lue qu'une seule fois dans le fichier tant qu'elle reste dans le cache.
+    @param cache_size: taille maximale du cache en octets (par défaut Coverage.LAYER_CACHE_SIZE)."""
+        if cache_size is None:
+            cache_size = Coverage.LAYER_CACHE_SIZE
+
+        if isinstance(self.reader, CachedCoverageReader):
+            self.reader.cache_size = cache_size
+        else:
+            self.reader = CachedCoverageReader(self.reader, cache_size)
+
+    def disable_layer_cache(self):
+        """Désactive le cache des couches lues."""
+        if isinstance(self.reader, CachedCoverageReader):
+            self.reader = self.reader.reader
+
+    def get_layer_cache_statistics(self):
+        """Retourne les statistiques du cache des couches lues.
+    @return: un dictionnaire contenant hits, misses, nb_layers et nbytes ou None si le cache n'est pas activé."""
+        if isinstance(self.reader, CachedCoverageReader):
+            return self.reader.get_statistics()
+        return None
+
+    def get_interpolation_weights(self, method=None):
+        """Retourne les poids d'interpolation horizontale entre la grille source et la grille cible du rang courant.
+    Les poids sont calculés une seule fois par méthode puis réutilisés pour chaque variable et chaque pas de temps.
+    Si Coverage.INTERPOLATION_WEIGHTS_DIRECTORY est renseigné, les poids sont également enregistrés sur disque et
+    relus lors des traitements suivants (fichier de remapping SCRIP pour "bilinear" et "conservative").
+    @param method: méthode d'interpolation (par défaut Coverage.HORIZONTAL_INTERPOLATION_METHOD)
+    @return: les poids d'interpolation."""
+
+        if method is None:
+            method = Coverage.HORIZONTAL_INTERPOLATION_METHOD
+
+        if method in self.interpolation_weights:
+            return self.interpolation_weights[method]
+
+        source_x = self.read_axis_x(type="source", with_overlap=True)
+        source_y = self.read_axis_y(type="source", with_overlap=True)
+        target_x = self.read_axis_x(type="target", with_overlap=True)
+        target_y = self.read_axis_y(type="target", with_overlap=True)
+
+        weights_file = None
+        if Coverage.INTERPOLATION_WEIGHTS_DIRECTORY is not None and method != "cubic":
+            signature = hashlib.md5()
+            for axis in [source_x, source_y, target_x, target_y]:
+                signature.update(np.ascontiguousarray(np.ma.filled(axis, fill_value=-9999.), dtype=np.float64).tobytes())
+            if method in Coverage.REMAP_METHODS:
+                weights_file = os.path.join(Coverage.INTERPOLATION_WEIGHTS_DIRECTORY,
+                                            "rmp_" + str(method) + "_" + signature.hexdigest() + ".nc")
+            else:
+                weights_file = os.path.join(Coverage.INTERPOLATION_WEIGHTS_DIRECTORY,
+                                            "interpolation_weights_" + str(method) + "_" + signature.hexdigest() + ".npz")
+
+            if os.path.isfile(weights_file):
+                logging.debug("[Coverage] Loading interpolation weights from " + str(weights_file))
+                if method in Coverage.REMAP_METHODS:
+                    self.interpolation_weights[method] = load_scrip_remap_file(weights_file)
+                else:
+                    self.interpolation_weights[method] = load_2d_interpolation_weights(weights_file)
+                return self.interpolation_weights[method]
+
+        self.interpolation_weights[method] = compute_2d_interpolation_weights(source_x, source_y, target_x, target_y,
+                                                                              method)
+
+        if weights_file is not None:
+            if method in Coverage.REMAP_METHODS:
+                save_scrip_remap_file(self.interpolation_weights[method], weights_file)
+            else:
+                save_2d_interpolation_weights(self.interpolation_weights[method], weights_file)
+
+        return self.interpolation_weights[method]
+
+    def resample_2d_to_grid(self, data, method=None):
+        """Interpole une couche de la grille source (avec recouvrement) sur la grille cible (avec recouvrement) à
+    l'aide des poids d'interpolation mis en cache.
+    @param data: données de la grille source [y,x]
+    @param method: méthode d'interpolation (par défaut Coverage.HORIZONTAL_INTERPOLATION_METHOD)
+    @return: les données interpolées [y,x]."""
+        return apply_2d_interpolation_weights(self.get_interpolation_weights(method), data)
+
     def find_point_index(self,target_lon, target_lat, decimal_tolerance=5, method="classic", only_mask_value=True,type="source"):
         """Retourne le point le plus proche du point donné en paramètre.
     @param target_lon: Coordonnée longitude du point
     @param target_lat: Coordonnée latitude du point
-    @param method : Méthode de calcul. "Classic" = On parcourt toute la grille à la recherche du plus prêt.
+    @param method : Méthode de calcul. "Classic" = On interroge l'index spatial de la grille à la recherche du plus prêt.
     @return: un tableau contenant
      [0] : l'index x du point le plus proche
      [1] : l'index y du point le plus proche
@@ -472,49 +589,17 @@ Soit l'axe y en premier puis l'axe x. Exemple : [y,x]
         lat = self.read_axis_y(type="source",with_overlap=False)
 
         if self.check_point_is_inside(target_lon, target_lat, lon, lat, tolerance=decimal_tolerance):
-            try:
-                mask = self.read_variable_2D_sea_binary_mask(type="source",with_overlap=False)
-                print(np.shape(mask))
-            except NotImplementedError:
-                logging.warning("No 2D sea binary mask found")
-                #mask = np.ones([self.source_global_y_size, self.source_global_x_size])
-                only_mask_value = False
-
-            dist = np.zeros([self.get_y_size(type="source",with_overlap=False), self.get_x_size(type="source",with_overlap=False)])
-            dist[:] = 10000000
 
             if method=="classic":
-                for x in range(0, self.get_x_size(type="source",with_overlap=False)):
-                    for y in range(0, self.get_y_size(type="source",with_overlap=False)):
-
-                        if only_mask_value:
-                            if(mask[y,x] == 1): #=Terre
-                                if self.reader.is_regular_grid():
-                                    dist[y,x] = distance_on_unit_sphere(target_lon,target_lat,lon[x],lat[y])
-                                else:
-                                    dist[y,x] = distance_on_unit_sphere(target_lon,target_lat,lon[y,x],lat[y,x])
-                        else:
-                            if self.reader.is_regular_grid():
-                                dist[y, x] = distance_on_unit_sphere(target_lon, target_lat, lon[x], lat[y])
-                            else:
-                                dist[y, x] = distance_on_unit_sphere(target_lon, target_lat, lon[y, x], lat[y, x])
-
-                nearest_y_index,nearest_x_index = np.where(dist == np.min(dist))
-
-                if len(nearest_y_index) == 0 or len(nearest_x_index) == 0:
-                    logging.error("no neaarest point found")
-                    raise RuntimeError("No nearest point found")
+
+                nearest_x_index, nearest_y_index, nearest_lon, nearest_lat, min_dist = self.get_spatial_index(
+                    only_mask_value=only_mask_value).query([target_lon], [target_lat])
 
                 nearest_x_index = nearest_x_index[0]
                 nearest_y_index = nearest_y_index[0]
-                min_dist = dist[nearest_y_index,nearest_x_index]
-
-                if self.is_regular_grid(type="source"):
-                    nearest_lon = lon[nearest_x_index]
-                    nearest_lat = lat[nearest_y_index]
-                else:
-                    nearest_lon = lon[nearest_y_index, nearest_x_index]
-                    nearest_lat = lat[nearest_y_index, nearest_x_index]
+                nearest_lon = nearest_lon[0]
+                nearest_lat = nearest_lat[0]
+                min_dist = distance_on_unit_sphere(target_lon, target_lat, nearest_lon, nearest_lat)
 
                 if type == "source":
                     return [nearest_x_index, nearest_y_index, nearest_lon, nearest_lat, min_dist]
@@ -557,7 +642,55 @@ Soit l'axe y en premier puis l'axe x. Exemple : [y,x]
         else:
             logging.warning("Point is outside the rank n°"+str(self.rank))
             raise NotFoundInRankError(self.rank,"Point is outside the rank")
-    
+
+    def find_points_index(self, target_lons, target_lats, decimal_tolerance=5, only_mask_value=True, type="source"):
+        """Retourne en une seule requête les point les plus proches des point donnés en paramètre.
+    @param target_lons: Tableau des coordonnées longitude des point
+    @param target_lats: Tableau des coordonnées latitude des point
+    @return: un tableau contenant
+     [0] : les index x des point les plus proches
+     [1] : les index y des point les plus proches
+     [2] : les coordonnées en longitude des point les plus proches
+     [3] : les coordonnées en latitude des point les plus proches
+     [4] : les distances des point les plus proches en kilomètre.
+    Les point en dehors du rang courant ont des index égaux à -1 et des valeurs NaN."""
+
+        if type != "source" and type != "source_global":
+            raise ValueError("Type doesn't match [source, source_global]")
+
+        target_lons = np.atleast_1d(np.asarray(target_lons, dtype=np.float64))
+        target_lats = np.atleast_1d(np.asarray(target_lats, dtype=np.float64))
+
+        lon = np.round(self.read_axis_x(type="source", with_overlap=False), decimals=decimal_tolerance)
+        lat = np.round(self.read_axis_y(type="source", with_overlap=False), decimals=decimal_tolerance)
+        rounded_lons = np.round(target_lons, decimals=decimal_tolerance)
+        rounded_lats = np.round(target_lats, decimals=decimal_tolerance)
+
+        inside = (rounded_lons >= np.min(lon)) & (rounded_lons <= np.max(lon)) & \
+                 (rounded_lats >= np.min(lat)) & (rounded_lats <= np.max(lat))
+
+        nearest_x_index = np.full(np.shape(target_lons), -1, dtype=np.int64)
+        nearest_y_index = np.full(np.shape(target_lons), -1, dtype=np.int64)
+        nearest_lon = np.full(np.shape(target_lons), np.nan)
+        nearest_lat = np.full(np.shape(target_lons), np.nan)
+        min_dist = np.full(np.shape(target_lons), np.nan)
+
+        if np.any(inside):
+            x, y, nearest_lon[inside], nearest_lat[inside], min_dist[inside] = self.get_spatial_index(
+                only_mask_value=only_mask_value).query(target_lons[inside], target_lats[inside])
+
+            if type == "source_global":
+                x = x + self.map_mpi[self.rank]["src_global_x"].start
+                y = y + self.map_mpi[self.rank]["src_global_y"].start
+
+            nearest_x_index[inside] = x
+            nearest_y_index[inside] = y
+
+        if not np.all(inside):
+            logging.debug(str(np.count_nonzero(~inside)) + " point(s) are outside the rank n°" + str(self.rank))
+
+        return [nearest_x_index, nearest_y_index, nearest_lon, nearest_lat, min_dist]
+
     # Variables
     #################
     # HYDRO
@@ -573,12 +706,7 @@ Soit l'axe y en premier puis l'axe x. Exemple : [y,x]
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            data = resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)
+            data = self.resample_2d_to_grid(data)
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -592,12 +720,7 @@ Soit l'axe y en premier puis l'axe x. Exemple : [y,x]
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            data = resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)
+            data = self.resample_2d_to_grid(data)
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
     
@@ -611,12 +734,7 @@ Soit l'axe y en premier puis l'axe x. Exemple : [y,x]
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            data = resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)
+            data = self.resample_2d_to_grid(data)
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -630,12 +748,7 @@ Soit l'axe y en premier puis l'axe x. Exemple : [y,x]
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            data = resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)
+            data = self.resample_2d_to_grid(data)
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -649,12 +762,7 @@ Soit l'axe y en premier puis l'axe x. Exemple : [y,x]
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            data = resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)
+            data = self.resample_2d_to_grid(data)
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
     
@@ -678,12 +786,7 @@ Soit l'axe y en premier puis l'axe x. Exemple : [y,x]
 
             if self.horizontal_resampling:
 
-                data = resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                           self.read_axis_y(type="source", with_overlap=True),
-                                           self.read_axis_x(type="target", with_overlap=True),
-                                           self.read_axis_y(type="target", with_overlap=True),
-                                           data,
-                                           Coverage.HORIZONTAL_INTERPOLATION_METHOD)
+                data = self.resample_2d_to_grid(data)
 
             return data[self.map_mpi[self.rank]["dst_local_y"],self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -697,12 +800,7 @@ Soit l'axe y en premier puis l'axe x. Exemple : [y,x]
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            data = resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)
+            data = self.resample_2d_to_grid(data)
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
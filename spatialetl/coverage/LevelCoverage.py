@@ -15,13 +15,13 @@
 #
 from __future__ import division, print_function, absolute_import
 
-from itertools import product
+from collections import OrderedDict
 
 import numpy as np
 
 from spatialetl.coverage.Coverage import Coverage
-from spatialetl.operator.interpolator.InterpolatorCore import resample_2d_to_grid
-from spatialetl.operator.interpolator.InterpolatorCore import vertical_interpolation
+from spatialetl.operator.interpolator.InterpolatorCore import apply_vertical_interpolation_weights
+from spatialetl.operator.interpolator.InterpolatorCore import compute_vertical_interpolation_weights
 from spatialetl.utils.logger import logging
 
 
@@ -32,6 +32,8 @@ Elle rajoute une dimension verticale à la couverture horizontale classique.
 """
     DEPTH_DELTA = 1.0; #meters
     VERTICAL_INTERPOLATION_METHOD = "linear"
+    VERTICAL_EXTRAPOLATION = False
+    VERTICAL_WEIGHTS_CACHE_SIZE = 128 * 1024 * 1024 # bytes
     
     def __init__(self, myReader,bbox=None,resolution_x=None,resolution_y=None,zbox=None,resolution_z=None):
         Coverage.__init__(self,myReader,bbox=bbox, resolution_x=resolution_x, resolution_y=resolution_y);
@@ -70,6 +72,7 @@ Elle rajoute une dimension verticale à la couverture horizontale classique.
 
             self.target_global_axis_z = self.source_global_axis_z[zmin:zmax]
             self.target_global_z_size = zmax - zmin
+            self.target_global_z_offset = zmin
         else:
             idx = np.where((self.source_global_axis_z[:,0:self.get_y_size(type="source_global"),0:self.get_x_size(type="source_global")] >= Zmin) &
                            (self.source_global_axis_z[:,0:self.get_y_size(type="source_global"),0:self.get_x_size(type="source_global")] <= Zmax))
@@ -81,6 +84,7 @@ Elle rajoute une dimension verticale à la couverture horizontale classique.
 
             self.target_global_axis_z = self.source_global_axis_z[zmin:zmax,0:self.get_y_size(type="source_global"),0:self.get_x_size(type="source_global")]
             self.target_global_z_size = zmax - zmin
+            self.target_global_z_offset = zmin
 
         # source_global sont réduit au zoom
 
@@ -113,7 +117,9 @@ Elle rajoute une dimension verticale à la couverture horizontale classique.
                 logging.info(
                     '[vertical_interpolation] Target grid size : ' + str(self.target_global_z_size) + " level(s)")
 
-        self.depth_weight = {}
+        # Cache LRU des poids d'interpolation verticale, indexé par profondeur
+        self.vertical_weights = OrderedDict()
+        self.vertical_weights_nbytes = 0
 
         if type(self) == LevelCoverage and self.horizontal_resampling and self.rank == 0:
             logging.info(
@@ -177,20 +183,25 @@ Elle rajoute une dimension verticale à la couverture horizontale classique.
         else:
             return self.target_global_z_size
 
-    def find_level_index(self,depth,method="fast"):
-        """Retourne l'index de la profondeur la plus proche selon le point le plus proche.
+    def find_level_index(self,depth):
+        """Retourne les couches sources encadrant la profondeur souhaitée et les poids d'interpolation verticale
+    en chacun des point de la grille source (avec recouvrement).
+    Lors de la première recherche d'une profondeur de l'axe z cible, les poids de toutes les profondeurs de l'axe
+    sont calculés en une seule fois. Ils sont conservés dans un cache LRU (LevelCoverage.VERTICAL_WEIGHTS_CACHE_SIZE)
+    partagé par toutes les variables.
     @type depth : integer ou flottant
     @param depth: Profondeur en mètre souhaitée ou index de la profondeur souhaitée
-    @return:  un tableau de l'indice de la couche verticale inférieur la plus proche en chacun point de la grille. z < vert_coord[y,x] et z > vert_coord[y,x]+1.
-    Les valeurs masquées valent -999."""
+    @return: un dictionnaire contenant
+     "lower", "upper" : les index des couches inférieure et supérieure [y,x]
+     "weight" : le poids de la couche supérieure [y,x]
+     "valid" : vrai si au moins une couche a été trouvée [y,x]
+     "levels" : les index des couches à lire."""
 
-        if depth in self.depth_weight:
-            return self.depth_weight[depth]
+        if depth in self.vertical_weights:
+            self.vertical_weights.move_to_end(depth)
+            return self.vertical_weights[depth]
 
-        xmax=self.get_x_size(type="source",with_overlap=True)
-        ymax=self.get_y_size(type="source",with_overlap=True)
-        vert_coord = np.empty([ymax,xmax],dtype=object)
-        indexes_z = []
+        shape = (self.get_y_size(type="source", with_overlap=True), self.get_x_size(type="source", with_overlap=True))
 
         if type(depth) == int or type(depth) == np.int32 or type(depth) == np.int64:
 
@@ -198,99 +209,72 @@ Elle rajoute une dimension verticale à la couverture horizontale classique.
                 raise ValueError("Depth index have to range between 0 and " + str(
                     self.get_z_size(type="source") - 1) + ". Actually Depth index = " + str(depth))
 
-            for y in range(0, ymax):
-                for x in range(0, xmax):
-                    vert_coord[y, x] = []
-                    vert_coord[y,x].append((depth))
+            self.add_level_index(depth, {
+                "method": "nearest",
+                "lower": np.full(shape, int(depth), dtype=np.int32),
+                "upper": np.full(shape, int(depth), dtype=np.int32),
+                "weight": np.zeros(shape),
+                "valid": np.ones(shape, dtype=bool),
+                "levels": np.array([int(depth)])
+            })
 
-            indexes_z.append((int(depth)))
-
-        elif self.is_sigma_coordinate(type="source") == True: # Cas de grille sigma
-
-            if self.rank == 0:
-                logging.debug("[LevelCoverage][find_level_index()] Looking for : " + str(depth) + " m water depth with an interval of +/- " + str(LevelCoverage.DEPTH_DELTA) + " m")
-
-            if method == "fast":
-
-                X = np.abs(self.source_global_axis_z[:,self.map_mpi[self.rank]["src_global_y_overlap"],self.map_mpi[self.rank]["src_global_x_overlap"]] - depth)
-                idx = np.where(X <= LevelCoverage.DEPTH_DELTA)
-                vert_coord[:] = None
-
-                for index in range(np.shape(idx)[1]):
-                    index_z = idx[0][index]
-                    x =  idx[2][index]
-                    y =  idx[1][index]
-
-                    if vert_coord[y,x] is None: #first time
-                        vert_coord[y, x] = []
-
-                    vert_coord[y, x].append((int(index_z)))
-
-                    if int(index_z) not in indexes_z:
-                        indexes_z.append((int(index_z)))
-            else:
-                raise ValueError("Unable to decode method between 'fast' or 'classic'.")
+        else:
 
-        else: # Cas de grille classique
+            # On calcule en une fois toutes les profondeurs de l'axe cible qui tiennent dans le cache
+            depths = [depth]
+            if not self.is_sigma_coordinate() and depth in np.asarray(self.target_global_axis_z):
+                nbytes = np.prod(shape) * (2 * np.dtype(np.int32).itemsize + np.dtype(np.float64).itemsize + 1)
+                nb_depths = max(1, int(LevelCoverage.VERTICAL_WEIGHTS_CACHE_SIZE // max(nbytes, 1)))
+                axis = [float(z) for z in self.target_global_axis_z if float(z) not in self.vertical_weights]
+                start = axis.index(float(depth))
+                depths = (axis[start:] + axis[:start])[0:nb_depths]
 
             if self.rank == 0:
                 logging.debug("[LevelCoverage][find_level_index()] Looking for : " + str(
-                    depth) + " m water depth with an interval of +/- " + str(LevelCoverage.DEPTH_DELTA) + " m")
-
-            if method == "fast":
-
-                X = np.abs(self.source_global_axis_z - depth)
-
-                idx = np.where(X == 0.0)
-                if (len(idx[0]) == 1):
-                    index_z = idx[0][0]
-
-                    if self.rank == 0:
-                        logging.debug("[LevelCoverage][find_level_index()] found : " + str(
-                                self.source_global_axis_z[index_z]) + " m water depth")
-
-                    for y,x in product(range(0,ymax),range(0,xmax)):
-                            if vert_coord[y, x] is None:  # first time
-                                vert_coord[y, x] = []
+                    depths) + " m water depth with an interval of +/- " + str(LevelCoverage.DEPTH_DELTA) + " m")
 
-                            vert_coord[y, x].append((int(index_z)))
+            source_axis = self.read_axis_z(type="source", with_horizontal_overlap=True)
+            if not self.is_sigma_coordinate(type="source"):
+                source_axis = np.broadcast_to(np.reshape(source_axis, (-1, 1, 1)), (len(source_axis),) + shape)
 
-                            if int(index_z) not in indexes_z:
-                                indexes_z.append((int(index_z)))
-                else:
-                    idx = np.where(X <= LevelCoverage.DEPTH_DELTA)
-
-                    for index in range(np.shape(idx)[1]):
-                        index_z = idx[0][index]
+            weights = compute_vertical_interpolation_weights(source_axis, depths,
+                                                             LevelCoverage.VERTICAL_INTERPOLATION_METHOD,
+                                                             extrapolate=LevelCoverage.VERTICAL_EXTRAPOLATION,
+                                                             depth_delta=LevelCoverage.DEPTH_DELTA)
 
-                        for y,x in product(range(0,ymax),range(0,xmax)):
-                            if vert_coord[y, x] is None:  # first time
-                                vert_coord[y, x] = []
-
-                            #logging.debug(
-                            #    "[LevelCoverage][find_level_index()] found : " + str(
-                            #        self.source_global_axis_z[index_z]) + " m water depth")
+            if len(weights[0]["levels"]) == 0:
+                logging.warning("[LevelCoverage] " + str(
+                    depth) + " m water depth was not found in the grid (proc n° " + str(
+                    self.rank) + "). Maybe the LevelCoverage.DEPTH_DELTA (+/- " + str(
+                    LevelCoverage.DEPTH_DELTA) + " m) is too small or the depth is out of range.")
 
-                            vert_coord[y, x].append((int(index_z)))
+            if self.rank == 0:
+                logging.debug("[LevelCoverage][find_level_index()] Found " + str(
+                    len(weights[0]["levels"])) + " candidate level(s)")
 
-                            if int(index_z) not in indexes_z:
-                                indexes_z.append((int(index_z)))
+            # La profondeur demandée est ajoutée en dernier pour ne pas être évincée
+            for index in reversed(range(0, len(depths))):
+                self.add_level_index(depths[index], weights[index])
 
-            else:
-                raise ValueError("Unable to decode method between 'fast' or 'classic'.")
+        return self.vertical_weights[depth]
 
-        if len(indexes_z)==0:
-            logging.warning("[LevelCoverage] " + str(
-                    depth) + " m water depth was not found in the grid (proc n° "+str(self.rank)+"). Maybe the LevelCoverage.DEPTH_DELTA (+/- " + str(
-                    LevelCoverage.DEPTH_DELTA) + " m) is too small or the depth is out of range.")
+    def add_level_index(self,depth,weights):
+        """Ajoute les poids d'interpolation verticale d'une profondeur dans le cache LRU. Les profondeurs les moins
+    récemment utilisées sont évincées au delà de LevelCoverage.VERTICAL_WEIGHTS_CACHE_SIZE octets.
+    @param depth: Profondeur en mètre ou index de la profondeur
+    @param weights: poids d'interpolation verticale (voir find_level_index())."""
 
-        if self.rank == 0:
-            logging.debug("[LevelCoverage][find_level_index()] Found " + str(len(indexes_z)) + " candidate level(s)")
+        if depth in self.vertical_weights:
+            self.vertical_weights_nbytes -= self.vertical_weights.pop(depth)["nbytes"]
 
-        # On retourne le tableau d'index
-        self.depth_weight[depth] = [vert_coord,np.array(np.unique(indexes_z))]
+        weights["nbytes"] = sum([value.nbytes for value in weights.values() if isinstance(value, np.ndarray)])
+        self.vertical_weights[depth] = weights
+        self.vertical_weights_nbytes += weights["nbytes"]
 
-        return self.depth_weight[depth]
+        while self.vertical_weights_nbytes > LevelCoverage.VERTICAL_WEIGHTS_CACHE_SIZE and len(self.vertical_weights) > 1:
+            evicted_depth, evicted = self.vertical_weights.popitem(last=False)
+            self.vertical_weights_nbytes -= evicted["nbytes"]
+            logging.debug("[LevelCoverage][add_level_index()] Evicting weights of " + str(evicted_depth) + " m water depth")
 
     def read_variable_3D_sea_binary_mask(self):
         """Retourne le masque terre/mer sur toute la couverture selon la profondeur z
@@ -301,60 +285,21 @@ Elle rajoute une dimension verticale à la couverture horizontale classique.
         return self.reader.read_variable_3D_sea_binary_mask()
 
     def read_variable_depth_at_depth(self, depth):
-        vert_coord,indexes_z = self.find_level_index(depth);
-        self.layers_temp[::] = np.NAN
-        self.data_temp[::] = np.NAN
-        targetDepth = [depth]
-
-        for z in range(0, len(indexes_z)):
-            self.layers_temp[z] = self.reader.read_variable_depth_at_depth(
-                indexes_z[z],
+        weights = self.find_level_index(depth)
+        layers = np.full([self.get_z_size(type="source"), self.get_y_size(type="source", with_overlap=True),
+                          self.get_x_size(type="source", with_overlap=True)], np.nan)
+
+        for index_z in weights["levels"]:
+            layers[index_z] = self.reader.read_variable_depth_at_depth(
+                index_z,
                 self.map_mpi[self.rank]["src_global_x_overlap"].start,
                 self.map_mpi[self.rank]["src_global_x_overlap"].stop,
                 self.map_mpi[self.rank]["src_global_y_overlap"].start,
                 self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
-        idx = np.where(vert_coord != None)
-        for index in range(np.shape(idx)[1]):
-            x = idx[1][index]
-            y = idx[0][index]
-
-            if len(vert_coord[y, x]) == 1:
-                # Il n'y a qu'une seule couche de sélectionner donc pas d'interpolation possible
-                # On retrouve l'index de la layer
-                index_layer = (np.abs(indexes_z - vert_coord[y, x][0])).argmin()
-                self.data_temp[0, y, x] = self.layers_temp[index_layer, 0, y, x]
-
-            else:
-                candidateValues = np.zeros([len(vert_coord[y, x])])
-                candidateDepths = np.zeros([len(vert_coord[y, x])])
-
-                for z in range(0, len(vert_coord[y, x])):
-                    # On retrouve l'index de la layer
-                    index_layer = (np.abs(indexes_z - vert_coord[y, x][z])).argmin()
-
-                    if self.is_sigma_coordinate(type="source"):
-                        candidateDepths[z] = self.read_axis_z(type="source", with_horizontal_overlap=True)[
-                            vert_coord[y, x][z], y, x]
-                    else:
-                        candidateDepths[z] = self.read_axis_z(type="source", with_horizontal_overlap=True)[
-                            vert_coord[y, x][z]]
-
-                    candidateValues[z] = self.layers_temp[index_layer,0, y, x]
-
-                self.data_temp[0,y, x] = vertical_interpolation(candidateDepths, targetDepth, candidateValues,
-                                                    LevelCoverage.VERTICAL_INTERPOLATION_METHOD)
+        data = apply_vertical_interpolation_weights(weights, layers)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       self.data_temp[0],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
-
-        return self.data_temp[0,self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
-        
-        
-    
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
+        return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
@@ -15,7 +15,6 @@
 #
 from __future__ import division, print_function, absolute_import
 
-import math
 from datetime import datetime
 from datetime import timedelta
 
@@ -26,7 +25,9 @@ from array_split import shape_split
 
 from spatialetl.coverage.Coverage import Coverage
 from spatialetl.exception.NotFoundInRankError import NotFoundInRankError
-from spatialetl.operator.interpolator.InterpolatorCore import resample_2d_to_grid
+from spatialetl.operator.vector.VectorCore import from_direction, speed, to_direction
+from spatialetl.utils.TimeAxis import TimeAxis, to_timestamps
+from spatialetl.utils.TimeIndex import TimeIndex
 from spatialetl.utils.logger import logging
 
 
@@ -44,16 +45,19 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
         Coverage.__init__(self, myReader, bbox=bbox, resolution_x=resolution_x, resolution_y=resolution_y);
 
         self.source_global_t_size = self.reader.get_t_size()
-        self.source_global_axis_t = self.reader.read_axis_t(0,self.source_global_t_size,0);
+        self.source_global_axis_t = TimeAxis.from_dates(self.reader.read_axis_t(0,self.source_global_t_size,0))
+        # Axes t en secondes depuis TIME_DATUM, calculés une seule fois
+        self.source_global_timestamps = to_timestamps(self.source_global_axis_t, TimeCoverage.TIME_DATUM)
+        self.source_global_timestamps.flags.writeable = False
+        self.time_index = None
 
         self.temporal_resampling = False
         tmin = 0
         tmax = self.source_global_t_size
-        zero_delta = timedelta(minutes=00)
 
         if start_time is not None:
 
-            if type(start_time) == datetime or type(start_time) == cftime._cftime.real_datetime:
+            if isinstance(start_time, (datetime, cftime.datetime)):
                 time = start_time
             elif type(start_time) == str:
                 try:
@@ -63,9 +67,9 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             else:
                 raise ValueError("start_time have to be string or datetime. Found " + str(type(start_time)))
 
-            nearest_t_index = (np.abs(np.asarray(self.source_global_axis_t) - time)).argmin()
+            nearest_t_index, distance = self.find_source_global_time_index(time)
 
-            if time - datetime.strptime(str(self.source_global_axis_t[nearest_t_index]),'%Y-%m-%d %H:%M:%S') == zero_delta or abs(time -datetime.strptime(str(self.source_global_axis_t[nearest_t_index]),'%Y-%m-%d %H:%M:%S')) < TimeCoverage.TIME_DELTA:
+            if distance == 0.0 or distance < (TimeCoverage.TIME_DELTA).total_seconds():
                 tmin = nearest_t_index
             else:
                 raise ValueError(str(time) + " not found. Maybe the TimeCoverage.TIME_DELTA (" + str(
@@ -73,7 +77,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
 
         if end_time is not None:
 
-            if type(end_time) == datetime or type(end_time) == cftime._cftime.real_datetime:
+            if isinstance(end_time, (datetime, cftime.datetime)):
                 time = end_time
             elif type(end_time) == str:
                 try:
@@ -83,22 +87,25 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             else:
                 raise ValueError("end_time have to be string or datetime. Found " + str(type(end_time)))
 
-            nearest_t_index = (np.abs(np.asarray(self.source_global_axis_t) - time)).argmin()
+            nearest_t_index, distance = self.find_source_global_time_index(time)
 
-            if time - datetime.strptime(str(self.source_global_axis_t[nearest_t_index]),'%Y-%m-%d %H:%M:%S') == zero_delta or abs(time - datetime.strptime(str(self.source_global_axis_t[nearest_t_index]),'%Y-%m-%d %H:%M:%S')) < TimeCoverage.TIME_DELTA:
+            if distance == 0.0 or distance < (TimeCoverage.TIME_DELTA).total_seconds():
                 tmax = nearest_t_index +1
             else:
                 raise ValueError(str(time) + " not found. Maybe the TimeCoverage.TIME_DELTA (" + str(
                     TimeCoverage.TIME_DELTA) + ") is too small or the date is out the range.")
 
         if freq is not None:
-            self.target_global_axis_t = pandas.date_range(start=datetime.utcfromtimestamp(self.read_axis_t(type="source_global", with_overlap=False,timestamp=1)[tmin]),
-                                                  end=datetime.utcfromtimestamp(self.read_axis_t(type="source_global", with_overlap=False,timestamp=1)[tmax-1]), freq=freq).to_pydatetime();
+            self.target_global_axis_t = TimeAxis.from_datetime64(pandas.date_range(start=self.source_global_axis_t.to_datetime64()[tmin],
+                                                  end=self.source_global_axis_t.to_datetime64()[tmax-1], freq=freq).values)
             self.target_global_t_size = np.shape(self.target_global_axis_t)[0]
         else:
             self.target_global_axis_t = self.source_global_axis_t[tmin:tmax]
             self.target_global_t_size = tmax - tmin
 
+        self.target_global_timestamps = to_timestamps(self.target_global_axis_t, TimeCoverage.TIME_DATUM)
+        self.target_global_timestamps.flags.writeable = False
+
         self.create_mpi_map()
         self.update_mpi_map()
 
@@ -263,6 +270,39 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
                                                          0:self.map_mpi[self.rank]["src_local_t_size_overlap"]]
    
     # Axis
+    def find_source_global_time_index(self, time):
+        """Retourne la date source la plus proche d'une date donnée, sur tout l'axe source.
+    @param time: date souhaitée
+    @return: l'index global de la date la plus proche et l'écart en secondes."""
+        indexes_t, distances = TimeIndex(self.source_global_timestamps).query(to_timestamps([time], TimeCoverage.TIME_DATUM))
+        return int(indexes_t[0]), distances[0]
+
+    def get_time_index(self):
+        """Retourne l'index (TimeIndex) des dates source du proc. Il est construit une seule fois par découpage MPI.
+    @return: un TimeIndex dont les index sont locaux au proc."""
+        src_global_t = self.map_mpi[self.rank]["src_global_t"]
+        if self.time_index is None or self.time_index_slice != src_global_t:
+            self.time_index = TimeIndex(self.source_global_timestamps[src_global_t])
+            self.time_index_slice = src_global_t
+        return self.time_index
+
+    def find_time_indices(self,times,domain="source"):
+        """Retourne en une seule requête les index des dates les plus proches à TIME_DELTA près.
+    @param times: tableau de dates (datetime, cftime, datetime64) ou de secondes depuis TIME_DATUM
+    @param domain: "source" pour des index locaux au proc, "source_global" pour des index globaux
+    @return: un tableau d'index, -1 pour les dates non trouvées."""
+
+        if domain not in ("source", "source_global"):
+            raise ValueError("Type doesn't match [source, source_global]")
+
+        indexes_t, distances = self.get_time_index().query(to_timestamps(times, TimeCoverage.TIME_DATUM))
+        found = (distances == 0.0) | (distances < (TimeCoverage.TIME_DELTA).total_seconds())
+
+        if domain == "source_global":
+            indexes_t = self.map_mpi[self.rank]["src_global_t"].start + indexes_t
+
+        return np.where(found, indexes_t, -1)
+
     def find_time_index(self,t,method="fast",domain="source"):
         """Retourne l'index de la date la plus proche à TIME_DELTA_MIN prêt.
     @type t: datetime ou int
@@ -277,30 +317,21 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
 
             return t;
 
-        if type(t) == datetime or type(t) == cftime._cftime.datetime or type(t) == cftime._cftime.real_datetime:
-
-            target_timestamp = (t - TimeCoverage.TIME_DATUM).total_seconds()
-            array = np.asarray(self.read_axis_t(type="source",timestamp=1))
+        if isinstance(t, (datetime, cftime.datetime, np.datetime64)):
 
             logging.debug("[TimeCoverage][find_time_index()] Looking for : " + str(t))
 
-            if method == "fast":
-
-                nearest_t_index = (np.abs(array - target_timestamp)).argmin()
-                if target_timestamp - array[nearest_t_index] == 0.0 or abs(target_timestamp - array[nearest_t_index]) < (TimeCoverage.TIME_DELTA).total_seconds():
-                    logging.debug("[TimeCoverage][find_time_index()] Nearest datetime found : " + str(
-                        self.read_axis_t(type="source",timestamp=0)[nearest_t_index]))
-
-                    if domain == "source":
-                        return nearest_t_index
-                    elif domain == "source_global":
-                        return self.map_mpi[self.rank]["src_global_t"].start + nearest_t_index
-                    else:
-                        raise ValueError("Type doesn't match [source, source_global]")
-            else:
+            if method != "fast":
                 raise NotImplementedError("Method " + str(method) + " is not implemented for regular grid.")
 
-            raise NotFoundInRankError(self.rank,"'"+str(t)+"' not found. Maybe the TimeCoverage.TIME_DELTA ("+ str(TimeCoverage.TIME_DELTA)+") is too small or the date is out the range.")
+            index_t = self.find_time_indices([t], domain=domain)[0]
+            if index_t < 0:
+                raise NotFoundInRankError(self.rank,"'"+str(t)+"' not found. Maybe the TimeCoverage.TIME_DELTA ("+ str(TimeCoverage.TIME_DELTA)+") is too small or the date is out the range.")
+
+            logging.debug("[TimeCoverage][find_time_index()] Nearest datetime found : " + str(
+                self.source_global_axis_t[index_t if domain == "source_global" else
+                                          self.map_mpi[self.rank]["src_global_t"].start + index_t]))
+            return int(index_t)
 
         else:
             raise ValueError(""+str(t)+" have to be an integer or a datetime. Current type: "+str(type(t)))
@@ -308,38 +339,28 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
     def read_axis_t(self,type="target",with_overlap=False,timestamp=0):
         """Retourne les valeurs de l'axe t.
     @param timestamp: égale 1 si le temps est souhaité en timestamp depuis TIME_DATUM.
-    @return:  un tableau à une dimensions [z] au format datetime ou timestamp si timestamp=1."""
+    @return:  un TimeAxis [t] ou un tableau de timestamps si timestamp=1."""
         if type == "target_global":
-            if timestamp == 1:
-                return [(t - TimeCoverage.TIME_DATUM).total_seconds() \
-                        for t in self.target_global_axis_t];
-            return self.target_global_axis_t
-
+            axis_t = np.s_[:]
         elif type == "source_global":
-            if timestamp == 1:
-                return [(t - TimeCoverage.TIME_DATUM).total_seconds() \
-                        for t in self.source_global_axis_t];
-            return self.source_global_axis_t
-
+            axis_t = np.s_[:]
         elif type == "source" and with_overlap is True:
-            return self.reader.read_axis_t(self.map_mpi[self.rank]["src_global_t_overlap"].start,
-                                           self.map_mpi[self.rank]["src_global_t_overlap"].stop, timestamp)
-
+            axis_t = self.map_mpi[self.rank]["src_global_t_overlap"]
         elif type == "source" and with_overlap is False:
-            return self.reader.read_axis_t(self.map_mpi[self.rank]["src_global_t"].start,
-                                           self.map_mpi[self.rank]["src_global_t"].stop, timestamp)
-
+            axis_t = self.map_mpi[self.rank]["src_global_t"]
         elif type == "target" and with_overlap is True:
-            if timestamp == 1:
-                return [(t - TimeCoverage.TIME_DATUM).total_seconds() \
-                        for t in self.target_global_axis_t[self.map_mpi[self.rank]["dst_global_t_overlap"]]];
-            return self.target_global_axis_t[self.map_mpi[self.rank]["dst_global_t_overlap"]]
-
+            axis_t = self.map_mpi[self.rank]["dst_global_t_overlap"]
         else:
+            axis_t = self.map_mpi[self.rank]["dst_global_t"]
+
+        if type == "source" or type == "source_global":
             if timestamp == 1:
-                return [(t - TimeCoverage.TIME_DATUM).total_seconds() \
-                        for t in self.target_global_axis_t[self.map_mpi[self.rank]["dst_global_t"]]];
-            return self.target_global_axis_t[self.map_mpi[self.rank]["dst_global_t"]]
+                return self.source_global_timestamps[axis_t]
+            return self.source_global_axis_t[axis_t]
+
+        if timestamp == 1:
+            return self.target_global_timestamps[axis_t]
+        return self.target_global_axis_t[axis_t]
 
     def get_t_size(self,type="target",with_overlap=False):
         if type == "target_global":
@@ -352,7 +373,50 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             return self.map_mpi[self.rank]["dst_local_t_size_overlap"]
         else:
             return self.map_mpi[self.rank]["dst_local_t_size"]
-    
+
+    # Block
+    def read_variable_block(self, name, t_slice=None):
+        """Retourne un bloc de la variable souhaitée sur plusieurs dates. Le bloc est lu en un seul appel au lecteur
+    puis toutes les couches sont interpolées horizontalement en une seule fois.
+    @param name: nom de la variable (ex: "sea_surface_temperature")
+    @param t_slice: slice de l'axe t de la couverture (par défaut toutes les dates)
+    @return: un tableau en trois dimensions [t,y,x] ou, pour un vecteur, deux tableaux [u_comp,v_comp] contenant
+    chacun trois dimensions [t,y,x]."""
+
+        times = self.read_axis_t()
+        if t_slice is None:
+            t_slice = np.s_[0:len(times)]
+
+        indexes_t = self.find_time_indices(self.read_axis_t(timestamp=1)[t_slice], domain="source_global")
+
+        if len(indexes_t) == 0:
+            raise ValueError("t_slice " + str(t_slice) + " doesn't select any date.")
+
+        missing = np.flatnonzero(indexes_t < 0)
+        if len(missing) > 0:
+            raise NotFoundInRankError(self.rank, "'" + str(times[t_slice][missing[0]]) + "' not found. Maybe the "
+                                      "TimeCoverage.TIME_DELTA (" + str(TimeCoverage.TIME_DELTA) + ") is too small or "
+                                      "the date is out the range.")
+
+        tmin = int(np.min(indexes_t))
+        tmax = int(np.max(indexes_t)) + 1
+
+        data = self.reader.read_variable_block(name, tmin, tmax,
+                                               self.map_mpi[self.rank]["src_global_x_overlap"].start,
+                                               self.map_mpi[self.rank]["src_global_x_overlap"].stop,
+                                               self.map_mpi[self.rank]["src_global_y_overlap"].start,
+                                               self.map_mpi[self.rank]["src_global_y_overlap"].stop)[indexes_t - tmin]
+
+        if self.horizontal_resampling:
+            data = self.resample_2d_to_grid(data)
+
+        data = data[..., self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+
+        if np.ndim(data) == 4:
+            return data[:, 0], data[:, 1]
+
+        return data
+
     # Variables
     def read_variable_2D_sea_binary_mask_at_time(self, t):
         """Retourne le masque à la date souhaitée sur toute la couverture horizontale.
@@ -370,12 +434,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -395,12 +454,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -416,12 +470,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+            return self.resample_2d_to_grid(data)[
                 self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
@@ -442,12 +491,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"],self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -463,12 +507,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -484,12 +523,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+            return self.resample_2d_to_grid(data)[
                 self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
@@ -510,12 +544,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -535,12 +564,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -560,12 +584,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -585,12 +604,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -610,12 +624,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -636,19 +645,9 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[0],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+            return self.resample_2d_to_grid(data[0])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]], \
-                   resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[1],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+                   self.resample_2d_to_grid(data[1])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[0][self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]],data[1][self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
@@ -674,12 +673,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -699,12 +693,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -724,19 +713,9 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[0],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+            return self.resample_2d_to_grid(data[0])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]], \
-                   resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[1],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+                   self.resample_2d_to_grid(data[1])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[0][self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]],data[1][self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
@@ -761,52 +740,24 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[0],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+            return self.resample_2d_to_grid(data[0])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]], \
-                   resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[1],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+                   self.resample_2d_to_grid(data[1])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[0][self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]],data[1][self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
     def read_variable_barotropic_sea_water_speed_at_time(self, date):
         comp = self.read_variable_barotropic_sea_water_velocity_at_time(date)
-        result = np.zeros([self.get_y_size(), self.get_x_size()])
-        result[:] = np.nan
-        for x in range(0, self.get_x_size()):
-            for y in range(0, self.get_y_size()):
-                result[y, x] = math.sqrt(comp[0][y, x] ** 2 + comp[1][y, x] ** 2)
-
-        return result
+        return speed(comp[0], comp[1])
 
     def read_variable_barotropic_sea_water_from_direction_at_time(self, date):
         comp = self.read_variable_barotropic_sea_water_velocity_at_time(date)
-        result = np.zeros([self.get_y_size(), self.get_x_size()])
-        result[:] = np.nan
-        for x in range(0, self.get_x_size()):
-            for y in range(0, self.get_y_size()):
-                result[y, x] = 270. - (180.0 / math.pi) * (math.atan2(comp[0][y, x], comp[1][y, x])) + 180.0 % 360.0
-
-        return result
+        return from_direction(comp[0], comp[1])
 
     def read_variable_barotropic_sea_water_to_direction_at_time(self, date):
         comp = self.read_variable_barotropic_sea_water_velocity_at_time(date)
-        result = np.zeros([self.get_y_size(), self.get_x_size()])
-        result[:] = np.nan
-        for x in range(0, self.get_x_size()):
-            for y in range(0, self.get_y_size()):
-                result[y, x] = 270. - (180.0 / math.pi) * (math.atan2(comp[0][y, x], comp[1][y, x])) % 360.0
-
-        return result
+        return to_direction(comp[0], comp[1])
 
     #################
     # WAVES
@@ -828,12 +779,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -853,12 +799,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
     
@@ -874,12 +815,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -895,12 +831,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -916,12 +847,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -937,12 +863,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -962,19 +883,9 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[0],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+            return self.resample_2d_to_grid(data[0])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]], \
-                   resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[1],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+                   self.resample_2d_to_grid(data[1])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[0][self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]],data[1][self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
@@ -995,12 +906,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -1020,19 +926,9 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[0],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+            return self.resample_2d_to_grid(data[0])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]], \
-                   resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[1],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+                   self.resample_2d_to_grid(data[1])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[0][self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]],data[1][self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
@@ -1053,12 +949,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -1082,19 +973,9 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[0],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+            return self.resample_2d_to_grid(data[0])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]], \
-                   resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[1],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+                   self.resample_2d_to_grid(data[1])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[0][self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]],data[1][self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
@@ -1115,19 +996,9 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[0],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+            return self.resample_2d_to_grid(data[0])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]], \
-                   resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[1],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+                   self.resample_2d_to_grid(data[1])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[0][self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]],data[1][self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
@@ -1152,12 +1023,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -1182,12 +1048,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -1207,12 +1068,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -1232,19 +1088,9 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[0],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+            return self.resample_2d_to_grid(data[0])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]], \
-                   resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[1],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+                   self.resample_2d_to_grid(data[1])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[0][self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]], data[1][
@@ -1266,12 +1112,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -1291,12 +1132,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -1316,12 +1152,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -1341,12 +1172,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -1366,12 +1192,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -1391,12 +1212,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -1416,12 +1232,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -1441,12 +1252,7 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data,
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
@@ -1470,19 +1276,9 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
             self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[0],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+            return self.resample_2d_to_grid(data[0])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]], \
-                   resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       data[1],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[
+                   self.resample_2d_to_grid(data[1])[
                        self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
         return data[0][self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]], data[1][
@@ -1490,33 +1286,15 @@ Elle rajoute une dimension temporelle à la couverture horizontale classique.
 
     def read_variable_wind_speed_10m_at_time(self, date):
         comp = self.read_variable_wind_10m_at_time(date)
-        result = np.zeros([self.get_y_size(),self.get_x_size()])
-        result[:] = np.nan
-        for x in range(0,self.get_x_size()):
-            for y in range(0,self.get_y_size()):
-                result[y,x] = math.sqrt(comp[0][y,x] ** 2 + comp[1][y,x] ** 2)
-
-        return result
+        return speed(comp[0], comp[1])
 
     def read_variable_wind_from_direction_10m_at_time(self, date):
         comp = self.read_variable_wind_10m_at_time(date)
-        result = np.zeros([self.get_y_size(), self.get_x_size()])
-        result[:] = np.nan
-        for x in range(0, self.get_x_size()):
-            for y in range(0, self.get_y_size()):
-                result[y, x] = 270. - (180.0 / math.pi) * (math.atan2(comp[0][y,x], comp[1][y,x])) + 180.0 % 360.0
-
-        return result
+        return from_direction(comp[0], comp[1])
 
     def read_variable_wind_to_direction_10m_at_time(self, date):
         comp = self.read_variable_wind_10m_at_time(date)
-        result = np.zeros([self.get_y_size(), self.get_x_size()])
-        result[:] = np.nan
-        for x in range(0, self.get_x_size()):
-            for y in range(0, self.get_y_size()):
-                result[y, x] = 270. - (180.0 / math.pi) * (math.atan2(comp[0][y,x], comp[1][y,x])) % 360.0
-
-        return result
+        return to_direction(comp[0], comp[1])
 
 
 
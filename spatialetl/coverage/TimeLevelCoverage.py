@@ -17,11 +17,11 @@ from __future__ import division, print_function, absolute_import
 
 import numpy as np
 
-from spatialetl.coverage.Coverage import Coverage
 from spatialetl.coverage.LevelCoverage import LevelCoverage
 from spatialetl.coverage.TimeCoverage import TimeCoverage
-from spatialetl.operator.interpolator.InterpolatorCore import resample_2d_to_grid
-from spatialetl.operator.interpolator.InterpolatorCore import vertical_interpolation
+from spatialetl.exception.NotFoundInRankError import NotFoundInRankError
+from spatialetl.operator.interpolator.InterpolatorCore import apply_vertical_interpolation_weights
+from spatialetl.operator.vector.VectorCore import from_direction, speed, to_direction
 from spatialetl.utils.logger import logging
 from spatialetl.utils.timing import timing
 
@@ -46,73 +46,130 @@ Elle rajoute les dimensions temporelle et verticale à la couverture horizontale
                 '[horizontal_interpolation] Target grid size : (' + str(self.target_global_x_size) + ", " + str(
                     self.target_global_y_size) + ")")
 
-    #################
-    # HYDRO
-    # 3D
-    #################
-    def read_variable_sea_water_temperature_at_time_and_depth(self, time, depth):
-        """Retourne la salinité à la date souhaitée et au niveau souhaité sur toute la couverture horizontale.
+    # Block
+    def read_layer_at_time_and_depth(self, name, time, depth):
+        """Retourne la variable souhaitée à la date et au niveau souhaités sur la grille source (avec recouvrement),
+    avant l'interpolation horizontale.
+    @param name: nom de la variable (ex: "sea_water_temperature")
     @type time: datetime ou l'index
     @param time: date souhaitée
     @type depth: profondeur en mètre (float) ou index (integer)
     @param depth: profondeur souhaitée. Si le z est un entier, on considère qu'il s'agit de l'index,
     si c'est un flottant on considère qu'il s'agit d'une profondeur
-    @return: un tableau en deux dimensions [y,x]."""
+    @return: un tableau en trois dimensions [composante,y,x] (une composante pour un scalaire, deux pour un vecteur)."""
+
+        function_name = "read_variable_" + str(name) + "_at_time_and_depth"
+        if not hasattr(self.reader, function_name):
+            raise ValueError("Unknown variable '" + str(name) + "'")
 
         index_t = self.find_time_index(time);
-        vert_coord,indexes_z = self.find_level_index(depth);
+        weights = self.find_level_index(depth)
         self.layers_temp[::] = np.nan
         self.data_temp[::] = np.nan
-        targetDepth = [depth]
+        nb_components = 1
 
-        for z in range(0, len(indexes_z)):
-            self.layers_temp[z] = self.reader.read_variable_sea_water_temperature_at_time_and_depth(
-                self.map_mpi[self.rank]["src_global_t"].start + index_t, indexes_z[z],
+        for index_z in weights["levels"]:
+            layer = getattr(self.reader, function_name)(
+                self.map_mpi[self.rank]["src_global_t"].start + index_t, index_z,
                 self.map_mpi[self.rank]["src_global_x_overlap"].start,
                 self.map_mpi[self.rank]["src_global_x_overlap"].stop,
                 self.map_mpi[self.rank]["src_global_y_overlap"].start,
                 self.map_mpi[self.rank]["src_global_y_overlap"].stop)
 
-        idx = np.where(vert_coord != None)
-        for index in range(np.shape(idx)[1]):
-            x = idx[1][index]
-            y = idx[0][index]
+            if isinstance(layer, (list, tuple)) or np.ndim(layer) == 3:
+                nb_components = 2
+
+            self.layers_temp[index_z] = layer
+
+        self.data_temp[0:nb_components] = apply_vertical_interpolation_weights(weights,
+                                                                               self.layers_temp[:, 0:nb_components])
+
+        return self.data_temp[0:nb_components]
+
+    def read_variable_block(self, name, t_slice=None, z_slice=None):
+        """Retourne un bloc de la variable souhaitée sur plusieurs dates et plusieurs niveaux. Les couches sources
+    nécessaires à tous les niveaux du bloc sont lues en un seul appel au lecteur (read_variable_level_block()), puis
+    interpolées verticalement niveau par niveau et horizontalement en une seule fois.
+    @param name: nom de la variable (ex: "sea_water_temperature")
+    @param t_slice: slice de l'axe t de la couverture (par défaut toutes les dates)
+    @param z_slice: slice de l'axe z de la couverture (par défaut tous les niveaux)
+    @return: un tableau en quatre dimensions [t,z,y,x] ou, pour un vecteur, deux tableaux [u_comp,v_comp] contenant
+    chacun quatre dimensions [t,z,y,x]."""
+
+        times = self.read_axis_t()
+        if self.is_sigma_coordinate():
+            # Les niveaux sigma sont lus par index
+            levels = np.arange(self.target_global_z_offset, self.target_global_z_offset + self.get_z_size())
+        else:
+            levels = self.read_axis_z()
+        if t_slice is None:
+            t_slice = np.s_[0:len(times)]
+        if z_slice is None:
+            z_slice = np.s_[0:len(levels)]
+
+        indexes_t = self.find_time_indices(self.read_axis_t(timestamp=1)[t_slice], domain="source_global")
+        weights = [self.find_level_index(level) for level in levels[z_slice]]
+
+        if len(indexes_t) == 0 or len(weights) == 0:
+            raise ValueError("t_slice " + str(t_slice) + " and z_slice " + str(z_slice) + " don't select any layer.")
+
+        missing = np.flatnonzero(indexes_t < 0)
+        if len(missing) > 0:
+            raise NotFoundInRankError(self.rank, "'" + str(times[t_slice][missing[0]]) + "' not found. Maybe the "
+                                      "TimeCoverage.TIME_DELTA (" + str(TimeCoverage.TIME_DELTA) + ") is too small or "
+                                      "the date is out the range.")
+
+        tmin = int(np.min(indexes_t))
+        tmax = int(np.max(indexes_t)) + 1
+
+        source_levels = np.concatenate([weight["levels"] for weight in weights]).astype(np.int64)
+        zmin = int(np.min(source_levels)) if len(source_levels) > 0 else 0
+        zmax = int(np.max(source_levels)) + 1 if len(source_levels) > 0 else 1
+
+        block = self.reader.read_variable_level_block(name, tmin, tmax, zmin, zmax,
+                                                      self.map_mpi[self.rank]["src_global_x_overlap"].start,
+                                                      self.map_mpi[self.rank]["src_global_x_overlap"].stop,
+                                                      self.map_mpi[self.rank]["src_global_y_overlap"].start,
+                                                      self.map_mpi[self.rank]["src_global_y_overlap"].stop)
+        block = np.ma.filled(np.ma.asarray(block, dtype=np.float64), fill_value=np.nan)[indexes_t - tmin]
+        if np.ndim(block) == 4:
+            block = block[:, :, np.newaxis]
+
+        # Couches sources [z,t,composante,y,x] indexées par leur niveau dans le fichier
+        layers = np.full((self.get_z_size(type="source"),) + np.shape(block)[0:1] + np.shape(block)[2:], np.nan)
+        layers[zmin:zmax] = np.moveaxis(block, 1, 0)
+
+        data = np.stack([apply_vertical_interpolation_weights(weight, layers) for weight in weights], axis=1)
 
-            if len(vert_coord[y, x]) == 1:
-                # Il n'y a qu'une seule couche de sélectionner donc pas d'interpolation possible
-                # On retrouve l'index de la layer
-                index_layer = (np.abs(indexes_z - vert_coord[y, x][0])).argmin()
-                self.data_temp[0,y,x] = self.layers_temp[index_layer,0,y, x]
-            else:
+        if self.horizontal_resampling:
+            data = self.resample_2d_to_grid(data)
 
-                candidateValues = np.zeros([len(vert_coord[y, x])])
-                candidateDepths = np.zeros([len(vert_coord[y, x])])
+        data = data[..., self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
-                for z in range(0, len(vert_coord[y, x])):
-                    # On retrouve l'index de la layer
-                    index_layer = (np.abs(indexes_z - vert_coord[y, x][z])).argmin()
+        if np.shape(data)[2] == 2:
+            return data[:, :, 0], data[:, :, 1]
 
-                    if self.is_sigma_coordinate(type="source"):
-                        candidateDepths[z] = self.read_axis_z(type="source", with_horizontal_overlap=True)[
-                            vert_coord[y, x][z], y, x]
-                    else:
-                        candidateDepths[z] = self.read_axis_z(type="source", with_horizontal_overlap=True)[
-                            vert_coord[y, x][z]]
+        return data[:, :, 0]
 
-                    candidateValues[z] = self.layers_temp[index_layer,0, y, x]
+    #################
+    # HYDRO
+    # 3D
+    #################
+    def read_variable_sea_water_temperature_at_time_and_depth(self, time, depth):
+        """Retourne la salinité à la date souhaitée et au niveau souhaité sur toute la couverture horizontale.
+    @type time: datetime ou l'index
+    @param time: date souhaitée
+    @type depth: profondeur en mètre (float) ou index (integer)
+    @param depth: profondeur souhaitée. Si le z est un entier, on considère qu'il s'agit de l'index,
+    si c'est un flottant on considère qu'il s'agit d'une profondeur
+    @return: un tableau en deux dimensions [y,x]."""
 
-                self.data_temp[0,y, x] = vertical_interpolation(candidateDepths, targetDepth, candidateValues,
-                                                    LevelCoverage.VERTICAL_INTERPOLATION_METHOD)
+        data = self.read_layer_at_time_and_depth("sea_water_temperature", time, depth)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       self.data_temp[0],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data[0])[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
-        return self.data_temp[0,self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+        return data[0,self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
     @timing
     def read_variable_sea_water_salinity_at_time_and_depth(self, time, depth):
@@ -124,60 +181,12 @@ Elle rajoute les dimensions temporelle et verticale à la couverture horizontale
     si c'est un flottant on considère qu'il s'agit d'une profondeur
     @return: un tableau en deux dimensions [y,x]."""
 
-        index_t = self.find_time_index(time);
-        vert_coord,indexes_z = self.find_level_index(depth);
-        self.layers_temp[::] = np.NAN
-        self.data_temp[::] = np.NAN
-        targetDepth = [depth]
-
-        for z in range(0, len(indexes_z)):
-            self.layers_temp[z] = self.reader.read_variable_sea_water_salinity_at_time_and_depth(
-                self.map_mpi[self.rank]["src_global_t"].start + index_t, indexes_z[z],
-                self.map_mpi[self.rank]["src_global_x_overlap"].start,
-                self.map_mpi[self.rank]["src_global_x_overlap"].stop,
-                self.map_mpi[self.rank]["src_global_y_overlap"].start,
-                self.map_mpi[self.rank]["src_global_y_overlap"].stop)
-
-        idx = np.where(vert_coord != None)
-        for index in range(np.shape(idx)[1]):
-            x = idx[1][index]
-            y = idx[0][index]
-
-            if len(vert_coord[y, x]) == 1:
-                # Il n'y a qu'une seule couche de sélectionner donc pas d'interpolation possible
-                # On retrouve l'index de la layer
-                index_layer = (np.abs(indexes_z - vert_coord[y, x][0])).argmin()
-                self.data_temp[0, y, x] = self.layers_temp[index_layer, 0, y, x]
-
-            else:
-                candidateValues = np.zeros([len(vert_coord[y, x])])
-                candidateDepths = np.zeros([len(vert_coord[y, x])])
-
-                for z in range(0, len(vert_coord[y, x])):
-                    # On retrouve l'index de la layer
-                    index_layer = (np.abs(indexes_z - vert_coord[y, x][z])).argmin()
-
-                    if self.is_sigma_coordinate(type="source"):
-                        candidateDepths[z] = self.read_axis_z(type="source", with_horizontal_overlap=True)[
-                            vert_coord[y, x][z], y, x]
-                    else:
-                        candidateDepths[z] = self.read_axis_z(type="source", with_horizontal_overlap=True)[
-                            vert_coord[y, x][z]]
-
-                    candidateValues[z] = self.layers_temp[index_layer,0, y, x]
-
-                self.data_temp[0,y, x] = vertical_interpolation(candidateDepths, targetDepth, candidateValues,
-                                                    LevelCoverage.VERTICAL_INTERPOLATION_METHOD)
+        data = self.read_layer_at_time_and_depth("sea_water_salinity", time, depth)
 
         if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       self.data_temp[0],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+            return self.resample_2d_to_grid(data[0])[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
-        return self.data_temp[0,self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+        return data[0,self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
 
     def read_variable_baroclinic_sea_water_velocity_at_time_and_depth(self,time,depth):
@@ -189,65 +198,41 @@ Elle rajoute les dimensions temporelle et verticale à la couverture horizontale
     si c'est un flottant on considère qu'il s'agit d'une profondeur
     @return: un tableau en deux dimensions [u_comp,v_comp] contenant chacun deux dimensions [y,x]."""
 
-        index_t = self.find_time_index(time);
-        vert_coord,indexes_z = self.find_level_index(depth);
-        self.layers_temp[::] = np.nan
-        self.data_temp[:] = np.nan
-        targetDepth = [depth]
-
-        for z in range(0, len(indexes_z)):
-            self.layers_temp[z] = self.reader.read_variable_baroclinic_sea_water_velocity_at_time_and_depth(
-                self.map_mpi[self.rank]["src_global_t"].start + index_t, indexes_z[z],
-                self.map_mpi[self.rank]["src_global_x_overlap"].start,
-                self.map_mpi[self.rank]["src_global_x_overlap"].stop,
-                self.map_mpi[self.rank]["src_global_y_overlap"].start,
-                self.map_mpi[self.rank]["src_global_y_overlap"].stop)
-
-        idx = np.where(vert_coord != None)
-        for index in range(np.shape(idx)[1]):
-            x = idx[1][index]
-            y = idx[0][index]
-
-            if len(vert_coord[y, x]) == 1:
-                # Il n'y a qu'une seule couche de sélectionner donc pas d'interpolation possible
-                # On retrouve l'index de la layer
-                index_layer = (np.abs(indexes_z - vert_coord[y, x][0])).argmin()
-
-                self.data_temp[0, y, x] = self.layers_temp[index_layer, 0, y, x]
-                self.data_temp[1, y, x] = self.layers_temp[index_layer, 1, y, x]
-            else:
-                candidateValues = np.zeros([2,len(vert_coord[y, x])])
-                candidateDepths = np.zeros([len(vert_coord[y, x])])
-
-                for z in range(0, len(vert_coord[y, x])):
-                    # On retrouve l'index de la layer
-                    index_layer = (np.abs(indexes_z - vert_coord[y, x][z])).argmin()
+        data = self.read_layer_at_time_and_depth("baroclinic_sea_water_velocity", time, depth)
 
-                    if self.is_sigma_coordinate(type="source"):
-                        candidateDepths[z] = self.read_axis_z(type="source", with_horizontal_overlap=True)[vert_coord[y, x][z], y, x]
-                    else:
-                        candidateDepths[z] = self.read_axis_z(type="source", with_horizontal_overlap=True)[vert_coord[y, x][z]]
+        if self.horizontal_resampling:
+            return self.resample_2d_to_grid(data[0])[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]],self.resample_2d_to_grid(data[1])[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
-                    candidateValues[0,z] = self.layers_temp[index_layer, 0, y, x]
-                    candidateValues[1,z] = self.layers_temp[index_layer, 1, y, x]
+        return data[0, self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]], data[1, self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
 
-                self.data_temp[0, y, x] = vertical_interpolation(candidateDepths, targetDepth, candidateValues[0],
-                                                                 LevelCoverage.VERTICAL_INTERPOLATION_METHOD)
+    def read_variable_baroclinic_sea_water_speed_at_time_and_depth(self, time, depth):
+        """Retourne la vitesse du courant à la date souhaitée et au niveau souhaité sur toute la couverture horizontale.
+    @type time: datetime ou l'index
+    @param time: date souhaitée
+    @type depth: profondeur en mètre (float) ou index (integer)
+    @param depth: profondeur souhaitée
+    @return: un tableau en deux dimensions [y,x]."""
+        comp = self.read_variable_baroclinic_sea_water_velocity_at_time_and_depth(time, depth)
+        return speed(comp[0], comp[1])
 
-                self.data_temp[1, y, x] = vertical_interpolation(candidateDepths, targetDepth, candidateValues[1],
-                                                                 LevelCoverage.VERTICAL_INTERPOLATION_METHOD)
+    def read_variable_baroclinic_sea_water_from_direction_at_time_and_depth(self, time, depth):
+        """Retourne la direction de provenance du courant à la date souhaitée et au niveau souhaité sur toute la
+    couverture horizontale.
+    @type time: datetime ou l'index
+    @param time: date souhaitée
+    @type depth: profondeur en mètre (float) ou index (integer)
+    @param depth: profondeur souhaitée
+    @return: un tableau en deux dimensions [y,x]."""
+        comp = self.read_variable_baroclinic_sea_water_velocity_at_time_and_depth(time, depth)
+        return from_direction(comp[0], comp[1])
 
-        if self.horizontal_resampling:
-            return resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                       self.read_axis_y(type="source", with_overlap=True),
-                                       self.read_axis_x(type="target", with_overlap=True),
-                                       self.read_axis_y(type="target", with_overlap=True),
-                                       self.data_temp[0],
-                                       Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]],resample_2d_to_grid(self.read_axis_x(type="source", with_overlap=True),
-                                                                                                                                                                                     self.read_axis_y(type="source", with_overlap=True),
-                                                                                                                                                                                     self.read_axis_x(type="target", with_overlap=True),
-                                                                                                                                                                                     self.read_axis_y(type="target", with_overlap=True),
-                                                                                                                                                                                     self.data_temp[1],
-                                                                                                                                                                                     Coverage.HORIZONTAL_INTERPOLATION_METHOD)[self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
-
-        return self.data_temp[0, self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]], self.data_temp[1, self.map_mpi[self.rank]["dst_local_y"], self.map_mpi[self.rank]["dst_local_x"]]
+    def read_variable_baroclinic_sea_water_to_direction_at_time_and_depth(self, time, depth):
+        """Retourne la direction du courant à la date souhaitée et au niveau souhaité sur toute la couverture
+    horizontale.
+    @type time: datetime ou l'index
+    @param time: date souhaitée
+    @type depth: profondeur en mètre (float) ou index (integer)
+    @param depth: profondeur souhaitée
+    @return: un tableau en deux dimensions [y,x]."""
+        comp = self.read_variable_baroclinic_sea_water_velocity_at_time_and_depth(time, depth)
+        return to_direction(comp[0], comp[1])
@@ -0,0 +1,130 @@
+#! /usr/bin/env python2.7
+# -*- coding: utf-8 -*-
+#
+# pySpatialETL is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# pySpatialETL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# Author : Fabien Rétif - fabien.retif@zoho.com
+#
+from __future__ import division, print_function, absolute_import
+
+from collections import OrderedDict
+
+import numpy as np
+
+from spatialetl.utils.logger import logging
+
+
+def get_nbytes(value):
+    """Retourne la taille en octets d'une couche lue (tableau ou liste de tableaux)."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (list, tuple)):
+        return sum([get_nbytes(item) for item in value])
+    return np.asarray(value).nbytes
+
+
+def set_read_only(value):
+    """Protège en écriture les tableaux conservés dans le cache."""
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            set_read_only(item)
+
+
+def unwrap_reader(reader):
+    """Retourne le lecteur d'origine d'un CachedCoverageReader (ou le lecteur lui-même)."""
+    if isinstance(reader, CachedCoverageReader):
+        return reader.reader
+    return reader
+
+
+class CachedCoverageReader(object):
+    """
+La classe CachedCoverageReader s'intercale entre une Coverage et son lecteur. Les couches lues par les fonctions
+read_variable_*() sont conservées dans un cache LRU indexé par (variable, t, z, hyperslab) : une couche déjà lue
+(par exemple les composantes du vent pour la vitesse puis pour la direction) n'est plus relue dans le fichier.
+Toutes les autres fonctions sont transmises au lecteur.
+
+Les tableaux conservés sont protégés en écriture.
+
+@param reader: lecteur de fichier
+@param cache_size: taille maximale du cache en octets
+"""
+
+    def __init__(self, reader, cache_size):
+        self.reader = reader
+        self.cache_size = cache_size
+        self.layers = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __getattr__(self, name):
+        attribute = getattr(self.reader, name)
+
+        if name.startswith("read_variable_") and callable(attribute):
+            def read_through(*args):
+                return self.read(name, attribute, args)
+
+            # La fonction est conservée pour ne plus passer par __getattr__
+            self.__dict__[name] = read_through
+            return read_through
+
+        return attribute
+
+    def read(self, name, function, args):
+        """Retourne la couche depuis le cache ou la lit dans le fichier.
+    @param name: nom de la fonction de lecture
+    @param function: fonction de lecture du lecteur
+    @param args: paramètres de lecture (index t, index z, hyperslab)
+    @return: la couche lue."""
+        try:
+            key = (name,) + tuple(args)
+            hash(key)
+        except TypeError:
+            return function(*args)
+
+        if key in self.layers:
+            self.hits += 1
+            self.layers.move_to_end(key)
+            return self.layers[key][0]
+
+        self.misses += 1
+        value = function(*args)
+
+        nbytes = get_nbytes(value)
+        if nbytes <= self.cache_size:
+            set_read_only(value)
+            self.layers[key] = (value, nbytes)
+            self.nbytes += nbytes
+
+            while self.nbytes > self.cache_size:
+                evicted_key, evicted = self.layers.popitem(last=False)
+                self.nbytes -= evicted[1]
+                logging.debug("[CachedCoverageReader] Evicting " + str(evicted_key))
+
+        return value
+
+    def clear(self):
+        """Vide le cache."""
+        self.layers.clear()
+        self.nbytes = 0
+
+    def get_statistics(self):
+        """Retourne les statistiques du cache.
+    @return: un dictionnaire contenant hits, misses, nb_layers et nbytes."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "nb_layers": len(self.layers),
+            "nbytes": self.nbytes
+        }
@@ -17,6 +17,8 @@ from __future__ import division, print_function, absolute_import
 
 import os
 
+import numpy as np
+
 
 class CoverageReader(object):
     
@@ -57,6 +59,54 @@ class CoverageReader(object):
     def read_axis_t(self,tmin,tmax,timestamp):
         raise NotImplementedError(str(type(self)) + " don't have implemented the function 'read_axis_t()'.")
 
+    # Block
+    def read_variable_block(self, name, tmin, tmax, xmin, xmax, ymin, ymax):
+        """Retourne un bloc contigu [t,y,x] (ou [t,composante,y,x] pour un vecteur) de la variable souhaitée.
+    Par défaut le bloc est construit à partir de read_variable_<name>_at_time(), les lecteurs peuvent surcharger
+    cette fonction pour lire l'hyperslab en un seul appel.
+    @param name: nom de la variable (ex: "sea_surface_temperature")
+    @param tmin,tmax: index du temps
+    @param xmin,xmax,ymin,ymax: hyperslab horizontal
+    @return: un tableau [t,y,x] ou [t,composante,y,x]."""
+
+        function_name = "read_variable_" + str(name) + "_at_time"
+        if not hasattr(self, function_name):
+            raise ValueError("Unknown variable '" + str(name) + "'")
+
+        layers = []
+        for index_t in range(tmin, tmax):
+            layer = getattr(self, function_name)(index_t, xmin, xmax, ymin, ymax)
+            if isinstance(layer, (list, tuple)):
+                layer = np.ma.stack(layer)
+            layers.append(layer)
+
+        return np.ma.stack(layers)
+
+    def read_variable_level_block(self, name, tmin, tmax, zmin, zmax, xmin, xmax, ymin, ymax):
+        """Retourne un bloc contigu [t,z,y,x] (ou [t,z,composante,y,x] pour un vecteur) de la variable souhaitée.
+    Par défaut le bloc est construit à partir de read_variable_<name>_at_time_and_depth(), les lecteurs peuvent
+    surcharger cette fonction pour lire l'hyperslab en un seul appel.
+    @param name: nom de la variable (ex: "sea_water_temperature")
+    @param tmin,tmax: index du temps
+    @param zmin,zmax: index des niveaux
+    @param xmin,xmax,ymin,ymax: hyperslab horizontal
+    @return: un tableau [t,z,y,x] ou [t,z,composante,y,x]."""
+
+        function_name = "read_variable_" + str(name) + "_at_time_and_depth"
+        if not hasattr(self, function_name):
+            raise ValueError("Unknown variable '" + str(name) + "'")
+
+        layers = []
+        for index_t in range(tmin, tmax):
+            for index_z in range(zmin, zmax):
+                layer = getattr(self, function_name)(index_t, index_z, xmin, xmax, ymin, ymax)
+                if isinstance(layer, (list, tuple)):
+                    layer = np.ma.stack(layer)
+                layers.append(layer)
+
+        layers = np.ma.stack(layers)
+        return np.ma.reshape(layers, (tmax - tmin, zmax - zmin) + np.shape(layers)[1:])
+
     # Variables
     def read_variable_longitude(self,xmin,xmax,ymin,ymax):
         raise NotImplementedError(str(type(self)) + " don't have implemented the function 'read_variable_longitude()'.")
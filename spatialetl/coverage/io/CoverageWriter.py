@@ -14,6 +14,11 @@
 # Author : Fabien Rétif - fabien.retif@zoho.com
 #
 from __future__ import division, print_function, absolute_import
+
+import numpy as np
+from mpi4py import MPI
+
+
 class CoverageWriter(object):
     
     def __init__(self, cov,myFile):
@@ -23,6 +28,101 @@ class CoverageWriter(object):
     def close(self):
         raise NotImplementedError(str(type(self)) + " don't have implemented the function 'close()'.")
 
+    def get_write_function(self, name):
+        """Retourne la fonction d'écriture d'une variable.
+    @param name: nom de la variable (ex: "sea_surface_temperature" pour write_variable_sea_surface_temperature())
+    @return: la fonction d'écriture."""
+        function = getattr(self, "write_variable_" + str(name), None)
+        if function is None:
+            raise NotImplementedError(str(type(self)) + " don't have implemented the function 'write_variable_" + str(
+                name) + "()'.")
+        return function
+
+    def write_variables(self, names):
+        """Écrit plusieurs variables. Par défaut, les variables sont écrites l'une après l'autre : les writers qui le
+    peuvent redéfinissent cette fonction pour lire et écrire toutes les variables en un seul parcours du temps.
+    @param names: liste des noms des variables (ex: ["sea_surface_height_above_mean_sea_level", "wind_10m"])."""
+        for name in names:
+            self.get_write_function(name)()
+
+    def get_time_range(self, rank, time_dependent=True):
+        """Retourne les pas de temps globaux d'un rang.
+    @param rank: le rang
+    @param time_dependent: False pour une variable sans dimension temporelle : elle a un seul pas de temps, écrit
+    par les rangs qui ont le premier pas de temps (ils couvrent une fois toute la grille horizontale).
+    @return: (tmin, tmax)"""
+        if time_dependent is False:
+            if "dst_global_t" in self.coverage.map_mpi[rank] and self.coverage.map_mpi[rank]["dst_global_t"].start > 0:
+                return 0, 0
+            return 0, 1
+        return self.coverage.map_mpi[rank]["dst_global_t"].start, self.coverage.map_mpi[rank]["dst_global_t"].stop
+
+    def read_local_layer(self, read_layer, time_index, nb_layers, time_dependent=True):
+        """Lit une couche de ce rang.
+    @param read_layer: fonction de lecture de la couverture (ex : self.coverage.read_variable_wind_10m_at_time)
+    @param time_index: index local du pas de temps
+    @param nb_layers: nombre de composantes de la variable (2 pour un vecteur)
+    @param time_dependent: False pour une variable sans dimension temporelle
+    @return: un tableau float64 contigu [nb_layers,y,x], les valeurs masquées valent NaN."""
+        if time_dependent:
+            local_data = read_layer(time_index)
+        else:
+            local_data = read_layer()
+
+        local_data = np.ma.filled(np.ma.asarray(local_data, dtype=np.float64), np.nan)
+        shape = (nb_layers, self.coverage.map_mpi[self.coverage.rank]["dst_local_y_size"],
+                 self.coverage.map_mpi[self.coverage.rank]["dst_local_x_size"])
+        return np.ascontiguousarray(np.reshape(local_data, shape))
+
+    def gather_layer(self, local_data, time_index, nb_layers, time_dependent=True):
+        """Rassemble sur le rang 0 la couche d'un pas de temps (MPI Gatherv). Tous les rangs doivent appeler cette
+    fonction, ceux qui n'ont pas ce pas de temps avec local_data à None.
+    @param local_data: couche [nb_layers,y,x] de ce rang ou None
+    @param time_index: index global du pas de temps
+    @param nb_layers: nombre de composantes de la variable
+    @param time_dependent: False pour une variable sans dimension temporelle
+    @return: sur le rang 0 la couche globale [nb_layers,y,x] (NaN hors des rangs), None sur les autres rangs."""
+        counts = []
+        for source in range(0, self.coverage.size):
+            tmin, tmax = self.get_time_range(source, time_dependent)
+            if tmin <= time_index < tmax:
+                counts.append(int(nb_layers * self.coverage.map_mpi[source]["dst_local_y_size"] *
+                                  self.coverage.map_mpi[source]["dst_local_x_size"]))
+            else:
+                counts.append(0)
+
+        if local_data is None:
+            sendbuf = np.empty(0, dtype=np.float64)
+        else:
+            sendbuf = np.ascontiguousarray(local_data, dtype=np.float64).ravel()
+
+        if self.coverage.rank != 0:
+            self.coverage.comm.Gatherv(sendbuf, None, root=0)
+            return None
+
+        displacements = [0]
+        for count in counts[:-1]:
+            displacements.append(displacements[-1] + count)
+
+        recvbuf = np.empty(sum(counts), dtype=np.float64)
+        self.coverage.comm.Gatherv(sendbuf, [recvbuf, counts, displacements, MPI.DOUBLE], root=0)
+
+        global_data = np.empty([nb_layers,
+                                self.coverage.get_y_size(type="target_global"),
+                                self.coverage.get_x_size(type="target_global")])
+        global_data[:] = np.nan
+
+        for source in range(0, self.coverage.size):
+            if counts[source] > 0:
+                global_data[:,
+                            self.coverage.map_mpi[source]["dst_global_y"],
+                            self.coverage.map_mpi[source]["dst_global_x"]] = np.reshape(
+                    recvbuf[displacements[source]:displacements[source] + counts[source]],
+                    (nb_layers, self.coverage.map_mpi[source]["dst_local_y_size"],
+                     self.coverage.map_mpi[source]["dst_local_x_size"]))
+
+        return global_data
+
     def write_variable_longitude(self):
         raise NotImplementedError(str(type(self)) + " don't have implemented the function 'write_variable_longitude()'.")
 
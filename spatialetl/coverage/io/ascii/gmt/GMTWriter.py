@@ -18,6 +18,7 @@ from __future__ import division, print_function, absolute_import
 import numpy as np
 
 from spatialetl.coverage.io.CoverageWriter import CoverageWriter
+from spatialetl.utils.text import write_columns
 
 
 class GMTWriter(CoverageWriter):
@@ -28,18 +29,22 @@ class GMTWriter(CoverageWriter):
 
         self.file = open(self.filename, "w")
 
-    def write_variable_axis(self):
-
+    def read_axes(self):
+        """Retourne les longitudes et latitudes de chaque maille.
+    @return: (lon, lat) en deux dimensions [y,x]"""
         lon = self.coverage.read_axis_x()
         lat = self.coverage.read_axis_y()
+        if np.ndim(lon) == 1:
+            lon, lat = np.meshgrid(lon, lat)
+        return lon, lat
+
+    def write_variable_axis(self):
+
+        lon, lat = self.read_axes()
 
         file = open(self.filename, "w")
         file.write("#Longitude \t Latitude\n")
-        for i in range(0, len(lon[1])):
-            for j in range(0, len(lon)):
-                # print i,j
-
-                file.write(str(lon[j, i]) + "\t" + str(lat[j, i]) + "\t" + "\n")
+        write_columns(file, [np.transpose(lon), np.transpose(lat)], end="\t\n")
 
         file.close()
 
@@ -48,63 +53,48 @@ class GMTWriter(CoverageWriter):
         
     def write_variable_bathymetry(self): 
         
-        lon = self.coverage.read_axis_x()
-        lat = self.coverage.read_axis_y()
+        lon, lat = self.read_axes()
         data =  self.coverage.read_variable_bathymetry()
-        print(np.shape(data))
 
         self.file.write("#Longitude \t Latitude \t h (m)\n")
-        for i in range(0, len(lon)):
-            for j in range(0, len(lat)):
-                #print i,j
-                
-                self.file.write(str(lon[i])+"\t"+str(lat[j])+"\t"+str(data[j,i])+"\n")
+        write_columns(self.file, [np.transpose(lon), np.transpose(lat), np.transpose(data)])
 
-        
     def write_variable_current_at_time_and_depth(self,time,z):
         
-        lon = self.coverage.read_axis_x()
-        lat = self.coverage.read_axis_y()
+        lon, lat = self.read_axes()
         cur = self.coverage.read_variable_current_at_time_and_depth(time,z)
         mask = self.coverage.read_variable_2D_mask()
-        
+
+        # Une maille sur 6, dans la mer
+        subset = np.s_[::6, ::6]
+        valid = np.transpose(mask[subset]) == 1.
+
         file = open(self.filename, "w")  
         file.write("#Longitude \t Latitude \t u comp (m/s) \t v comp (m/s)\n")
-        for i in range(0, self.coverage.get_x_size(),6):
-            for j in range(0, self.coverage.get_y_size(),6):
-                    if(mask[j,i]==1.):
-                        file.write(str(lon[j,i])+"\t"+str(lat[j,i])+"\t"+str(cur[0][j,i])+"\t"+str(cur[1][j,i])+"\n")
+        write_columns(file, [np.transpose(lon[subset])[valid], np.transpose(lat[subset])[valid],
+                             np.transpose(cur[0][subset])[valid], np.transpose(cur[1][subset])[valid]])
                 
         file.close()
         
     def write_variable_current_at_time(self,time):
         
-        lon = self.coverage.read_axis_x()
-        lat = self.coverage.read_axis_y()
+        lon, lat = self.read_axes()
         ucur = self.coverage.read_variable_u_current_at_time(time)
         vcur = self.coverage.read_variable_v_current_at_time(time)
         
         file = open(self.filename, "w")  
         file.write("#Longitude \t Latitude \t u comp (m/s) \t v comp (m/s)\n")  
-        for i in range(0, self.coverage.get_x_size()):
-            for j in range(0, self.coverage.get_y_size()):
-                
-                file.write(str(lon[j,i])+"\t"+str(lat[j,i])+"\t"+str(ucur[j,i])+"\t"+str(vcur[j,i])+"\n")  
+        write_columns(file, [np.transpose(lon), np.transpose(lat), np.transpose(ucur), np.transpose(vcur)])
                 
         file.close()
 
     def write_variable_ssh_at_time(self, time):
 
-        lon = self.coverage.read_axis_x()
-        lat = self.coverage.read_axis_y()
+        lon, lat = self.read_axes()
         ssh = self.coverage.read_variable_ssh_at_time(time)
 
         file = open(self.filename, "w")
         file.write("#Longitude \t Latitude \t u comp (m/s) \t v comp (m/s)\n")
-        for i in range(0, self.coverage.get_x_size()):
-            for j in range(0, self.coverage.get_y_size()):
-                file.write(
-                    str(lon[j, i]) + "\t" + str(lat[j, i]) + "\t" + str(ssh[j, i]) + "\n")
+        write_columns(file, [np.transpose(lon), np.transpose(lat), np.transpose(ssh)])
 
         file.close()
-
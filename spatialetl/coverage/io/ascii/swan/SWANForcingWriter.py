@@ -19,88 +19,60 @@ import numpy as np
 
 from spatialetl.coverage.io.CoverageWriter import CoverageWriter
 from spatialetl.utils.logger import logging
+from spatialetl.utils.text import write_columns
 
 
 class SWANForcingWriter(CoverageWriter):
+    """
+La classe SWANForcingWriter écrit le vent à 10 m d'une couverture dans un fichier de forçage ASCII SWAN.
+
+Pour chaque pas de temps, la date puis les composantes u et v sont écrites, une valeur par ligne, colonne par
+colonne (x puis y). Les couches sont rassemblées sur le rang 0 un pas de temps à la fois et écrites aussitôt : la
+mémoire du rang 0 reste de l'ordre d'une couche [y,x].
+
+@param cov: la couverture
+@param myFile: fichier de forçage
+"""
 
     def __init__(self,cov,myFile):
         CoverageWriter.__init__(self,cov,myFile);
 
-        self.file = open(self.filename, "w")
+        self.file = None
+        if self.coverage.rank == 0:
+            self.file = open(self.filename, "w")
 
     def close(self):
-        self.file.close()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def write_layer(self, data):
+        """Écrit une couche [y,x], une valeur par ligne, colonne par colonne. Les valeurs sont écrites comme
+    str(valeur), à l'identique de l'écriture valeur par valeur.
+    @param data: la couche"""
+        write_columns(self.file, [np.transpose(data)])
 
     def write_variable_wind_10m(self):
 
-        if self.coverage.rank == 0:
-            logging.info('[SWANForcingWriter] Gathering data from all processors')
-            global_data = np.empty(
-                [self.coverage.get_t_size(type="target_global"),
-                 2,
-                 self.coverage.get_y_size(type="target_global"),
-                 self.coverage.get_x_size(type="target_global")])
-            global_data[:] = np.nan
-
-        for time_index in range(0,self.coverage.get_t_size()):
-
-            local_data = self.coverage.read_variable_wind_10m_at_time(time_index)
-
-            if self.coverage.rank != 0:
-                self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-            else:
-                # Pour le proc n°1
-                global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                            0,
-                            self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                            self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[0]
-
-                global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                            1,
-                            self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                            self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[1]
-
-                # Pour les autres
-                for source in range(1,self.coverage.size):
-                    recvbuf = np.empty([2,self.coverage.map_mpi[source]["dst_local_y_size"],self.coverage.map_mpi[source]["dst_local_x_size"]])
-                    self.coverage.comm.Recv(recvbuf,source=source)
-
-                    global_data[self.coverage.map_mpi[source]["dst_global_t"].start+time_index,
-                                0,
-                         self.coverage.map_mpi[source]["dst_global_y"],
-                         self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[0]
-
-                    global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                1,
-                                self.coverage.map_mpi[source]["dst_global_y"],
-                                self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[1]
-
-        self.coverage.comm.barrier()
+        times = self.coverage.read_axis_t(type="target_global")
+        tmin, tmax = self.get_time_range(self.coverage.rank)
 
         if self.coverage.rank == 0:
-
             logging.info('[SWANForcingWriter] Writing variable \'Wind 10m\'')
 
-            file = open(self.filename, "w")
-
-            for time_index in range(0,self.coverage.get_t_size(type="target_global")):
-                time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                logging.debug('[SWANForcingWriter] Writing variable \'Wind 10m\' at time \'' + str(time) + '\'')
-
-                file.write(time.strftime("%Y%m%d.%H%M%S")+"\n")
-
-                for vector in range(0,2):
-                    if vector == 0:
-                        file.write("u-component\n")
-                    else:
-                        file.write("v-component\n")
-                    for i in range(0, self.coverage.get_x_size()):
-                        for j in range(0, self.coverage.get_y_size()):
-                            file.write(str(global_data[time_index][vector][j,i])+"\n")
-
-            file.close()
-
+        for time_index in range(0, len(times)):
+            local_data = None
+            if tmin <= time_index < tmax:
+                local_data = self.read_local_layer(self.coverage.read_variable_wind_10m_at_time, time_index - tmin, 2)
 
+            global_data = self.gather_layer(local_data, time_index, 2)
 
+            if self.coverage.rank == 0:
+                logging.debug('[SWANForcingWriter] Writing variable \'Wind 10m\' at time \'' + str(
+                    times[time_index]) + '\'')
 
+                self.file.write(times[time_index].strftime("%Y%m%d.%H%M%S") + "\n")
+                self.file.write("u-component\n")
+                self.write_layer(global_data[0])
+                self.file.write("v-component\n")
+                self.write_layer(global_data[1])
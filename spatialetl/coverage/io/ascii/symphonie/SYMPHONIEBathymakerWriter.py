@@ -18,6 +18,7 @@ from __future__ import division, print_function, absolute_import
 import numpy as np
 
 from spatialetl.coverage.io.CoverageWriter import CoverageWriter
+from spatialetl.utils.text import write_columns
 
 
 class SYMPHONIEBathymakerWriter(CoverageWriter):
@@ -33,9 +34,7 @@ class SYMPHONIEBathymakerWriter(CoverageWriter):
         lat = self.coverage.read_axis_y()
 
         file = open(self.filename, "w")
-        for i in range(0, len(lon[1])):
-            for j in range(0, len(lon)):
-                file.write(str(lat[j]) + "\t" + str(lon[i]) + "\t" + "\n")
+        write_columns(file, [np.tile(lat, len(lon)), np.repeat(lon, len(lat))], end="\t\n")
 
         file.close()
 
@@ -46,10 +45,9 @@ class SYMPHONIEBathymakerWriter(CoverageWriter):
         
         lon = self.coverage.read_axis_x()
         lat = self.coverage.read_axis_y()
-        data =  self.coverage.read_variable_bathymetry()
-        for i in range(0, len(lon)):
-            for j in range(0, len(lat)):
-                if data[j,i] != np.nan and str(data[j,i]) != "nan" :
-                    self.file.write(str(lat[j])+"\t"+str(lon[i])+"\t"+str(data[j,i])+"\n")
-
+        data =  np.transpose(np.ma.asarray(self.coverage.read_variable_bathymetry()))
 
+        # Colonne par colonne (x puis y), sans les valeurs manquantes (masquées ou NaN)
+        valid = (np.ma.getmaskarray(data) == False) & (np.isnan(np.ma.getdata(data)) == False)
+        write_columns(self.file, [np.tile(lat, len(lon))[valid.ravel()], np.repeat(lon, len(lat))[valid.ravel()],
+                                  np.ma.getdata(data)[valid]])
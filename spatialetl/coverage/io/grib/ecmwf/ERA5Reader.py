@@ -24,6 +24,7 @@ import numpy as np
 from spatialetl.coverage.TimeCoverage import TimeCoverage
 from spatialetl.coverage.io.CoverageReader import CoverageReader
 from spatialetl.exception.VariableNameError import VariableNameError
+from spatialetl.utils.TimeAxis import TimeAxis
 from spatialetl.utils.VariableDefinition import VariableDefinition
 from spatialetl.utils.logger import logging
 
@@ -180,13 +181,11 @@ class ERA5Reader(CoverageReader):
     def read_axis_t(self, tmin, tmax, timestamp):
         try:
             if "time" in self.ds_instant.variables:
-                data = self.ds_instant.variables['time'].data[tmin:tmax]
-                result = [datetime.utcfromtimestamp(t) \
-                          for t in data]
+                # Secondes depuis le 1970-01-01
+                result = TimeAxis(self.ds_instant.variables['time'].data[tmin:tmax])
 
                 if timestamp == 1:
-                    return [(t - TimeCoverage.TIME_DATUM).total_seconds() \
-                            for t in result];
+                    return result.to_timestamps(TimeCoverage.TIME_DATUM)
                 else:
                     return result;
             else:
@@ -49,9 +49,7 @@ class ImageReader(CoverageReader):
         if self.x is None:
             width = self.file.RasterXSize
 
-            self.x = np.zeros([width])
-            for x in range(0, width):
-                self.x[x] = self.pixel2coord(x, 0)[0]
+            self.x = self.pixel2coord(np.arange(width), 0)[0]
 
         return self.x[xmin:xmax]
 
@@ -59,9 +57,7 @@ class ImageReader(CoverageReader):
         if self.y is None:
             height = self.file.RasterYSize
 
-            self.y = np.zeros([height])
-            for y in range(0, height):
-                self.y[y] = self.pixel2coord(0, y)[1]
+            self.y = self.pixel2coord(0, np.arange(height))[1]
 
         return self.y[ymin:ymax]
 
@@ -93,7 +89,7 @@ class ImageReader(CoverageReader):
     def pixel2coord(self, y, x):
         # unravel GDAL affine transform parameters
         c, a, b, f, d, e = self.file.GetGeoTransform()
-        """Returns global coordinates to pixel center using base-0 raster index"""
+        """Returns global coordinates to pixel center using base-0 raster index (scalars or numpy arrays)"""
         xp = a * y + b * x + a * 0.5 + b * 0.5 + c
         yp = d * y + e * x + d * 0.5 + e * 0.5 + f
         return (xp, yp)
@@ -18,7 +18,6 @@ from __future__ import division, print_function, absolute_import
 import numpy as np
 from mpi4py import MPI
 from netCDF4 import Dataset
-from netCDF4 import date2num
 from numpy import int16, float32, float64
 
 from spatialetl.coverage.LevelCoverage import LevelCoverage
@@ -31,14 +30,66 @@ from spatialetl.utils.logger import logging
 
 
 class DefaultWriter (CoverageWriter):
-
-    def __init__(self,cov,myFile,mode='w'):
+    """
+La classe DefaultWriter écrit une Coverage dans un fichier NetCDF (écriture parallèle MPI).
+
+Le stockage des variables (découpage en blocs, compression, quantification, accès parallèle) est défini par un
+profil (DefaultWriter.PROFILES) dont chaque option peut être modifiée avec le paramètre options :
+    - chunking : None (stockage contigu), "map" (un bloc par pas de temps et par niveau, aligné sur le découpage MPI),
+    "timeseries" (blocs couvrant tout l'axe du temps sur une petite zone) ou un dictionnaire {dimension : taille}.
+    - zlib, complevel, shuffle : compression zlib.
+    - significant_digits, quantize_mode : quantification (avec perte) des variables réelles.
+    - parallel_access : "independent" ou "collective". La compression impose un accès collectif.
+    - buffer_size : taille maximale (en octets) du tampon de chaque rang. Les pas de temps (et les niveaux) sont
+    accumulés dans ce tampon puis écrits en une seule écriture (hyperslab).
+    - buffer_time_steps : nombre maximal de pas de temps dans le tampon (None = limité par buffer_size uniquement).
+
+@param cov: Coverage à écrire
+@param myFile: fichier NetCDF
+@param mode: 'w' (création) ou 'a' (ajout de variables)
+@param profile: nom du profil
+@param options: dictionnaire des options modifiant le profil
+"""
+    CHUNK_MAX_BYTES = 4 * 1024 * 1024
+
+    PROFILES = {
+        "default": {"chunking": None, "zlib": False, "complevel": 4, "shuffle": True,
+                    "significant_digits": None, "quantize_mode": "BitGroom", "parallel_access": "independent",
+                    "buffer_size": 64 * 1024 * 1024, "buffer_time_steps": None},
+        "map": {"chunking": "map", "zlib": True, "complevel": 4, "shuffle": True,
+                "significant_digits": None, "quantize_mode": "BitGroom", "parallel_access": "collective",
+                "buffer_size": 64 * 1024 * 1024, "buffer_time_steps": None},
+        "timeseries": {"chunking": "timeseries", "zlib": True, "complevel": 4, "shuffle": True,
+                       "significant_digits": None, "quantize_mode": "BitGroom", "parallel_access": "collective",
+                       "buffer_size": 64 * 1024 * 1024, "buffer_time_steps": None},
+        "archive": {"chunking": "map", "zlib": True, "complevel": 6, "shuffle": True,
+                    "significant_digits": 4, "quantize_mode": "GranularBitRound", "parallel_access": "collective",
+                    "buffer_size": 64 * 1024 * 1024, "buffer_time_steps": None}
+    }
+
+    def __init__(self,cov,myFile,mode='w',profile="default",options=None):
         CoverageWriter.__init__(self,cov,myFile);
         self.mode=mode
         format = 'NETCDF4_CLASSIC'
 
+        if profile not in DefaultWriter.PROFILES:
+            raise ValueError("Unknown profile '" + str(profile) + "'. Available profiles are " + str(
+                sorted(DefaultWriter.PROFILES.keys())))
+
+        self.options = dict(DefaultWriter.PROFILES[profile])
+        if options is not None:
+            unknown = set(options.keys()) - set(self.options.keys())
+            if len(unknown) > 0:
+                raise ValueError("Unknown options " + str(sorted(unknown)))
+            self.options.update(options)
+
+        if self.options["parallel_access"] not in ("independent", "collective"):
+            raise ValueError("parallel_access must be 'independent' or 'collective'")
+
+        self.pending_time_steps = None
+
         if self.mode=='w':
-            self.ncfile = Dataset(self.filename, 'w', parallel=True, comm=self.coverage.comm, info=MPI.Info(), format=format)
+            self.ncfile = self.open_dataset('w', format)
             self.ncfile.description = 'Generated with pySpatialETL'
 
             # dimensions
@@ -103,7 +154,7 @@ class DefaultWriter (CoverageWriter):
                 times.conventions = "UTC time"
 
                 times[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"]] = date2num(self.coverage.read_axis_t(), units = times.units, calendar = times.calendar)
+                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"]] = self.coverage.read_axis_t().to_num(times.units, times.calendar)
 
             if(isinstance(self.coverage, LevelCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
 
@@ -121,8 +172,7 @@ class DefaultWriter (CoverageWriter):
 
         if self.mode=="a":
 
-            self.ncfile = Dataset(self.filename, 'a', parallel=True, comm=self.coverage.comm, info=MPI.Info(),
-                                  format=format)
+            self.ncfile = self.open_dataset('a', format)
             #self.ncfile.description = 'Generated with pySpatialETL'
 
             # dimensions
@@ -145,16 +195,299 @@ class DefaultWriter (CoverageWriter):
                 if self.ncfile.dimensions['depth'].size != self.coverage.get_z_size(type="target"):
                     raise ValueError("Depth dimensions hasn't the same size than the Coverage. Unable to append the file.")
 
+            if self.options["parallel_access"] == "collective":
+                for var in self.ncfile.variables.values():
+                    var.set_collective(True)
+
+    def open_dataset(self, mode, format):
+        """Ouvre le fichier NetCDF. Le fichier n'est ouvert en parallèle (MPI-IO) que si la couverture est découpée sur
+    plusieurs rangs : un seul rang écrit sans MPI-IO, ce qui ne nécessite pas une bibliothèque NetCDF parallèle.
+    @param mode: 'w' ou 'a'
+    @param format: format du fichier
+    @return: le Dataset."""
+        if self.coverage.size > 1:
+            return Dataset(self.filename, mode, parallel=True, comm=self.coverage.comm, info=MPI.Info(), format=format)
+        return Dataset(self.filename, mode, format=format)
+
     def close(self):
         self.ncfile.close()
 
+    def get_mpi_block_sizes(self):
+        """Retourne la plus grande taille des blocs du découpage MPI pour chaque dimension découpée.
+    @return: un dictionnaire {nom de la dimension : taille}"""
+        blocks = {}
+        for dimension, key in ((VariableDefinition.VARIABLE_NAME['time'], "dst_local_t_size"),
+                               (VariableDefinition.VARIABLE_NAME['latitude'], "dst_local_y_size"),
+                               (VariableDefinition.VARIABLE_NAME['longitude'], "dst_local_x_size")):
+            sizes = [map[key] for map in self.coverage.map_mpi if key in map]
+            if len(sizes) > 0:
+                blocks[dimension] = max(sizes)
+        return blocks
+
+    def compute_chunksizes(self, datatype, dimensions):
+        """Calcule la taille des blocs d'une variable selon l'option chunking.
+    @param datatype: type de la variable
+    @param dimensions: dimensions de la variable
+    @return: la liste des tailles des blocs ou None (stockage contigu)."""
+        chunking = self.options["chunking"]
+        if chunking is None or len(dimensions) == 0:
+            return None
+
+        sizes = [len(self.ncfile.dimensions[dimension]) for dimension in dimensions]
+
+        if isinstance(chunking, dict):
+            return [max(1, min(size, chunking.get(dimension, size))) for dimension, size in zip(dimensions, sizes)]
+
+        if chunking not in ("map", "timeseries"):
+            raise ValueError("Unknown chunking '" + str(chunking) + "'")
+
+        time = VariableDefinition.VARIABLE_NAME['time']
+        depth = VariableDefinition.VARIABLE_NAME['depth']
+        blocks = self.get_mpi_block_sizes()
+
+        chunks = []
+        for dimension, size in zip(dimensions, sizes):
+            if dimension == time:
+                chunks.append(size if chunking == "timeseries" else 1)
+            elif dimension == depth:
+                chunks.append(1)
+            else:
+                chunks.append(max(1, min(size, blocks.get(dimension, size))))
+
+        # On réduit les blocs trop gros : d'abord l'horizontale, puis le temps
+        itemsize = np.dtype(datatype).itemsize
+        horizontal = [index for index, dimension in enumerate(dimensions) if dimension not in (time, depth)]
+        while np.prod(chunks) * itemsize > DefaultWriter.CHUNK_MAX_BYTES:
+            candidates = [index for index in horizontal if chunks[index] > 1]
+            if len(candidates) == 0:
+                candidates = [index for index in range(0, len(chunks)) if chunks[index] > 1]
+            if len(candidates) == 0:
+                break
+            largest = max(candidates, key=lambda index: chunks[index])
+            chunks[largest] = int(np.ceil(chunks[largest] / 2))
+
+        return chunks
+
+    def create_variable(self, name, datatype, dimensions, fill_value=None):
+        """Crée une variable avec le découpage, la compression, la quantification et l'accès parallèle des options
+    du writer.
+    @param name: nom de la variable
+    @param datatype: type de la variable
+    @param dimensions: dimensions de la variable
+    @param fill_value: valeur de remplissage
+    @return: la variable NetCDF."""
+        kwargs = {"fill_value": fill_value}
+
+        chunksizes = self.compute_chunksizes(datatype, dimensions)
+        if chunksizes is not None:
+            kwargs["chunksizes"] = chunksizes
+
+        if self.options["zlib"]:
+            kwargs["zlib"] = True
+            kwargs["complevel"] = self.options["complevel"]
+            kwargs["shuffle"] = self.options["shuffle"]
+
+        quantize = self.options["significant_digits"] is not None and np.dtype(datatype).kind == 'f' \
+                   and len(dimensions) > 1
+        if quantize:
+            kwargs["significant_digits"] = self.options["significant_digits"]
+            kwargs["quantize_mode"] = self.options["quantize_mode"]
+
+        var = self.ncfile.createVariable(name, datatype, dimensions, **kwargs)
+
+        # Les filtres HDF5 (compression, quantification) imposent l'écriture collective
+        if self.options["parallel_access"] == "collective" or self.options["zlib"] or quantize:
+            var.set_collective(True)
+
+        return var
+
+    def mask_invalid(self, var, data):
+        """Masque les NaN des données d'une variable quantifiée : la quantification GranularBitRound les remplace
+    par -0.0. Les valeurs masquées sont écrites avec le _FillValue de la variable.
+    @param var: variable NetCDF
+    @param data: données à écrire
+    @return: les données (masquées si la variable est quantifiée)."""
+        if var.quantization() is None:
+            return data
+        return np.ma.masked_invalid(data)
+
+    def is_collective(self):
+        """Retourne True si des variables peuvent être écrites en accès collectif : tous les rangs doivent alors
+    faire le même nombre d'écritures."""
+        return self.options["parallel_access"] == "collective" or self.options["zlib"] or \
+               self.options["significant_digits"] is not None
+
+    def compute_write_blocks(self, t_size, z_size, layer_nbytes):
+        """Découpe les pas de temps (et les niveaux) de ce rang en blocs tenant dans le tampon d'écriture.
+    @param t_size: nombre de pas de temps du rang
+    @param z_size: nombre de niveaux (None pour une variable sans niveau)
+    @param layer_nbytes: taille en octets d'une couche [y,x] de toutes les variables écrites
+    @return: la liste des blocs (tmin, tmax, zmin, zmax). Des blocs vides sont ajoutés en accès collectif pour que
+    tous les rangs fassent le même nombre d'écritures."""
+        levels = 1 if z_size is None else z_size
+        budget = max(1, int(self.options["buffer_size"] // max(1, layer_nbytes)))
+
+        blocks = []
+        if budget >= levels:
+            # Plusieurs pas de temps complets par écriture
+            t_step = max(1, budget // levels)
+            if self.options["buffer_time_steps"] is not None:
+                t_step = max(1, min(t_step, self.options["buffer_time_steps"]))
+            for tmin in range(0, t_size, t_step):
+                blocks.append((tmin, min(tmin + t_step, t_size), 0, levels))
+        else:
+            # Un pas de temps ne tient pas dans le tampon : on découpe les niveaux
+            for tmin in range(0, t_size):
+                for zmin in range(0, levels, budget):
+                    blocks.append((tmin, tmin + 1, zmin, min(zmin + budget, levels)))
+
+        if self.is_collective() and self.coverage.size > 1:
+            nb_blocks = self.coverage.comm.allreduce(len(blocks), op=MPI.MAX)
+            blocks.extend([(t_size, t_size, 0, levels)] * (nb_blocks - len(blocks)))
+
+        return blocks
+
+    def write_time_steps(self, variables, read_layer, name, levels=False, block=None):
+        """Écrit une ou plusieurs variables [t,y,x] ou [t,z,y,x] (composantes d'un vecteur). Dans write_variables(),
+    l'écriture est différée pour être faite en un seul parcours du temps avec les autres variables.
+    @param variables: liste des variables NetCDF
+    @param read_layer: fonction de lecture d'une couche read_layer(time) ou read_layer(time, level). Elle retourne
+    un tableau [y,x] ou, pour un vecteur, un tableau [y,x] par composante.
+    @param name: nom de la variable pour les logs
+    @param levels: True si les variables ont un axe vertical
+    @param block: nom de la variable de la couverture. S'il est renseigné, chaque bloc d'écriture est lu en un seul
+    appel à read_variable_block() au lieu de read_layer() à chaque pas de temps (et niveau)."""
+        if self.pending_time_steps is not None:
+            self.pending_time_steps.append((variables, read_layer, name, levels, block))
+        else:
+            self.write_time_steps_group([(variables, read_layer, name, levels, block)])
+
+    def write_time_steps_group(self, items):
+        """Écrit des variables en un seul parcours du temps. Les couches lues sont accumulées dans un tampon borné par
+    les options buffer_size et buffer_time_steps puis écrites en un seul hyperslab par bloc de pas de temps (et de
+    niveaux pour une variable seule). Les variables ayant un nom de bloc sont lues bloc par bloc.
+    @param items: liste de (variables, read_layer, name, levels, block) (voir write_time_steps())."""
+        map = self.coverage.map_mpi[self.coverage.rank]
+        times = self.coverage.read_axis_t()
+        depths = None
+        if any([levels for variables, read_layer, name, levels, block in items]):
+            depths = self.coverage.read_axis_z()
+
+        # Couches comptées en float64 (+ le masque)
+        layer_nbytes = map["dst_local_y_size"] * map["dst_local_x_size"] * 9
+        if len(items) == 1:
+            variables, read_layer, name, levels, block = items[0]
+            blocks = self.compute_write_blocks(len(times), len(depths) if levels else None,
+                                               len(variables) * layer_nbytes)
+        else:
+            step_nbytes = sum([len(variables) * (len(depths) if levels else 1) * layer_nbytes
+                               for variables, read_layer, name, levels, block in items])
+            blocks = self.compute_write_blocks(len(times), None, step_nbytes)
+
+        buffers = [None] * len(items)
+        for tmin, tmax, zmin, zmax in blocks:
+
+            for item_index, (variables, read_layer, name, levels, block) in enumerate(items):
+                if block is None or tmin >= tmax:
+                    continue
+
+                logging.info('[DefaultWriter] Writing variable \'' + str(name) + '\' from \'' + str(
+                    times[tmin]) + '\' to \'' + str(times[tmax - 1]) + '\'')
+
+                item_zmin, item_zmax = self.get_item_levels(items, levels, depths, zmin, zmax)
+                if levels:
+                    layers = self.coverage.read_variable_block(block, t_slice=np.s_[tmin:tmax],
+                                                               z_slice=np.s_[item_zmin:item_zmax])
+                else:
+                    # TimeCoverage.read_variable_block() : une TimeLevelCoverage lit aussi des variables sans niveau
+                    layers = TimeCoverage.read_variable_block(self.coverage, block, t_slice=np.s_[tmin:tmax])
+
+                if len(variables) == 1:
+                    layers = [layers]
+
+                if not levels:
+                    layers = [np.ma.asarray(layer)[:, np.newaxis] for layer in layers]
+
+                buffers[item_index] = [np.ma.asarray(layer) for layer in layers]
+
+            for time_index in range(tmin, tmax):
+                for item_index, (variables, read_layer, name, levels, block) in enumerate(items):
+                    if block is not None:
+                        continue
+
+                    logging.info('[DefaultWriter] Writing variable \'' + str(name) + '\' at time \'' + str(
+                        times[time_index]) + '\'')
+
+                    item_zmin, item_zmax = self.get_item_levels(items, levels, depths, zmin, zmax)
+
+                    for level_index in range(item_zmin, item_zmax):
+                        if levels:
+                            layers = read_layer(times[time_index], depths[level_index])
+                        else:
+                            layers = read_layer(times[time_index])
+
+                        if len(variables) == 1:
+                            layers = [layers]
+
+                        if buffers[item_index] is None:
+                            shape = (tmax - tmin, item_zmax - item_zmin, map["dst_local_y_size"],
+                                     map["dst_local_x_size"])
+                            buffers[item_index] = [np.ma.masked_all(shape, dtype=np.asarray(layer).dtype)
+                                                   for layer in layers]
+
+                        for buffer, layer in zip(buffers[item_index], layers):
+                            buffer[time_index - tmin, level_index - item_zmin] = layer
+
+            global_t = np.s_[map["dst_global_t"].start + tmin:map["dst_global_t"].start + tmax]
+            for item_index, (variables, read_layer, name, levels, block) in enumerate(items):
+                item_zmin, item_zmax = self.get_item_levels(items, levels, depths, zmin, zmax)
+
+                for index, var in enumerate(variables):
+                    if buffers[item_index] is None:
+                        data = np.ma.masked_all((0, max(0, item_zmax - item_zmin), map["dst_local_y_size"],
+                                                 map["dst_local_x_size"]), dtype=var.dtype)
+                    else:
+                        data = buffers[item_index][index][0:tmax - tmin, 0:item_zmax - item_zmin]
+
+                    data = self.mask_invalid(var, data)
+                    if levels:
+                        var[global_t, item_zmin:item_zmax, map["dst_global_y"], map["dst_global_x"]] = data
+                    else:
+                        var[global_t, map["dst_global_y"], map["dst_global_x"]] = data[:, 0]
+
+    def get_item_levels(self, items, levels, depths, zmin, zmax):
+        """Retourne les niveaux d'une variable à écrire dans le bloc courant : ceux du bloc pour une variable seule,
+    tous les niveaux sinon (les blocs d'un groupe ne découpent que le temps)."""
+        if len(items) == 1:
+            return zmin, zmax
+        if levels:
+            return 0, len(depths)
+        return 0, 1
+
+    def write_variables(self, names):
+        """Écrit plusieurs variables en un seul parcours du temps : à chaque pas de temps, toutes les variables sont
+    lues (le fichier source n'est ouvert qu'une fois) puis écrites ensemble.
+    @param names: liste des noms des variables (ex: ["sea_surface_height_above_mean_sea_level", "wind_10m"])."""
+        self.pending_time_steps = []
+        try:
+            for name in names:
+                self.get_write_function(name)()
+            items = self.pending_time_steps
+        finally:
+            self.pending_time_steps = None
+
+        if len(items) > 0:
+            if self.coverage.rank == 0:
+                logging.info('[DefaultWriter] Writing ' + str(len(items)) + ' variables in one pass over time')
+            self.write_time_steps_group(items)
+
     # Variables
     def write_variable_mesh_size(self):
 
         if VariableDefinition.VARIABLE_NAME['mesh_size'] in self.ncfile.variables:
             var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['mesh_size']]
         else:
-            var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['mesh_size'], float32, (VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
+            var = self.create_variable(VariableDefinition.VARIABLE_NAME['mesh_size'], float32, (VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
         var.long_name = VariableDefinition.LONG_NAME['mesh_size']
         var.standard_name = VariableDefinition.STANDARD_NAME['mesh_size']
         var.units = VariableDefinition.CANONICAL_UNITS['mesh_size']
@@ -165,14 +498,14 @@ class DefaultWriter (CoverageWriter):
         var[
             self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
             self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-        ] = self.coverage.read_variable_mesh_size()
+        ] = self.mask_invalid(var, self.coverage.read_variable_mesh_size())
 
     def write_variable_mesh_size_factor(self):
 
         if VariableDefinition.VARIABLE_NAME['mesh_size'] in self.ncfile.variables:
             var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['mesh_size']]
         else:
-            var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['mesh_size'], float32, (
+            var = self.create_variable(VariableDefinition.VARIABLE_NAME['mesh_size'], float32, (
             VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),
                                              fill_value=9.96921e+36)
         var.long_name = VariableDefinition.LONG_NAME['mesh_size']
@@ -189,14 +522,14 @@ class DefaultWriter (CoverageWriter):
         var[
             self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
             self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-        ] = factor
+        ] = self.mask_invalid(var, factor)
 
     def write_variable_2D_sea_binary_mask(self):
 
         if VariableDefinition.VARIABLE_NAME['2d_sea_binary_mask'] in self.ncfile.variables:
             var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['2d_sea_binary_mask']]
         else:
-            var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['2d_sea_binary_mask'], int16, (VariableDefinition.VARIABLE_NAME['latitude'],VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=-9999)
+            var = self.create_variable(VariableDefinition.VARIABLE_NAME['2d_sea_binary_mask'], int16, (VariableDefinition.VARIABLE_NAME['latitude'],VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=-9999)
         var.long_name = VariableDefinition.LONG_NAME['2d_sea_binary_mask']
         var.standard_name = VariableDefinition.STANDARD_NAME['2d_sea_binary_mask']
         var.units = VariableDefinition.CANONICAL_UNITS['2d_sea_binary_mask']
@@ -217,7 +550,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['wet_binary_mask'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['wet_binary_mask']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['wet_binary_mask'], float32, (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['wet_binary_mask'], float32, (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),
                                              fill_value=9.96921e+36)
             var.long_name = VariableDefinition.LONG_NAME['wet_binary_mask']
             var.standard_name = VariableDefinition.STANDARD_NAME['wet_binary_mask']
@@ -227,17 +560,8 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.VARIABLE_NAME['wet_binary_mask']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(VariableDefinition.VARIABLE_NAME['wet_binary_mask']) + '\' at time \'' + str(time) + '\'')
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_2D_wet_binary_mask_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_2D_wet_binary_mask_at_time,
+                                  VariableDefinition.VARIABLE_NAME['wet_binary_mask'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -248,7 +572,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['2d_sea_binary_mask'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['2d_sea_binary_mask']]
             else:
-                var = self.ncfile.createVariable(
+                var = self.create_variable(
                     VariableDefinition.VARIABLE_NAME['2d_sea_binary_mask'], float32, (
                     VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'],
                     VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
@@ -261,20 +585,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info('[DefaultWriter] Writing variable \'' + str(
                     VariableDefinition.LONG_NAME['2d_sea_binary_mask']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['2d_sea_binary_mask']) + '\' at time \'' + str(
-                    time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_2D_sea_binary_mask_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_2D_sea_binary_mask_at_time,
+                                  VariableDefinition.LONG_NAME['2d_sea_binary_mask'])
         else:
             raise CoverageError("DefaultWriter",
                                 "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
@@ -286,7 +598,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['2d_land_binary_mask'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['2d_land_binary_mask']]
             else:
-                var = self.ncfile.createVariable(
+                var = self.create_variable(
                     VariableDefinition.VARIABLE_NAME['2d_land_binary_mask'], float32, (
                     VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'],
                     VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
@@ -299,20 +611,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info('[DefaultWriter] Writing variable \'' + str(
                     VariableDefinition.LONG_NAME['2d_land_binary_mask']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['2d_land_binary_mask']) + '\' at time \'' + str(
-                    time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_2D_land_binary_mask_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_2D_land_binary_mask_at_time,
+                                  VariableDefinition.LONG_NAME['2d_land_binary_mask'])
         else:
             raise CoverageError("DefaultWriter",
                                 "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
@@ -326,7 +626,7 @@ class DefaultWriter (CoverageWriter):
         if VariableDefinition.VARIABLE_NAME['bathymetry'] in self.ncfile.variables:
             var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['bathymetry']]
         else:
-            var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['bathymetry'], float32, (VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
+            var = self.create_variable(VariableDefinition.VARIABLE_NAME['bathymetry'], float32, (VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
         var.long_name = VariableDefinition.LONG_NAME['bathymetry']
         var.standard_name = VariableDefinition.STANDARD_NAME['bathymetry']
         var.units = VariableDefinition.CANONICAL_UNITS['bathymetry']
@@ -337,7 +637,7 @@ class DefaultWriter (CoverageWriter):
         var[
         self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
         self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-        ] = self.coverage.read_variable_bathymetry()
+        ] = self.mask_invalid(var, self.coverage.read_variable_bathymetry())
 
     def write_variable_barotropic_sea_water_velocity(self):
 
@@ -346,7 +646,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['barotropic_eastward_sea_water_velocity'] in self.ncfile.variables:
                 ucomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['barotropic_eastward_sea_water_velocity']]
             else:
-                ucomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['barotropic_eastward_sea_water_velocity'],
+                ucomp = self.create_variable(VariableDefinition.VARIABLE_NAME['barotropic_eastward_sea_water_velocity'],
                                               float32,
                                               (VariableDefinition.VARIABLE_NAME['time'],
                                                VariableDefinition.VARIABLE_NAME['latitude'],
@@ -359,7 +659,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['barotropic_northward_sea_water_velocity'] in self.ncfile.variables:
                 vcomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['barotropic_northward_sea_water_velocity']]
             else:
-                vcomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['barotropic_northward_sea_water_velocity'],
+                vcomp = self.create_variable(VariableDefinition.VARIABLE_NAME['barotropic_northward_sea_water_velocity'],
                                               float32,
                                               (VariableDefinition.VARIABLE_NAME['time'],
                                                VariableDefinition.VARIABLE_NAME['latitude'],
@@ -372,22 +672,9 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'Barotropic Sea Water Velocity\'\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'Barotropic Sea Water Velocity\' at time \'' + str(time) + '\'')
-
-                data_u,data_v = self.coverage.read_variable_barotropic_sea_water_velocity_at_time(time)
-
-                ucomp[ self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = data_u
-
-                vcomp[ self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = data_v
-
-                time_index += 1
+            self.write_time_steps([ucomp, vcomp], self.coverage.read_variable_barotropic_sea_water_velocity_at_time,
+                                  'Barotropic Sea Water Velocity',
+                                  block="barotropic_sea_water_velocity")
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -398,7 +685,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['barotropic_sea_water_speed'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['barotropic_sea_water_speed']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['barotropic_sea_water_speed'], float32,
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['barotropic_sea_water_speed'], float32,
                                                  (VariableDefinition.VARIABLE_NAME['time'],
                                                   VariableDefinition.VARIABLE_NAME['latitude'],
                                                   VariableDefinition.VARIABLE_NAME['longitude'],),
@@ -411,20 +698,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info(
                     '[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['barotropic_sea_water_speed']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['barotropic_sea_water_speed']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_barotropic_sea_water_speed_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_barotropic_sea_water_speed_at_time,
+                                  VariableDefinition.LONG_NAME['barotropic_sea_water_speed'])
         else:
             raise CoverageError("DefaultWriter",
                                 "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
@@ -436,7 +711,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['barotropic_sea_water_to_direction'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['barotropic_sea_water_to_direction']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['barotropic_sea_water_to_direction'], float32,
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['barotropic_sea_water_to_direction'], float32,
                                                  (VariableDefinition.VARIABLE_NAME['time'],
                                                   VariableDefinition.VARIABLE_NAME['latitude'],
                                                   VariableDefinition.VARIABLE_NAME['longitude'],),
@@ -449,20 +724,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info('[DefaultWriter] Writing variable \'' + str(
                     VariableDefinition.LONG_NAME['barotropic_sea_water_to_direction']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['barotropic_sea_water_to_direction']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_barotropic_sea_water_to_direction_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_barotropic_sea_water_to_direction_at_time,
+                                  VariableDefinition.LONG_NAME['barotropic_sea_water_to_direction'])
         else:
             raise CoverageError("DefaultWriter",
                                 "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
@@ -474,7 +737,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['barotropic_sea_water_from_direction'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['barotropic_sea_water_from_direction']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['barotropic_sea_water_from_direction'], float32,
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['barotropic_sea_water_from_direction'], float32,
                                                  (VariableDefinition.VARIABLE_NAME['time'],
                                                   VariableDefinition.VARIABLE_NAME['latitude'],
                                                   VariableDefinition.VARIABLE_NAME['longitude'],),
@@ -487,20 +750,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info('[DefaultWriter] Writing variable \'' + str(
                     VariableDefinition.LONG_NAME['barotropic_sea_water_from_direction']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['barotropic_sea_water_from_direction']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_barotropic_sea_water_from_direction_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_barotropic_sea_water_from_direction_at_time,
+                                  VariableDefinition.LONG_NAME['barotropic_sea_water_from_direction'])
         else:
             raise CoverageError("DefaultWriter",
                                 "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
@@ -516,7 +767,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_surface_height_above_mean_sea_level'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_surface_height_above_mean_sea_level']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_surface_height_above_mean_sea_level'], float32, (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['sea_surface_height_above_mean_sea_level'], float32, (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
 
             var.long_name = VariableDefinition.LONG_NAME['sea_surface_height_above_mean_sea_level']
             var.standard_name = VariableDefinition.STANDARD_NAME['sea_surface_height_above_mean_sea_level']
@@ -525,18 +776,9 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['sea_surface_height_above_mean_sea_level'])+'\'')
 
-            time_index=0
-            for time in self.coverage.read_axis_t():
-
-                logging.info('[DefaultWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['sea_surface_height_above_mean_sea_level'])+'\' at time \''+str(time)+'\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_sea_surface_height_above_mean_sea_level_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_surface_height_above_mean_sea_level_at_time,
+                                  VariableDefinition.LONG_NAME['sea_surface_height_above_mean_sea_level'],
+                                  block="sea_surface_height_above_mean_sea_level")
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -547,7 +789,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_surface_height_above_geoid'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_surface_height_above_geoid']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_surface_height_above_geoid'], float32,
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['sea_surface_height_above_geoid'], float32,
                                              (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
             var.long_name = VariableDefinition.LONG_NAME['sea_surface_height_above_geoid']
             var.standard_name = VariableDefinition.STANDARD_NAME['sea_surface_height_above_geoid']
@@ -556,17 +798,8 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_surface_height_above_geoid']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_surface_height_above_geoid']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_sea_surface_height_above_geoid_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_surface_height_above_geoid_at_time,
+                                  VariableDefinition.LONG_NAME['sea_surface_height_above_geoid'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -577,7 +810,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_water_column_thickness'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_water_column_thickness']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_water_column_thickness'],
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['sea_water_column_thickness'],
                                                  float32,
                                                  (VariableDefinition.VARIABLE_NAME['time'],
                                                   VariableDefinition.VARIABLE_NAME['latitude'],
@@ -591,20 +824,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info('[DefaultWriter] Writing variable \'' + str(
                     VariableDefinition.LONG_NAME['sea_water_column_thickness']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_column_thickness']) + '\' at time \'' + str(
-                    time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_sea_water_column_thickness_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_water_column_thickness_at_time,
+                                  VariableDefinition.LONG_NAME['sea_water_column_thickness'])
         else:
             raise CoverageError("DefaultWriter",
                                 "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
@@ -616,7 +837,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_surface_temperature'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_surface_temperature']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_surface_temperature'], float32, (
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['sea_surface_temperature'], float32, (
             VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'],
             VariableDefinition.VARIABLE_NAME['longitude'],),
                                              fill_value=9.96921e+36)
@@ -627,19 +848,9 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_surface_temperature']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['sea_surface_temperature']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_sea_surface_temperature_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_surface_temperature_at_time,
+                                  VariableDefinition.LONG_NAME['sea_surface_temperature'],
+                                  block="sea_surface_temperature")
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -650,7 +861,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_surface_salinity'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_surface_salinity']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_surface_salinity'], float32, (
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['sea_surface_salinity'], float32, (
             VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'],
             VariableDefinition.VARIABLE_NAME['longitude'],),
                                              fill_value=9.96921e+36)
@@ -661,19 +872,9 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_surface_salinity']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['sea_surface_salinity']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_sea_surface_salinity_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_surface_salinity_at_time,
+                                  VariableDefinition.LONG_NAME['sea_surface_salinity'],
+                                  block="sea_surface_salinity")
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -684,7 +885,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['eastward_sea_water_velocity_at_sea_water_surface'] in self.ncfile.variables:
                 ucomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['eastward_sea_water_velocity_at_sea_water_surface']]
             else:
-                ucomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['eastward_sea_water_velocity_at_sea_water_surface'],
+                ucomp = self.create_variable(VariableDefinition.VARIABLE_NAME['eastward_sea_water_velocity_at_sea_water_surface'],
                                               float32,
                                               (VariableDefinition.VARIABLE_NAME['time'],
                                                VariableDefinition.VARIABLE_NAME['latitude'],
@@ -697,7 +898,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['northward_sea_water_velocity_at_sea_water_surface'] in self.ncfile.variables:
                 vcomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['northward_sea_water_velocity_at_sea_water_surface']]
             else:
-                vcomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['northward_sea_water_velocity_at_sea_water_surface'],
+                vcomp = self.create_variable(VariableDefinition.VARIABLE_NAME['northward_sea_water_velocity_at_sea_water_surface'],
                                               float32,
                                               (VariableDefinition.VARIABLE_NAME['time'],
                                                VariableDefinition.VARIABLE_NAME['latitude'],
@@ -710,22 +911,9 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'Sea Water Velocity at Sea Water Surface\'\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'Sea Water Velocity at Sea Water Surface\' at time \'' + str(time) + '\'')
-
-                data_u,data_v = self.coverage.read_variable_sea_water_velocity_at_sea_water_surface_at_time(time)
-
-                ucomp[ self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = data_u
-
-                vcomp[ self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = data_v
-
-                time_index += 1
+            self.write_time_steps([ucomp, vcomp], self.coverage.read_variable_sea_water_velocity_at_sea_water_surface_at_time,
+                                  'Sea Water Velocity at Sea Water Surface',
+                                  block="sea_water_velocity_at_sea_water_surface")
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -741,7 +929,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_water_temperature_at_ground_level'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_water_temperature_at_ground_level']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_water_temperature_at_ground_level'], float32, (
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['sea_water_temperature_at_ground_level'], float32, (
             VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'],
             VariableDefinition.VARIABLE_NAME['longitude'],),
                                              fill_value=9.96921e+36)
@@ -752,19 +940,8 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_water_temperature_at_ground_level']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['sea_water_temperature_at_ground_level']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_sea_water_temperature_at_ground_level_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_water_temperature_at_ground_level_at_time,
+                                  VariableDefinition.LONG_NAME['sea_water_temperature_at_ground_level'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -775,7 +952,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_water_salinity_at_ground_level'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_water_salinity_at_ground_level']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_water_salinity_at_ground_level'], float32, (
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['sea_water_salinity_at_ground_level'], float32, (
             VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'],
             VariableDefinition.VARIABLE_NAME['longitude'],),
                                              fill_value=9.96921e+36)
@@ -786,19 +963,8 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_water_salinity_at_ground_level']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['sea_water_salinity_at_ground_level']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_sea_water_salinity_at_ground_level_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_water_salinity_at_ground_level_at_time,
+                                  VariableDefinition.LONG_NAME['sea_water_salinity_at_ground_level'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -809,7 +975,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['eastward_sea_water_velocity_at_ground_level'] in self.ncfile.variables:
                 ucomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['eastward_sea_water_velocity_at_ground_level']]
             else:
-                ucomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['eastward_sea_water_velocity_at_ground_level'],
+                ucomp = self.create_variable(VariableDefinition.VARIABLE_NAME['eastward_sea_water_velocity_at_ground_level'],
                                               float32,
                                               (VariableDefinition.VARIABLE_NAME['time'],
                                                VariableDefinition.VARIABLE_NAME['latitude'],
@@ -822,7 +988,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['northward_sea_water_velocity_at_ground_level'] in self.ncfile.variables:
                 vcomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['northward_sea_water_velocity_at_ground_level']]
             else:
-                vcomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['northward_sea_water_velocity_at_ground_level'],
+                vcomp = self.create_variable(VariableDefinition.VARIABLE_NAME['northward_sea_water_velocity_at_ground_level'],
                                               float32,
                                               (VariableDefinition.VARIABLE_NAME['time'],
                                                VariableDefinition.VARIABLE_NAME['latitude'],
@@ -835,22 +1001,8 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'Sea Water Velocity at Ground Level\'\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'Sea Water Velocity at Ground Level\' at time \'' + str(time) + '\'')
-
-                data_u,data_v = self.coverage.read_variable_sea_water_velocity_at_ground_level_at_time(time)
-
-                ucomp[ self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = data_u
-
-                vcomp[ self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = data_v
-
-                time_index += 1
+            self.write_time_steps([ucomp, vcomp], self.coverage.read_variable_sea_water_velocity_at_ground_level_at_time,
+                                  'Sea Water Velocity at Ground Level')
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -867,7 +1019,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['depth_sigma'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['depth_sigma']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['depth_sigma'], float32,
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['depth_sigma'], float32,
                                              (VariableDefinition.VARIABLE_NAME['depth'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
             var.long_name = VariableDefinition.LONG_NAME['depth_sigma']
             var.standard_name = VariableDefinition.STANDARD_NAME['depth_sigma']
@@ -881,7 +1033,7 @@ class DefaultWriter (CoverageWriter):
                 var[level_index:level_index + 1,
                 self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
                 self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_depth_at_depth(level)
+                ] = self.mask_invalid(var, self.coverage.read_variable_depth_at_depth(level))
 
                 level_index += 1
         else:
@@ -895,7 +1047,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_water_temperature'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_water_temperature']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_water_temperature'], float32,
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['sea_water_temperature'], float32,
                                              (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['depth'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
             var.long_name = VariableDefinition.LONG_NAME['sea_water_temperature']
             var.standard_name = VariableDefinition.STANDARD_NAME['sea_water_temperature']
@@ -904,25 +1056,9 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_water_temperature']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_water_temperature']) + '\' at time \'' + str(time) + '\'')
-
-                level_index = 0
-                for level in self.coverage.read_axis_z():
-                    # Pas d'interpolation temporelle donc on parcours les index du temps
-                    var[
-                    self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                    level_index:level_index + 1,
-                    self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                    self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                    ] = self.coverage.read_variable_sea_water_temperature_at_time_and_depth(time, level)
-
-                    level_index += 1
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_water_temperature_at_time_and_depth,
+                                  VariableDefinition.LONG_NAME['sea_water_temperature'], levels=True,
+                                  block="sea_water_temperature")
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeLevelCoverage'")
 
@@ -933,7 +1069,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_water_salinity'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_water_salinity']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_water_salinity'], float32,
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['sea_water_salinity'], float32,
                                              (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['depth'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
             var.long_name = VariableDefinition.LONG_NAME['sea_water_salinity']
             var.standard_name = VariableDefinition.STANDARD_NAME['sea_water_salinity']
@@ -942,25 +1078,9 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_water_salinity']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-
-                logging.info(
-                '[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_water_salinity']) + '\' at time \'' + str(time) + '\'')
-
-                level_index = 0
-                for level in self.coverage.read_axis_z():
-                    # Pas d'interpolation temporelle donc on parcours les index du temps
-                    var[
-                    self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                    level_index:level_index + 1,
-                    self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                    self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                    ] = self.coverage.read_variable_sea_water_salinity_at_time_and_depth(time, level)
-
-                    level_index += 1
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_water_salinity_at_time_and_depth,
+                                  VariableDefinition.LONG_NAME['sea_water_salinity'], levels=True,
+                                  block="sea_water_salinity")
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeLevelCoverage'")
 
@@ -971,7 +1091,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['baroclinic_eastward_sea_water_velocity'] in self.ncfile.variables:
                 ucomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['baroclinic_eastward_sea_water_velocity']]
             else:
-                ucomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['baroclinic_eastward_sea_water_velocity'],
+                ucomp = self.create_variable(VariableDefinition.VARIABLE_NAME['baroclinic_eastward_sea_water_velocity'],
                                               float32,
                                               (VariableDefinition.VARIABLE_NAME['time'],
                                                VariableDefinition.VARIABLE_NAME['depth'],
@@ -985,7 +1105,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['baroclinic_northward_sea_water_velocity'] in self.ncfile.variables:
                 vcomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['baroclinic_northward_sea_water_velocity']]
             else:
-                vcomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['baroclinic_northward_sea_water_velocity'],
+                vcomp = self.create_variable(VariableDefinition.VARIABLE_NAME['baroclinic_northward_sea_water_velocity'],
                                               float32,
                                               (VariableDefinition.VARIABLE_NAME['time'],
                                                VariableDefinition.VARIABLE_NAME['depth'],
@@ -999,32 +1119,9 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'Baroclinic Sea Water Velocity\'\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-
-                logging.info(
-                    '[DefaultWriter] Writing variable \'Baroclinic Sea Water Velocity\' at time \'' + str(time) + '\'')
-
-                level_index = 0
-                for level in self.coverage.read_axis_z():
-                    data_u,data_v = self.coverage.read_variable_baroclinic_sea_water_velocity_at_time_and_depth(time, level)
-
-                    ucomp[
-                    self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                    level_index:level_index + 1,
-                    self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                    self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                    ] = data_u
-
-                    vcomp[
-                    self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                    level_index:level_index + 1,
-                    self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                    self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                    ] = data_v
-                    level_index += 1
-
-                time_index += 1
+            self.write_time_steps([ucomp, vcomp], self.coverage.read_variable_baroclinic_sea_water_velocity_at_time_and_depth,
+                                  'Baroclinic Sea Water Velocity', levels=True,
+                                  block="baroclinic_sea_water_velocity")
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeLevelCoverage'")
 
@@ -1039,7 +1136,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_surface_wave_significant_height'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_surface_wave_significant_height']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_surface_wave_significant_height'], float32, (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['sea_surface_wave_significant_height'], float32, (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
             var.long_name = VariableDefinition.LONG_NAME['sea_surface_wave_significant_height']
             var.standard_name = VariableDefinition.STANDARD_NAME['sea_surface_wave_significant_height']
             var.units = VariableDefinition.CANONICAL_UNITS['sea_surface_wave_significant_height']
@@ -1047,18 +1144,9 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_surface_wave_significant_height']) + '\'')
 
-            time_index=0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_surface_wave_significant_height']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_sea_surface_wave_significant_height_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_surface_wave_significant_height_at_time,
+                                  VariableDefinition.LONG_NAME['sea_surface_wave_significant_height'],
+                                  block="sea_surface_wave_significant_height")
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -1069,7 +1157,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_surface_wave_breaking_height'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_surface_wave_breaking_height']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_surface_wave_breaking_height'], float32,
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['sea_surface_wave_breaking_height'], float32,
                                              (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
             var.long_name = VariableDefinition.LONG_NAME['sea_surface_wave_breaking_height']
             var.standard_name = VariableDefinition.STANDARD_NAME['sea_surface_wave_breaking_height']
@@ -1078,18 +1166,8 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_surface_wave_breaking_height']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_surface_wave_breaking_height']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_sea_surface_wave_breaking_height_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_surface_wave_breaking_height_at_time,
+                                  VariableDefinition.LONG_NAME['sea_surface_wave_breaking_height'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -1100,7 +1178,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_surface_wave_mean_period'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_surface_wave_mean_period']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_surface_wave_mean_period'], float32,
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['sea_surface_wave_mean_period'], float32,
                                              (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
             var.long_name = VariableDefinition.LONG_NAME['sea_surface_wave_mean_period']
             var.standard_name = VariableDefinition.STANDARD_NAME['sea_surface_wave_mean_period']
@@ -1109,18 +1187,9 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_surface_wave_mean_period']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_surface_wave_mean_period']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_sea_surface_wave_mean_period_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_surface_wave_mean_period_at_time,
+                                  VariableDefinition.LONG_NAME['sea_surface_wave_mean_period'],
+                                  block="sea_surface_wave_mean_period")
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -1131,7 +1200,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_surface_wave_peak_period'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_surface_wave_peak_period']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_surface_wave_peak_period'], float32,
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['sea_surface_wave_peak_period'], float32,
                                              (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
             var.long_name = VariableDefinition.LONG_NAME['sea_surface_wave_peak_period']
             var.standard_name = VariableDefinition.STANDARD_NAME['sea_surface_wave_peak_period']
@@ -1140,18 +1209,8 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_surface_wave_peak_period']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_surface_wave_peak_period']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_sea_surface_wave_peak_period_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_surface_wave_peak_period_at_time,
+                                  VariableDefinition.LONG_NAME['sea_surface_wave_peak_period'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -1162,7 +1221,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_surface_wave_from_direction'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_surface_wave_from_direction']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_surface_wave_from_direction'], float32,
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['sea_surface_wave_from_direction'], float32,
                                              (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
             var.long_name = VariableDefinition.LONG_NAME['sea_surface_wave_from_direction']
             var.standard_name = VariableDefinition.STANDARD_NAME['sea_surface_wave_from_direction']
@@ -1171,18 +1230,8 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_surface_wave_from_direction']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_surface_wave_from_direction']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_sea_surface_wave_from_direction_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_surface_wave_from_direction_at_time,
+                                  VariableDefinition.LONG_NAME['sea_surface_wave_from_direction'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -1193,7 +1242,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_surface_wave_to_direction'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_surface_wave_to_direction']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_surface_wave_to_direction'], float32,
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['sea_surface_wave_to_direction'], float32,
                                              (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
             var.long_name = VariableDefinition.LONG_NAME['sea_surface_wave_to_direction']
             var.standard_name = VariableDefinition.STANDARD_NAME['sea_surface_wave_to_direction']
@@ -1202,18 +1251,9 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_surface_wave_to_direction']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['sea_surface_wave_to_direction']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_sea_surface_wave_to_direction_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_surface_wave_to_direction_at_time,
+                                  VariableDefinition.LONG_NAME['sea_surface_wave_to_direction'],
+                                  block="sea_surface_wave_to_direction")
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -1224,7 +1264,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['eastward_sea_surface_wave_stokes_drift_velocity'] in self.ncfile.variables:
                 ucomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['eastward_sea_surface_wave_stokes_drift_velocity']]
             else:
-                ucomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['eastward_sea_surface_wave_stokes_drift_velocity'], float32, (VariableDefinition.VARIABLE_NAME['time'],VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
+                ucomp = self.create_variable(VariableDefinition.VARIABLE_NAME['eastward_sea_surface_wave_stokes_drift_velocity'], float32, (VariableDefinition.VARIABLE_NAME['time'],VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
             ucomp.long_name = VariableDefinition.LONG_NAME['eastward_sea_surface_wave_stokes_drift_velocity']
             ucomp.standard_name = VariableDefinition.STANDARD_NAME['eastward_sea_surface_wave_stokes_drift_velocity']
             ucomp.units = VariableDefinition.CANONICAL_UNITS['eastward_sea_surface_wave_stokes_drift_velocity']
@@ -1232,7 +1272,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['northward_sea_surface_wave_stokes_drift_velocity'] in self.ncfile.variables:
                 vcomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['northward_sea_surface_wave_stokes_drift_velocity']]
             else:
-                vcomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['northward_sea_surface_wave_stokes_drift_velocity'], float32, (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
+                vcomp = self.create_variable(VariableDefinition.VARIABLE_NAME['northward_sea_surface_wave_stokes_drift_velocity'], float32, (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
             vcomp.long_name = VariableDefinition.LONG_NAME['northward_sea_surface_wave_stokes_drift_velocity']
             vcomp.standard_name = VariableDefinition.STANDARD_NAME['northward_sea_surface_wave_stokes_drift_velocity']
             vcomp.units = VariableDefinition.CANONICAL_UNITS['northward_sea_surface_wave_stokes_drift_velocity']
@@ -1240,26 +1280,9 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'Surface Stokes Drift Velocity\'\'')
 
-            time_index=0
-            for time in self.coverage.read_axis_t():
-
-                logging.info('[DefaultWriter] Writing variable \'Surface Stokes Drift Velocity\' at time \''+str(time)+'\'')
-
-                data_u,data_v = self.coverage.read_variable_sea_surface_wave_stokes_drift_velocity_at_time(time)
-
-                ucomp[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = data_u
-
-                vcomp[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = data_v
-
-                time_index += 1
+            self.write_time_steps([ucomp, vcomp], self.coverage.read_variable_sea_surface_wave_stokes_drift_velocity_at_time,
+                                  'Surface Stokes Drift Velocity',
+                                  block="sea_surface_wave_stokes_drift_velocity")
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -1270,7 +1293,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['radiation_pressure_bernouilli_head'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['radiation_pressure_bernouilli_head']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['radiation_pressure_bernouilli_head'], float32,
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['radiation_pressure_bernouilli_head'], float32,
                                              (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
             var.long_name = VariableDefinition.LONG_NAME['radiation_pressure_bernouilli_head']
             var.standard_name = VariableDefinition.STANDARD_NAME['radiation_pressure_bernouilli_head']
@@ -1279,18 +1302,8 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['radiation_pressure_bernouilli_head']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['radiation_pressure_bernouilli_head']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_radiation_pressure_bernouilli_head_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_radiation_pressure_bernouilli_head_at_time,
+                                  VariableDefinition.LONG_NAME['radiation_pressure_bernouilli_head'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -1301,7 +1314,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_surface_wave_energy_flux_to_ocean'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_surface_wave_energy_flux_to_ocean']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_surface_wave_energy_flux_to_ocean'],
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['sea_surface_wave_energy_flux_to_ocean'],
                                              float32,
                                              (VariableDefinition.VARIABLE_NAME['time'],
                                               VariableDefinition.VARIABLE_NAME['latitude'],
@@ -1314,20 +1327,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info('[DefaultWriter] Writing variable \'' + str(
                 VariableDefinition.LONG_NAME['sea_surface_wave_energy_flux_to_ocean']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['sea_surface_wave_energy_flux_to_ocean']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_sea_surface_wave_energy_flux_to_ocean_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_surface_wave_energy_flux_to_ocean_at_time,
+                                  VariableDefinition.LONG_NAME['sea_surface_wave_energy_flux_to_ocean'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -1342,7 +1343,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_surface_wave_energy_dissipation_at_ground_level'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_surface_wave_energy_dissipation_at_ground_level']]
             else:
-                var = self.ncfile.createVariable(
+                var = self.create_variable(
                 VariableDefinition.VARIABLE_NAME['sea_surface_wave_energy_dissipation_at_ground_level'], float32,
                 (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'],
                  VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
@@ -1354,20 +1355,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info('[DefaultWriter] Writing variable \'' + str(
                 VariableDefinition.LONG_NAME['sea_surface_wave_energy_dissipation_at_ground_level']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                    'sea_surface_wave_energy_dissipation_at_ground_level']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_sea_surface_wave_energy_dissipation_at_ground_level_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_surface_wave_energy_dissipation_at_ground_level_at_time,
+                                  VariableDefinition.LONG_NAME['sea_surface_wave_energy_dissipation_at_ground_level'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -1382,7 +1371,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['eastward_atmosphere_momentum_flux_to_waves'] in self.ncfile.variables:
                 ucomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['eastward_atmosphere_momentum_flux_to_waves']]
             else:
-                ucomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['eastward_atmosphere_momentum_flux_to_waves'], float32, (VariableDefinition.VARIABLE_NAME['time'],VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
+                ucomp = self.create_variable(VariableDefinition.VARIABLE_NAME['eastward_atmosphere_momentum_flux_to_waves'], float32, (VariableDefinition.VARIABLE_NAME['time'],VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
             ucomp.long_name = VariableDefinition.LONG_NAME['eastward_atmosphere_momentum_flux_to_waves']
             ucomp.standard_name = VariableDefinition.STANDARD_NAME['eastward_atmosphere_momentum_flux_to_waves']
             ucomp.units = VariableDefinition.CANONICAL_UNITS['eastward_atmosphere_momentum_flux_to_waves']
@@ -1390,7 +1379,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['northward_atmosphere_momentum_flux_to_waves'] in self.ncfile.variables:
                 vcomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['northward_atmosphere_momentum_flux_to_waves']]
             else:
-                vcomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['northward_atmosphere_momentum_flux_to_waves'], float32, (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
+                vcomp = self.create_variable(VariableDefinition.VARIABLE_NAME['northward_atmosphere_momentum_flux_to_waves'], float32, (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
             vcomp.long_name = VariableDefinition.LONG_NAME['northward_atmosphere_momentum_flux_to_waves']
             vcomp.standard_name = VariableDefinition.STANDARD_NAME['northward_atmosphere_momentum_flux_to_waves']
             vcomp.units =VariableDefinition.CANONICAL_UNITS['northward_atmosphere_momentum_flux_to_waves']
@@ -1398,26 +1387,9 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'Atmosphere Momentum Flux to Waves\'\'')
 
-            time_index=0
-            for time in self.coverage.read_axis_t():
-
-                logging.info('[DefaultWriter] Writing variable \'Atmosphere Momentum Flux to Waves\' at time \''+str(time)+'\'')
-
-                data_u,data_v = self.coverage.read_variable_atmosphere_momentum_flux_to_waves_at_time(time)
-
-                ucomp[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = data_u
-
-                vcomp[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = data_v
-
-                time_index += 1
+            self.write_time_steps([ucomp, vcomp], self.coverage.read_variable_atmosphere_momentum_flux_to_waves_at_time,
+                                  'Atmosphere Momentum Flux to Waves',
+                                  block="atmosphere_momentum_flux_to_waves")
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -1428,7 +1400,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['eastward_waves_momentum_flux_to_ocean'] in self.ncfile.variables:
                 ucomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['eastward_waves_momentum_flux_to_ocean']]
             else:
-                ucomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['eastward_waves_momentum_flux_to_ocean'], float32, (VariableDefinition.VARIABLE_NAME['time'],VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
+                ucomp = self.create_variable(VariableDefinition.VARIABLE_NAME['eastward_waves_momentum_flux_to_ocean'], float32, (VariableDefinition.VARIABLE_NAME['time'],VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
             ucomp.long_name = VariableDefinition.LONG_NAME['eastward_waves_momentum_flux_to_ocean']
             ucomp.standard_name = VariableDefinition.STANDARD_NAME['eastward_waves_momentum_flux_to_ocean']
             ucomp.units = VariableDefinition.CANONICAL_UNITS['eastward_waves_momentum_flux_to_ocean']
@@ -1436,7 +1408,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['northward_waves_momentum_flux_to_ocean'] in self.ncfile.variables:
                 vcomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['northward_waves_momentum_flux_to_ocean']]
             else:
-                vcomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['northward_waves_momentum_flux_to_ocean'], float32, (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
+                vcomp = self.create_variable(VariableDefinition.VARIABLE_NAME['northward_waves_momentum_flux_to_ocean'], float32, (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
             vcomp.long_name = VariableDefinition.LONG_NAME['northward_waves_momentum_flux_to_ocean']
             vcomp.standard_name = VariableDefinition.STANDARD_NAME['northward_waves_momentum_flux_to_ocean']
             vcomp.units = VariableDefinition.CANONICAL_UNITS['northward_waves_momentum_flux_to_ocean']
@@ -1444,26 +1416,9 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'Waves Momentum Flux To Ocean\'\'')
 
-            time_index=0
-            for time in self.coverage.read_axis_t():
-
-                logging.info('[DefaultWriter] Writing variable \'Waves Momentum Flux To Ocean\' at time \''+str(time)+'\'')
-
-                data_u,data_v = self.coverage.read_variable_waves_momentum_flux_to_ocean_at_time(time)
-
-                ucomp[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = data_u
-
-                vcomp[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = data_v
-
-                time_index += 1
+            self.write_time_steps([ucomp, vcomp], self.coverage.read_variable_waves_momentum_flux_to_ocean_at_time,
+                                  'Waves Momentum Flux To Ocean',
+                                  block="waves_momentum_flux_to_ocean")
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -1483,7 +1438,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['sea_surface_air_pressure'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['sea_surface_air_pressure']]
             else:
-                var = self.ncfile.createVariable(
+                var = self.create_variable(
                     VariableDefinition.VARIABLE_NAME['sea_surface_air_pressure'],
                     float32,
                     (VariableDefinition.VARIABLE_NAME['time'],
@@ -1497,21 +1452,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info('[DefaultWriter] Writing variable \'' + str(
                     VariableDefinition.LONG_NAME['sea_surface_air_pressure']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['sea_surface_air_pressure']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_sea_surface_air_pressure_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_sea_surface_air_pressure_at_time,
+                                  VariableDefinition.LONG_NAME['sea_surface_air_pressure'])
         else:
             raise CoverageError("DefaultWriter",
                                 "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
@@ -1523,7 +1465,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['surface_air_temperature'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['surface_air_temperature']]
             else:
-                var = self.ncfile.createVariable(
+                var = self.create_variable(
                     VariableDefinition.VARIABLE_NAME['surface_air_temperature'],
                     float32,
                     (VariableDefinition.VARIABLE_NAME['time'],
@@ -1537,21 +1479,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info('[DefaultWriter] Writing variable \'' + str(
                     VariableDefinition.LONG_NAME['surface_air_temperature']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['surface_air_temperature']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_surface_air_temperature_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_surface_air_temperature_at_time,
+                                  VariableDefinition.LONG_NAME['surface_air_temperature'])
         else:
             raise CoverageError("DefaultWriter",
                                 "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
@@ -1563,7 +1492,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['dew_point_temperature'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['dew_point_temperature']]
             else:
-                var = self.ncfile.createVariable(
+                var = self.create_variable(
                     VariableDefinition.VARIABLE_NAME['dew_point_temperature'],
                     float32,
                     (VariableDefinition.VARIABLE_NAME['time'],
@@ -1577,21 +1506,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info('[DefaultWriter] Writing variable \'' + str(
                     VariableDefinition.LONG_NAME['dew_point_temperature']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['dew_point_temperature']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_dew_point_temperature_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_dew_point_temperature_at_time,
+                                  VariableDefinition.LONG_NAME['dew_point_temperature'])
         else:
             raise CoverageError("DefaultWriter",
                                 "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
@@ -1603,7 +1519,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['rainfall_amount'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['rainfall_amount']]
             else:
-                var = self.ncfile.createVariable(
+                var = self.create_variable(
                     VariableDefinition.VARIABLE_NAME['rainfall_amount'],
                     float32,
                     (VariableDefinition.VARIABLE_NAME['time'],
@@ -1617,21 +1533,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info('[DefaultWriter] Writing variable \'' + str(
                     VariableDefinition.LONG_NAME['rainfall_amount']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['rainfall_amount']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_rainfall_amount_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_rainfall_amount_at_time,
+                                  VariableDefinition.LONG_NAME['rainfall_amount'])
         else:
             raise CoverageError("DefaultWriter",
                                 "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
@@ -1643,7 +1546,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['surface_downward_sensible_heat_flux'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['surface_downward_sensible_heat_flux']]
             else:
-                var = self.ncfile.createVariable(
+                var = self.create_variable(
                     VariableDefinition.VARIABLE_NAME['surface_downward_sensible_heat_flux'],
                     float32,
                     (VariableDefinition.VARIABLE_NAME['time'],
@@ -1657,21 +1560,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info('[DefaultWriter] Writing variable \'' + str(
                     VariableDefinition.LONG_NAME['surface_downward_sensible_heat_flux']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['surface_downward_sensible_heat_flux']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_surface_downward_sensible_heat_flux_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_surface_downward_sensible_heat_flux_at_time,
+                                  VariableDefinition.LONG_NAME['surface_downward_sensible_heat_flux'])
         else:
             raise CoverageError("DefaultWriter",
                                 "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
@@ -1683,7 +1573,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['surface_downward_latent_heat_flux'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['surface_downward_latent_heat_flux']]
             else:
-                var = self.ncfile.createVariable(
+                var = self.create_variable(
                     VariableDefinition.VARIABLE_NAME['surface_downward_latent_heat_flux'],
                     float32,
                     (VariableDefinition.VARIABLE_NAME['time'],
@@ -1697,21 +1587,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info('[DefaultWriter] Writing variable \'' + str(
                     VariableDefinition.LONG_NAME['surface_downward_latent_heat_flux']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['surface_downward_latent_heat_flux']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_surface_downward_latent_heat_flux_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_surface_downward_latent_heat_flux_at_time,
+                                  VariableDefinition.LONG_NAME['surface_downward_latent_heat_flux'])
         else:
             raise CoverageError("DefaultWriter",
                                 "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
@@ -1723,7 +1600,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['surface_downwards_solar_radiation'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['surface_downwards_solar_radiation']]
             else:
-                var = self.ncfile.createVariable(
+                var = self.create_variable(
                     VariableDefinition.VARIABLE_NAME['surface_downwards_solar_radiation'],
                     float32,
                     (VariableDefinition.VARIABLE_NAME['time'],
@@ -1737,21 +1614,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info('[DefaultWriter] Writing variable \'' + str(
                     VariableDefinition.LONG_NAME['surface_downwards_solar_radiation']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['surface_downwards_solar_radiation']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_surface_downward_solar_radiation_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_surface_downward_solar_radiation_at_time,
+                                  VariableDefinition.LONG_NAME['surface_downwards_solar_radiation'])
         else:
             raise CoverageError("DefaultWriter",
                                 "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
@@ -1763,7 +1627,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['surface_downwards_thermal_radiation'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['surface_downwards_thermal_radiation']]
             else:
-                var = self.ncfile.createVariable(
+                var = self.create_variable(
                     VariableDefinition.VARIABLE_NAME['surface_downwards_thermal_radiation'],
                     float32,
                     (VariableDefinition.VARIABLE_NAME['time'],
@@ -1777,21 +1641,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info('[DefaultWriter] Writing variable \'' + str(
                     VariableDefinition.LONG_NAME['surface_downwards_thermal_radiation']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['surface_downwards_thermal_radiation']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_surface_downward_thermal_radiation_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_surface_downward_thermal_radiation_at_time,
+                                  VariableDefinition.LONG_NAME['surface_downwards_thermal_radiation'])
         else:
             raise CoverageError("DefaultWriter",
                                 "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
@@ -1803,7 +1654,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['surface_solar_radiation'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['surface_solar_radiation']]
             else:
-                var = self.ncfile.createVariable(
+                var = self.create_variable(
                     VariableDefinition.VARIABLE_NAME['surface_solar_radiation'],
                     float32,
                     (VariableDefinition.VARIABLE_NAME['time'],
@@ -1817,21 +1668,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info('[DefaultWriter] Writing variable \'' + str(
                     VariableDefinition.LONG_NAME['surface_solar_radiation']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['surface_solar_radiation']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_surface_solar_radiation_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_surface_solar_radiation_at_time,
+                                  VariableDefinition.LONG_NAME['surface_solar_radiation'])
         else:
             raise CoverageError("DefaultWriter",
                                 "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
@@ -1843,7 +1681,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['surface_thermal_radiation'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['surface_thermal_radiation']]
             else:
-                var = self.ncfile.createVariable(
+                var = self.create_variable(
                     VariableDefinition.VARIABLE_NAME['surface_thermal_radiation'],
                     float32,
                     (VariableDefinition.VARIABLE_NAME['time'],
@@ -1857,21 +1695,8 @@ class DefaultWriter (CoverageWriter):
                 logging.info('[DefaultWriter] Writing variable \'' + str(
                     VariableDefinition.LONG_NAME['surface_thermal_radiation']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(
-                        VariableDefinition.LONG_NAME['surface_thermal_radiation']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_surface_thermal_radiation_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_surface_thermal_radiation_at_time,
+                                  VariableDefinition.LONG_NAME['surface_thermal_radiation'])
         else:
             raise CoverageError("DefaultWriter",
                                 "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
@@ -1883,7 +1708,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['eastward_wind_stress'] in self.ncfile.variables:
                 ucomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['eastward_wind_stress']]
             else:
-                ucomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['eastward_wind_stress'], float32, (
+                ucomp = self.create_variable(VariableDefinition.VARIABLE_NAME['eastward_wind_stress'], float32, (
             VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'],
             VariableDefinition.VARIABLE_NAME['longitude'],),
                                               fill_value=9.96921e+36)
@@ -1894,7 +1719,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['northward_wind_stress'] in self.ncfile.variables:
                 vcomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['northward_wind_stress']]
             else:
-                vcomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['northward_wind_stress'], float32, (
+                vcomp = self.create_variable(VariableDefinition.VARIABLE_NAME['northward_wind_stress'], float32, (
             VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'],
             VariableDefinition.VARIABLE_NAME['longitude'],),
                                               fill_value=9.96921e+36)
@@ -1905,25 +1730,8 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'Wind Stress\'\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info('[DefaultWriter] Writing variable \'Wind Stress\' at time \'' + str(time) + '\'')
-
-                data_u,data_v = self.coverage.read_variable_wind_stress_at_time(time)
-
-                ucomp[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = data_u
-
-                vcomp[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = data_v
-
-                time_index += 1
+            self.write_time_steps([ucomp, vcomp], self.coverage.read_variable_wind_stress_at_time, 'Wind Stress',
+                                  block="wind_stress")
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -1938,7 +1746,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['eastward_wind_10m'] in self.ncfile.variables:
                 ucomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['eastward_wind_10m']]
             else:
-                ucomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['eastward_wind_10m'], float32, (VariableDefinition.VARIABLE_NAME['time'],VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
+                ucomp = self.create_variable(VariableDefinition.VARIABLE_NAME['eastward_wind_10m'], float32, (VariableDefinition.VARIABLE_NAME['time'],VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
             ucomp.long_name = VariableDefinition.LONG_NAME['eastward_wind_10m']
             ucomp.standard_name = VariableDefinition.STANDARD_NAME['eastward_wind_10m']
             ucomp.units = VariableDefinition.CANONICAL_UNITS['eastward_wind_10m']
@@ -1946,7 +1754,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['northward_wind_10m'] in self.ncfile.variables:
                 vcomp = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['northward_wind_10m']]
             else:
-                vcomp = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['northward_wind_10m'], float32, (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
+                vcomp = self.create_variable(VariableDefinition.VARIABLE_NAME['northward_wind_10m'], float32, (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],),fill_value=9.96921e+36)
             vcomp.long_name = VariableDefinition.LONG_NAME['northward_wind_10m']
             vcomp.standard_name = VariableDefinition.STANDARD_NAME['northward_wind_10m']
             vcomp.units = VariableDefinition.CANONICAL_UNITS['northward_wind_10m']
@@ -1954,28 +1762,8 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'Wind 10m\'')
 
-            time_index=0
-            for time in self.coverage.read_axis_t():
-
-                logging.info('[DefaultWriter] Writing variable \'Wind 10m\' at time \''+str(time)+'\'')
-
-                data_u,data_v = self.coverage.read_variable_wind_10m_at_time(time)
-
-                ucomp[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = data_u
-
-                vcomp[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index:
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index + 1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = data_v
-
-                time_index += 1
+            self.write_time_steps([ucomp, vcomp], self.coverage.read_variable_wind_10m_at_time, 'Wind 10m',
+                                  block="wind_10m")
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -1986,7 +1774,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['wind_speed_10m'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['wind_speed_10m']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['wind_speed_10m'], float32,
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['wind_speed_10m'], float32,
                                              (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
             var.long_name = VariableDefinition.LONG_NAME['wind_speed_10m']
             var.standard_name = VariableDefinition.STANDARD_NAME['wind_speed_10m']
@@ -1995,18 +1783,8 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['wind_speed_10m']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['wind_speed_10m']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_wind_speed_10m_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_wind_speed_10m_at_time,
+                                  VariableDefinition.LONG_NAME['wind_speed_10m'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -2017,7 +1795,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['wind_to_direction_10m'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['wind_to_direction_10m']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['wind_to_direction_10m'], float32,
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['wind_to_direction_10m'], float32,
                                              (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
             var.long_name = VariableDefinition.LONG_NAME['wind_to_direction_10m']
             var.standard_name = VariableDefinition.STANDARD_NAME['wind_to_direction_10m']
@@ -2026,18 +1804,8 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['wind_to_direction_10m']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['wind_to_direction_10m']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_wind_to_direction_10m_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_wind_to_direction_10m_at_time,
+                                  VariableDefinition.LONG_NAME['wind_to_direction_10m'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -2048,7 +1816,7 @@ class DefaultWriter (CoverageWriter):
             if VariableDefinition.VARIABLE_NAME['wind_from_direction_10m'] in self.ncfile.variables:
                 var = self.ncfile.variables[VariableDefinition.VARIABLE_NAME['wind_from_direction_10m']]
             else:
-                var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['wind_from_direction_10m'], float32,
+                var = self.create_variable(VariableDefinition.VARIABLE_NAME['wind_from_direction_10m'], float32,
                                              (VariableDefinition.VARIABLE_NAME['time'], VariableDefinition.VARIABLE_NAME['latitude'], VariableDefinition.VARIABLE_NAME['longitude'],), fill_value=9.96921e+36)
             var.long_name = VariableDefinition.LONG_NAME['wind_from_direction_10m']
             var.standard_name = VariableDefinition.STANDARD_NAME['wind_from_direction_10m']
@@ -2057,18 +1825,8 @@ class DefaultWriter (CoverageWriter):
             if self.coverage.rank == 0:
                 logging.info('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['wind_from_direction_10m']) + '\'')
 
-            time_index = 0
-            for time in self.coverage.read_axis_t():
-                logging.info(
-                    '[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['wind_from_direction_10m']) + '\' at time \'' + str(time) + '\'')
-
-                var[
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index:self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start+time_index+1,
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]
-                ] = self.coverage.read_variable_wind_from_direction_10m_at_time(time)
-
-                time_index += 1
+            self.write_time_steps([var], self.coverage.read_variable_wind_from_direction_10m_at_time,
+                                  VariableDefinition.LONG_NAME['wind_from_direction_10m'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -17,7 +17,6 @@ from __future__ import division, print_function, absolute_import
 
 from mpi4py import MPI
 from netCDF4 import Dataset
-from netCDF4 import date2num
 from numpy import float32
 from numpy import float64
 
@@ -74,9 +73,7 @@ class ECMWFWriter (CoverageWriter):
         latitudes[self.coverage.map_mpi[self.coverage.rank]["dst_global_y"]] = self.coverage.read_axis_y()
         longitudes[self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = self.coverage.read_axis_x()
         times[
-            self.coverage.map_mpi[self.coverage.rank]["dst_global_t"]] = date2num(self.coverage.read_axis_t(),
-                                                                                  units=times.units,
-                                                                                  calendar=times.calendar)
+            self.coverage.map_mpi[self.coverage.rank]["dst_global_t"]] = self.coverage.read_axis_t().to_num(times.units, times.calendar)
 
     def close(self):
         self.ncfile.close()
@@ -8,10 +8,11 @@ import os
 from datetime import datetime
 
 import numpy as np
-from netCDF4 import Dataset, MFDataset, num2date
+from netCDF4 import Dataset, num2date
 
 from spatialetl.coverage.TimeCoverage import TimeCoverage
 from spatialetl.coverage.io.CoverageReader import CoverageReader
+from spatialetl.utils.AggregatedDataset import AggregatedDataset
 
 
 class HYCOMReader(CoverageReader):
@@ -24,9 +25,9 @@ class HYCOMReader(CoverageReader):
         if os.path.isfile(myFile):
             self.ncfile = Dataset(myFile, 'r')
         elif os.path.isdir(myFile):
-            self.ncfile = MFDataset(os.path.join(myFile, "*.nc"), 'r')
+            self.ncfile = AggregatedDataset(os.path.join(myFile, "*.nc"))
         elif myFile.endswith("*"):
-            self.ncfile = MFDataset(myFile + ".nc", 'r')
+            self.ncfile = AggregatedDataset(myFile + ".nc")
         else:
             raise ValueError("Unable to decode file " + str(myFile))
 
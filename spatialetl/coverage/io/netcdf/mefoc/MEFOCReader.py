@@ -8,10 +8,11 @@ import os
 from datetime import datetime
 
 import numpy as np
-from netCDF4 import Dataset, MFDataset, num2date
+from netCDF4 import Dataset, num2date
 
 from spatialetl.coverage.TimeCoverage import TimeCoverage
 from spatialetl.coverage.io.CoverageReader import CoverageReader
+from spatialetl.utils.AggregatedDataset import AggregatedDataset
 
 
 class MEFOCReader(CoverageReader):
@@ -22,9 +23,9 @@ class MEFOCReader(CoverageReader):
         if os.path.isfile(self.filename):
             self.ncfile = Dataset(self.filename, 'r')
         elif os.path.isdir(self.filename):
-            self.ncfile = MFDataset(os.path.join(self.filename, "*.nc"), 'r')
+            self.ncfile = AggregatedDataset(os.path.join(self.filename, "*.nc"))
         elif self.filename.endswith("*"):
-            self.ncfile = MFDataset(self.filename + ".nc", 'r')
+            self.ncfile = AggregatedDataset(self.filename + ".nc")
         else:
             raise ValueError("Unable to decode file " + str(self.filename))
 
@@ -18,7 +18,6 @@ from __future__ import division, print_function, absolute_import
 import numpy as np
 from mpi4py import MPI
 from netCDF4 import Dataset
-from netCDF4 import date2num
 from numpy import int16, float32, float64
 
 from spatialetl.coverage.LevelCoverage import LevelCoverage
@@ -78,7 +77,7 @@ class DefaultWriter (CoverageWriter):
                     times.conventions = "UTC time"
 
                     times[
-                    self.coverage.map_mpi[self.coverage.rank]["dst_global_t"]] = date2num(self.coverage.read_axis_t(), units = times.units, calendar = times.calendar)
+                    self.coverage.map_mpi[self.coverage.rank]["dst_global_t"]] = self.coverage.read_axis_t().to_num(times.units, times.calendar)
 
                 if(isinstance(self.coverage, LevelCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
 
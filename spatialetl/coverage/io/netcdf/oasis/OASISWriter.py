@@ -17,9 +17,13 @@ from __future__ import division, print_function, absolute_import
 
 import numpy as np
 from netCDF4 import Dataset
+from mpi4py import MPI
 from numpy import float64
 
+from spatialetl.coverage.io.CachedCoverageReader import unwrap_reader
 from spatialetl.coverage.io.netcdf.ww3.WW3UnstructuredReader import WW3UnstructuredReader
+from spatialetl.operator.interpolator.InterpolatorCore import compute_2d_interpolation_weights_mpi
+from spatialetl.operator.interpolator.InterpolatorCore import save_scrip_remap_file
 from spatialetl.utils.logger import logging
 
 
@@ -90,7 +94,7 @@ class OASISWriter(object):
 
         else:
 
-            if(isinstance(self.ww3Coverage.reader, WW3UnstructuredReader)):
+            if(isinstance(unwrap_reader(self.ww3Coverage.reader), WW3UnstructuredReader)):
 
                 # dimensions WW3
                 ncfile.createDimension('y_ww3t', 1)
@@ -197,7 +201,7 @@ class OASISWriter(object):
 
         else:
 
-            if(isinstance(self.ww3Coverage.reader, WW3UnstructuredReader)):
+            if(isinstance(unwrap_reader(self.ww3Coverage.reader), WW3UnstructuredReader)):
 
                 # dimensions WW3
                 ncfile.createDimension('y_ww3t', 1)
@@ -241,4 +245,38 @@ class OASISWriter(object):
 
         ncfile.close()
        
-    
\ No newline at end of file
+    
+
+     def write_remapping(self,filename,method="bilinear",source="symt"):
+        """Calcule les poids de remapping entre les grilles SYMPHONIE et WW3 et les écrit dans un fichier de remapping
+    SCRIP lisible par OASIS. Le calcul des poids est réparti sur les rangs MPI et le fichier est écrit par le rang 0.
+    Le fichier peut ensuite être réutilisé d'un run à l'autre.
+    @param filename: chemin du fichier de remapping (ex: rmp_symt_to_ww3t_CONSERV_FRACAREA.nc)
+    @param method: méthode de remapping : "bilinear" ou "conservative" (uniquement entre deux grilles régulières)
+    @param source: grille source : "symt" (SYMPHONIE vers WW3) ou "ww3t" (WW3 vers SYMPHONIE)"""
+
+        if source == "symt":
+            source_coverage, target_coverage, target = self.symphonieCoverage, self.ww3Coverage, "ww3t"
+        elif source == "ww3t":
+            source_coverage, target_coverage, target = self.ww3Coverage, self.symphonieCoverage, "symt"
+        else:
+            raise ValueError("Source grid doesn't match [symt, ww3t]")
+
+        source_x = source_coverage.read_axis_x(type="target_global")
+        source_y = source_coverage.read_axis_y(type="target_global")
+        target_x = target_coverage.read_axis_x(type="target_global")
+        target_y = target_coverage.read_axis_y(type="target_global")
+
+        if method == "conservative" and max(np.ndim(source_x), np.ndim(source_y), np.ndim(target_x),
+                                            np.ndim(target_y)) != 1:
+            raise ValueError("Conservative remapping is only available between regular grids. Use method='bilinear' "
+                             "or interpolate the coverages on a regular grid (resolution_x, resolution_y).")
+
+        comm = MPI.COMM_WORLD
+        if comm.Get_rank() == 0:
+            logging.info('[OASISWriter] Write ' + str(method) + ' remapping from ' + str(source) + ' to ' + str(target) + '.')
+
+        weights = compute_2d_interpolation_weights_mpi(comm, source_x, source_y, target_x, target_y, method)
+
+        if weights is not None:
+            save_scrip_remap_file(weights, filename, source_name=source, target_name=target)
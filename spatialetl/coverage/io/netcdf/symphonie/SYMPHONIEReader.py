@@ -18,6 +18,7 @@ from __future__ import division, print_function, absolute_import
 import glob
 import os
 import re
+from collections import OrderedDict
 
 import cftime
 import numpy as np
@@ -26,10 +27,35 @@ from netCDF4 import Dataset, num2date
 from spatialetl.coverage.TimeCoverage import TimeCoverage
 from spatialetl.coverage.io.CoverageReader import CoverageReader
 from spatialetl.exception.VariableNameError import VariableNameError
+from spatialetl.operator.vector.VectorCore import rotate_vector
+from spatialetl.utils.SpatialIndex import file_signature
+from spatialetl.utils.TimeAxis import TimeAxis
+from spatialetl.utils.AggregatedDataset import AggregatedDataset
+from spatialetl.utils.FileHandlePool import FILE_HANDLES
+from spatialetl.utils.FileTimeIndex import FileTimeIndex, get_index_filename
 from spatialetl.utils.VariableDefinition import VariableDefinition
 from spatialetl.utils.logger import logging
 from spatialetl.utils.path import path_leaf
 
+MONTHS = {'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04', 'may': '05', 'jun': '06',
+          'jul': '07', 'aug': '08', 'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'}
+
+# Matrices de rotation partagées entre les lecteurs, indexées par (fichier de grille, date de modification). Les
+# matrices les moins récemment utilisées sont évincées au delà de GRID_ROTATIONS_SIZE grilles.
+GRID_ROTATIONS = OrderedDict()
+GRID_ROTATIONS_SIZE = 4
+
+
+def cache_grid_rotation(key, rotation):
+    """Ajoute les matrices de rotation d'une grille au cache partagé et évince les moins récemment utilisées.
+    @param key: (fichier de grille, date de modification)
+    @param rotation: (gridrotcos_t, gridrotsin_t)
+    @return: rotation"""
+    GRID_ROTATIONS[key] = rotation
+    while len(GRID_ROTATIONS) > GRID_ROTATIONS_SIZE:
+        GRID_ROTATIONS.popitem(last=False)
+    return rotation
+
 
 class SYMPHONIEReader(CoverageReader):
     """
@@ -40,6 +66,39 @@ La classe SymphonieReader permet de lire les données du format Symphonie
 """
     HORIZONTAL_OVERLAPING_SIZE = 2
     APPLY_WET_MASK = False
+    ROTATION_DIRECTORY = None
+    USE_TIME_INDEX = True
+    TIME_INDEX_FILENAME = ".symphonie_time_index.json"
+    TIME_INDEX_DIRECTORY = None
+
+    # Variables lues en un seul hyperslab par read_variable_block() :
+    # nom -> (variables NetCDF candidates, True si la couche de surface d'une variable [t,z,y,x] est lue)
+    BLOCK_SCALARS = {
+        "sea_surface_height_above_mean_sea_level": (["ssh_w", "ssh", "ssh_inst"], False),
+        "sea_surface_temperature": (["tem"], True),
+        "sea_surface_salinity": (["sal"], True),
+        "sea_surface_wave_significant_height": (["hs_wave_t"], False),
+        "sea_surface_wave_mean_period": (["t_wave_t"], False),
+        "sea_surface_wave_to_direction": (["dir_wave_conv1"], False)
+    }
+    # nom -> (couples de variables NetCDF candidates (u,v), True si la couche de surface est lue)
+    BLOCK_VECTORS = {
+        "sea_water_velocity_at_sea_water_surface": ([("vel_u", "vel_v"), ("u", "v")], True),
+        "barotropic_sea_water_velocity": ([("velbar_u", "velbar_v")], False),
+        "sea_surface_wave_stokes_drift_velocity": ([("velbarstokes_u", "velbarstokes_v")], False),
+        "atmosphere_momentum_flux_to_waves": ([("tawx", "tawy")], False),
+        "waves_momentum_flux_to_ocean": ([("twox", "twoy")], False),
+        "wind_stress": ([("wstress_u", "wstress_v")], False),
+        "wind_10m": ([("uwind_t", "vwind_t")], False)
+    }
+    # Variables lues en un seul hyperslab par read_variable_level_block()
+    LEVEL_BLOCK_SCALARS = {
+        "sea_water_temperature": ["tem"],
+        "sea_water_salinity": ["sal"]
+    }
+    LEVEL_BLOCK_VECTORS = {
+        "baroclinic_sea_water_velocity": [("vel_u", "vel_v"), ("u", "v")]
+    }
 
     def __init__(self,myGrid, myFile=None):
         CoverageReader.__init__(self,myGrid);
@@ -47,6 +106,8 @@ La classe SymphonieReader permet de lire les données du format Symphonie
         self.grid = Dataset(self.filename, 'r')
         self.gridrotcos_t = None
         self.gridrotsin_t = None
+        self.aggregated_dataset = None
+        self.aggregated_dataset_checked = False
 
         if myFile is not None:
             if os.path.isfile(myFile):
@@ -58,15 +119,16 @@ La classe SymphonieReader permet de lire les données du format Symphonie
             else:
                 raise ValueError("Unable to decode file " + str(myFile))
 
-            self.ncfile = Dataset(self.files[0], 'r')
+            self.ncfile_key, self.ncfile = FILE_HANDLES.acquire(self.files[0], Dataset)
             self.last_opened_t_index = 0
         else:
             self.files = []
-            self.ncfile = Dataset(self.filename, 'r')
+            self.ncfile_key, self.ncfile = FILE_HANDLES.acquire(self.filename, Dataset)
             self.last_opened_t_index = 0
 
         self.t_size = len(self.files)
         self.times = []
+        time_index = self.read_time_index()
 
         for file in self.files:
             groups = re.search("^([0-9]{4})([0-9]{2})([0-9]{2})\_([0-9]{2})([0-9]{2})([0-9]{2}).*.nc$",
@@ -78,49 +140,96 @@ La classe SymphonieReader permet de lire les données du format Symphonie
                 self.times.append(current_time)
             else:
                 if os.path.isfile(file) and "bathycote_in" not in str(file):
-                    try:
-                        current_file = Dataset(file, 'r')
-
-                        if "time" in current_file.variables and np.shape(current_file.variables["time"]) == (1,):
-                            current_time = num2date(current_file.variables["time"][0],
-                                     units=current_file.variables["time"].units.replace('from', 'since').replace('jan',
-                                                                                                                    '01').replace(
-                                         'feb', '02').replace('mar', '03').replace('apr', '04').replace('may',
-                                                                                                        '05').replace('jun',
-                                                                                                                      '06').replace(
-                                         'jul', '07').replace('aug', '08').replace('sep', '09').replace('oct',
-                                                                                                        '10').replace('nov',
-                                                                                                                      '11').replace(
-                                         'dec', '12'), calendar=current_file.variables['time'].calendar)
-                            self.times.append(current_time)
-                        else:
-                            for time in current_file.variables["time"]:
-                                nc_time = num2date(time,
-                                         units=current_file.variables["time"].units, calendar=current_file.variables['time'].calendar)
-
-                                self.times.append(nc_time.replace(microsecond=0))
-
-                            self.t_size = len(self.times)
-                    except Exception as ex:
-                        raise ValueError("Unable to decode time records in file "+str(file)+ ":"+str(ex))
+                    times = time_index.get_times(file)
+                    if times is None:
+                        times, calendar = self.decode_time_records(file)
+                        time_index.set_times(file, times, calendar)
+
+                    self.times.extend(times)
+                    if len(times) != 1:
+                        self.t_size = len(self.times)
+
+        time_index.save()
+        self.times = TimeAxis.from_dates(self.times)
 
         if len(self.times) == 0:
             logging.info("No time records found")
 
-    def open_file(self, index_t):
-
-        if len(self.files) == 1 and index_t > 0:
-           return
+    def read_time_index(self):
+        """Retourne l'index des dates des fichiers de données. L'index est enregistré dans
+    SYMPHONIEReader.TIME_INDEX_DIRECTORY ou, s'il n'est pas renseigné, à côté des fichiers
+    (SYMPHONIEReader.TIME_INDEX_FILENAME) pour éviter de relire la variable time de tous les fichiers
+    lors des traitements suivants.
+    @return: un FileTimeIndex."""
+        if not SYMPHONIEReader.USE_TIME_INDEX or len(self.files) == 0:
+            return FileTimeIndex(None)
+
+        directory = os.path.dirname(os.path.abspath(self.files[0]))
+        return FileTimeIndex(get_index_filename(directory, SYMPHONIEReader.TIME_INDEX_FILENAME,
+                                                SYMPHONIEReader.TIME_INDEX_DIRECTORY), directory)
+
+    def decode_time_records(self, file):
+        """Décode les dates contenues dans la variable time d'un fichier de données.
+    @param file: chemin du fichier
+    @return: la liste des dates et le calendrier de la variable time."""
+        try:
+            current_file = Dataset(file, 'r')
+            try:
+                time = current_file.variables["time"]
+                calendar = getattr(time, "calendar", "standard")
+                if np.shape(time) == (1,):
+                    units = re.sub("|".join(MONTHS), lambda month: MONTHS[month.group(0)],
+                                   time.units.replace('from', 'since'))
+                    return [num2date(time[0], units=units, calendar=calendar)], calendar
+
+                return [num2date(value, units=time.units, calendar=calendar).replace(microsecond=0)
+                        for value in time[:]], calendar
+            finally:
+                current_file.close()
+        except Exception as ex:
+            raise ValueError("Unable to decode time records in file " + str(file) + ":" + str(ex))
 
-        if index_t != self.last_opened_t_index:
+    def open_file(self, index_t):
+        """Ouvre le fichier de données du pas de temps index_t. Les fichiers sont pris dans le pool des fichiers
+    ouverts (FILE_HANDLES) : revenir sur un pas de temps voisin ne rouvre pas le fichier.
+    @param index_t: index du pas de temps"""
+        if len(self.files) <= 1:
+            index_t = 0
+
+        if index_t != self.last_opened_t_index or self.ncfile is None:
+            if len(self.files) > 0:
+                key, ncfile = FILE_HANDLES.acquire(self.files[index_t], Dataset)
+            else:
+                key, ncfile = FILE_HANDLES.acquire(self.filename, Dataset)
             self.close()
-            self.ncfile = Dataset(self.files[index_t])
+            self.ncfile_key, self.ncfile = key, ncfile
+            self.last_opened_t_index = index_t
 
     def close(self):
-        self.ncfile.close()
+        if self.ncfile is not None:
+            FILE_HANDLES.release(self.ncfile_key)
+            self.ncfile = None
 
     def compute_rot(self):
 
+        key = (os.path.abspath(self.filename), file_signature(self.filename))
+        if key in GRID_ROTATIONS:
+            GRID_ROTATIONS.move_to_end(key)
+            self.gridrotcos_t, self.gridrotsin_t = GRID_ROTATIONS[key]
+            return
+
+        persisted_file = None
+        if SYMPHONIEReader.ROTATION_DIRECTORY is not None:
+            persisted_file = os.path.join(SYMPHONIEReader.ROTATION_DIRECTORY, "rotation_" + path_leaf(
+                self.filename) + "_" + str(int(key[1])) + ".npz")
+
+            if os.path.isfile(persisted_file):
+                logging.debug("[SymphonieReader] Loading grid rotation matrix from " + str(persisted_file))
+                with np.load(persisted_file) as archive:
+                    self.gridrotcos_t, self.gridrotsin_t = cache_grid_rotation(
+                        key, (archive["gridrotcos_t"], archive["gridrotsin_t"]))
+                return
+
         logging.debug("[SymphonieReader] Compute grid rotation matrix...")
 
         lon_t = np.ma.filled(self.grid.variables['longitude_t'][:], fill_value=np.nan)
@@ -129,156 +238,87 @@ La classe SymphonieReader permet de lire les données du format Symphonie
         self.gridrotcos_t = np.zeros([self.get_y_size(), self.get_x_size()])
         self.gridrotsin_t = np.zeros([self.get_y_size(), self.get_x_size()])
 
-        for y in range(1, self.get_y_size() - 1):
-            for x in range(1, self.get_x_size() - 1):
+        x1 = (lon_t[1:-1, 2:] - lon_t[1:-1, :-2]) * np.pi / 180.
+        x1 = np.where(x1 < -np.pi, x1 + 2. * np.pi, x1)
+        x1 = np.where(x1 > np.pi, x1 - 2. * np.pi, x1)
+        x0 = -np.arctan2((lat_t[1:-1, 2:] - lat_t[1:-1, :-2]) * np.pi / 180.,
+                         x1 * np.cos(lat_t[1:-1, 1:-1] * np.pi / 180.))
+        self.gridrotcos_t[1:-1, 1:-1] = np.cos(x0)
+        self.gridrotsin_t[1:-1, 1:-1] = np.sin(x0)
+
+        cache_grid_rotation(key, (self.gridrotcos_t, self.gridrotsin_t))
+
+        if persisted_file is not None:
+            np.savez(persisted_file, gridrotcos_t=self.gridrotcos_t, gridrotsin_t=self.gridrotsin_t)
+
+    def compute_interior_to_tracer(self, data_u, data_v, mask_t, mask_u, mask_v):
+        """Calcule les composantes u,v aux point tracer par demi-somme des faces u et v encadrant chaque point
+    (les faces masquées valent 0), sans traiter les bords du domaine.
+    ##############################
+    #           v_up
+    #
+    #   u_left   X     u_right
+    #
+    #         v_bottom
+    #############################
+    @param data_u, data_v: composantes [y,x] ou piles [...,y,x] (dates, niveaux)
+    @param mask_t, mask_u, mask_v: masques des point t, u et v
+    @return: les composantes [u_t,v_t] aux point tracer. Les bords et les point masqués valent NaN."""
+
+        mask_t = np.ma.filled(mask_t, fill_value=0) == 1.
+        mask_u = np.ma.filled(mask_u, fill_value=0) == 1.
+        mask_v = np.ma.filled(mask_v, fill_value=0) == 1.
+        data_u = np.ma.filled(data_u, fill_value=np.nan)
+        data_v = np.ma.filled(data_v, fill_value=np.nan)
+
+        # Les faces u et v peuvent avoir une colonne ou une ligne de moins que les point t
+        y_size, x_size = np.shape(mask_t)[-2:]
+        inner_y = slice(1, y_size - 1)
+        inner_x = slice(1, x_size - 1)
+
+        def face(data, mask, index_y, index_x):
+            return np.where(mask[..., index_y, index_x], data[..., index_y, index_x], 0.)
+
+        u_left = face(data_u, mask_u, inner_y, slice(0, x_size - 2))
+        u_right = face(data_u, mask_u, inner_y, inner_x)
+        v_down = face(data_v, mask_v, slice(0, y_size - 2), inner_x)
+        v_up = face(data_v, mask_v, inner_y, inner_x)
+
+        shape = np.broadcast_shapes(np.shape(u_left)[:-2], np.shape(mask_t)[:-2]) + (y_size, x_size)
+        u_t = np.full(shape, np.nan)
+        v_t = np.full(shape, np.nan)
+
+        u_t[..., inner_y, inner_x] = np.where(mask_t[..., inner_y, inner_x], 0.5 * (u_left + u_right), np.nan)
+        v_t[..., inner_y, inner_x] = np.where(mask_t[..., inner_y, inner_x], 0.5 * (v_down + v_up), np.nan)
 
-                x1 = (lon_t[y, x + 1] - lon_t[y, x - 1]) * np.pi / 180.
-                if (x1 < -np.pi): x1 = x1 + 2. * np.pi
-                if (x1 > np.pi): x1 = x1 - 2. * np.pi
-                x0 = -np.arctan2((lat_t[y, x + 1] - lat_t[y, x - 1]) * np.pi / 180.,
-                                 x1 * np.cos(lat_t[y, x] * np.pi / 180.))
-                self.gridrotcos_t[y, x] = np.cos(x0)
-                self.gridrotsin_t[y, x] = np.sin(x0)
-
-    def compute_to_tracer(self, data_u, data_v, mask_t, mask_u, mask_v):
+        return u_t, v_t
 
-        x_size = np.shape(mask_t)[1]
-        y_size = np.shape(mask_t)[0]
-
-        u_t = np.zeros([y_size, x_size])
-        u_t[:] = np.nan
-        v_t = np.zeros([y_size, x_size])
-        v_t[:] = np.nan
-
-        # 1. On calcule les point à l'intérieur du domaine en excluant les bords
-        for y in range(1, y_size - 1):
-            for x in range(1, x_size - 1):
-
-                if mask_t[y, x] == 1.:
-
-                    # 1.2 On récupère les valeurs aux point encadrant X pour faire la demi-somme
-                    ##############################
-                    #           v_up
-                    #
-                    #   u_left   X     u_right
-                    #
-                    #         v_bottom
-                    #############################
-
-                    # u_left
-                    u_left = 0
-                    if mask_u[y, x - 1] == 1.:
-                        u_left = data_u[y, x - 1];
-
-                    # u_right
-                    u_right = 0
-                    if mask_u[y, x] == 1.:
-                        u_right = data_u[y, x];
-
-                    # v_down
-                    v_down = 0
-                    if mask_v[y - 1, x] == 1.:
-                        v_down = data_v[y - 1, x];
-
-                    # v_up
-                    v_up = 0
-                    if mask_v[y, x] == 1.:
-                        v_up = data_v[y, x];
-
-                    # 1.3 On calcule la demi-somme
-                    u_t[y, x] = 0.5 * (u_left + u_right)
-                    v_t[y, x] = 0.5 * (v_down + v_up)
-
-        # 2. On duplique les point sur les bords.
+    def duplicate_borders(self, data):
+        """Duplique sur les bords du domaine les valeurs des point voisins intérieurs.
+    @param data: tableau [y,x] ou pile [...,y,x]
+    @return: le tableau modifié."""
         # bottom
-        u_t[0, 0:x_size] = u_t[1, 0:x_size]
-        v_t[0, 0:x_size] = v_t[1, 0:x_size]
+        data[..., 0, :] = data[..., 1, :]
         # up
-        u_t[y_size - 1, 0:x_size] = u_t[y_size - 2, 0:x_size]
-        v_t[y_size - 1, 0:x_size] = v_t[y_size - 2, 0:x_size]
-
+        data[..., -1, :] = data[..., -2, :]
         # left
-        u_t[0:y_size, 0] = u_t[0:y_size, 1]
-        v_t[0:y_size, 0] = v_t[0:y_size, 1]
+        data[..., :, 0] = data[..., :, 1]
         # right
-        u_t[0:y_size, x_size - 1] = u_t[0:y_size, x_size - 2]
-        v_t[0:y_size, x_size - 1] = v_t[0:y_size, x_size - 2]
+        data[..., :, -1] = data[..., :, -2]
+        return data
 
-        return u_t, v_t
+    def compute_to_tracer(self, data_u, data_v, mask_t, mask_u, mask_v):
 
-    def compute_vector_rotation(self, data_u, data_v, rotcos, rotsin, mask_t, mask_u, mask_v):
+        u_t, v_t = self.compute_interior_to_tracer(data_u, data_v, mask_t, mask_u, mask_v)
 
-        x_size = np.shape(mask_t)[1]
-        y_size = np.shape(mask_t)[0]
-
-        u = np.zeros([y_size, x_size])
-        u[:] = np.nan
-        v = np.zeros([y_size, x_size])
-        v[:] = np.nan
-        u_rot = np.zeros([y_size, x_size])
-        u_rot[:] = np.nan
-        v_rot = np.zeros([y_size, x_size])
-        v_rot[:] = np.nan
-
-        # 1. On calcule les point à l'intérieur du domaine en excluant les bords
-        for y in range(1, y_size - 1):
-            for x in range(1, x_size - 1):
-
-                if mask_t[y, x] == 1.:
-
-                    # 1.2 On récupère les valeurs aux point encadrant X pour faire la demi-somme
-                    ##############################
-                    #           v_up
-                    #
-                    #   u_left   X     u_right
-                    #
-                    #         v_bottom
-                    #############################
-
-                    # u_left
-                    u_left = 0
-                    if mask_u[y, x - 1] == 1.:
-                        u_left = data_u[y, x - 1];
-
-                    # u_right
-                    u_right = 0
-                    if mask_u[y, x] == 1.:
-                        u_right = data_u[y, x];
-
-                    # v_down
-                    v_down = 0
-                    if mask_v[y - 1, x] == 1.:
-                        v_down = data_v[y - 1, x];
-
-                    # v_up
-                    v_up = 0
-                    if mask_v[y, x] == 1.:
-                        v_up = data_v[y, x];
-
-                    # 1.3 On calcule la demi-somme
-                    u[y, x] = 0.5 * (u_left + u_right)
-                    v[y, x] = 0.5 * (v_down + v_up)
-
-                    # 1.4 On applique la rotation
-                    u_rot[y, x] = u[y, x] * rotcos[y, x] + v[y, x] * rotsin[y, x]
-                    v_rot[y, x] = -u[y, x] * rotsin[y, x] + v[y, x] * rotcos[y, x]
-
-        # 2. On duplique les point sur les bords.
-        # bottom
-        u_rot[0, 0:x_size] = u_rot[1, 0:x_size]
-        v_rot[0, 0:x_size] = v_rot[1, 0:x_size]
-        # up
-        u_rot[y_size - 1, 0:x_size] = u_rot[y_size - 2, 0:x_size]
-        v_rot[y_size - 1, 0:x_size] = v_rot[y_size - 2, 0:x_size]
+        return self.duplicate_borders(u_t), self.duplicate_borders(v_t)
 
-        # left
-        u_rot[0:y_size, 0] = u_rot[0:y_size, 1]
-        v_rot[0:y_size, 0] = v_rot[0:y_size, 1]
-        # right
-        u_rot[0:y_size, x_size - 1] = u_rot[0:y_size, x_size - 2]
-        v_rot[0:y_size, x_size - 1] = v_rot[0:y_size, x_size - 2]
+    def compute_vector_rotation(self, data_u, data_v, rotcos, rotsin, mask_t, mask_u, mask_v):
+
+        u, v = self.compute_interior_to_tracer(data_u, data_v, mask_t, mask_u, mask_v)
+        u_rot, v_rot = rotate_vector(u, v, rotcos, rotsin)
 
-        return u_rot, v_rot
+        return self.duplicate_borders(u_rot), self.duplicate_borders(v_rot)
 
     def compute_overlap_indexes(self, xmin, xmax, ymin, ymax):
 
@@ -405,11 +445,157 @@ La classe SymphonieReader permet de lire les données du format Symphonie
     def read_axis_t(self, tmin, tmax, timestamp):
 
         if timestamp == 1:
-            return [(t - TimeCoverage.TIME_DATUM).total_seconds() \
-                    for t in self.times[tmin:tmax]];
+            return self.times[tmin:tmax].to_timestamps(TimeCoverage.TIME_DATUM)
         else:
             return self.times[tmin:tmax]
 
+    # Block
+    def get_aggregated_dataset(self):
+        """Retourne les fichiers de données agrégés le long du temps (AggregatedDataset).
+    @return: un AggregatedDataset ou None si les enregistrements des fichiers ne correspondent pas aux index du temps
+    du lecteur (fichiers datés contenant plusieurs enregistrements, fichiers sans dimension temporelle...)."""
+        if not self.aggregated_dataset_checked:
+            self.aggregated_dataset_checked = True
+            try:
+                if len(self.files) > 0:
+                    dataset = AggregatedDataset(self.files)
+                    if dataset.get_t_size() == self.t_size:
+                        self.aggregated_dataset = dataset
+                    else:
+                        dataset.close()
+            except (IOError, OSError, ValueError) as ex:
+                logging.debug("[SymphonieReader] Unable to aggregate data files: " + str(ex))
+
+        return self.aggregated_dataset
+
+    def read_block_variable(self, dataset, names, key):
+        """Lit un hyperslab de la première variable trouvée parmi names.
+    @param dataset: AggregatedDataset
+    @param names: variables NetCDF candidates
+    @param key: sélection [t,...,y,x]
+    @return: le tableau lu (valeurs masquées à NaN) ou None si aucune variable n'est trouvée."""
+        for name in names:
+            if name in dataset.variables:
+                return np.ma.filled(dataset.variables[name][key], fill_value=np.nan)
+        return None
+
+    def apply_block_wet_mask(self, dataset, data, tmin, tmax, ymin, ymax, xmin, xmax):
+        """Applique le masque des points secs (wetmask_t) à un bloc [t,...,y,x]."""
+        if SYMPHONIEReader.APPLY_WET_MASK and "wetmask_t" in dataset.variables:
+            wetmask = np.ma.getdata(dataset.variables["wetmask_t"][tmin:tmax, ymin:ymax, xmin:xmax])
+            wetmask = np.reshape(wetmask, (tmax - tmin,) + (1,) * (np.ndim(data) - 3) + np.shape(wetmask)[1:])
+            data[np.broadcast_to(wetmask == 0, np.shape(data))] = np.nan
+        return data
+
+    def read_vector_block(self, dataset, components, tmin, tmax, levels, xmin, xmax, ymin, ymax):
+        """Lit les composantes d'un vecteur sur un bloc de dates (et de niveaux), les ramène aux point tracer et les
+    tourne en une seule fois.
+    @param dataset: AggregatedDataset
+    @param components: couples de variables NetCDF candidates (u,v)
+    @param tmin,tmax: index du temps
+    @param levels: index ou slice des niveaux lus
+    @param xmin,xmax,ymin,ymax: hyperslab horizontal
+    @return: les composantes [u,v], chacune [t,y,x] (niveau unique) ou [t,z,y,x] (slice de niveaux)."""
+        xmin_overlap, xmax_overlap, ymin_overlap, ymax_overlap, new_xmin, new_xmax, new_ymin, new_ymax = self.compute_overlap_indexes(
+            xmin, xmax, ymin, ymax)
+        horizontal = (slice(ymin_overlap, ymax_overlap), slice(xmin_overlap, xmax_overlap))
+
+        mask_t = self.grid.variables["mask_t"][(levels,) + horizontal]
+        mask_u = self.grid.variables["mask_u"][(levels,) + horizontal]
+        mask_v = self.grid.variables["mask_v"][(levels,) + horizontal]
+
+        if self.gridrotcos_t is None and self.gridrotsin_t is None:
+            self.compute_rot()
+
+        rotcos = self.gridrotcos_t[horizontal]
+        rotsin = self.gridrotsin_t[horizontal]
+
+        for name_u, name_v in components:
+            if name_u in dataset.variables and name_v in dataset.variables:
+                file_levels = () if dataset.variables[name_u].ndim == 3 else (levels,)
+                key = (slice(tmin, tmax),) + file_levels + horizontal
+                data_u = np.ma.filled(dataset.variables[name_u][key], fill_value=np.nan)
+                data_v = np.ma.filled(dataset.variables[name_v][key], fill_value=np.nan)
+                break
+        else:
+            raise VariableNameError("SymphonieReader", "No variables found for " + str(components), 1000)
+
+        u_rot, v_rot = self.compute_vector_rotation(data_u, data_v, rotcos, rotsin, mask_t, mask_u, mask_v)
+        u_rot = self.apply_block_wet_mask(dataset, u_rot, tmin, tmax, ymin_overlap, ymax_overlap, xmin_overlap,
+                                          xmax_overlap)
+        v_rot = self.apply_block_wet_mask(dataset, v_rot, tmin, tmax, ymin_overlap, ymax_overlap, xmin_overlap,
+                                          xmax_overlap)
+
+        return [u_rot[..., new_ymin:new_ymax, new_xmin:new_xmax], v_rot[..., new_ymin:new_ymax, new_xmin:new_xmax]]
+
+    def read_variable_block(self, name, tmin, tmax, xmin, xmax, ymin, ymax):
+        """Retourne un bloc [t,y,x] (ou [t,composante,y,x] pour un vecteur) de la variable souhaitée. Les variables
+    de BLOCK_SCALARS et BLOCK_VECTORS sont lues en un seul hyperslab [tmin:tmax,...,ymin:ymax,xmin:xmax] des fichiers
+    agrégés ; les composantes des vecteurs sont ramenées aux point tracer et tournées sur tout le bloc. Les autres
+    variables sont lues pas de temps par pas de temps.
+    @param name: nom de la variable (ex: "sea_surface_temperature")
+    @param tmin,tmax: index du temps
+    @param xmin,xmax,ymin,ymax: hyperslab horizontal
+    @return: un tableau [t,y,x] ou [t,composante,y,x]."""
+        dataset = None
+        if name in SYMPHONIEReader.BLOCK_SCALARS or name in SYMPHONIEReader.BLOCK_VECTORS:
+            dataset = self.get_aggregated_dataset()
+
+        if dataset is None:
+            return CoverageReader.read_variable_block(self, name, tmin, tmax, xmin, xmax, ymin, ymax)
+
+        try:
+            index_z = self.get_z_size() - 1
+            if name in SYMPHONIEReader.BLOCK_SCALARS:
+                names, surface = SYMPHONIEReader.BLOCK_SCALARS[name]
+                key = (slice(tmin, tmax),) + ((index_z,) if surface else ()) + (slice(ymin, ymax), slice(xmin, xmax))
+                data = self.read_block_variable(dataset, names, key)
+                if data is None:
+                    raise VariableNameError("SymphonieReader", "No variables found for '" + str(
+                        VariableDefinition.LONG_NAME[name]) + "'", 1000)
+                return self.apply_block_wet_mask(dataset, data, tmin, tmax, ymin, ymax, xmin, xmax)
+
+            components, surface = SYMPHONIEReader.BLOCK_VECTORS[name]
+            return np.stack(self.read_vector_block(dataset, components, tmin, tmax, index_z, xmin, xmax, ymin, ymax),
+                            axis=1)
+
+        except Exception as ex:
+            logging.debug("Error '" + str(ex) + "'")
+            raise (VariableNameError("SymphonieReader", "An error occured : '" + str(ex) + "'", 1000))
+
+    def read_variable_level_block(self, name, tmin, tmax, zmin, zmax, xmin, xmax, ymin, ymax):
+        """Retourne un bloc [t,z,y,x] (ou [t,z,composante,y,x] pour un vecteur) de la variable souhaitée. Les
+    variables de LEVEL_BLOCK_SCALARS et LEVEL_BLOCK_VECTORS sont lues en un seul hyperslab
+    [tmin:tmax,zmin:zmax,ymin:ymax,xmin:xmax] des fichiers agrégés.
+    @param name: nom de la variable (ex: "sea_water_temperature")
+    @param tmin,tmax: index du temps
+    @param zmin,zmax: index des niveaux
+    @param xmin,xmax,ymin,ymax: hyperslab horizontal
+    @return: un tableau [t,z,y,x] ou [t,z,composante,y,x]."""
+        dataset = None
+        if name in SYMPHONIEReader.LEVEL_BLOCK_SCALARS or name in SYMPHONIEReader.LEVEL_BLOCK_VECTORS:
+            dataset = self.get_aggregated_dataset()
+
+        if dataset is None:
+            return CoverageReader.read_variable_level_block(self, name, tmin, tmax, zmin, zmax, xmin, xmax, ymin,
+                                                            ymax)
+
+        try:
+            if name in SYMPHONIEReader.LEVEL_BLOCK_SCALARS:
+                key = (slice(tmin, tmax), slice(zmin, zmax), slice(ymin, ymax), slice(xmin, xmax))
+                data = self.read_block_variable(dataset, SYMPHONIEReader.LEVEL_BLOCK_SCALARS[name], key)
+                if data is None:
+                    raise VariableNameError("SymphonieReader", "No variables found for '" + str(
+                        VariableDefinition.LONG_NAME[name]) + "'", 1000)
+                return self.apply_block_wet_mask(dataset, data, tmin, tmax, ymin, ymax, xmin, xmax)
+
+            return np.stack(self.read_vector_block(dataset, SYMPHONIEReader.LEVEL_BLOCK_VECTORS[name], tmin, tmax,
+                                                   slice(zmin, zmax), xmin, xmax, ymin, ymax), axis=2)
+
+        except Exception as ex:
+            logging.debug("Error '" + str(ex) + "'")
+            raise (VariableNameError("SymphonieReader", "An error occured : '" + str(ex) + "'", 1000))
+
     # Variables
     def read_variable_time(self,tmin, tmax, timestamp):
         return self.read_axis_t(tmin,tmax, timestamp=timestamp)
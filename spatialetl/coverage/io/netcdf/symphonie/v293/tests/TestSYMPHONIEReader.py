@@ -108,6 +108,25 @@ class TestSYMPHONIEReader(TestCase):
         self.assertEqual(expected_shape, np.shape(candidate_value), "shape assert")
         np.testing.assert_almost_equal(expected_value, candidate_value, 5)
 
+    # Block
+    def test_read_variable_block(self):
+        for name in ["sea_surface_height_above_mean_sea_level", "sea_surface_temperature", "sea_surface_salinity"]:
+            expected_value = np.array([getattr(self.reader, "read_variable_" + name + "_at_time")(index_t, 2, 9, 1, 7)
+                                       for index_t in range(0, 3)])
+
+            candidate_value = self.reader.read_variable_block(name, 0, 3, 2, 9, 1, 7)
+            self.assertEqual((3, 6, 7), np.shape(candidate_value), "shape assert")
+            np.testing.assert_array_equal(expected_value, candidate_value, name)
+
+    def test_read_variable_level_block(self):
+        for name in ["sea_water_temperature", "sea_water_salinity"]:
+            expected_value = np.array([[getattr(self.reader, "read_variable_" + name + "_at_time_and_depth")(
+                index_t, index_z, 0, 12, 0, 12) for index_z in range(3, 8)] for index_t in range(1, 3)])
+
+            candidate_value = self.reader.read_variable_level_block(name, 1, 3, 3, 8, 0, 12, 0, 12)
+            self.assertEqual((2, 5, 12, 12), np.shape(candidate_value), "shape assert")
+            np.testing.assert_array_equal(expected_value, candidate_value, name)
+
     # Variables
     def test_read_variable_longitude(self):
         expected_shape = (12, 12)
@@ -0,0 +1,114 @@
+import sys
+sys.path = ['/work/sciences/pySpatialETL'] + sys.path
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+from netCDF4 import Dataset
+
+from spatialetl.coverage import TimeCoverage
+from spatialetl.coverage.io.netcdf.DefaultWriter import DefaultWriter
+from spatialetl.coverage.io.netcdf.symphonie.v293.SYMPHONIEReader import SYMPHONIEReader
+
+
+class TestDefaultWriter(TestCase):
+
+    VARIABLES = ["sea_surface_height_above_mean_sea_level", "sea_surface_temperature"]
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, profile, options=None):
+        coverage = TimeCoverage(SYMPHONIEReader("../symphonie/v293/tests/resources/grid.nc",
+                                                "../symphonie/v293/tests/resources/2014*"))
+        filename = os.path.join(self.directory, profile + ".nc")
+        writer = DefaultWriter(coverage, filename, profile=profile, options=options)
+        writer.write_variable_bathymetry()
+        writer.write_variables(TestDefaultWriter.VARIABLES)
+        writer.close()
+        return Dataset(filename, 'r')
+
+    def test_profiles(self):
+        expected_file = self.write("default")
+        try:
+            names = ["bathymetry", "ssh_msl", "sea_surface_temperature"]
+            for name in names:
+                self.assertEqual("contiguous", expected_file.variables[name].chunking(), name)
+                self.assertFalse(expected_file.variables[name].filters()["zlib"], name)
+                self.assertIsNone(expected_file.variables[name].quantization(), name)
+
+            # Profil : (taille des blocs 2D, taille des blocs 3D, niveau de compression, quantification)
+            for profile, chunks_2d, chunks_3d, complevel, quantization in [
+                ("map", [12, 12], [1, 12, 12], 4, None),
+                ("timeseries", [12, 12], [3, 12, 12], 4, None),
+                ("archive", [12, 12], [1, 12, 12], 6, (4, "GranularBitRound"))]:
+                candidate_file = self.write(profile)
+                try:
+                    for name in names:
+                        expected_var = expected_file.variables[name]
+                        candidate_var = candidate_file.variables[name]
+                        message = profile + " " + name
+
+                        self.assertEqual(chunks_2d if expected_var.ndim == 2 else chunks_3d, candidate_var.chunking(),
+                                         message)
+                        filters = candidate_var.filters()
+                        self.assertTrue(filters["zlib"], message)
+                        self.assertTrue(filters["shuffle"], message)
+                        self.assertEqual(complevel, filters["complevel"], message)
+                        self.assertEqual(quantization, candidate_var.quantization(), message)
+
+                        expected_value = np.ma.filled(expected_var[:], np.nan)
+                        candidate_value = np.ma.filled(candidate_var[:].astype(np.float64), np.nan)
+                        if quantization is None:
+                            np.testing.assert_array_equal(expected_value, candidate_value, err_msg=message)
+                        else:
+                            np.testing.assert_allclose(expected_value, candidate_value, rtol=1e-3, err_msg=message)
+                finally:
+                    candidate_file.close()
+        finally:
+            expected_file.close()
+
+    def test_archive_missing_values(self):
+        expected_file = self.write("default")
+        candidate_file = self.write("archive")
+        try:
+            for name in ["bathymetry", "ssh_msl", "sea_surface_temperature"]:
+                missing = np.isnan(np.ma.filled(expected_file.variables[name][:], np.nan))
+                self.assertTrue(np.any(missing), name)
+
+                # Les valeurs manquantes (terre) restent manquantes : elles ne deviennent pas des zéros
+                candidate_var = candidate_file.variables[name]
+                candidate_value = candidate_var[:]
+                np.testing.assert_array_equal(missing, np.ma.getmaskarray(candidate_value), err_msg=name)
+                np.testing.assert_array_equal(candidate_var._FillValue, np.ma.getdata(candidate_value)[missing],
+                                              err_msg=name)
+        finally:
+            expected_file.close()
+            candidate_file.close()
+
+    def test_write_blocks(self):
+        expected_file = self.write("default")
+        # Un pas de temps par écriture
+        candidate_file = self.write("map", options={"buffer_size": 1, "chunking": {"time": 2, "latitude": 5}})
+        try:
+            for name in ["ssh_msl", "sea_surface_temperature"]:
+                self.assertEqual([2, 5, 12], candidate_file.variables[name].chunking(), name)
+                np.testing.assert_array_equal(np.ma.filled(expected_file.variables[name][:], np.nan),
+                                              np.ma.filled(candidate_file.variables[name][:], np.nan), err_msg=name)
+        finally:
+            expected_file.close()
+            candidate_file.close()
+
+    def test_unknown_profile(self):
+        coverage = TimeCoverage(SYMPHONIEReader("../symphonie/v293/tests/resources/grid.nc",
+                                                "../symphonie/v293/tests/resources/2014*"))
+        with self.assertRaises(ValueError):
+            DefaultWriter(coverage, os.path.join(self.directory, "unknown.nc"), profile="unknown")
+        with self.assertRaises(ValueError):
+            DefaultWriter(coverage, os.path.join(self.directory, "unknown.nc"), options={"unknown": 1})
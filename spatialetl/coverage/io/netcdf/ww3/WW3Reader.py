@@ -16,13 +16,16 @@
 from __future__ import division, print_function, absolute_import
 
 import os
+from datetime import datetime
 
-import cftime
 import numpy as np
-from netCDF4 import Dataset, MFDataset, num2date
+from netCDF4 import Dataset
 
 from spatialetl.coverage.TimeCoverage import TimeCoverage
 from spatialetl.coverage.io.CoverageReader import CoverageReader
+from spatialetl.utils.AggregatedDataset import AggregatedDataset
+from spatialetl.utils.TimeAxis import TimeAxis
+from spatialetl.utils.logger import logging
 
 
 class WW3Reader (CoverageReader):
@@ -33,7 +36,7 @@ class WW3Reader (CoverageReader):
         if os.path.isfile(self.filename):
             self.ncfile = Dataset(self.filename, 'r')
         elif os.path.isdir(self.filename):
-            self.ncfile = MFDataset(os.path.join(self.filename, "*.nc"), 'r')
+            self.ncfile = AggregatedDataset(os.path.join(self.filename, "*.nc"))
 
         if self.ncfile.variables['longitude'].ndim == 2:
             self.regular_grid=False
@@ -64,14 +67,21 @@ class WW3Reader (CoverageReader):
     # Axis
     def read_axis_t(self,tmin,tmax,timestamp):
         data = self.ncfile.variables['time'][tmin:tmax]
-        temp = num2date(data, units=self.ncfile.variables['time'].units, calendar="julian")
-
-        result = [cftime.datetime(t.year, t.month, t.day, t.hour, t.minute, t.second, t.microsecond) \
-                  for t in temp];
+        temp = TimeAxis.from_num(data, units=self.ncfile.variables['time'].units, calendar="julian")
+
+        # Les dates julian sont relues dans le calendrier standard avec les mêmes champs (année, mois, jour...) :
+        # entre 1901 et 2099 les deux calendriers ont les mêmes années bissextiles, les secondes sont donc identiques.
+        if len(temp) > 0 and (temp.to_date(np.min(temp.seconds)).year < 1901 or
+                              temp.to_date(np.max(temp.seconds)).year > 2099):
+            logging.warning("[WW3Reader] Julian dates outside 1901-2099 are converted field by field to the standard "
+                            "calendar.")
+            result = TimeAxis.from_dates([datetime(t.year, t.month, t.day, t.hour, t.minute, t.second)
+                                          for t in temp], "standard")
+        else:
+            result = TimeAxis(temp.seconds, "standard")
 
         if timestamp == 1:
-            return [(t - TimeCoverage.TIME_DATUM).total_seconds() \
-                    for t in result];
+            return result.to_timestamps(TimeCoverage.TIME_DATUM)
         else:
             return result;
     
@@ -16,7 +16,6 @@
 from __future__ import division, print_function, absolute_import
 
 from netCDF4 import Dataset
-from netCDF4 import date2num
 from numpy import float32
 from numpy import float64
 
@@ -68,7 +67,7 @@ class WW3Writer (CoverageWriter):
          # data
         latitudes[:,:] = self.coverage.read_axis_y();
         longitudes[:,:] = self.coverage.read_axis_x();
-        times[:] = date2num(self.coverage.read_axis_t(), units = times.units, calendar = times.calendar)
+        times[:] = self.coverage.read_axis_t().to_num(times.units, times.calendar)
 
     def close(self):
         self.ncfile.close()
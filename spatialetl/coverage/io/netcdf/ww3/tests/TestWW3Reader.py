@@ -0,0 +1,58 @@
+import sys
+sys.path = ['/work/sciences/pySpatialETL'] + sys.path
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import cftime
+import numpy as np
+from netCDF4 import Dataset
+
+from spatialetl.coverage.io.netcdf.ww3.WW3Reader import WW3Reader
+
+
+class TestWW3Reader(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def create_file(self, dates):
+        filename = os.path.join(self.directory, "ww3.nc")
+        dataset = Dataset(filename, "w")
+        dataset.createDimension("time", None)
+        dataset.createDimension("longitude", 3)
+        dataset.createDimension("latitude", 2)
+        dataset.createVariable("longitude", np.float32, ("longitude",))[:] = [0., 1., 2.]
+        dataset.createVariable("latitude", np.float32, ("latitude",))[:] = [40., 41.]
+        time = dataset.createVariable("time", np.float64, ("time",))
+        time.units = "days since 1990-01-01 00:00:00"
+        time.calendar = "julian"
+        time[:] = cftime.date2num(dates, time.units, "julian")
+        dataset.close()
+        return filename
+
+    def test_read_axis_t(self):
+        dates = [cftime.DatetimeJulian(2014, 1, 1, 0, 0, 0), cftime.DatetimeJulian(2016, 2, 29, 12, 30, 0)]
+        reader = WW3Reader(self.create_file(dates))
+        try:
+            # Les dates julian gardent leurs champs (année, mois, jour...) dans le calendrier standard
+            candidate = reader.read_axis_t(0, 2, 0)
+            self.assertEqual("standard", candidate.calendar)
+            self.assertEqual([str(date) for date in dates], [str(date) for date in candidate])
+        finally:
+            reader.close()
+
+    def test_read_axis_t_out_of_range(self):
+        dates = [cftime.DatetimeJulian(1850, 1, 1, 0, 0, 0), cftime.DatetimeJulian(2014, 1, 1, 6, 0, 0)]
+        reader = WW3Reader(self.create_file(dates))
+        try:
+            with self.assertLogs("main", level="WARNING"):
+                candidate = reader.read_axis_t(0, 2, 0)
+            self.assertEqual([str(date) for date in dates], [str(date) for date in candidate])
+        finally:
+            reader.close()
@@ -16,6 +16,7 @@
 from __future__ import division, print_function, absolute_import
 
 import os
+from xml.sax.saxutils import escape
 
 import numpy as np
 from osgeo import gdal
@@ -25,13 +26,64 @@ from spatialetl.coverage.TimeCoverage import TimeCoverage
 from spatialetl.coverage.TimeLevelCoverage import TimeLevelCoverage
 from spatialetl.coverage.io.CoverageWriter import CoverageWriter
 from spatialetl.exception.CoverageError import CoverageError
+from spatialetl.utils.FileHandlePool import close_handle
 from spatialetl.utils.VariableDefinition import VariableDefinition
 from spatialetl.utils.logger import logging
 
 
 class DefaultWriter (CoverageWriter):
-
-    def __init__(self,cov,myFile):
+    """
+La classe DefaultWriter écrit une couverture dans un répertoire de GeoTIFF : un fichier par variable et par pas de
+temps, ou un fichier par variable dont chaque bande est un pas de temps (option pack_time_steps).
+
+Deux modes d'écriture sont disponibles :
+    - "stream" : les couches sont rassemblées sur le rang 0 un pas de temps à la fois (MPI Gatherv) et écrites
+    aussitôt. La mémoire du rang 0 reste de l'ordre d'une couche [y,x].
+    - "tiles" : chaque rang écrit ses propres tuiles dans le sous-répertoire DefaultWriter.TILES_DIRECTORY, puis le
+    rang 0 écrit un VRT par fichier qui assemble les tuiles. Aucune donnée n'est échangée entre les rangs.
+
+Le format des fichiers est défini par un profil (DefaultWriter.PROFILES) dont chaque option peut être modifiée avec
+le paramètre options :
+    - tiled, block_size : découpage des fichiers en tuiles de block_size x block_size pixels.
+    - compress : None, "DEFLATE", "ZSTD" ou "LZW".
+    - predictor : None, 2 (différences horizontales, entiers) ou 3 (flottants).
+    - level : niveau de compression DEFLATE ou ZSTD (None = niveau par défaut de GDAL).
+    - data_type : "Float64", "Float32" ou "Int16". En Int16, les valeurs sont écrites sous la forme
+    (valeur - add_offset) / scale_factor et les valeurs manquantes valent DefaultWriter.INT16_NODATA.
+    - overviews : None, "auto" (réductions par 2 jusqu'à la taille d'une tuile) ou une liste de facteurs.
+    - overview_resampling : méthode de calcul des overviews (ex : "AVERAGE", "NEAREST").
+    - cog : True pour écrire des Cloud Optimized GeoTIFF (GDAL >= 3.1, mode "stream" uniquement).
+    - pack_time_steps : True pour écrire tous les pas de temps d'une variable dans un seul fichier (une bande par
+    pas de temps).
+
+@param cov: la couverture
+@param myFile: répertoire de sortie
+@param mode: mode d'écriture ("stream" ou "tiles")
+@param profile: nom du profil
+@param options: dictionnaire des options modifiant le profil
+"""
+    MODES = ["stream", "tiles"]
+    TILES_DIRECTORY = "tiles"
+    DATA_TYPES = ["Float64", "Float32", "Int16"]
+    COMPRESSIONS = [None, "DEFLATE", "ZSTD", "LZW"]
+    INT16_NODATA = -32768
+
+    PROFILES = {
+        "default": {"tiled": False, "block_size": 256, "compress": None, "predictor": None, "level": None,
+                    "data_type": "Float64", "scale_factor": None, "add_offset": 0.0, "overviews": None,
+                    "overview_resampling": "AVERAGE", "cog": False, "pack_time_steps": False},
+        "compressed": {"tiled": True, "block_size": 256, "compress": "DEFLATE", "predictor": 3, "level": 6,
+                       "data_type": "Float32", "scale_factor": None, "add_offset": 0.0, "overviews": None,
+                       "overview_resampling": "AVERAGE", "cog": False, "pack_time_steps": False},
+        "cog": {"tiled": True, "block_size": 512, "compress": "DEFLATE", "predictor": 3, "level": 6,
+                "data_type": "Float32", "scale_factor": None, "add_offset": 0.0, "overviews": "auto",
+                "overview_resampling": "AVERAGE", "cog": True, "pack_time_steps": False},
+        "flood_map": {"tiled": True, "block_size": 512, "compress": "ZSTD", "predictor": 2, "level": 9,
+                      "data_type": "Int16", "scale_factor": 0.001, "add_offset": 0.0, "overviews": "auto",
+                      "overview_resampling": "AVERAGE", "cog": True, "pack_time_steps": False}
+    }
+
+    def __init__(self,cov,myFile,mode="stream",profile="default",options=None):
         CoverageWriter.__init__(self,cov,myFile);
 
         if self.coverage.is_regular_grid() == False:
@@ -40,8 +92,34 @@ class DefaultWriter (CoverageWriter):
         if os.path.isdir(self.filename) is False:
             raise ValueError("Filename has to be a directory.")
 
+        if mode not in DefaultWriter.MODES:
+            raise ValueError("Unknown mode '" + str(mode) + "'. Available modes are " + str(DefaultWriter.MODES))
+
+        if profile not in DefaultWriter.PROFILES:
+            raise ValueError("Unknown profile '" + str(profile) + "'. Available profiles are " + str(
+                sorted(DefaultWriter.PROFILES.keys())))
+
+        self.mode = mode
+        self.options = dict(DefaultWriter.PROFILES[profile])
+        if options is not None:
+            unknown = set(options.keys()) - set(self.options.keys())
+            if len(unknown) > 0:
+                raise ValueError("Unknown options " + str(sorted(unknown)))
+            self.options.update(options)
+
+        self.check_options()
+
         gdal.AllRegister()
         self.driver = gdal.GetDriverByName('GTiff')
+        if self.options["cog"]:
+            self.cog_driver = gdal.GetDriverByName('COG')
+            if self.cog_driver is None:
+                raise ValueError("Cloud Optimized GeoTIFF requires GDAL >= 3.1")
+
+        # CRS info
+        proj = osr.SpatialReference()
+        proj.SetWellKnownGeogCS("EPSG:4326")
+        self.projection = proj.ExportToWkt()
 
         self.rows = self.coverage.get_x_size(type="target_global")
         self.cols = self.coverage.get_y_size(type="target_global")
@@ -55,424 +133,397 @@ class DefaultWriter (CoverageWriter):
 
         self.geotransform = (xmin, x_pixel_size, 0, ymin, 0, y_pixel_size)
 
+        if self.mode == "tiles":
+            tiles_directory = os.path.join(self.filename, DefaultWriter.TILES_DIRECTORY)
+            if self.coverage.rank == 0 and os.path.isdir(tiles_directory) is False:
+                os.makedirs(tiles_directory)
+            self.coverage.comm.barrier()
+
     def close(self):
         return
 
+    def check_options(self):
+        """Vérifie la cohérence des options du writer."""
+        if self.options["data_type"] not in DefaultWriter.DATA_TYPES:
+            raise ValueError("data_type must be one of " + str(DefaultWriter.DATA_TYPES))
+
+        if self.options["compress"] not in DefaultWriter.COMPRESSIONS:
+            raise ValueError("compress must be one of " + str(DefaultWriter.COMPRESSIONS))
+
+        if self.options["predictor"] not in (None, 1, 2, 3):
+            raise ValueError("predictor must be None, 1, 2 or 3")
+
+        if self.options["predictor"] == 3 and self.options["data_type"] == "Int16":
+            raise ValueError("predictor 3 (floating point) is not available for Int16 data")
+
+        if self.options["data_type"] == "Int16" and not self.options["scale_factor"]:
+            raise ValueError("Int16 data requires a scale_factor")
+
+        if self.options["overviews"] is not None and self.options["overviews"] != "auto":
+            if any(int(factor) < 2 for factor in self.options["overviews"]):
+                raise ValueError("overviews must be None, 'auto' or a list of factors greater than 1")
+
+        if self.options["cog"] and self.mode == "tiles":
+            raise ValueError("Cloud Optimized GeoTIFF requires a single file per layer: use mode 'stream'")
+
+    def get_creation_options(self, nb_bands=1):
+        """Retourne les options de création GDAL d'un GeoTIFF.
+    @param nb_bands: nombre de bandes du fichier
+    @return: la liste des options GTiff"""
+        options = ["BIGTIFF=IF_SAFER"]
+
+        if self.options["tiled"] or self.options["cog"]:
+            options.extend(["TILED=YES",
+                            "BLOCKXSIZE=" + str(self.options["block_size"]),
+                            "BLOCKYSIZE=" + str(self.options["block_size"])])
+
+        if nb_bands > 1:
+            options.append("INTERLEAVE=BAND")
+
+        # Les COG sont compressés lors de la copie finale
+        if self.options["compress"] is not None and self.options["cog"] is False:
+            options.append("COMPRESS=" + self.options["compress"])
+            if self.options["predictor"] is not None:
+                options.append("PREDICTOR=" + str(self.options["predictor"]))
+            if self.options["level"] is not None and self.options["compress"] == "DEFLATE":
+                options.append("ZLEVEL=" + str(self.options["level"]))
+            if self.options["level"] is not None and self.options["compress"] == "ZSTD":
+                options.append("ZSTD_LEVEL=" + str(self.options["level"]))
+
+        return options
+
+    def get_cog_options(self):
+        """Retourne les options de création GDAL d'un Cloud Optimized GeoTIFF.
+    @return: la liste des options COG"""
+        options = ["BIGTIFF=IF_SAFER", "BLOCKSIZE=" + str(self.options["block_size"])]
+
+        if self.options["compress"] is not None:
+            options.append("COMPRESS=" + self.options["compress"])
+            if self.options["predictor"] is not None and self.options["predictor"] > 1:
+                options.append("PREDICTOR=YES")
+            if self.options["level"] is not None and self.options["compress"] in ("DEFLATE", "ZSTD"):
+                options.append("LEVEL=" + str(self.options["level"]))
+
+        if self.options["overviews"] is None:
+            options.append("OVERVIEWS=NONE")
+        else:
+            options.extend(["OVERVIEWS=AUTO", "OVERVIEW_RESAMPLING=" + self.options["overview_resampling"]])
+
+        return options
+
+    def get_overview_factors(self, x_size, y_size):
+        """Retourne les facteurs de réduction des overviews d'un fichier.
+    @param x_size: nombre de colonnes du fichier
+    @param y_size: nombre de lignes du fichier
+    @return: la liste des facteurs (vide sans overviews)"""
+        if self.options["overviews"] is None:
+            return []
+
+        if self.options["overviews"] != "auto":
+            return [int(factor) for factor in self.options["overviews"]]
+
+        factors = []
+        factor = 2
+        while max(x_size, y_size) / factor >= self.options["block_size"] / 2:
+            factors.append(factor)
+            factor = factor * 2
+        return factors
+
+    def get_layer_filename(self, name, time=None, rank=None):
+        """Retourne le nom du fichier d'une variable.
+    @param name: nom de la variable (clé de VariableDefinition.VARIABLE_NAME)
+    @param time: date du pas de temps (None pour une variable sans dimension temporelle ou dont les pas de temps
+    sont des bandes)
+    @param rank: rang de la tuile. Si None, le fichier de la grille globale.
+    @return: le chemin du fichier"""
+        basename = VariableDefinition.VARIABLE_NAME[name]
+        if time is not None:
+            basename = time.strftime("%Y%m%d_%H%M%S") + "_" + basename
+
+        if rank is not None:
+            return os.path.join(self.filename, DefaultWriter.TILES_DIRECTORY, basename + "_" + str(rank) + ".tiff")
+        if self.mode == "tiles":
+            return os.path.join(self.filename, basename + ".vrt")
+        return os.path.join(self.filename, basename + ".tiff")
+
+    def get_tile_geotransform(self, rank):
+        """Retourne le géoréférencement de la tuile d'un rang.
+    @param rank: le rang
+    @return: le geotransform GDAL de la tuile"""
+        x_start = self.coverage.map_mpi[rank]["dst_global_x"].start
+        y_start = self.coverage.map_mpi[rank]["dst_global_y"].start
+        return (self.geotransform[0] + x_start * self.geotransform[1], self.geotransform[1], 0,
+                self.geotransform[3] + y_start * self.geotransform[5], 0, self.geotransform[5])
+
+    def pack_layer(self, data):
+        """Convertit une couche dans le type de données des fichiers.
+    @param data: la couche (float64, NaN pour les valeurs manquantes)
+    @return: la couche convertie"""
+        if self.options["data_type"] == "Float32":
+            return data.astype(np.float32)
+
+        if self.options["data_type"] == "Int16":
+            packed = np.round((data - self.options["add_offset"]) / self.options["scale_factor"])
+            packed = np.clip(np.where(np.isfinite(packed), packed, DefaultWriter.INT16_NODATA),
+                             DefaultWriter.INT16_NODATA, np.iinfo(np.int16).max)
+            # Une valeur valide ne doit pas être confondue avec la valeur manquante
+            packed[np.isfinite(data) & (packed == DefaultWriter.INT16_NODATA)] = DefaultWriter.INT16_NODATA + 1
+            return packed.astype(np.int16)
+
+        return data
+
+    def create_file(self, filename, x_size, y_size, nb_bands, geotransform):
+        """Crée un GeoTIFF. Un COG est d'abord écrit dans un fichier temporaire, converti par close_file() et
+    supprimé par remove_temporary_file().
+    @param filename: chemin du fichier
+    @param x_size: nombre de colonnes
+    @param y_size: nombre de lignes
+    @param nb_bands: nombre de bandes
+    @param geotransform: le geotransform GDAL du fichier
+    @return: le fichier GDAL ouvert"""
+        if self.options["cog"]:
+            filename = filename + ".tmp"
+
+        file = self.driver.Create(filename, int(x_size), int(y_size), int(nb_bands),
+                                  gdal.GetDataTypeByName(self.options["data_type"]),
+                                  options=self.get_creation_options(nb_bands))
+        file.SetProjection(self.projection)
+        file.SetGeoTransform(geotransform)
+
+        if self.options["data_type"] == "Int16":
+            for band in range(1, nb_bands + 1):
+                file.GetRasterBand(band).SetNoDataValue(DefaultWriter.INT16_NODATA)
+                file.GetRasterBand(band).SetScale(self.options["scale_factor"])
+                file.GetRasterBand(band).SetOffset(self.options["add_offset"])
+
+        return file
+
+    def write_band(self, file, band, data, time=None):
+        """Écrit une couche dans une bande d'un fichier.
+    @param file: le fichier GDAL ouvert
+    @param band: numéro de la bande (à partir de 1)
+    @param data: la couche [y,x]
+    @param time: date du pas de temps, enregistrée comme description de la bande"""
+        raster_band = file.GetRasterBand(band)
+        raster_band.WriteArray(self.pack_layer(data))
+        if time is not None:
+            raster_band.SetDescription(str(time))
+
+    def close_file(self, file, filename):
+        """Termine l'écriture d'un fichier : calcul des overviews ou conversion en COG. L'appelant doit ensuite
+    déréférencer le fichier avant d'appeler remove_temporary_file().
+    @param file: le fichier GDAL ouvert
+    @param filename: chemin du fichier"""
+        if self.options["cog"]:
+            file.FlushCache()
+            cog_file = self.cog_driver.CreateCopy(filename, file, options=self.get_cog_options())
+            # Sans Close() (GDAL < 3.8), un dataset n'est fermé qu'à la disparition de sa dernière référence
+            close_handle(cog_file)
+            cog_file = None
+            close_handle(file)
+            file = None
+            return
+
+        factors = self.get_overview_factors(file.RasterXSize, file.RasterYSize)
+        if len(factors) > 0:
+            file.BuildOverviews(self.options["overview_resampling"], factors)
+        file.FlushCache()
+        close_handle(file)
+
+    def remove_temporary_file(self, filename):
+        """Supprime le fichier temporaire d'un COG, une fois le fichier fermé et déréférencé.
+    @param filename: chemin du fichier"""
+        if self.options["cog"] and os.path.exists(filename + ".tmp"):
+            os.remove(filename + ".tmp")
+
+    def close_files(self, files):
+        """Ferme les fichiers ouverts par write_layers() et les retire du dictionnaire.
+    @param files: dictionnaire {nom: (chemin, fichier GDAL ouvert)}"""
+        while len(files) > 0:
+            filename, file = files.pop(next(iter(files)))
+            self.close_file(file, filename)
+            file = None
+            self.remove_temporary_file(filename)
+
+    def write_file(self, filename, data, geotransform, time=None):
+        """Écrit une couche [y,x] dans un GeoTIFF d'une bande.
+    @param filename: chemin du fichier
+    @param data: la couche
+    @param geotransform: le geotransform GDAL de la couche
+    @param time: date du pas de temps"""
+        file = self.create_file(filename, np.shape(data)[1], np.shape(data)[0], 1, geotransform)
+        self.write_band(file, 1, data, time)
+        self.close_file(file, filename)
+        file = None
+        self.remove_temporary_file(filename)
+
+    def write_vrt(self, name, time, time_indexes, time_dependent=True):
+        """Écrit le VRT qui assemble les tuiles d'une variable (mode "tiles").
+    @param name: nom de la variable
+    @param time: date du pas de temps (None pour une variable sans dimension temporelle ou dont les pas de temps
+    sont des bandes)
+    @param time_indexes: index globaux des pas de temps, un par bande du VRT
+    @param time_dependent: False pour une variable sans dimension temporelle"""
+        packed = self.options["pack_time_steps"] and time_dependent
+        times = None
+        if packed:
+            times = self.coverage.read_axis_t(type="target_global")
+
+        lines = ['<VRTDataset rasterXSize="' + str(int(self.rows)) + '" rasterYSize="' + str(int(self.cols)) + '">',
+                 '  <SRS>' + escape(self.projection) + '</SRS>',
+                 '  <GeoTransform>' + ", ".join([repr(float(value)) for value in self.geotransform]) +
+                 '</GeoTransform>']
+
+        for band in range(0, len(time_indexes)):
+            time_index = time_indexes[band]
+            lines.append('  <VRTRasterBand dataType="' + self.options["data_type"] + '" band="' + str(band + 1) + '">')
+            if packed:
+                lines.append('    <Description>' + escape(str(times[time_index])) + '</Description>')
+            if self.options["data_type"] == "Int16":
+                lines.extend(['    <NoDataValue>' + str(DefaultWriter.INT16_NODATA) + '</NoDataValue>',
+                              '    <Offset>' + repr(float(self.options["add_offset"])) + '</Offset>',
+                              '    <Scale>' + repr(float(self.options["scale_factor"])) + '</Scale>'])
+
+            for source in range(0, self.coverage.size):
+                tmin, tmax = self.get_time_range(source, time_dependent)
+                if time_index < tmin or time_index >= tmax:
+                    continue
+
+                source_band = 1
+                if packed:
+                    source_band = time_index - tmin + 1
+
+                x_size = str(self.coverage.map_mpi[source]["dst_local_x_size"])
+                y_size = str(self.coverage.map_mpi[source]["dst_local_y_size"])
+                tile = os.path.relpath(self.get_layer_filename(name, time, rank=source), self.filename)
+                lines.extend(['    <SimpleSource>',
+                              '      <SourceFilename relativeToVRT="1">' + escape(tile) + '</SourceFilename>',
+                              '      <SourceBand>' + str(source_band) + '</SourceBand>',
+                              '      <SrcRect xOff="0" yOff="0" xSize="' + x_size + '" ySize="' + y_size + '"/>',
+                              '      <DstRect xOff="' + str(self.coverage.map_mpi[source]["dst_global_x"].start) +
+                              '" yOff="' + str(self.coverage.map_mpi[source]["dst_global_y"].start) +
+                              '" xSize="' + x_size + '" ySize="' + y_size + '"/>',
+                              '    </SimpleSource>'])
+
+            lines.append('  </VRTRasterBand>')
+
+        lines.append('</VRTDataset>')
+
+        with open(self.get_layer_filename(name, time), "w") as file:
+            file.write("\n".join(lines) + "\n")
+
+    def write_layers(self, read_layer, names, time_dependent=True):
+        """Écrit une variable (ou les composantes d'un vecteur) pas de temps par pas de temps, selon le mode
+    d'écriture du writer.
+    @param read_layer: fonction de lecture de la couverture (ex : self.coverage.read_variable_wind_10m_at_time)
+    @param names: noms des composantes écrites (clés de VariableDefinition.VARIABLE_NAME), une par fichier
+    @param time_dependent: False pour une variable sans dimension temporelle"""
+        rank = self.coverage.rank
+        tmin, tmax = self.get_time_range(rank, time_dependent)
+        packed = self.options["pack_time_steps"] and time_dependent
+
+        if time_dependent:
+            times = self.coverage.read_axis_t(type="target_global")
+        else:
+            times = [None]
+
+        if rank == 0:
+            logging.info('[DefaultWriter] Writing variable \'' + ", ".join(
+                [str(VariableDefinition.LONG_NAME.get(name, name)) for name in names]) + '\'')
+
+        if self.mode == "tiles":
+            files = {}
+            for time_index in range(tmin, tmax):
+                local_data = self.read_local_layer(read_layer, time_index - tmin, len(names), time_dependent)
+                for index, name in enumerate(names):
+                    if packed:
+                        if name not in files:
+                            filename = self.get_layer_filename(name, rank=rank)
+                            files[name] = (filename, self.create_file(filename, np.shape(local_data)[2],
+                                                                      np.shape(local_data)[1], tmax - tmin,
+                                                                      self.get_tile_geotransform(rank)))
+                        self.write_band(files[name][1], time_index - tmin + 1, local_data[index], times[time_index])
+                    else:
+                        self.write_file(self.get_layer_filename(name, times[time_index], rank=rank),
+                                        local_data[index], self.get_tile_geotransform(rank))
+
+            self.close_files(files)
+
+            self.coverage.comm.barrier()
+
+            if rank == 0:
+                for name in names:
+                    if packed:
+                        self.write_vrt(name, None, range(0, len(times)), time_dependent)
+                    else:
+                        for time_index in range(0, len(times)):
+                            self.write_vrt(name, times[time_index], [time_index], time_dependent)
+            return
+
+        files = {}
+        for time_index in range(0, len(times)):
+            local_data = None
+            if tmin <= time_index < tmax:
+                local_data = self.read_local_layer(read_layer, time_index - tmin, len(names), time_dependent)
+
+            global_data = self.gather_layer(local_data, time_index, len(names), time_dependent)
+
+            if rank == 0:
+                for index, name in enumerate(names):
+                    logging.debug('[DefaultWriter] Writing variable \'' + str(
+                        VariableDefinition.LONG_NAME.get(name, name)) + '\' at time \'' + str(times[time_index]) + '\'')
+                    if packed:
+                        if name not in files:
+                            filename = self.get_layer_filename(name)
+                            files[name] = (filename, self.create_file(filename, self.rows, self.cols, len(times),
+                                                                      self.geotransform))
+                        self.write_band(files[name][1], time_index + 1, global_data[index], times[time_index])
+                    else:
+                        self.write_file(self.get_layer_filename(name, times[time_index]), global_data[index],
+                                        self.geotransform)
+
+        self.close_files(files)
+
     # Variables
     def write_variable_mesh_size(self):
-
-        if self.coverage.rank == 0:
-            logging.info('[DefaultWriter] Gathering data from all processors')
-            global_data = np.empty(
-                [self.coverage.get_y_size(type="target_global"),
-                 self.coverage.get_x_size(type="target_global")])
-            global_data[:] = np.nan
-
-        local_data = self.coverage.read_variable_mesh_size()
-
-        if self.coverage.rank != 0:
-            self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-        else:
-            # Pour le proc n°1
-            global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                        self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-            # Pour les autres
-            for source in range(1, self.coverage.size):
-                recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                    self.coverage.map_mpi[source]["dst_local_x_size"]])
-                self.coverage.comm.Recv(recvbuf, source=source)
-
-                global_data[self.coverage.map_mpi[source]["dst_global_y"],
-                            self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-        self.coverage.comm.barrier()
-
-        if self.coverage.rank == 0:
-            logging.info('[DefaultWriter] Writing variable \'' + str(
-                VariableDefinition.LONG_NAME['mesh_size']) + '\'')
-
-            file = self.driver.Create(
-                os.path.join(self.filename, VariableDefinition.VARIABLE_NAME['mesh_size'] + ".tiff"),
-                int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-            # CRS info
-            proj = osr.SpatialReference()
-            proj.SetWellKnownGeogCS("EPSG:4326")
-            file.SetProjection(proj.ExportToWkt())
-            file.SetGeoTransform(self.geotransform)
-            file.GetRasterBand(1).WriteArray(global_data)
+        self.write_layers(self.coverage.read_variable_mesh_size, ['mesh_size'], time_dependent=False)
 
     def write_variable_2D_sea_binary_mask(self):
-
-        if self.coverage.rank == 0:
-            logging.info('[DefaultWriter] Gathering data from all processors')
-            global_data = np.empty(
-                [self.coverage.get_y_size(type="target_global"),
-                 self.coverage.get_x_size(type="target_global")])
-            global_data[:] = np.nan
-
-        local_data = self.coverage.read_variable_2d_sea_binary_mask()
-
-        if self.coverage.rank != 0:
-            self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-        else:
-            # Pour le proc n°1
-            global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                        self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-            # Pour les autres
-            for source in range(1, self.coverage.size):
-                recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                    self.coverage.map_mpi[source]["dst_local_x_size"]])
-                self.coverage.comm.Recv(recvbuf, source=source)
-
-                global_data[self.coverage.map_mpi[source]["dst_global_y"],
-                            self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-        self.coverage.comm.barrier()
-
-        if self.coverage.rank == 0:
-            logging.info('[DefaultWriter] Writing variable \'' + str(
-                VariableDefinition.LONG_NAME['2d_sea_binary_mask']) + '\'')
-
-            file = self.driver.Create(
-                os.path.join(self.filename, VariableDefinition.VARIABLE_NAME['2d_sea_binary_mask'] + ".tiff"),
-                int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-            # CRS info
-            proj = osr.SpatialReference()
-            proj.SetWellKnownGeogCS("EPSG:4326")
-            file.SetProjection(proj.ExportToWkt())
-            file.SetGeoTransform(self.geotransform)
-            file.GetRasterBand(1).WriteArray(global_data)
+        self.write_layers(self.coverage.read_variable_2d_sea_binary_mask, ['2d_sea_binary_mask'], time_dependent=False)
 
     def write_variable_wet_binary_mask(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_wet_binary_mask_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['wet_binary_mask']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'wet_binary_mask']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'wet_binary_mask'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_wet_binary_mask_at_time, ['wet_binary_mask'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_3D_sea_binary_mask(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_2D_sea_binary_mask_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['2d_sea_binary_mask']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  '2d_sea_binary_mask']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               '2d_sea_binary_mask'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_2D_sea_binary_mask_at_time, ['2d_sea_binary_mask'])
         else:
-            raise CoverageError("DefaultWriter",
-                                "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_3D_land_binary_mask(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_2D_land_binary_mask_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['2d_land_binary_mask']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  '2d_land_binary_mask']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               '2d_land_binary_mask'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_2D_land_binary_mask_at_time, ['2d_land_binary_mask'])
         else:
-            raise CoverageError("DefaultWriter",
-                                "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     #################
     # HYDRO
     # 2D
     #################
     def write_variable_bathymetry(self):
-
-        if self.coverage.rank == 0:
-            logging.info('[DefaultWriter] Gathering data from all processors')
-            global_data = np.empty(
-                [self.coverage.get_y_size(type="target_global"),
-                 self.coverage.get_x_size(type="target_global")])
-            global_data[:] = np.nan
-
-        local_data = self.coverage.read_variable_bathymetry()
-
-        if self.coverage.rank != 0:
-            self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-        else:
-            # Pour le proc n°1
-            global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                        self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-            # Pour les autres
-            for source in range(1, self.coverage.size):
-                recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                    self.coverage.map_mpi[source]["dst_local_x_size"]])
-                self.coverage.comm.Recv(recvbuf, source=source)
-
-                global_data[self.coverage.map_mpi[source]["dst_global_y"],
-                            self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-        self.coverage.comm.barrier()
-
-        if self.coverage.rank == 0:
-
-            logging.info('[DefaultWriter] Writing variable \'' + str(
-                VariableDefinition.LONG_NAME['bathymetry']) + '\'')
-
-            file = self.driver.Create(os.path.join(self.filename, VariableDefinition.VARIABLE_NAME['bathymetry'] + ".tiff"),
-                                      int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-            # CRS info
-            proj = osr.SpatialReference()
-            proj.SetWellKnownGeogCS("EPSG:4326")
-            file.SetProjection(proj.ExportToWkt())
-            file.SetGeoTransform(self.geotransform)
-            file.GetRasterBand(1).WriteArray(global_data)
+        self.write_layers(self.coverage.read_variable_bathymetry, ['bathymetry'], time_dependent=False)
 
     def write_variable_barotropic_sea_water_velocity(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     2,
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_barotropic_sea_water_velocity_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                0,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[0]
-
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                1,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[1]
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([2, self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    0,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[0]
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    1,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[1]
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'Barotropic Sea Water Velocity\'\'')
-
-                file = open(self.filename, "w")
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.info(
-                        '[DefaultWriter] Writing variable \'Barotropic Sea Water Velocity\' at time \'' + str(
-                            time) + '\'')
-                    for vector in range(0, 2):
-                        if vector == 0:
-
-                            file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                                   VariableDefinition.VARIABLE_NAME[
-                                                                       'barotropic_eastward_sea_water_velocity'] + ".tiff"),
-                                                      int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                            # CRS info
-                            proj = osr.SpatialReference()
-                            proj.SetWellKnownGeogCS("EPSG:4326")
-                            file.SetProjection(proj.ExportToWkt())
-                            file.SetGeoTransform(self.geotransform)
-                            file.GetRasterBand(1).WriteArray(global_data[time_index][0])
-
-                        else:
-
-                            file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                                   VariableDefinition.VARIABLE_NAME[
-                                                                       'barotropic_northward_sea_water_velocity'] + ".tiff"),
-                                                      int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                            # CRS info
-                            proj = osr.SpatialReference()
-                            proj.SetWellKnownGeogCS("EPSG:4326")
-                            file.SetProjection(proj.ExportToWkt())
-                            file.SetGeoTransform(self.geotransform)
-                            file.GetRasterBand(1).WriteArray(global_data[time_index][1])
-
+            self.write_layers(self.coverage.read_variable_barotropic_sea_water_velocity_at_time,
+                              ['barotropic_eastward_sea_water_velocity', 'barotropic_northward_sea_water_velocity'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -483,399 +534,47 @@ class DefaultWriter (CoverageWriter):
     def write_variable_sea_surface_height_above_mean_sea_level(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_surface_height_above_mean_sea_level_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['sea_surface_height_above_mean_sea_level'])+'\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['sea_surface_height_above_mean_sea_level'])+'\' at time \'' + str(time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename,time.strftime("%Y%m%d_%H%M%S")+"_"+VariableDefinition.VARIABLE_NAME['sea_surface_height_above_mean_sea_level']+".tiff"), int(self.rows),int(self.cols), 1,gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
-
+            self.write_layers(self.coverage.read_variable_sea_surface_height_above_mean_sea_level_at_time,
+                              ['sea_surface_height_above_mean_sea_level'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_sea_surface_height_above_geoid(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_surface_height_above_geoid_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_height_above_geoid']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'sea_surface_height_above_geoid']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'sea_surface_height_above_geoid'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_sea_surface_height_above_geoid_at_time,
+                              ['sea_surface_height_above_geoid'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_sea_water_column_thickness(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_water_column_thickness_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_column_thickness']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'sea_water_column_thickness']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'sea_water_column_thickness'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_sea_water_column_thickness_at_time,
+                              ['sea_water_column_thickness'])
         else:
-            raise CoverageError("DefaultWriter",
-                                "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_sea_surface_temperature(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_surface_temperature_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_temperature']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'sea_surface_temperature']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'sea_surface_temperature'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_sea_surface_temperature_at_time, ['sea_surface_temperature'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_sea_surface_salinity(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_surface_salinity_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_salinity']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'sea_surface_salinity']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'sea_surface_salinity'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_sea_surface_salinity_at_time, ['sea_surface_salinity'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_sea_water_velocity_at_sea_water_surface(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     2,
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_water_velocity_at_sea_water_surface_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                0,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[0]
-
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                1,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[1]
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([2, self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    0,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[0]
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    1,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[1]
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'Sea Water Velocity at Sea Water Surface\'\'')
-
-                file = open(self.filename, "w")
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.info(
-                        '[DefaultWriter] Writing variable \'Sea Water Velocity at Sea Water Surface\' at time \'' + str(
-                            time) + '\'')
-                    for vector in range(0, 2):
-                        if vector == 0:
-
-                            file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                                   VariableDefinition.VARIABLE_NAME[
-                                                                       'eastward_sea_water_velocity_at_sea_water_surface'] + ".tiff"),
-                                                      int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                            # CRS info
-                            proj = osr.SpatialReference()
-                            proj.SetWellKnownGeogCS("EPSG:4326")
-                            file.SetProjection(proj.ExportToWkt())
-                            file.SetGeoTransform(self.geotransform)
-                            file.GetRasterBand(1).WriteArray(global_data[time_index][0])
-
-                        else:
-
-                            file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                                   VariableDefinition.VARIABLE_NAME[
-                                                                       'northward_sea_water_velocity_at_sea_water_surface'] + ".tiff"),
-                                                      int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                            # CRS info
-                            proj = osr.SpatialReference()
-                            proj.SetWellKnownGeogCS("EPSG:4326")
-                            file.SetProjection(proj.ExportToWkt())
-                            file.SetGeoTransform(self.geotransform)
-                            file.GetRasterBand(1).WriteArray(global_data[time_index][1])
-
+            self.write_layers(self.coverage.read_variable_sea_water_velocity_at_sea_water_surface_at_time,
+                              ['eastward_sea_water_velocity_at_sea_water_surface',
+                               'northward_sea_water_velocity_at_sea_water_surface'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -887,216 +586,25 @@ class DefaultWriter (CoverageWriter):
     def write_variable_sea_water_temperature_at_ground_level(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_water_temperature_at_ground_level_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_temperature_at_ground_level']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'sea_water_temperature_at_ground_level']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'sea_water_temperature_at_ground_level'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_sea_water_temperature_at_ground_level_at_time,
+                              ['sea_water_temperature_at_ground_level'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_sea_water_salinity_at_ground_level(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_water_salinity_at_ground_level_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_salinity_at_ground_level']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'sea_water_salinity_at_ground_level']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'sea_water_salinity_at_ground_level'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_sea_water_salinity_at_ground_level_at_time,
+                              ['sea_water_salinity_at_ground_level'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_sea_water_velocity_at_ground_level(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     2,
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_water_velocity_at_ground_level_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                0,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[0]
-
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                1,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[1]
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([2, self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    0,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[0]
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    1,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[1]
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'Sea Water Velocity at Ground Level\'\'')
-
-                file = open(self.filename, "w")
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.info(
-                        '[DefaultWriter] Writing variable \'Sea Water Velocity at Ground Level\' at time \'' + str(
-                            time) + '\'')
-                    for vector in range(0, 2):
-                        if vector == 0:
-
-                            file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                                   VariableDefinition.VARIABLE_NAME[
-                                                                       'eastward_sea_water_velocity_at_ground_level'] + ".tiff"),
-                                                      int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                            # CRS info
-                            proj = osr.SpatialReference()
-                            proj.SetWellKnownGeogCS("EPSG:4326")
-                            file.SetProjection(proj.ExportToWkt())
-                            file.SetGeoTransform(self.geotransform)
-                            file.GetRasterBand(1).WriteArray(global_data[time_index][0])
-
-                        else:
-
-                            file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                                   VariableDefinition.VARIABLE_NAME[
-                                                                       'northward_sea_water_velocity_at_ground_level'] + ".tiff"),
-                                                      int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                            # CRS info
-                            proj = osr.SpatialReference()
-                            proj.SetWellKnownGeogCS("EPSG:4326")
-                            file.SetProjection(proj.ExportToWkt())
-                            file.SetGeoTransform(self.geotransform)
-                            file.GetRasterBand(1).WriteArray(global_data[time_index][1])
+            self.write_layers(self.coverage.read_variable_sea_water_velocity_at_ground_level_at_time,
+                              ['eastward_sea_water_velocity_at_ground_level',
+                               'northward_sea_water_velocity_at_ground_level'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -1174,589 +682,73 @@ class DefaultWriter (CoverageWriter):
     def write_variable_sea_surface_wave_significant_height(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
+            self.write_layers(self.coverage.read_variable_sea_surface_wave_significant_height_at_time,
+                              ['sea_surface_wave_significant_height'])
+        else:
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
+    def write_variable_sea_surface_wave_breaking_height(self):
 
-                local_data = self.coverage.read_variable_sea_surface_wave_significant_height_at_time(time_index)
+        if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
+            self.write_layers(self.coverage.read_variable_sea_surface_wave_breaking_height_at_time,
+                              ['sea_surface_wave_breaking_height'])
+        else:
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
+    def write_variable_sea_surface_wave_mean_period(self):
 
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
+        if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
+            self.write_layers(self.coverage.read_variable_sea_surface_wave_mean_period_at_time,
+                              ['sea_surface_wave_mean_period'])
+        else:
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
+    def write_variable_sea_surface_wave_peak_period(self):
 
-            self.coverage.comm.barrier()
+        if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
+            self.write_layers(self.coverage.read_variable_sea_surface_wave_peak_period_at_time,
+                              ['sea_surface_wave_peak_period'])
+        else:
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
-            if self.coverage.rank == 0:
+    def write_variable_sea_surface_wave_from_direction(self):
 
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_wave_significant_height']) + '\'')
+        if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
+            self.write_layers(self.coverage.read_variable_sea_surface_wave_from_direction_at_time,
+                              ['sea_surface_wave_from_direction'])
+        else:
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
+    def write_variable_sea_surface_wave_to_direction(self):
 
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'sea_surface_wave_significant_height']) + '\' at time \'' + str(
-                        time) + '\'')
+        if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
+            self.write_layers(self.coverage.read_variable_sea_surface_wave_to_direction_at_time,
+                              ['sea_surface_wave_to_direction'])
+        else:
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'sea_surface_wave_significant_height'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
+    def write_variable_sea_surface_wave_stokes_drift_velocity(self):
 
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+        if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
+            self.write_layers(self.coverage.read_variable_sea_surface_wave_stokes_drift_velocity_at_time,
+                              ['eastward_sea_surface_wave_stokes_drift_velocity',
+                               'northward_sea_surface_wave_stokes_drift_velocity'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
-    def write_variable_sea_surface_wave_breaking_height(self):
+    def write_variable_radiation_pressure_bernouilli_head(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
+            self.write_layers(self.coverage.read_variable_radiation_pressure_bernouilli_head_at_time,
+                              ['radiation_pressure_bernouilli_head'])
+        else:
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_surface_wave_breaking_height_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_wave_breaking_height']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'sea_surface_wave_breaking_height']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'sea_surface_wave_breaking_height'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
-        else:
-            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
-
-    def write_variable_sea_surface_wave_mean_period(self):
-
-        if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_surface_wave_mean_period_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_wave_mean_period']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'sea_surface_wave_mean_period']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'sea_surface_wave_mean_period'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
-        else:
-            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
-
-    def write_variable_sea_surface_wave_peak_period(self):
-
-        if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_surface_wave_peak_period_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_wave_peak_period']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'sea_surface_wave_peak_period']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'sea_surface_wave_peak_period'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
-        else:
-            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
-
-    def write_variable_sea_surface_wave_from_direction(self):
-
-        if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_surface_wave_from_direction_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_wave_from_direction']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'sea_surface_wave_from_direction']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'sea_surface_wave_from_direction'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
-        else:
-            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
-
-    def write_variable_sea_surface_wave_to_direction(self):
-
-        if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_surface_wave_to_direction_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_wave_to_direction']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'sea_surface_wave_to_direction']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'sea_surface_wave_to_direction'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
-        else:
-            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
-
-    def write_variable_sea_surface_wave_stokes_drift_velocity(self):
+    def write_variable_sea_surface_wave_energy_flux_to_ocean(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     2,
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_surface_wave_stokes_drift_velocity_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                0,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[0]
-
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                1,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[1]
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([2, self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    0,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[0]
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    1,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[1]
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'Surface Stokes Drift Velocity\'\'')
-
-                file = open(self.filename, "w")
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.info('[DefaultWriter] Writing variable \'Surface Stokes Drift Velocity\' at time \'' + str(
-                        time) + '\'')
-
-                    for vector in range(0, 2):
-                        if vector == 0:
-
-                            file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                                   VariableDefinition.VARIABLE_NAME[
-                                                                       'eastward_sea_surface_wave_stokes_drift_velocity'] + ".tiff"),
-                                                      int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                            # CRS info
-                            proj = osr.SpatialReference()
-                            proj.SetWellKnownGeogCS("EPSG:4326")
-                            file.SetProjection(proj.ExportToWkt())
-                            file.SetGeoTransform(self.geotransform)
-                            file.GetRasterBand(1).WriteArray(global_data[time_index][0])
-
-                        else:
-
-                            file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                                   VariableDefinition.VARIABLE_NAME[
-                                                                       'northward_sea_surface_wave_stokes_drift_velocity'] + ".tiff"),
-                                                      int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                            # CRS info
-                            proj = osr.SpatialReference()
-                            proj.SetWellKnownGeogCS("EPSG:4326")
-                            file.SetProjection(proj.ExportToWkt())
-                            file.SetGeoTransform(self.geotransform)
-                            file.GetRasterBand(1).WriteArray(global_data[time_index][1])
-
-        else:
-            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
-
-    def write_variable_radiation_pressure_bernouilli_head(self):
-
-        if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_radiation_pressure_bernouilli_head_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['radiation_pressure_bernouilli_head']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'radiation_pressure_bernouilli_head']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'radiation_pressure_bernouilli_head'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
-        else:
-            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
-
-    def write_variable_sea_surface_wave_energy_flux_to_ocean(self):
-
-        if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_surface_wave_energy_flux_to_ocean_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_wave_energy_flux_to_ocean']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'sea_surface_wave_energy_flux_to_ocean']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'sea_surface_wave_energy_flux_to_ocean'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_sea_surface_wave_energy_flux_to_ocean_at_time,
+                              ['sea_surface_wave_energy_flux_to_ocean'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -1767,62 +759,8 @@ class DefaultWriter (CoverageWriter):
     def write_variable_sea_surface_wave_energy_dissipation_at_ground_level(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_surface_wave_energy_dissipation_at_ground_level_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_wave_energy_dissipation_at_ground_level']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'sea_surface_wave_energy_dissipation_at_ground_level']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'sea_surface_wave_energy_dissipation_at_ground_level'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_sea_surface_wave_energy_dissipation_at_ground_level_at_time,
+                              ['sea_surface_wave_energy_dissipation_at_ground_level'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -1833,186 +771,17 @@ class DefaultWriter (CoverageWriter):
     def write_variable_atmosphere_momentum_flux_to_waves(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     2,
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_atmosphere_momentum_flux_to_waves_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                0,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[0]
-
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                1,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[1]
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([2, self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    0,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[0]
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    1,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[1]
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'Atmosphere Momentum Flux to Waves\'\'')
-
-                file = open(self.filename, "w")
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.info(
-                        '[DefaultWriter] Writing variable \'Atmosphere Momentum Flux to Waves\' at time \'' + str(
-                            time) + '\'')
-
-                    for vector in range(0, 2):
-                        if vector == 0:
-
-                            file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                                   VariableDefinition.VARIABLE_NAME[
-                                                                       'eastward_atmosphere_momentum_flux_to_waves'] + ".tiff"),
-                                                      int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                            # CRS info
-                            proj = osr.SpatialReference()
-                            proj.SetWellKnownGeogCS("EPSG:4326")
-                            file.SetProjection(proj.ExportToWkt())
-                            file.SetGeoTransform(self.geotransform)
-                            file.GetRasterBand(1).WriteArray(global_data[time_index][0])
-
-                        else:
-
-                            file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                                   VariableDefinition.VARIABLE_NAME[
-                                                                       'northward_atmosphere_momentum_flux_to_waves'] + ".tiff"),
-                                                      int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                            # CRS info
-                            proj = osr.SpatialReference()
-                            proj.SetWellKnownGeogCS("EPSG:4326")
-                            file.SetProjection(proj.ExportToWkt())
-                            file.SetGeoTransform(self.geotransform)
-                            file.GetRasterBand(1).WriteArray(global_data[time_index][1])
-
+            self.write_layers(self.coverage.read_variable_atmosphere_momentum_flux_to_waves_at_time,
+                              ['eastward_atmosphere_momentum_flux_to_waves',
+                               'northward_atmosphere_momentum_flux_to_waves'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_waves_momentum_flux_to_ocean(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     2,
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_waves_momentum_flux_to_ocean_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                0,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[0]
-
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                1,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[1]
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([2, self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    0,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[0]
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    1,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[1]
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'Waves Momentum Flux To Ocean\'\'')
-
-                file = open(self.filename, "w")
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.info('[DefaultWriter] Writing variable \'Waves Momentum Flux To Ocean\' at time \''+str(time)+'\'')
-
-                    for vector in range(0, 2):
-                        if vector == 0:
-
-                            file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                                   VariableDefinition.VARIABLE_NAME[
-                                                                       'eastward_waves_momentum_flux_to_ocean'] + ".tiff"),
-                                                      int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                            # CRS info
-                            proj = osr.SpatialReference()
-                            proj.SetWellKnownGeogCS("EPSG:4326")
-                            file.SetProjection(proj.ExportToWkt())
-                            file.SetGeoTransform(self.geotransform)
-                            file.GetRasterBand(1).WriteArray(global_data[time_index][0])
-
-                        else:
-
-                            file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                                   VariableDefinition.VARIABLE_NAME[
-                                                                       'northward_waves_momentum_flux_to_ocean'] + ".tiff"),
-                                                      int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                            # CRS info
-                            proj = osr.SpatialReference()
-                            proj.SetWellKnownGeogCS("EPSG:4326")
-                            file.SetProjection(proj.ExportToWkt())
-                            file.SetGeoTransform(self.geotransform)
-                            file.GetRasterBand(1).WriteArray(global_data[time_index][1])
-
+            self.write_layers(self.coverage.read_variable_waves_momentum_flux_to_ocean_at_time,
+                              ['eastward_waves_momentum_flux_to_ocean', 'northward_waves_momentum_flux_to_ocean'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -2028,730 +797,84 @@ class DefaultWriter (CoverageWriter):
     def write_variable_sea_surface_air_pressure(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_sea_surface_air_pressure_at_time(
-                    time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_air_pressure']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'sea_surface_air_pressure']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'sea_surface_air_pressure'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_sea_surface_air_pressure_at_time,
+                              ['sea_surface_air_pressure'])
         else:
-            raise CoverageError("DefaultWriter",
-                                "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_surface_air_temperature(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_surface_air_temperature_at_time(
-                    time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['surface_air_temperature']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'surface_air_temperature']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'surface_air_temperature'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_surface_air_temperature_at_time, ['surface_air_temperature'])
         else:
-            raise CoverageError("DefaultWriter",
-                                "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_dew_point_temperature(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_dew_point_temperature_at_time(
-                    time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['dew_point_temperature']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'dew_point_temperature']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'dew_point_temperature'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_dew_point_temperature_at_time, ['dew_point_temperature'])
         else:
-            raise CoverageError("DefaultWriter",
-                                "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_rainfall_amount(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_rainfall_amount_at_time(
-                    time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['rainfall_amount']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'rainfall_amount']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'rainfall_amount'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_rainfall_amount_at_time, ['rainfall_amount'])
         else:
-            raise CoverageError("DefaultWriter",
-                                "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_surface_downward_sensible_heat_flux(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_surface_downward_sensible_heat_flux_at_time(
-                    time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['surface_downward_sensible_heat_flux']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'surface_downward_sensible_heat_flux']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'surface_downward_sensible_heat_flux'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_surface_downward_sensible_heat_flux_at_time,
+                              ['surface_downward_sensible_heat_flux'])
         else:
-            raise CoverageError("DefaultWriter",
-                                "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_surface_downward_latent_heat_flux(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_surface_downward_latent_heat_flux_at_time(
-                    time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['surface_downward_latent_heat_flux']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'surface_downward_latent_heat_flux']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'surface_downward_latent_heat_flux'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_surface_downward_latent_heat_flux_at_time,
+                              ['surface_downward_latent_heat_flux'])
         else:
-            raise CoverageError("DefaultWriter",
-                                "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_surface_downward_solar_radiation(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_surface_downward_solar_radiation_at_time(
-                    time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['surface_downwards_solar_radiation']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'surface_downwards_solar_radiation']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'surface_downwards_solar_radiation'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_surface_downward_solar_radiation_at_time,
+                              ['surface_downward_solar_radiation'])
         else:
-            raise CoverageError("DefaultWriter",
-                                "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_surface_downward_thermal_radiation(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_surface_downward_thermal_radiation_at_time(
-                    time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['surface_downwards_thermal_radiation']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'surface_downwards_thermal_radiation']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'surface_downwards_thermal_radiation'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_surface_downward_thermal_radiation_at_time,
+                              ['surface_downward_thermal_radiation'])
         else:
-            raise CoverageError("DefaultWriter",
-                                "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_surface_solar_radiation(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_surface_solar_radiation_at_time(
-                    time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['surface_solar_radiation']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'surface_solar_radiation']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'surface_solar_radiation'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_surface_solar_radiation_at_time, ['surface_solar_radiation'])
         else:
-            raise CoverageError("DefaultWriter",
-                                "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_surface_thermal_radiation(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_surface_thermal_radiation_at_time(
-                    time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['surface_thermal_radiation']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'surface_thermal_radiation']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'surface_thermal_radiation'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_surface_thermal_radiation_at_time,
+                              ['surface_thermal_radiation'])
         else:
-            raise CoverageError("DefaultWriter",
-                                "The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
+            raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_wind_stress(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     2,
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_wind_stress_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                0,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[0]
-
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                1,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[1]
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([2, self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    0,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[0]
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    1,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[1]
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'Wind Stress\'\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.info('[DefaultWriter] Writing variable \'Wind Stress\' at time \'' + str(time) + '\'')
-
-                    for vector in range(0, 2):
-                        if vector == 0:
-
-                            file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                                   VariableDefinition.VARIABLE_NAME[
-                                                                       'eastward_wind_stress'] + ".tiff"),
-                                                      int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                            # CRS info
-                            proj = osr.SpatialReference()
-                            proj.SetWellKnownGeogCS("EPSG:4326")
-                            file.SetProjection(proj.ExportToWkt())
-                            file.SetGeoTransform(self.geotransform)
-                            file.GetRasterBand(1).WriteArray(global_data[time_index][0])
-
-                        else:
-
-                            file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                                   VariableDefinition.VARIABLE_NAME[
-                                                                       'northward_wind_stress'] + ".tiff"),
-                                                      int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                            # CRS info
-                            proj = osr.SpatialReference()
-                            proj.SetWellKnownGeogCS("EPSG:4326")
-                            file.SetProjection(proj.ExportToWkt())
-                            file.SetGeoTransform(self.geotransform)
-                            file.GetRasterBand(1).WriteArray(global_data[time_index][1])
-
+            self.write_layers(self.coverage.read_variable_wind_stress_at_time,
+                              ['eastward_wind_stress', 'northward_wind_stress'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
@@ -2762,282 +885,27 @@ class DefaultWriter (CoverageWriter):
     def write_variable_wind_10m(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     2,
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_wind_10m_at_time(time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                0,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[0]
-
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                1,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data[1]
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([2, self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    0,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[0]
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    1,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf[1]
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'Wind 10m\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.info('[DefaultWriter] Writing variable \'Wind 10m\' at time \''+str(time)+'\'')
-
-                    for vector in range(0, 2):
-                        if vector == 0:
-
-                            file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                                   VariableDefinition.VARIABLE_NAME[
-                                                                       'eastward_wind_10m'] + ".tiff"),
-                                                      int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                            # CRS info
-                            proj = osr.SpatialReference()
-                            proj.SetWellKnownGeogCS("EPSG:4326")
-                            file.SetProjection(proj.ExportToWkt())
-                            file.SetGeoTransform(self.geotransform)
-                            file.GetRasterBand(1).WriteArray(global_data[time_index][0])
-
-                        else:
-
-                            file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                                   VariableDefinition.VARIABLE_NAME[
-                                                                       'northward_wind_10m'] + ".tiff"),
-                                                      int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                            # CRS info
-                            proj = osr.SpatialReference()
-                            proj.SetWellKnownGeogCS("EPSG:4326")
-                            file.SetProjection(proj.ExportToWkt())
-                            file.SetGeoTransform(self.geotransform)
-                            file.GetRasterBand(1).WriteArray(global_data[time_index][1])
+            self.write_layers(self.coverage.read_variable_wind_10m_at_time, ['eastward_wind_10m', 'northward_wind_10m'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_wind_speed_10m(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_wind_speed_10m_at_time(
-                    time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['wind_speed_10m']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'wind_speed_10m']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'wind_speed_10m'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_wind_speed_10m_at_time, ['wind_speed_10m'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_wind_to_direction_10m(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_wind_to_direction_10m_at_time(
-                    time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['wind_to_direction_10m']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'wind_to_direction_10m']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'wind_to_direction_10m'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_wind_to_direction_10m_at_time, ['wind_to_direction_10m'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
 
     def write_variable_wind_from_direction_10m(self):
 
         if (isinstance(self.coverage, TimeCoverage) or isinstance(self.coverage, TimeLevelCoverage)):
-
-            if self.coverage.rank == 0:
-                logging.info('[DefaultWriter] Gathering data from all processors')
-                global_data = np.empty(
-                    [self.coverage.get_t_size(type="target_global"),
-                     self.coverage.get_y_size(type="target_global"),
-                     self.coverage.get_x_size(type="target_global")])
-                global_data[:] = np.nan
-
-            for time_index in range(0, self.coverage.get_t_size()):
-
-                local_data = self.coverage.read_variable_wind_from_direction_10m_at_time(
-                    time_index)
-
-                if self.coverage.rank != 0:
-                    self.coverage.comm.Send(np.ascontiguousarray(local_data), dest=0)
-                else:
-                    # Pour le proc n°1
-                    global_data[self.coverage.map_mpi[self.coverage.rank]["dst_global_t"].start + time_index,
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_y"],
-                                self.coverage.map_mpi[self.coverage.rank]["dst_global_x"]] = local_data
-
-                    # Pour les autres
-                    for source in range(1, self.coverage.size):
-                        recvbuf = np.empty([self.coverage.map_mpi[source]["dst_local_y_size"],
-                                            self.coverage.map_mpi[source]["dst_local_x_size"]])
-                        self.coverage.comm.Recv(recvbuf, source=source)
-
-                        global_data[self.coverage.map_mpi[source]["dst_global_t"].start + time_index,
-                                    self.coverage.map_mpi[source]["dst_global_y"],
-                                    self.coverage.map_mpi[source]["dst_global_x"]] = recvbuf
-
-            self.coverage.comm.barrier()
-
-            if self.coverage.rank == 0:
-
-                logging.info('[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['wind_from_direction_10m']) + '\'')
-
-                for time_index in range(0, self.coverage.get_t_size(type="target_global")):
-                    time = self.coverage.read_axis_t(type="target_global")[time_index]
-
-                    logging.debug('[DefaultWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME[
-                                                                                  'wind_from_direction_10m']) + '\' at time \'' + str(
-                        time) + '\'')
-
-                    file = self.driver.Create(os.path.join(self.filename, time.strftime("%Y%m%d_%H%M%S") + "_" +
-                                                           VariableDefinition.VARIABLE_NAME[
-                                                               'wind_from_direction_10m'] + ".tiff"),
-                                              int(self.rows), int(self.cols), 1, gdal.GDT_Float64)
-
-                    # CRS info
-                    proj = osr.SpatialReference()
-                    proj.SetWellKnownGeogCS("EPSG:4326")
-                    file.SetProjection(proj.ExportToWkt())
-                    file.SetGeoTransform(self.geotransform)
-                    file.GetRasterBand(1).WriteArray(global_data[time_index])
+            self.write_layers(self.coverage.read_variable_wind_from_direction_10m_at_time, ['wind_from_direction_10m'])
         else:
             raise CoverageError("DefaultWriter","The given coverage is not an instance of 'TimeCoverage' or 'TimeLevelCoverage'")
-
-
-
-
-
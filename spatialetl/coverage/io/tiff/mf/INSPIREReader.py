@@ -25,6 +25,8 @@ from osgeo import gdal
 
 from spatialetl.coverage.TimeCoverage import TimeCoverage
 from spatialetl.coverage.io.CoverageReader import CoverageReader
+from spatialetl.utils.FileHandlePool import FILE_HANDLES
+from spatialetl.utils.TimeAxis import TimeAxis
 from spatialetl.utils.path import path_leaf
 
 
@@ -61,6 +63,7 @@ class INSPIREReader(CoverageReader):
             raise ValueError("Unable to decode file " + str(self.filename))
 
         self.times = []
+        known_times = set()
         self.variable_files = {}
         for var in INSPIREReader.VARIABLES:
             self.variable_files[var] = []
@@ -70,7 +73,8 @@ class INSPIREReader(CoverageReader):
             if groups:
                 current_time = cftime.datetime(int(groups.group(1)), int(groups.group(2)), int(groups.group(3)), int(groups.group(4)), int(groups.group(5)),
                                     int(groups.group(6)))
-                if current_time not in self.times:
+                if current_time not in known_times:
+                    known_times.add(current_time)
                     self.times.append(current_time)
 
                 if self.variable_files[groups.group(7)] is None:
@@ -88,18 +92,33 @@ class INSPIREReader(CoverageReader):
             print("Nb files : " + str(len(self.files)))
             raise ValueError("Tous les variables n'ont pas les mêmes temps :")
 
+        self.times = TimeAxis.from_dates(self.times)
+
         self.last_opened_t_index = 0
+        self.last_opened_file = self.variable_files["PRESSURE__MEAN_SEA_LEVEL"][self.last_opened_t_index]
 
-        self.tifffile = gdal.Open(self.variable_files["PRESSURE__MEAN_SEA_LEVEL"][self.last_opened_t_index])
+        self.tifffile_key, self.tifffile = FILE_HANDLES.acquire(self.last_opened_file, gdal.Open)
         self.y = None
         self.x = None
 
     def open_file(self,varname, index_t):
-        self.close()
-        self.tifffile = gdal.Open(self.variable_files[varname][index_t])
+        """Ouvre le fichier de la variable varname au pas de temps index_t. Les fichiers sont pris dans le pool des
+    fichiers ouverts (FILE_HANDLES) : relire une variable déjà ouverte ne rouvre pas le fichier.
+    @param varname: nom de la variable
+    @param index_t: index du pas de temps"""
+        file = self.variable_files[varname][index_t]
+
+        if file != self.last_opened_file or self.tifffile is None:
+            key, tifffile = FILE_HANDLES.acquire(file, gdal.Open)
+            self.close()
+            self.tifffile_key, self.tifffile = key, tifffile
+            self.last_opened_file = file
+            self.last_opened_t_index = index_t
 
     def close(self):
-        self.tifffile = None
+        if self.tifffile is not None:
+            FILE_HANDLES.release(self.tifffile_key)
+            self.tifffile = None
 
     def is_regular_grid(self):
         return True
@@ -107,7 +126,7 @@ class INSPIREReader(CoverageReader):
     def pixel2coord(self, y, x):
         # unravel GDAL affine transform parameters
         c, a, b, f, d, e = self.tifffile.GetGeoTransform()
-        """Returns global coordinates to pixel center using base-0 raster index"""
+        """Returns global coordinates to pixel center using base-0 raster index (scalars or numpy arrays)"""
         xp = a * y + b * x + a * 0.5 + b * 0.5 + c
         yp = d * y + e * x + d * 0.5 + e * 0.5 + f
         return (xp, yp)
@@ -125,8 +144,7 @@ class INSPIREReader(CoverageReader):
     def read_axis_t(self,tmin,tmax,timestamp):
 
         if timestamp == 1:
-            return [(t - TimeCoverage.TIME_DATUM).total_seconds() \
-                    for t in self.times[tmin:tmax]];
+            return self.times[tmin:tmax].to_timestamps(TimeCoverage.TIME_DATUM)
         else:
             return self.times[tmin:tmax]
         
@@ -135,9 +153,7 @@ class INSPIREReader(CoverageReader):
         if self.x is None:
             width = self.tifffile.RasterXSize
 
-            self.x = np.zeros([width])
-            for x in range(0,width):
-                self.x[x] = self.pixel2coord(x,0)[0]
+            self.x = self.pixel2coord(np.arange(width), 0)[0]
 
         return self.x[xmin:xmax]
 
@@ -145,9 +161,7 @@ class INSPIREReader(CoverageReader):
         if self.y is None:
             height = self.tifffile.RasterYSize
 
-            self.y = np.zeros([height])
-            for y in range(0,height):
-                self.y[y] = self.pixel2coord(0,y)[1]
+            self.y = self.pixel2coord(0, np.arange(height))[1]
 
         return self.y[ymin:ymax]
 
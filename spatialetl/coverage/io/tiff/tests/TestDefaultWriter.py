@@ -0,0 +1,149 @@
+import sys
+sys.path = ['/work/sciences/pySpatialETL'] + sys.path
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase, skipIf
+
+import numpy as np
+
+from spatialetl.coverage import TimeCoverage
+from spatialetl.coverage.io.netcdf.symphonie.v293.SYMPHONIEReader import SYMPHONIEReader
+
+try:
+    from osgeo import gdal
+    from spatialetl.coverage.io.tiff.DefaultWriter import DefaultWriter
+except ImportError:
+    gdal = None
+
+
+@skipIf(gdal is None, "GDAL is not available")
+class TestDefaultWriter(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.coverage = TimeCoverage(SYMPHONIEReader("../../netcdf/symphonie/v293/tests/resources/grid.nc",
+                                                     "../../netcdf/symphonie/v293/tests/resources/2014*"),
+                                     resolution_x=0.005, resolution_y=0.005)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def get_expected_geotransform(self):
+        # Géoréférencement écrit par le writer avant l'écriture en flux
+        x = self.coverage.read_axis_x(type="target_global")
+        y = self.coverage.read_axis_y(type="target_global")
+        return (np.min(x), round((np.max(x) - np.min(x)) / len(x), 6), 0,
+                np.min(y), 0, round((np.max(y) - np.min(y)) / len(y), 6))
+
+    def get_expected_layers(self):
+        # Le writer avant l'écriture en flux écrivait les couches de la couverture en Float64, sans conversion
+        return [np.asarray(self.coverage.read_variable_sea_surface_height_above_mean_sea_level_at_time(time),
+                           dtype=np.float64) for time in self.coverage.read_axis_t()]
+
+    def read_file(self, filename, band=1):
+        file = gdal.Open(filename)
+        try:
+            return file.GetRasterBand(band).ReadAsArray(), file.GetGeoTransform(), file.RasterCount
+        finally:
+            file = None
+
+    def test_stream(self):
+        writer = DefaultWriter(self.coverage, self.directory)
+        writer.write_variable_bathymetry()
+        writer.write_variable_sea_surface_height_above_mean_sea_level()
+        writer.close()
+
+        candidate_value, geotransform, nb_bands = self.read_file(writer.get_layer_filename("bathymetry"))
+        np.testing.assert_array_equal(np.asarray(self.coverage.read_variable_bathymetry(), dtype=np.float64),
+                                      candidate_value)
+        np.testing.assert_almost_equal(self.get_expected_geotransform(), geotransform)
+
+        for time, expected_value in zip(self.coverage.read_axis_t(), self.get_expected_layers()):
+            filename = writer.get_layer_filename("sea_surface_height_above_mean_sea_level", time)
+            self.assertTrue(os.path.basename(filename).startswith(time.strftime("%Y%m%d_%H%M%S")))
+            candidate_value, geotransform, nb_bands = self.read_file(filename)
+            self.assertEqual(1, nb_bands)
+            np.testing.assert_array_equal(expected_value, candidate_value)
+
+    def test_stream_pack_time_steps(self):
+        writer = DefaultWriter(self.coverage, self.directory, options={"pack_time_steps": True})
+        writer.write_variable_sea_surface_height_above_mean_sea_level()
+        writer.close()
+
+        filename = writer.get_layer_filename("sea_surface_height_above_mean_sea_level")
+        for band, expected_value in enumerate(self.get_expected_layers()):
+            candidate_value, geotransform, nb_bands = self.read_file(filename, band + 1)
+            self.assertEqual(self.coverage.get_t_size(), nb_bands)
+            np.testing.assert_array_equal(expected_value, candidate_value)
+
+    def test_tiles_vrt(self):
+        for pack_time_steps in [False, True]:
+            directory = os.path.join(self.directory, str(pack_time_steps))
+            os.makedirs(directory)
+            writer = DefaultWriter(self.coverage, directory, mode="tiles",
+                                   options={"pack_time_steps": pack_time_steps})
+            writer.write_variable_bathymetry()
+            writer.write_variable_sea_surface_height_above_mean_sea_level()
+            writer.close()
+
+            self.assertTrue(os.path.isdir(os.path.join(directory, DefaultWriter.TILES_DIRECTORY)))
+
+            filename = writer.get_layer_filename("bathymetry")
+            self.assertTrue(filename.endswith(".vrt"))
+            candidate_value, geotransform, nb_bands = self.read_file(filename)
+            np.testing.assert_array_equal(np.asarray(self.coverage.read_variable_bathymetry(), dtype=np.float64),
+                                          candidate_value)
+            np.testing.assert_almost_equal(self.get_expected_geotransform(), geotransform)
+
+            for index, (time, expected_value) in enumerate(zip(self.coverage.read_axis_t(),
+                                                               self.get_expected_layers())):
+                if pack_time_steps:
+                    filename, band = writer.get_layer_filename("sea_surface_height_above_mean_sea_level"), index + 1
+                else:
+                    filename, band = writer.get_layer_filename("sea_surface_height_above_mean_sea_level", time), 1
+                candidate_value, geotransform, nb_bands = self.read_file(filename, band)
+                np.testing.assert_array_equal(expected_value, candidate_value, err_msg=str(pack_time_steps))
+
+    def test_profiles(self):
+        writer = DefaultWriter(self.coverage, self.directory, profile="compressed")
+        writer.write_variable_bathymetry()
+        writer.close()
+
+        filename = writer.get_layer_filename("bathymetry")
+        info = gdal.Info(filename, format="json")
+        self.assertEqual("DEFLATE", info["metadata"]["IMAGE_STRUCTURE"]["COMPRESSION"])
+        self.assertEqual("Float32", info["bands"][0]["type"])
+        candidate_value, geotransform, nb_bands = self.read_file(filename)
+        np.testing.assert_array_equal(np.asarray(self.coverage.read_variable_bathymetry(), dtype=np.float32),
+                                      candidate_value)
+
+        with self.assertRaises(ValueError):
+            DefaultWriter(self.coverage, self.directory, profile="unknown")
+        with self.assertRaises(ValueError):
+            DefaultWriter(self.coverage, self.directory, mode="tiles", profile="cog")
+
+    def test_cog(self):
+        writer = DefaultWriter(self.coverage, self.directory, profile="cog", options={"block_size": 16})
+        writer.write_variable_bathymetry()
+        writer.write_variable_sea_surface_height_above_mean_sea_level()
+        writer.close()
+
+        self.assertEqual([], [name for name in os.listdir(self.directory) if name.endswith(".tmp")])
+
+        filename = writer.get_layer_filename("bathymetry")
+        info = gdal.Info(filename, format="json")
+        self.assertEqual("COG", info["metadata"]["IMAGE_STRUCTURE"]["LAYOUT"])
+        self.assertEqual("DEFLATE", info["metadata"]["IMAGE_STRUCTURE"]["COMPRESSION"])
+        self.assertEqual([16, 16], info["bands"][0]["block"])
+        self.assertTrue(len(info["bands"][0]["overviews"]) > 0)
+        candidate_value, geotransform, nb_bands = self.read_file(filename)
+        np.testing.assert_array_equal(np.asarray(self.coverage.read_variable_bathymetry(), dtype=np.float32),
+                                      candidate_value)
+
+        for time, expected_value in zip(self.coverage.read_axis_t(), self.get_expected_layers()):
+            filename = writer.get_layer_filename("sea_surface_height_above_mean_sea_level", time)
+            self.assertEqual("COG", gdal.Info(filename, format="json")["metadata"]["IMAGE_STRUCTURE"]["LAYOUT"])
+            candidate_value, geotransform, nb_bands = self.read_file(filename)
+            np.testing.assert_array_equal(expected_value.astype(np.float32), candidate_value)
@@ -51,6 +51,14 @@ class TestCoverage(TestCase):
             if coverage.size == 1:
                 self.fail(ex.message)
 
+        # test_find_points_index()
+        if coverage.size == 1:
+            candidate_value = coverage.find_points_index([0.0719, 0.0719], [0.0899, 0.0899], decimal_tolerance=3,
+                                                         type="source_global")
+            self.assertEqual([5, 5], list(candidate_value[0]), "test_find_points_index()")
+            self.assertEqual([6, 6], list(candidate_value[1]), "test_find_points_index()")
+            np.testing.assert_allclose(candidate_value[4], [0.006314286576960388] * 2, err_msg="test_find_points_index()")
+
         # test_read_variable_bathymetry()
         expected_shape = (coverage.map_mpi[coverage.rank]["dst_local_y_size"],
                           coverage.map_mpi[coverage.rank]["dst_local_x_size"])
@@ -5,10 +5,13 @@ from unittest import TestCase
 
 import numpy as np
 import cftime
+import pandas
 
 from spatialetl.coverage import TimeCoverage
 from spatialetl.coverage.io.netcdf.symphonie.v293.SYMPHONIEReader import SYMPHONIEReader
 from spatialetl.exception.NotFoundInRankError import NotFoundInRankError
+from spatialetl.utils.FileHandlePool import FILE_HANDLES
+from spatialetl.utils.TimeAxis import TimeAxis, to_timestamps
 
 
 class TestTimeCoverage(TestCase):
@@ -45,6 +48,81 @@ class TestTimeCoverage(TestCase):
         #self.assertEqual(expected_shape, candidate_shape, "test_read_variable_bathymetry()")
 
 
+    def test_read_variable_block(self):
+        reader = SYMPHONIEReader("../io/netcdf/symphonie/v293/tests/resources/grid.nc",
+                                 "../io/netcdf/symphonie/v293/tests/resources/2014*")
+        coverage = TimeCoverage(reader, resolution_x=0.001, resolution_y=0.001)
+
+        # test_read_variable_block()
+        expected_shape = (coverage.map_mpi[coverage.rank]["dst_local_t_size"],
+                          coverage.map_mpi[coverage.rank]["dst_local_y_size"],
+                          coverage.map_mpi[coverage.rank]["dst_local_x_size"])
+        candidate_value = coverage.read_variable_block("sea_surface_height_above_mean_sea_level")
+        self.assertEqual(expected_shape, np.shape(candidate_value), "test_read_variable_block()")
+
+        expected_value = coverage.read_variable_sea_surface_height_above_mean_sea_level_at_time(coverage.read_axis_t()[1])
+        np.testing.assert_array_equal(expected_value, candidate_value[1], err_msg="test_read_variable_block()")
+
+    def test_find_time_indices(self):
+        reader = SYMPHONIEReader("../io/netcdf/symphonie/v293/tests/resources/grid.nc",
+                                 "../io/netcdf/symphonie/v293/tests/resources/2014*")
+        coverage = TimeCoverage(reader)
+
+        # test_find_time_indices()
+        dates = list(coverage.read_axis_t(type="source")) + [cftime.datetime(2015, 1, 1, 0, 0, 0)]
+        expected_value = [coverage.find_time_index(date) for date in dates[:-1]] + [-1]
+        candidate_value = coverage.find_time_indices(dates)
+        np.testing.assert_array_equal(expected_value, candidate_value, err_msg="test_find_time_indices()")
+
+    def test_freq(self):
+        reader = SYMPHONIEReader("../io/netcdf/symphonie/v293/tests/resources/grid.nc",
+                                 "../io/netcdf/symphonie/v293/tests/resources/2014*")
+        coverage = TimeCoverage(reader, freq="15min")
+
+        # test_read_axis_t()
+        candidate_value = coverage.read_axis_t()
+        self.assertIsInstance(candidate_value, TimeAxis, "test_read_axis_t()")
+        self.assertEqual("standard", candidate_value.calendar, "test_read_axis_t()")
+        expected_value = pandas.date_range(start="2014-01-01 12:00:00", end="2014-01-01 13:00:12", freq="15min").values
+        np.testing.assert_array_equal(expected_value.astype("datetime64[s]"), candidate_value.to_datetime64(),
+                                      err_msg="test_read_axis_t()")
+        np.testing.assert_array_equal(to_timestamps(expected_value, TimeCoverage.TIME_DATUM),
+                                      coverage.read_axis_t(timestamp=1), err_msg="test_read_axis_t()")
+
+        # L'axe source n'est pas modifié
+        np.testing.assert_array_equal(reader.read_axis_t(0, reader.get_t_size(), 0).seconds,
+                                      coverage.read_axis_t(type="source_global").seconds, err_msg="test_read_axis_t()")
+
+    def test_layer_cache(self):
+        reader = SYMPHONIEReader("../io/netcdf/symphonie/v293/tests/resources/grid.nc",
+                                 "../io/netcdf/symphonie/v293/tests/resources/2014*")
+        coverage = TimeCoverage(reader)
+        expected_value = coverage.read_variable_wind_speed_10m_at_time(1)
+
+        coverage.enable_layer_cache()
+        coverage.read_variable_wind_speed_10m_at_time(1)
+        coverage.read_variable_wind_from_direction_10m_at_time(1)
+        candidate_value = coverage.read_variable_wind_speed_10m_at_time(1)
+
+        np.testing.assert_array_equal(expected_value, candidate_value, err_msg="test_layer_cache()")
+        statistics = coverage.get_layer_cache_statistics()
+        self.assertEqual(1, statistics["misses"], "test_layer_cache()")
+        self.assertEqual(2, statistics["hits"], "test_layer_cache()")
+
+    def test_file_handle_pool(self):
+        reader = SYMPHONIEReader("../io/netcdf/symphonie/v293/tests/resources/grid.nc",
+                                 "../io/netcdf/symphonie/v293/tests/resources/2014*")
+        coverage = TimeCoverage(reader)
+        expected_value = coverage.read_variable_sea_surface_height_above_mean_sea_level_at_time(0)
+
+        coverage.read_variable_sea_surface_height_above_mean_sea_level_at_time(1)
+        hits = FILE_HANDLES.get_statistics()["hits"]
+        candidate_value = coverage.read_variable_sea_surface_height_above_mean_sea_level_at_time(0)
+
+        np.testing.assert_array_equal(expected_value, candidate_value, err_msg="test_file_handle_pool()")
+        self.assertEqual(0, reader.last_opened_t_index, "test_file_handle_pool()")
+        self.assertEqual(hits + 1, FILE_HANDLES.get_statistics()["hits"], "test_file_handle_pool()")
+
     def test_mpi_interpolated_coverage(self):
         reader = SYMPHONIEReader("../io/netcdf/symphonie/v293/tests/resources/grid.nc",
                                  "../io/netcdf/symphonie/v293/tests/resources/2014*")
@@ -18,32 +18,471 @@ from __future__ import division, print_function, absolute_import
 from datetime import datetime
 
 import numpy as np
+from netCDF4 import Dataset
 from numpy import int8, int16, int32, int64
-from scipy.interpolate import griddata
+from scipy.interpolate import CloughTocher2DInterpolator
+from scipy.interpolate import CubicSpline
 from scipy.interpolate import interp1d
+from scipy.sparse import csr_matrix
+from scipy.sparse import kron as sparse_kron
+from scipy.sparse import vstack as sparse_vstack
+from scipy.spatial import Delaunay, cKDTree
 
 from spatialetl.utils.logger import logging
 
+# Nom des méthodes dans les fichiers de remapping SCRIP
+SCRIP_MAP_METHODS = {
+    "linear": "Linear remapping",
+    "bilinear": "Bilinear remapping",
+    "conservative": "Conservative remapping"
+}
 
-def resample_2d_to_grid(gridX,gridY,newX,newY,data,method):
+
+def resample_2d_to_grid(gridX,gridY,newX,newY,data,method,weights=None):
 
     logging.debug("[InterpolatorCore][horizontal_interpolation()] starting interpolation with method '" + str(method) + "'")
 
+    if weights is None:
+        weights = compute_2d_interpolation_weights(gridX, gridY, newX, newY, method)
+
+    return apply_2d_interpolation_weights(weights, data)
+
+def _rescale_points(points, offset=None, scale=None):
+    """Ramène les coordonnées dans le cube unité (même normalisation que griddata(rescale=True))."""
+    if offset is None:
+        offset = np.mean(points, axis=0)
+        scale = np.ptp(points, axis=0)
+        scale[~(scale > 0)] = 1.0
+    return (points - offset) / scale, offset, scale
+
+def compute_2d_interpolation_weights(gridX,gridY,newX,newY,method,target_rows=None):
+    """
+    Calcule une seule fois les poids d'interpolation entre une grille source et une grille cible. Les poids
+    sont ensuite appliqués à chaque couche par apply_2d_interpolation_weights() sans refaire la triangulation.
+    @param gridX: axe x de la grille source : [x] ou [y,x]
+    @param gridY: axe y de la grille source : [y] ou [y,x]
+    @param newX: axe x de la grille cible : [x] ou [y,x]
+    @param newY: axe y de la grille cible : [y] ou [y,x]
+    @param method: méthode d'interpolation : "nearest", "linear", "cubic", "bilinear" ou "conservative"
+    @param target_rows: slice des lignes (axe y) de la grille cible à calculer (par défaut toute la grille)
+    @return: un dictionnaire contenant les poids :
+     - "linear", "bilinear", "conservative" : une matrice creuse [nb point cible, nb point source] et le masque
+     des point cibles sans poids
+     - "nearest" : l'index du point source le plus proche de chaque point cible
+     - "cubic" : la triangulation de la grille source et les point cibles normalisés
+    """
+    logging.debug("[InterpolatorCore][compute_2d_interpolation_weights()] computing weights with method '" + str(method) + "'")
+
+    if method == "conservative":
+        return _compute_conservative_weights(gridX, gridY, newX, newY, target_rows)
+
     gridX = np.ma.filled(gridX,fill_value=-9999.)
     gridY = np.ma.filled(gridY,fill_value=-9999.)
 
     if gridX.ndim ==1 and gridY.ndim==1:
         gridX, gridY = np.meshgrid(gridX, gridY)
 
-    points = np.array([gridX.flatten(), gridY.flatten()]).T
-    values = data.flatten()
-    xx, yy = np.meshgrid(newX, newY)
+    if np.ndim(newX) == 1 and np.ndim(newY) == 1:
+        xx, yy = np.meshgrid(newX, newY)
+    else:
+        xx, yy = np.ma.filled(newX, fill_value=-9999.), np.ma.filled(newY, fill_value=-9999.)
+
+    if target_rows is not None:
+        xx, yy = xx[target_rows], yy[target_rows]
+
+    if method == "bilinear":
+        return _compute_bilinear_weights(gridX, gridY, xx, yy)
+
+    points = np.array([gridX.flatten(), gridY.flatten()], dtype=np.float64).T
+    target_points = np.array([xx.flatten(), yy.flatten()], dtype=np.float64).T
+
+    points, offset, scale = _rescale_points(points)
+    target_points = _rescale_points(target_points, offset, scale)[0]
+
+    weights = {
+        "method": method,
+        "source_size": np.shape(points)[0],
+        "source_shape": np.shape(gridX),
+        "target_shape": np.shape(xx)
+    }
+
+    if method == "nearest":
+        weights["indices"] = cKDTree(points).query(target_points)[1]
+
+    elif method == "linear":
+        tri = Delaunay(points)
+        simplex = tri.find_simplex(target_points)
+        outside = simplex == -1
+        simplex[outside] = 0
+
+        # Coordonnées barycentriques des point cibles dans leur triangle
+        transform = tri.transform[simplex]
+        b = np.einsum('ijk,ik->ij', transform[:, :2, :], target_points - transform[:, 2, :])
+        barycentric = np.column_stack((b, 1.0 - b.sum(axis=1)))
+        barycentric[outside] = 0.0
+
+        rows = np.repeat(np.arange(np.shape(target_points)[0]), 3)
+        weights["matrix"] = csr_matrix((barycentric.flatten(), (rows, tri.simplices[simplex].flatten())),
+                                       shape=(np.shape(target_points)[0], np.shape(points)[0]))
+        weights["outside"] = outside
+
+    elif method == "cubic":
+        weights["triangulation"] = Delaunay(points)
+        weights["target_points"] = target_points
+
+    else:
+        raise ValueError("Unable to decode horizontal interpolation method : " + str(method))
+
+    return weights
+
+def _compute_bilinear_weights(gridX,gridY,xx,yy,max_iterations=10,tolerance=1e-6):
+    """
+    Poids de l'interpolation bilinéaire d'une grille source [y,x] (régulière ou curviligne) vers des point cibles
+    [y,x]. Pour chaque point cible, on cherche la maille source qui le contient parmi les quatre mailles entourant le
+    noeud source le plus proche, puis on inverse la transformation bilinéaire de la maille (méthode de Newton).
+    """
+    source_shape = np.shape(gridX)
+    y_size, x_size = source_shape
+    target_points = np.array([xx.flatten(), yy.flatten()], dtype=np.float64).T
+    nb_targets = np.shape(target_points)[0]
+
+    if y_size < 2 or x_size < 2:
+        raise ValueError("Bilinear remapping needs at least 2x2 source points.")
+
+    nodes = np.array([gridX.flatten(), gridY.flatten()], dtype=np.float64).T
+    nearest = cKDTree(nodes).query(target_points)[1]
+    nearest_j, nearest_i = np.unravel_index(nearest, source_shape)
+
+    found = np.zeros(nb_targets, dtype=bool)
+    cell_j = np.zeros(nb_targets, dtype=np.int64)
+    cell_i = np.zeros(nb_targets, dtype=np.int64)
+    cell_s = np.zeros(nb_targets)
+    cell_t = np.zeros(nb_targets)
+
+    for dj, di in [(0, 0), (-1, 0), (0, -1), (-1, -1)]:
+
+        todo = np.where(~found)[0]
+        if len(todo) == 0:
+            break
+
+        j = np.clip(nearest_j[todo] + dj, 0, y_size - 2)
+        i = np.clip(nearest_i[todo] + di, 0, x_size - 2)
+
+        p00 = nodes[j * x_size + i]
+        p10 = nodes[j * x_size + i + 1]
+        p01 = nodes[(j + 1) * x_size + i]
+        p11 = nodes[(j + 1) * x_size + i + 1]
+        a = p10 - p00
+        b = p01 - p00
+        c = p00 - p10 + p11 - p01
+        target = target_points[todo]
+
+        s = np.full(len(todo), 0.5)
+        t = np.full(len(todo), 0.5)
+        for iteration in range(0, max_iterations):
+            f = p00 + s[:, np.newaxis] * a + t[:, np.newaxis] * b + (s * t)[:, np.newaxis] * c - target
+            ds_col = a + t[:, np.newaxis] * c
+            dt_col = b + s[:, np.newaxis] * c
+            det = ds_col[:, 0] * dt_col[:, 1] - dt_col[:, 0] * ds_col[:, 1]
+            det[det == 0] = np.nan
+            s = s - (dt_col[:, 1] * f[:, 0] - dt_col[:, 0] * f[:, 1]) / det
+            t = t - (ds_col[:, 0] * f[:, 1] - ds_col[:, 1] * f[:, 0]) / det
+
+        inside = (s >= -tolerance) & (s <= 1 + tolerance) & (t >= -tolerance) & (t <= 1 + tolerance)
+        todo = todo[inside]
+        found[todo] = True
+        cell_j[todo] = j[inside]
+        cell_i[todo] = i[inside]
+        cell_s[todo] = np.clip(s[inside], 0., 1.)
+        cell_t[todo] = np.clip(t[inside], 0., 1.)
+
+    corners = np.column_stack((cell_j * x_size + cell_i,
+                               cell_j * x_size + cell_i + 1,
+                               (cell_j + 1) * x_size + cell_i + 1,
+                               (cell_j + 1) * x_size + cell_i))
+    coefficients = np.column_stack(((1 - cell_s) * (1 - cell_t),
+                                    cell_s * (1 - cell_t),
+                                    cell_s * cell_t,
+                                    (1 - cell_s) * cell_t))
+    coefficients[~found] = 0.0
+
+    rows = np.repeat(np.arange(nb_targets), 4)
+    return {
+        "method": "bilinear",
+        "source_size": x_size * y_size,
+        "source_shape": source_shape,
+        "target_shape": np.shape(xx),
+        "matrix": csr_matrix((coefficients.flatten(), (rows, corners.flatten())), shape=(nb_targets, x_size * y_size)),
+        "outside": ~found
+    }
+
+def _cell_bounds(axis):
+    """Retourne les bornes des mailles d'un axe régulier : milieux entre les centres, extrapolés aux extrémités."""
+    axis = np.asarray(axis, dtype=np.float64)
+    if len(axis) < 2:
+        raise ValueError("Conservative remapping needs at least 2 points per axis.")
+    middles = (axis[1:] + axis[:-1]) / 2.
+    return np.concatenate(([axis[0] - (middles[0] - axis[0])], middles, [axis[-1] + (axis[-1] - middles[-1])]))
+
+def _overlap_matrix(target_bounds,source_bounds):
+    """Longueur du recouvrement entre chaque maille cible et chaque maille source d'un axe [cible, source]."""
+    target_min = np.minimum(target_bounds[:-1], target_bounds[1:])[:, np.newaxis]
+    target_max = np.maximum(target_bounds[:-1], target_bounds[1:])[:, np.newaxis]
+    source_min = np.minimum(source_bounds[:-1], source_bounds[1:])[np.newaxis, :]
+    source_max = np.maximum(source_bounds[:-1], source_bounds[1:])[np.newaxis, :]
+    return np.maximum(0., np.minimum(target_max, source_max) - np.maximum(target_min, source_min))
+
+def _compute_conservative_weights(gridX,gridY,newX,newY,target_rows=None):
+    """
+    Poids du remapping conservatif du premier ordre entre deux grilles régulières en longitude/latitude. Les aires
+    sont calculées sur la sphère (l'aire d'une maille est proportionnelle à delta(lon) * delta(sin(lat))) et les
+    poids sont normalisés par la fraction couverte de chaque maille cible (normalisation SCRIP "fracarea").
+    """
+    if np.ndim(gridX) != 1 or np.ndim(gridY) != 1 or np.ndim(newX) != 1 or np.ndim(newY) != 1:
+        raise NotImplementedError("Conservative remapping is only implemented between regular grids.")
+
+    source_x_bounds = _cell_bounds(np.ma.filled(gridX, fill_value=np.nan))
+    source_y_bounds = np.sin(np.radians(np.clip(_cell_bounds(np.ma.filled(gridY, fill_value=np.nan)), -90., 90.)))
+    target_x_bounds = _cell_bounds(newX)
+    target_y_bounds = np.sin(np.radians(np.clip(_cell_bounds(newY), -90., 90.)))
+
+    overlap_x = _overlap_matrix(target_x_bounds, source_x_bounds)
+    overlap_y = _overlap_matrix(target_y_bounds, source_y_bounds)
+
+    if target_rows is not None:
+        overlap_y = overlap_y[target_rows]
+
+    # Fraction de chaque maille cible couverte par la grille source
+    covered_x = overlap_x.sum(axis=1)
+    covered_y = overlap_y.sum(axis=1)
+    frac_x = covered_x / np.abs(np.diff(target_x_bounds))
+    frac_y = covered_y / np.abs(np.diff(target_y_bounds))[target_rows if target_rows is not None else np.s_[:]]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        overlap_x = np.nan_to_num(overlap_x / covered_x[:, np.newaxis])
+        overlap_y = np.nan_to_num(overlap_y / covered_y[:, np.newaxis])
+
+    matrix = sparse_kron(csr_matrix(overlap_y), csr_matrix(overlap_x), format="csr")
+    matrix.eliminate_zeros()
+    frac = np.outer(frac_y, frac_x).flatten()
+
+    return {
+        "method": "conservative",
+        "source_size": len(gridX) * len(gridY),
+        "source_shape": (len(gridY), len(gridX)),
+        "target_shape": (np.shape(overlap_y)[0], len(newX)),
+        "matrix": matrix,
+        "outside": frac == 0,
+        "frac": frac
+    }
+
+def compute_2d_interpolation_weights_mpi(comm,gridX,gridY,newX,newY,method):
+    """
+    Calcule en parallèle les poids d'interpolation de toute la grille cible : chaque rang MPI calcule les poids d'une
+    partie des lignes de la grille cible, puis les poids sont rassemblés sur le rang 0.
+    @param comm: communicateur MPI
+    @return: les poids d'interpolation sur le rang 0, None sur les autres rangs.
+    """
+    if method not in ["linear", "bilinear", "conservative"]:
+        raise ValueError("Parallel weights computation is only available for 'linear', 'bilinear' and 'conservative' methods.")
+
+    target_y_size = np.shape(newY)[0]
+    rows = np.array_split(np.arange(target_y_size), comm.Get_size())[comm.Get_rank()]
+
+    local = None
+    if len(rows) > 0:
+        local = compute_2d_interpolation_weights(gridX, gridY, newX, newY, method,
+                                                 target_rows=np.s_[rows[0]:rows[-1] + 1])
+
+    parts = comm.gather(local, root=0)
+
+    if comm.Get_rank() != 0:
+        return None
+
+    parts = [part for part in parts if part is not None]
+    weights = {
+        "method": method,
+        "source_size": parts[0]["source_size"],
+        "source_shape": parts[0]["source_shape"],
+        "target_shape": (sum([part["target_shape"][0] for part in parts]), parts[0]["target_shape"][1]),
+        "matrix": sparse_vstack([part["matrix"] for part in parts], format="csr"),
+        "outside": np.concatenate([part["outside"] for part in parts])
+    }
+    if method == "conservative":
+        weights["frac"] = np.concatenate([part["frac"] for part in parts])
+
+    return weights
+
+def apply_2d_interpolation_weights(weights,data):
+    """
+    Applique des poids calculés par compute_2d_interpolation_weights() à une couche ou à une pile de couches. Une
+    pile [...,y,x] est interpolée en un seul produit matrice creuse x matrice dense.
+    @param weights: poids d'interpolation
+    @param data: données de la grille source [y,x] ou [...,y,x]
+    @return: les données interpolées sur la grille cible [y,x] ou [...,y,x].
+    """
+    values = np.asarray(np.ma.getdata(data))
+    layers_shape = np.shape(values)[:-2]
+    values = values.reshape((-1, int(np.prod(np.shape(values)[-2:]))))
+
+    if np.shape(values)[1] != weights["source_size"]:
+        raise ValueError("Data size " + str(np.shape(values)[1]) + " doesn't match interpolation weights source size " + str(weights["source_size"]))
+
     if data.dtype == int8 or data.dtype == int16 or data.dtype == int32 or data.dtype == int64:
         fill_value = -9999
     else:
         fill_value = 9.96921e+36
 
-    return griddata(points, values, (xx, yy), method=method, rescale=True,fill_value=fill_value)
+    if weights["method"] == "nearest":
+        result = values[:, weights["indices"]]
+
+    elif "matrix" in weights:
+        result = weights["matrix"].dot(values.T.astype(np.float64)).T
+        result[:, weights["outside"]] = fill_value
+
+    else:
+        ip = CloughTocher2DInterpolator(weights["triangulation"], values.T, fill_value=fill_value)
+        result = ip(weights["target_points"]).T
+
+    return result.reshape(layers_shape + tuple(weights["target_shape"]))
+
+def save_2d_interpolation_weights(weights,filename):
+    """
+    Enregistre des poids d'interpolation dans un fichier numpy (.npz) pour être réutilisés lors d'un prochain
+    traitement. Toutes les méthodes sauf "cubic" sont enregistrables.
+    @param weights: poids d'interpolation
+    @param filename: chemin du fichier.
+    """
+    arrays = {"method": weights["method"], "source_size": weights["source_size"],
+              "target_shape": np.array(weights["target_shape"])}
+    if "source_shape" in weights:
+        arrays["source_shape"] = np.array(weights["source_shape"])
+    if "frac" in weights:
+        arrays["frac"] = weights["frac"]
+
+    if weights["method"] == "nearest":
+        np.savez(filename, indices=weights["indices"], **arrays)
+    elif "matrix" in weights:
+        matrix = weights["matrix"]
+        np.savez(filename, data=matrix.data, indices=matrix.indices, indptr=matrix.indptr,
+                 shape=np.array(matrix.shape), outside=weights["outside"], **arrays)
+    else:
+        raise NotImplementedError("Saving interpolation weights is not implemented for method " + str(weights["method"]))
+
+def load_2d_interpolation_weights(filename):
+    """
+    Relit des poids d'interpolation enregistrés par save_2d_interpolation_weights().
+    @param filename: chemin du fichier.
+    @return: les poids d'interpolation.
+    """
+    with np.load(filename) as archive:
+        weights = {
+            "method": str(archive["method"]),
+            "source_size": int(archive["source_size"]),
+            "target_shape": tuple(int(v) for v in archive["target_shape"])
+        }
+        if "source_shape" in archive:
+            weights["source_shape"] = tuple(int(v) for v in archive["source_shape"])
+        if "frac" in archive:
+            weights["frac"] = archive["frac"]
+
+        if weights["method"] == "nearest":
+            weights["indices"] = archive["indices"]
+        else:
+            weights["matrix"] = csr_matrix((archive["data"], archive["indices"], archive["indptr"]),
+                                           shape=tuple(int(v) for v in archive["shape"]))
+            weights["outside"] = archive["outside"]
+
+    return weights
+
+def save_scrip_remap_file(weights,filename,source_name="src",target_name="dst"):
+    """
+    Enregistre des poids d'interpolation sous la forme d'un fichier de remapping NetCDF au format SCRIP (celui lu par
+    OASIS). Les adresses sont numérotées à partir de 1 et les grilles sont parcourues x en premier.
+    @param weights: poids d'interpolation (méthodes "linear", "bilinear" ou "conservative")
+    @param filename: chemin du fichier
+    @param source_name: nom de la grille source
+    @param target_name: nom de la grille cible
+    """
+    if "matrix" not in weights:
+        raise NotImplementedError("SCRIP remap file is not available for method " + str(weights["method"]))
+
+    matrix = weights["matrix"].tocoo()
+
+    ncfile = Dataset(filename, 'w', format='NETCDF4')
+    ncfile.title = str(source_name) + " to " + str(target_name) + " " + str(weights["method"]) + " remapping"
+    ncfile.conventions = "SCRIP"
+    ncfile.source_grid = str(source_name)
+    ncfile.dest_grid = str(target_name)
+    ncfile.map_method = SCRIP_MAP_METHODS[weights["method"]]
+    ncfile.normalization = "fracarea" if weights["method"] == "conservative" else "none"
+    ncfile.description = 'Generated with pySpatialETL'
+
+    ncfile.createDimension('src_grid_size', weights["source_size"])
+    ncfile.createDimension('dst_grid_size', int(np.prod(weights["target_shape"])))
+    ncfile.createDimension('src_grid_rank', 2)
+    ncfile.createDimension('dst_grid_rank', 2)
+    ncfile.createDimension('num_links', matrix.nnz)
+    ncfile.createDimension('num_wgts', 1)
+
+    src_grid_dims = ncfile.createVariable('src_grid_dims', np.int32, ('src_grid_rank',))
+    src_grid_dims[:] = [weights["source_shape"][1], weights["source_shape"][0]]
+    dst_grid_dims = ncfile.createVariable('dst_grid_dims', np.int32, ('dst_grid_rank',))
+    dst_grid_dims[:] = [weights["target_shape"][1], weights["target_shape"][0]]
+
+    dst_grid_frac = ncfile.createVariable('dst_grid_frac', np.float64, ('dst_grid_size',))
+    if "frac" in weights:
+        dst_grid_frac[:] = weights["frac"]
+    else:
+        dst_grid_frac[:] = np.where(weights["outside"], 0., 1.)
+
+    src_address = ncfile.createVariable('src_address', np.int32, ('num_links',))
+    src_address[:] = matrix.col + 1
+    dst_address = ncfile.createVariable('dst_address', np.int32, ('num_links',))
+    dst_address[:] = matrix.row + 1
+    remap_matrix = ncfile.createVariable('remap_matrix', np.float64, ('num_links', 'num_wgts',))
+    remap_matrix[:, 0] = matrix.data
+
+    ncfile.close()
+
+def load_scrip_remap_file(filename):
+    """
+    Relit un fichier de remapping NetCDF au format SCRIP.
+    @param filename: chemin du fichier.
+    @return: les poids d'interpolation.
+    """
+    ncfile = Dataset(filename, 'r')
+    try:
+        methods = dict((value, key) for key, value in SCRIP_MAP_METHODS.items())
+        map_method = str(ncfile.getncattr("map_method"))
+        if map_method not in methods:
+            raise ValueError("Unable to decode SCRIP map method : " + map_method)
+
+        src_grid_dims = ncfile.variables['src_grid_dims'][:]
+        dst_grid_dims = ncfile.variables['dst_grid_dims'][:]
+        source_size = int(np.prod(src_grid_dims))
+        target_size = int(np.prod(dst_grid_dims))
+
+        matrix = csr_matrix((np.asarray(ncfile.variables['remap_matrix'][:, 0], dtype=np.float64),
+                             (np.asarray(ncfile.variables['dst_address'][:], dtype=np.int64) - 1,
+                              np.asarray(ncfile.variables['src_address'][:], dtype=np.int64) - 1)),
+                            shape=(target_size, source_size))
+        frac = np.asarray(ncfile.variables['dst_grid_frac'][:], dtype=np.float64)
+
+        weights = {
+            "method": methods[map_method],
+            "source_size": source_size,
+            "source_shape": (int(src_grid_dims[1]), int(src_grid_dims[0])),
+            "target_shape": (int(dst_grid_dims[1]), int(dst_grid_dims[0])),
+            "matrix": matrix,
+            "outside": frac == 0
+        }
+        if weights["method"] == "conservative":
+            weights["frac"] = frac
+    finally:
+        ncfile.close()
+
+    return weights
 
 def vertical_interpolation(sourceAxis,targetAxis,data,method,extrapolate=False):
     #logging.debug("[InterpolatorCore][vertical_interpolation()] Looking for water depth : " + str(
@@ -84,6 +523,187 @@ def vertical_interpolation(sourceAxis,targetAxis,data,method,extrapolate=False):
     else:
         raise ValueError("Unable to decode vertical interpolation method : "+str(method))
 
+def compute_vertical_interpolation_weights(sourceAxis, targetDepth, method, extrapolate=False, depth_delta=None):
+    """
+    Calcule, pour toutes les colonnes d'eau à la fois, les couches sources encadrant la profondeur cible et les
+    poids d'interpolation verticale. Les profondeurs de chaque colonne sont triées une seule fois puis on recherche
+    (à la manière de searchsorted) les deux couches qui encadrent chaque profondeur cible.
+
+    Seules les couches situées à +/- depth_delta de la profondeur cible sont candidates (comme dans
+    vertical_interpolation() où les couches candidates sont choisies autour de la profondeur cible). Si la profondeur
+    cible n'est pas encadrée par deux couches candidates, on extrapole à partir des deux couches candidates les plus
+    proches (extrapolate=True) ou on prend la couche la plus proche.
+
+    @param sourceAxis: profondeurs des couches sources : [z] ou [z,y,x] (coordonnées sigma). Les valeurs NaN ou
+    masquées sont ignorées.
+    @param targetDepth: profondeur cible (flottant) ou liste de profondeurs cibles
+    @param method: "linear", "nearest", "mean" ou "cubic"
+    @param extrapolate: si vrai, on extrapole au lieu de prendre la couche la plus proche hors de l'intervalle
+    @param depth_delta: intervalle de recherche des couches candidates en mètre (None = toutes les couches)
+    @return: un dictionnaire (ou une liste de dictionnaires si plusieurs profondeurs sont demandées) contenant
+     "lower", "upper" : les index des couches inférieure et supérieure [y,x]
+     "weight" : le poids de la couche supérieure [y,x]
+     "valid" : vrai si au moins une couche candidate a été trouvée [y,x]
+     "levels" : les index des couches à lire.
+    """
+    if method not in ("linear", "nearest", "mean", "cubic"):
+        raise ValueError("Unable to decode vertical interpolation method : " + str(method))
+
+    source = np.ma.filled(np.ma.asarray(sourceAxis, dtype=np.float64), fill_value=np.nan)
+    if source.ndim == 1:
+        source = source.reshape((-1, 1, 1))
+
+    nz = np.shape(source)[0]
+    index_type = np.int16 if nz <= np.iinfo(np.int16).max else np.int32
+
+    # Tri des couches de chaque colonne (les NaN sont rangés à la fin). Les colonnes sont le plus souvent déjà
+    # ordonnées (de la surface vers le fond ou inversement), on évite alors le tri.
+    finite = np.isfinite(source)
+    steps = np.diff(source, axis=0)
+    if np.all(finite == finite[0]) and not np.any(steps < 0):
+        order = None
+        depths = source
+    elif np.all(finite == finite[0]) and not np.any(steps > 0):
+        order = "reverse"
+        depths = source[::-1]
+    else:
+        order = np.argsort(source, axis=0)
+        depths = np.take_along_axis(source, order, axis=0)
+
+    # Index des couches dans la colonne d'origine
+    if order is None:
+        source_index = lambda index: index
+    elif isinstance(order, str):
+        source_index = lambda index: nz - 1 - index
+    else:
+        source_index = lambda index: np.take_along_axis(order, index[np.newaxis], axis=0)[0]
+
+    nb_levels = np.sum(np.isfinite(depths), axis=0)
+
+    def take(index):
+        return np.take_along_axis(depths, np.clip(index, 0, nz - 1)[np.newaxis], axis=0)[0]
+
+    results = []
+    for target in np.atleast_1d(targetDepth):
+
+        if depth_delta is None:
+            depth_min = -np.inf
+            depth_max = np.inf
+        else:
+            depth_min = target - depth_delta
+            depth_max = target + depth_delta
+
+        # Les couches candidates de chaque colonne sont contiguës une fois triées : [first, first + nb_candidates[
+        first = np.sum(depths < depth_min, axis=0)
+        nb_candidates = np.sum(depths <= depth_max, axis=0) - first
+        valid = nb_candidates > 0
+
+        # Nombre de couches au dessus de la cible : la cible est entre les couches k-1 et k
+        k = np.sum(depths <= target, axis=0)
+        lo = np.clip(k - 1, 0, nz - 1)
+        hi = np.clip(np.minimum(k, nb_levels - 1), 0, nz - 1)
+        with np.errstate(invalid="ignore"):
+            nearest = np.where(np.abs(take(hi) - target) < np.abs(take(lo) - target), hi, lo)
+
+        lower = nearest.copy()
+        upper = nearest.copy()
+        weight = np.zeros(np.shape(nearest), dtype=np.float64)
+
+        if method == "linear":
+            inside = valid & (k >= 1) & (k < nb_levels) & (lo >= first) & (hi < first + nb_candidates)
+
+            lower[inside] = lo[inside]
+            upper[inside] = hi[inside]
+
+            outside = valid & np.logical_not(inside) & (take(nearest) != target)
+            if np.any(outside):
+                logging.debug("[InterpolatorCore][compute_vertical_interpolation_weights()] " + str(
+                    np.count_nonzero(outside)) + " water column(s) out of range for " + str(target) + " m")
+
+                if extrapolate:
+                    last = first + nb_candidates - 1
+                    extrapolated = outside & (nb_candidates >= 2)
+                    lo = np.where(target < take(first), first, last - 1)
+                    lower[extrapolated] = lo[extrapolated]
+                    upper[extrapolated] = lo[extrapolated] + 1
+
+            z_lower = take(lower)
+            z_upper = take(upper)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                weight = np.where(upper != lower, (target - z_lower) / (z_upper - z_lower), 0.0)
+
+        weights = {
+            "method": method,
+            "lower": source_index(lower).astype(index_type),
+            "upper": source_index(upper).astype(index_type),
+            "weight": weight,
+            "valid": valid
+        }
+
+        if method == "mean" or method == "cubic":
+            weights["candidates"] = (source >= depth_min) & (source <= depth_max)
+            weights["source"] = source
+            weights["target"] = target
+            weights["extrapolate"] = extrapolate
+            weights["levels"] = np.nonzero(np.any(weights["candidates"], axis=(1, 2)))[0]
+        else:
+            weights["levels"] = np.unique(np.concatenate((weights["lower"][valid], weights["upper"][valid])))
+
+        results.append(weights)
+
+    if np.ndim(targetDepth) == 0:
+        return results[0]
+
+    return results
+
+
+def apply_vertical_interpolation_weights(weights, data):
+    """
+    Applique les poids calculés par compute_vertical_interpolation_weights() à toutes les colonnes d'eau à la fois.
+
+    @param weights: poids d'interpolation verticale
+    @param data: les couches sources [z,y,x] ou [z,composante,y,x]. Seules les couches weights["levels"] sont lues,
+    les autres peuvent contenir n'importe quelle valeur.
+    @return: la couche interpolée [y,x] ou [composante,y,x]. Les colonnes sans couche candidate valent NaN.
+    """
+    data = np.ma.filled(np.ma.asarray(data, dtype=np.float64), fill_value=np.nan)
+    shape = np.shape(data)[1:]
+
+    def take(index):
+        return np.take_along_axis(data, np.broadcast_to(index, shape)[np.newaxis], axis=0)[0]
+
+    if weights["method"] == "linear" or weights["method"] == "nearest":
+        weight = np.broadcast_to(weights["weight"], shape)
+        lower_values = take(weights["lower"])
+        result = np.where(weight == 0.0, lower_values, lower_values * (1.0 - weight) + take(weights["upper"]) * weight)
+
+    elif weights["method"] == "mean":
+        candidates = np.broadcast_to(weights["candidates"].reshape(
+            (-1,) + (1,) * (len(shape) - 2) + np.shape(weights["candidates"])[1:]), np.shape(data))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = np.sum(np.where(candidates, data, 0.0), axis=0) / np.sum(candidates, axis=0)
+
+    else:
+        # Interpolation cubique : pas de forme vectorisée, on interpole colonne par colonne
+        result = np.full(shape, np.nan)
+        columns_shape = (np.shape(data)[0],) + shape[-2:]
+        source = np.broadcast_to(weights["source"], columns_shape)
+        all_candidates = np.broadcast_to(weights["candidates"], columns_shape)
+        for y, x in zip(*np.nonzero(np.broadcast_to(weights["valid"], shape[-2:]))):
+            candidates = all_candidates[:, y, x]
+            for component in np.ndindex(shape[:-2]):
+                values = data[(slice(None),) + component + (y, x)][candidates]
+                if len(values) == 1:
+                    result[component + (y, x)] = values[0]
+                else:
+                    result[component + (y, x)] = np.ravel(vertical_interpolation(source[candidates, y, x],
+                                                                                 [weights["target"]], values,
+                                                                                 "cubic",
+                                                                                 weights["extrapolate"]))[0]
+
+    return np.where(np.broadcast_to(weights["valid"], shape), result, np.nan)
+
+
 def time_1d_interpolation(sourceAxis,targetAxis,data,method,extrapolate=False):
     logging.debug("[InterpolatorCore][time_interpolation()] Looking for time : "+str(datetime.utcfromtimestamp(targetAxis[0]))+" with method '"+str(method)+"'.")
     for time in sourceAxis:
@@ -129,3 +749,110 @@ def time_1d_interpolation(sourceAxis,targetAxis,data,method,extrapolate=False):
     else:
         raise ValueError("Unable to decode vertical interpolation method : " + str(method))
 
+
+def time_interpolation(sourceAxis,targetAxis,data,method,tolerance=None):
+    """
+    Interpolation temporelle de plusieurs séries en une seule opération (sans boucle sur les séries). Chaque série
+    n'utilise que ses valeurs valides : les NaN sont ignorés. Une date cible qui n'est pas encadrée par deux valeurs
+    valides prend la valeur valide la plus proche, comme time_1d_interpolation() sans extrapolation.
+
+    @param sourceAxis: dates source en secondes [t source]. Les dates en double ne gardent que leur première valeur.
+    @param targetAxis: dates cibles en secondes [t cible]
+    @param data: valeurs [t source,...] (ex : [t,point] ou [t,composante,point])
+    @param method: None (pas d'interpolation : valeurs des dates source identiques), "mean", "nearest", "linear" ou "cubic"
+    @param tolerance: écart maximal en secondes entre une date cible et les dates source utilisées. None = pas de limite.
+    @return: un tableau [t cible,...]. NaN si aucune valeur valide n'est utilisable.
+    """
+    source = np.asarray(sourceAxis, dtype=np.float64)
+    target = np.atleast_1d(np.asarray(targetAxis, dtype=np.float64))
+    if np.ma.isMaskedArray(data):
+        values = np.ma.filled(data.astype(np.float64), np.nan)
+    else:
+        values = np.asarray(data, dtype=np.float64)
+
+    shape = (len(target),) + np.shape(values)[1:]
+    values = np.reshape(values, (len(source), -1))
+
+    if method not in (None, "mean", "nearest", "linear", "cubic"):
+        raise ValueError("Unable to decode time interpolation method : " + str(method))
+
+    results = np.full((len(target), np.shape(values)[1]), np.nan)
+    if len(source) == 0:
+        return np.reshape(results, shape)
+
+    if method is None:
+        method, tolerance = "nearest", 0.0
+
+    # Dates triées et sans doublon
+    if np.any(np.diff(source) <= 0):
+        order = np.argsort(source, kind="stable")
+        source, first = np.unique(source[order], return_index=True)
+        values = values[order[first]]
+
+    if tolerance is None:
+        tolerance = np.inf
+
+    nb_source = len(source)
+    valid = ~np.isnan(values)
+    times = target[:, np.newaxis]
+
+    if method == "mean":
+        start = np.searchsorted(source, target - tolerance, side="left")
+        stop = np.searchsorted(source, target + tolerance, side="right")
+        sums = np.concatenate((np.zeros((1, np.shape(values)[1])), np.cumsum(np.where(valid, values, 0.0), axis=0)))
+        counts = np.concatenate((np.zeros((1, np.shape(values)[1])), np.cumsum(valid, axis=0)))
+        count = counts[stop] - counts[start]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            results = np.where(count > 0, (sums[stop] - sums[start]) / count, np.nan)
+        return np.reshape(results, shape)
+
+    # Pour chaque date source : index de la dernière valeur valide avant (incluse) et de la première valeur valide après
+    positions = np.arange(nb_source)[:, np.newaxis]
+    if np.all(valid):
+        previous = following = np.broadcast_to(positions, np.shape(values))
+    else:
+        previous = np.maximum.accumulate(np.where(valid, positions, -1), axis=0)
+        following = np.minimum.accumulate(np.where(valid, positions, nb_source)[::-1], axis=0)[::-1]
+
+    # source[index - 1] <= date cible < source[index]
+    index = np.searchsorted(source, target, side="right")
+    left = np.where((index > 0)[:, np.newaxis], previous[np.maximum(index - 1, 0)], -1)
+    right = np.where((index < nb_source)[:, np.newaxis], following[np.minimum(index, nb_source - 1)], nb_source)
+
+    has_left = left >= 0
+    has_right = right < nb_source
+    left = np.clip(left, 0, nb_source - 1)
+    right = np.clip(right, 0, nb_source - 1)
+
+    left_distance = np.where(has_left, times - source[left], np.inf)
+    right_distance = np.where(has_right, source[right] - times, np.inf)
+    left_values = np.take_along_axis(values, left, axis=0)
+    right_values = np.take_along_axis(values, right, axis=0)
+
+    # Valeur valide la plus proche (la plus ancienne en cas d'égalité)
+    distance = np.minimum(left_distance, right_distance)
+    results = np.where(np.isfinite(distance) & (distance <= tolerance),
+                       np.where(left_distance <= right_distance, left_values, right_values), np.nan)
+
+    if method == "nearest":
+        return np.reshape(results, shape)
+
+    bracketed = has_left & has_right & (left_distance <= tolerance) & (right_distance <= tolerance)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weights = (times - source[left]) / (source[right] - source[left])
+        results = np.where(bracketed, left_values + weights * (right_values - left_values), results)
+
+    if method == "cubic":
+        # Une spline par groupe de séries ayant les mêmes valeurs valides. Moins de 4 valeurs : on reste en linéaire.
+        first_columns, groups = np.unique(np.packbits(valid, axis=0).T, axis=0, return_index=True,
+                                          return_inverse=True)[1:]
+        groups = np.ravel(groups)
+        for group, first_column in enumerate(first_columns):
+            pattern = valid[:, first_column]
+            if np.count_nonzero(pattern) < 4:
+                continue
+            columns = np.flatnonzero(groups == group)
+            spline = CubicSpline(source[pattern], values[pattern][:, columns], axis=0, extrapolate=False)
+            results[:, columns] = np.where(bracketed[:, columns], spline(target), results[:, columns])
+
+    return np.reshape(results, shape)
@@ -0,0 +1,132 @@
+import sys
+sys.path = ['/work/sciences/pySpatialETL'] + sys.path
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from spatialetl.operator.interpolator.InterpolatorCore import apply_2d_interpolation_weights
+from spatialetl.operator.interpolator.InterpolatorCore import compute_2d_interpolation_weights
+from spatialetl.operator.interpolator.InterpolatorCore import load_2d_interpolation_weights
+from spatialetl.operator.interpolator.InterpolatorCore import load_scrip_remap_file
+from spatialetl.operator.interpolator.InterpolatorCore import save_2d_interpolation_weights
+from spatialetl.operator.interpolator.InterpolatorCore import save_scrip_remap_file
+from spatialetl.operator.interpolator.InterpolatorCore import time_1d_interpolation
+from spatialetl.operator.interpolator.InterpolatorCore import time_interpolation
+
+
+class TestInterpolatorCore(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.source_x = np.linspace(0., 1., 11)
+        self.source_y = np.linspace(40., 41., 9)
+        self.target_x = np.linspace(0.05, 0.95, 7)
+        self.target_y = np.linspace(40.1, 40.9, 5)
+        self.data = np.random.RandomState(0).rand(2, len(self.source_y), len(self.source_x))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_save_load_scrip_remap_file(self):
+        for method in ["linear", "bilinear", "conservative"]:
+            weights = compute_2d_interpolation_weights(self.source_x, self.source_y, self.target_x, self.target_y,
+                                                       method)
+            expected_value = apply_2d_interpolation_weights(weights, self.data)
+
+            weights_file = os.path.join(self.directory, method + ".npz")
+            save_2d_interpolation_weights(weights, weights_file)
+            candidate = load_2d_interpolation_weights(weights_file)
+            self.assertEqual(weights["source_shape"], candidate["source_shape"], method)
+            np.testing.assert_array_equal(expected_value, apply_2d_interpolation_weights(candidate, self.data),
+                                          err_msg=method)
+
+            # Les poids relus doivent pouvoir être écrits au format SCRIP
+            remap_file = os.path.join(self.directory, method + ".nc")
+            save_scrip_remap_file(candidate, remap_file)
+            remap = load_scrip_remap_file(remap_file)
+            self.assertEqual(method, remap["method"])
+            self.assertEqual(weights["source_shape"], remap["source_shape"], method)
+            self.assertEqual(weights["target_shape"], remap["target_shape"], method)
+            np.testing.assert_almost_equal(expected_value, apply_2d_interpolation_weights(remap, self.data),
+                                           err_msg=method)
+            if method == "conservative":
+                np.testing.assert_array_equal(weights["frac"], remap["frac"])
+
+    def test_time_interpolation(self):
+        source = 1388577600. + 3600. * np.arange(0, 8)
+        target = 1388577600. + np.array([0., 1200., 5400., 9000., 17999., 21600., 25200.])
+        values = np.random.RandomState(1).rand(len(source), 3)
+
+        for method in ["nearest", "linear", "cubic"]:
+            candidate = time_interpolation(source, target, values, method)
+            self.assertEqual((len(target), 3), np.shape(candidate))
+            for point in range(0, 3):
+                for index in range(0, len(target)):
+                    expected_value = time_1d_interpolation(source, [target[index]], values[:, point], method)
+                    np.testing.assert_almost_equal(np.squeeze(expected_value), candidate[index, point],
+                                                   err_msg=method)
+
+        # Une seule date cible
+        np.testing.assert_almost_equal(time_1d_interpolation(source, [target[2]], values[:, 0], "linear"),
+                                       time_interpolation(source, target[2], values[:, 0], "linear"))
+
+    def test_time_interpolation_nan(self):
+        source = 3600. * np.arange(0, 6)
+        values = np.array([[0., 10.], [1., np.nan], [np.nan, np.nan], [3., 13.], [4., 14.], [5., np.nan]])
+        target = np.array([1800., 5400., 7200., 16200., 19800.])
+
+        candidate = time_interpolation(source, target, values, "linear")
+
+        # Chaque série n'utilise que ses valeurs valides
+        for point in range(0, 2):
+            valid = ~np.isnan(values[:, point])
+            for index in range(0, len(target)):
+                expected_value = time_1d_interpolation(source[valid], [target[index]], values[valid, point], "linear")
+                np.testing.assert_almost_equal(np.squeeze(expected_value), candidate[index, point])
+
+        # Masked array
+        np.testing.assert_almost_equal(candidate, time_interpolation(source, target, np.ma.masked_invalid(values),
+                                                                     "linear"))
+
+        # Aucune valeur valide
+        self.assertTrue(np.all(np.isnan(time_interpolation(source, target, np.full((6, 1), np.nan), "nearest"))))
+
+    def test_time_interpolation_duplicate_dates(self):
+        source = np.array([0., 3600., 3600., 7200.])
+        values = np.array([0., 1., 100., 2.])
+
+        # Les dates en double ne gardent que leur première valeur
+        np.testing.assert_almost_equal([0.5, 1., 1.5], time_interpolation(source, [1800., 3600., 5400.], values,
+                                                                          "linear"))
+        np.testing.assert_almost_equal([1.], time_interpolation(source, [3600.], values, None))
+
+        # Dates non triées
+        order = np.array([3, 1, 0, 2])
+        np.testing.assert_almost_equal([0.5, 1.5], time_interpolation(source[order], [1800., 5400.],
+                                                                      values[order], "linear"))
+
+    def test_time_interpolation_tolerance(self):
+        source = np.array([0., 3600., 36000.])
+        values = np.array([0., 1., 10.])
+        target = np.array([600., 3700., 20000., 36000., 40000.])
+
+        np.testing.assert_almost_equal([0., 1., np.nan, 10., np.nan],
+                                       time_interpolation(source, target, values, "nearest", tolerance=900.))
+        # Une date trop éloignée d'une de ses deux voisines prend la valeur la plus proche
+        np.testing.assert_almost_equal([0., 1., np.nan, 10., np.nan],
+                                       time_interpolation(source, target, values, "linear", tolerance=900.))
+        np.testing.assert_almost_equal([600. / 3600., 1., np.nan, 10., np.nan],
+                                       time_interpolation(source, target, values, "linear", tolerance=3600.))
+        np.testing.assert_almost_equal([0.5, 1., np.nan],
+                                       time_interpolation(source, [1800., 3500., 20000.], values, "mean",
+                                                          tolerance=1800.))
+
+        # Sans tolérance, les dates hors de l'axe source prennent la valeur la plus proche
+        np.testing.assert_almost_equal([0., 10.], time_interpolation(source, [-600., 40000.], values, "linear"))
+
+        # Méthode None : seules les dates source identiques
+        np.testing.assert_almost_equal([np.nan, 1.], time_interpolation(source, [600., 3600.], values, None))
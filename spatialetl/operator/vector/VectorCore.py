@@ -0,0 +1,77 @@
+#! /usr/bin/env python2.7
+# -*- coding: utf-8 -*-
+#
+# pySpatialETL is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# pySpatialETL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# Author : Fabien Rétif - fabien.retif@zoho.com
+#
+from __future__ import division, print_function, absolute_import
+
+import numpy as np
+
+# Les fonctions de ce module calculent les variables dérivées d'un vecteur (vitesse, direction, rotation) sur des
+# tableaux complets : [x] (point), [y,x] (couverture) ou des piles de dates et de niveaux [t,z,y,x]. Les valeurs
+# masquées sont remplacées par NaN.
+
+
+def _to_array(comp):
+    return np.ma.filled(np.ma.asarray(comp, dtype=np.float64), fill_value=np.nan)
+
+
+def speed(u, v):
+    """
+    Calcule la norme d'un vecteur.
+
+    @param u: composante u du vecteur
+    @param v: composante v du vecteur
+    @return: un tableau de la même forme que les composantes : sqrt(u**2+v**2).
+    """
+    return np.hypot(_to_array(u), _to_array(v))
+
+
+def from_direction(u, v):
+    """
+    Calcule la direction de provenance d'un vecteur (convention météorologique) en degrés, dans le sens horaire
+    depuis le nord.
+
+    @param u: composante u du vecteur
+    @param v: composante v du vecteur
+    @return: un tableau de la même forme que les composantes, valeurs dans [0,360[.
+    """
+    return np.mod(270.0 - np.degrees(np.arctan2(_to_array(v), _to_array(u))), 360.0)
+
+
+def to_direction(u, v):
+    """
+    Calcule la direction de destination d'un vecteur (convention océanographique) en degrés, dans le sens horaire
+    depuis le nord.
+
+    @param u: composante u du vecteur
+    @param v: composante v du vecteur
+    @return: un tableau de la même forme que les composantes, valeurs dans [0,360[.
+    """
+    return np.mod(270.0 - np.degrees(np.arctan2(_to_array(v), _to_array(u))) + 180.0, 360.0)
+
+
+def rotate_vector(u, v, rotcos, rotsin):
+    """
+    Applique la rotation de la grille à un vecteur. Les cosinus et sinus de l'angle de rotation [y,x] sont
+    appliqués à toutes les dates et tous les niveaux d'une pile [...,y,x].
+
+    @param u: composante u du vecteur
+    @param v: composante v du vecteur
+    @param rotcos: cosinus de l'angle de rotation de la grille
+    @param rotsin: sinus de l'angle de rotation de la grille
+    @return: les composantes [u_rot,v_rot] après rotation.
+    """
+    u = _to_array(u)
+    v = _to_array(v)
+    return u * rotcos + v * rotsin, -u * rotsin + v * rotcos
@@ -0,0 +1,10 @@
+# -*- encoding:utf-8 -*-
+"""
+==================================
+Vector (:mod:`coverage.operator.vector`)
+==================================
+
+.. currentmodule:: coverage.operator.vector
+
+"""
+from __future__ import division, print_function, absolute_import
@@ -20,6 +20,7 @@ import math
 import numpy as np
 from mpi4py import MPI
 
+from spatialetl.utils.SpatialIndex import SpatialIndex
 from spatialetl.utils.logger import logging
 
 
@@ -72,6 +73,7 @@ class MultiPoint():
 
     def __init__(self,myReader):
         self.reader = myReader;
+        self.spatial_index = None
 
         # MPI
         self.map_mpi = None
@@ -144,10 +146,6 @@ class MultiPoint():
      [2] : la coordonnée en latitude point le plus proche
      [3] : la distance du point le plus proche en kilomètre."""
 
-        min_dist = 10000000
-        lon = self.read_axis_x()
-        lat = self.read_axis_y()
-
         if type(target_lon) == int and type(target_lat) == int:
 
             if (target_lon != target_lat):
@@ -159,28 +157,61 @@ class MultiPoint():
 
             return [target_lon, target_lat, self.read_axis_x()[target_lon], self.read_axis_y()[target_lat], 0.0]
 
-        nearest_point_index = 0
-        nearest_lon = np.nan
-        nearest_lat = np.nan
-
         if method == "classic":
-            for point in range(0, self.get_nb_points()):
-
-                dist = distance_on_unit_sphere(target_lon, target_lat, lon[point], lat[point])
-
-                if dist < min_dist:
-                    min_dist = dist
-                    nearest_lon = lon[point]
-                    nearest_lat = lat[point]
-                    nearest_point_index = point
+            nearest_point_index, nearest_lon, nearest_lat, min_dist = [value[0] for value in
+                                                                       self.find_points_index([target_lon],
+                                                                                              [target_lat])]
         else:
             raise RuntimeError("Method " + str(method) + " is not implemented yet.")
 
-        if nearest_lon == np.nan or nearest_lat == np.nan:
-            raise RuntimeError("No nearest point found.")
-
         return [nearest_point_index, nearest_lon, nearest_lat, min_dist]
 
+    def find_points_index(self, target_lons, target_lats):
+        """Retourne en une seule requête les point les plus proches des point donnés en paramètre.
+    @param target_lons: Tableau des coordonnées longitude des point
+    @param target_lats: Tableau des coordonnées latitude des point
+    @return: un tableau contenant
+     [0] : les index des point les plus proches
+     [1] : les coordonnées en longitude des point les plus proches
+     [2] : les coordonnées en latitude des point les plus proches
+     [3] : les distances des point les plus proches en kilomètre."""
+
+        if self.spatial_index is None:
+            self.spatial_index = SpatialIndex(np.asarray(self.read_axis_x())[np.newaxis, :],
+                                              np.asarray(self.read_axis_y())[np.newaxis, :])
+
+        nearest_index, y, nearest_lon, nearest_lat, min_dist = self.spatial_index.query(target_lons, target_lats)
+
+        return [nearest_index, nearest_lon, nearest_lat, min_dist]
+
+    def get_point_indexes(self, stations=None):
+        """Retourne les index des point souhaités.
+    @param stations: index ou noms des point (par défaut tous les point)
+    @return: un tableau d'index."""
+
+        if stations is None:
+            return np.arange(self.get_nb_points())
+
+        if isinstance(stations, (str, int, np.integer)):
+            stations = [stations]
+
+        names = None
+        indexes = []
+        for station in stations:
+            if isinstance(station, (int, np.integer)):
+                if station < 0 or station >= self.get_nb_points():
+                    raise ValueError("Point index have to range between 0 and " + str(
+                        self.get_nb_points() - 1) + ". Actually point index = " + str(station))
+                indexes.append(int(station))
+            else:
+                if names is None:
+                    names = [str(name) for name in self.read_variable_point_names()]
+                if str(station) not in names:
+                    raise ValueError("Point '" + str(station) + "' not found.")
+                indexes.append(names.index(str(station)))
+
+        return np.asarray(indexes, dtype=np.int64)
+
     # Scalar
     def read_variable_point_names(self):
         return self.reader.read_variable_point_names()
@@ -37,10 +37,10 @@ class TimeLevelMultiPoint(LevelMultiPoint, TimeMultiPoint):
         indexes_z = tmp[1]
 
         layers = np.zeros([np.shape(indexes_t)[0],2, np.shape(indexes_z)[0],self.get_nb_points()])
-        layers[::] = np.NAN
+        layers[::] = np.nan
 
         results = np.zeros([np.shape(indexes_t)[0],2,self.get_nb_points()])
-        results[:] = np.NAN
+        results[:] = np.nan
 
         for t in range(0, len(indexes_t)):
 
@@ -73,10 +73,10 @@ class TimeLevelMultiPoint(LevelMultiPoint, TimeMultiPoint):
         indexes_z = tmp[1]
 
         layers = np.zeros([np.shape(indexes_t)[0],np.shape(indexes_z)[0], self.get_nb_points()])
-        layers[::] = np.NAN
+        layers[::] = np.nan
 
         results = np.zeros([np.shape(indexes_t)[0],self.get_nb_points()])
-        results[:] = np.NAN
+        results[:] = np.nan
 
         for t in range(0, len(indexes_t)):
             for z in range(0, len(indexes_z)):
@@ -98,10 +98,10 @@ class TimeLevelMultiPoint(LevelMultiPoint, TimeMultiPoint):
         indexes_z = tmp[1]
 
         layers = np.zeros([np.shape(indexes_t)[0], np.shape(indexes_z)[0], self.get_nb_points()])
-        layers[::] = np.NAN
+        layers[::] = np.nan
 
         results = np.zeros([np.shape(indexes_t)[0], self.get_nb_points()])
-        results[:] = np.NAN
+        results[:] = np.nan
 
         for t in range(0, len(indexes_t)):
             for z in range(0, len(indexes_z)):
@@ -15,16 +15,19 @@
 #
 from __future__ import division, print_function, absolute_import
 
-import math
-from datetime import datetime, timedelta, timezone
+from collections import OrderedDict
+from datetime import datetime, timedelta
 
 import cftime
 import numpy as np
 import pandas
 from array_split import shape_split
 
-from spatialetl.operator.interpolator.InterpolatorCore import time_1d_interpolation
+from spatialetl.operator.interpolator.InterpolatorCore import time_interpolation
+from spatialetl.operator.vector.VectorCore import from_direction, speed, to_direction
 from spatialetl.point.MultiPoint import MultiPoint
+from spatialetl.utils.TimeAxis import TimeAxis, to_timestamps
+from spatialetl.utils.TimeIndex import TimeIndex
 from spatialetl.utils.logger import logging
 
 
@@ -35,26 +38,51 @@ class TimeMultiPoint(MultiPoint):
     TIME_DELTA = timedelta(minutes=5)
     TIME_INTERPOLATION_METHOD = "nearest"
     TIME_OVERLAPING_SIZE = 2
+    # Nombre de séries temporelles (toutes les stations) conservées par read_variable_timeseries(). 0 = pas de cache
+    TIMESERIES_CACHE_SIZE = 4
+
+    # Variables dérivées d'un vecteur : nom -> (nom du vecteur, opérateur)
+    VECTOR_VARIABLES = {
+        "barotropic_sea_water_speed": ("barotropic_sea_water_velocity", speed),
+        "barotropic_sea_water_from_direction": ("barotropic_sea_water_velocity", from_direction),
+        "barotropic_sea_water_to_direction": ("barotropic_sea_water_velocity", to_direction),
+        "sea_water_speed_at_sea_water_surface": ("sea_water_velocity_at_sea_water_surface", speed),
+        "sea_water_from_direction_at_sea_water_surface": ("sea_water_velocity_at_sea_water_surface", from_direction),
+        "sea_water_to_direction_at_sea_water_surface": ("sea_water_velocity_at_sea_water_surface", to_direction),
+        "sea_water_speed_at_ground_level": ("sea_water_velocity_at_ground_level", speed),
+        "sea_water_from_direction_at_ground_level": ("sea_water_velocity_at_ground_level", from_direction),
+        "sea_water_to_direction_at_ground_level": ("sea_water_velocity_at_ground_level", to_direction),
+        "wind_stress_stress": ("wind_stress", speed),
+        "wind_stress_from_direction": ("wind_stress", from_direction),
+        "wind_stress_to_direction": ("wind_stress", to_direction),
+        "wind_speed_10m": ("wind_10m", speed),
+        "wind_from_direction_10m": ("wind_10m", from_direction),
+        "wind_to_direction_10m": ("wind_10m", to_direction)
+    }
 
     def __init__(self,myReader,start_time=None,end_time=None,freq=None,time_range=None):
         MultiPoint.__init__(self, myReader)
+        self.timeseries_cache = OrderedDict()
 
         self.source_global_t_size = self.reader.get_t_size()
-        self.source_global_axis_t = self.reader.read_axis_t(0, self.source_global_t_size, 0);
+        self.source_global_axis_t = TimeAxis.from_dates(self.reader.read_axis_t(0, self.source_global_t_size, 0))
+        # Axes t en secondes depuis TIME_DATUM, calculés une seule fois
+        self.source_global_timestamps = to_timestamps(self.source_global_axis_t, TimeMultiPoint.TIME_DATUM)
+        self.source_global_timestamps.flags.writeable = False
+        self.time_index = None
         tmin = 0
         tmax = self.source_global_t_size
-        zero_delta = timedelta(minutes=00)
 
         self.temporal_resampling = False
 
         if time_range is not None:
-            self.target_global_axis_t = time_range
+            self.target_global_axis_t = TimeAxis.from_dates(time_range)
             self.target_global_t_size = np.shape(self.target_global_axis_t)[0]
             self.temporal_resampling = True
 
         if start_time is not None:
 
-            if type(start_time) == datetime or type(start_time) == cftime._cftime.real_datetime:
+            if isinstance(start_time, (datetime, cftime.datetime)):
                 time = start_time
             elif type(start_time) == str:
                 try:
@@ -64,10 +92,9 @@ class TimeMultiPoint(MultiPoint):
             else:
                 raise ValueError("start_time have to be string or datetime. Found " + str(type(start_time)))
 
-            nearest_t_index = (np.abs(np.asarray(self.source_global_axis_t) - time)).argmin()
+            nearest_t_index, distance = self.find_source_global_time_index(time)
 
-            if time - datetime.strptime(str(self.source_global_axis_t[nearest_t_index]),'%Y-%m-%d %H:%M:%S') == zero_delta or abs(
-                    time - datetime.strptime(str(self.source_global_axis_t[nearest_t_index]),'%Y-%m-%d %H:%M:%S')) < TimeMultiPoint.TIME_DELTA:
+            if distance == 0.0 or distance < (TimeMultiPoint.TIME_DELTA).total_seconds():
                 tmin = nearest_t_index
             else:
                 raise ValueError(str(time) + " not found. Maybe the TimeMultiPoint.TIME_DELTA (" + str(
@@ -75,7 +102,7 @@ class TimeMultiPoint(MultiPoint):
 
         if end_time is not None:
 
-            if type(end_time) == datetime or type(end_time) == cftime._cftime.real_datetime:
+            if isinstance(end_time, (datetime, cftime.datetime)):
                 time = end_time
             elif type(end_time) == str:
                 try:
@@ -85,10 +112,9 @@ class TimeMultiPoint(MultiPoint):
             else:
                 raise ValueError("end_time have to be string or datetime. Found " + str(type(end_time)))
 
-            nearest_t_index = (np.abs(np.asarray(self.source_global_axis_t) - time)).argmin()
+            nearest_t_index, distance = self.find_source_global_time_index(time)
 
-            if time - datetime.strptime(str(self.source_global_axis_t[nearest_t_index]),'%Y-%m-%d %H:%M:%S') == zero_delta or abs(
-                    time - datetime.strptime(str(self.source_global_axis_t[nearest_t_index]),'%Y-%m-%d %H:%M:%S')) < TimeMultiPoint.TIME_DELTA:
+            if distance == 0.0 or distance < (TimeMultiPoint.TIME_DELTA).total_seconds():
                 tmax = nearest_t_index + 1
             else:
                 raise ValueError(str(time) + " not found. Maybe the TimeMultiPoint.TIME_DELTA (" + str(
@@ -96,13 +122,16 @@ class TimeMultiPoint(MultiPoint):
 
         if freq is not None:
             self.temporal_resampling = True
-            self.target_global_axis_t =pandas.date_range(start=datetime.utcfromtimestamp(self.read_axis_t(type="source_global", with_overlap=False,timestamp=1)[tmin]),
-                                                  end=datetime.utcfromtimestamp(self.read_axis_t(type="source_global", with_overlap=False,timestamp=1)[tmax-1]), freq=freq).to_pydatetime();
+            self.target_global_axis_t = TimeAxis.from_datetime64(pandas.date_range(start=self.source_global_axis_t.to_datetime64()[tmin],
+                                                  end=self.source_global_axis_t.to_datetime64()[tmax-1], freq=freq).values)
             self.target_global_t_size = np.shape(self.target_global_axis_t)[0]
         else:
             self.target_global_axis_t = self.source_global_axis_t[tmin:tmax]
             self.target_global_t_size = tmax - tmin
 
+        self.target_global_timestamps = to_timestamps(self.target_global_axis_t, TimeMultiPoint.TIME_DATUM)
+        self.target_global_timestamps.flags.writeable = False
+
         self.create_mpi_map()
         self.update_mpi_map()
 
@@ -199,39 +228,28 @@ class TimeMultiPoint(MultiPoint):
     def read_axis_t(self, type="target", with_overlap=False, timestamp=0):
         """Retourne les valeurs de l'axe t.
     @param timestamp: égale 1 si le temps est souhaité en timestamp depuis TIME_DATUM.
-    @return:  un tableau à une dimensions [z] au format datetime ou timestamp si timestamp=1."""
+    @return:  un TimeAxis [t] ou un tableau de timestamps si timestamp=1."""
         if type == "target_global":
-            if timestamp == 1:
-                return [(t - TimeMultiPoint.TIME_DATUM).total_seconds() \
-                        for t in self.target_global_axis_t];
-            return self.target_global_axis_t
-
+            axis_t = np.s_[:]
         elif type == "source_global":
-            if timestamp == 1:
-                return [(t - TimeMultiPoint.TIME_DATUM).total_seconds() \
-                        for t in self.source_global_axis_t];
-            return self.source_global_axis_t
-
+            axis_t = np.s_[:]
         elif type == "source" and with_overlap is True:
-            return self.reader.read_axis_t(self.map_mpi[self.rank]["src_global_t_overlap"].start,
-                                           self.map_mpi[self.rank]["src_global_t_overlap"].stop, timestamp)
-
+            axis_t = self.map_mpi[self.rank]["src_global_t_overlap"]
         elif type == "source" and with_overlap is False:
-            return self.reader.read_axis_t(self.map_mpi[self.rank]["src_global_t"].start,
-                                           self.map_mpi[self.rank]["src_global_t"].stop, timestamp)
-
+            axis_t = self.map_mpi[self.rank]["src_global_t"]
         elif type == "target" and with_overlap is True:
-            if timestamp == 1:
-                return [(t - TimeMultiPoint.TIME_DATUM).total_seconds() \
-                        for t in self.target_global_axis_t[self.map_mpi[self.rank]["dst_global_t_overlap"]]];
-            return self.target_global_axis_t[self.map_mpi[self.rank]["dst_global_t_overlap"]]
-
+            axis_t = self.map_mpi[self.rank]["dst_global_t_overlap"]
         else:
+            axis_t = self.map_mpi[self.rank]["dst_global_t"]
+
+        if type == "source" or type == "source_global":
             if timestamp == 1:
-                return [(t - TimeMultiPoint.TIME_DATUM).total_seconds() \
-                        for t in self.target_global_axis_t[self.map_mpi[self.rank]["dst_global_t"]]];
-            return self.target_global_axis_t[self.map_mpi[self.rank]["dst_global_t"]]
+                return self.source_global_timestamps[axis_t]
+            return self.source_global_axis_t[axis_t]
 
+        if timestamp == 1:
+            return self.target_global_timestamps[axis_t]
+        return self.target_global_axis_t[axis_t]
 
     def get_t_size(self, type="target", with_overlap=False):
         if type == "target_global":
@@ -247,45 +265,53 @@ class TimeMultiPoint(MultiPoint):
         else:
             return self.map_mpi[self.rank]["dst_local_t_size"]
 
+    def find_source_global_time_index(self, time):
+        """Retourne la date source la plus proche d'une date donnée, sur tout l'axe source.
+    @param time: date souhaitée
+    @return: l'index global de la date la plus proche et l'écart en secondes."""
+        indexes_t, distances = TimeIndex(self.source_global_timestamps).query(to_timestamps([time], TimeMultiPoint.TIME_DATUM))
+        return int(indexes_t[0]), distances[0]
+
+    def get_time_index(self):
+        """Retourne l'index (TimeIndex) des dates source du proc. Il est construit une seule fois par découpage MPI.
+    @return: un TimeIndex dont les index sont locaux au proc."""
+        src_global_t = self.map_mpi[self.rank]["src_global_t"]
+        if self.time_index is None or self.time_index_slice != src_global_t:
+            self.time_index = TimeIndex(self.source_global_timestamps[src_global_t])
+            self.time_index_slice = src_global_t
+        return self.time_index
+
+    def find_time_indices(self, times):
+        """Retourne en une seule requête les index des dates source les plus proches à TIME_DELTA près.
+    @param times: tableau de dates (datetime, cftime, datetime64) ou de secondes depuis TIME_DATUM
+    @return: un tableau d'index locaux au proc, -1 pour les dates non trouvées."""
+
+        indexes_t, distances = self.get_time_index().query(to_timestamps(times, TimeMultiPoint.TIME_DATUM))
+        return np.where(distances <= (TimeMultiPoint.TIME_DELTA).total_seconds(), indexes_t, -1)
+
     def find_time_index(self, t):
-        """Retourne l'index de la date la plus proche à TIME_DELTA_MIN prêt.
+        """Retourne les index des dates à TIME_DELTA_MIN prêt.
     @type t: datetime ou int
     @param t: date souhaitée ou l'index de la date souhaitée
-    @return:  l'index de la date la plus proche à TIME_DELTA_MIN prêt ou une erreur si aucune date n'a pu être trouvée."""
+    @return:  les index des dates à TIME_DELTA_MIN prêt ou une erreur si aucune date n'a pu être trouvée."""
 
-        indexes_t = []
-        zero_delta = timedelta(seconds=0.2)
-
-        if type(t) == int or type(t) == int32 or type(t)== int64:
+        if isinstance(t, (int, np.integer)):
 
             if t < 0 or t >= self.get_t_size(type="source"):
                 raise ValueError("Time index have to range between 0 and " + str(
                     self.get_t_size(type="source") - 1) + ". Actually Time index = " + str(t))
 
-            indexes_t.append(int(t));
+            indexes_t = np.array([int(t)])
 
-        if type(t) == datetime or type(t) == cftime._cftime.datetime or type(t) == cftime._cftime.real_datetime:
+        elif isinstance(t, (datetime, cftime.datetime, np.datetime64)):
 
             logging.debug("[TimeMultiPoint][find_time_index()] Looking for : "+str(t))
 
-            target_timestamp = (t - TimeMultiPoint.TIME_DATUM).total_seconds()
-            array = np.asarray(self.read_axis_t(type="source", timestamp=1))
-
-            X = np.abs(array - target_timestamp)
+            target_timestamp = to_timestamps(t, TimeMultiPoint.TIME_DATUM)[0]
+            delta = (TimeMultiPoint.TIME_DELTA).total_seconds()
+            indexes_t = self.get_time_index().query_interval(target_timestamp - delta, target_timestamp + delta)
 
-            idx = np.where(X <= (TimeMultiPoint.TIME_DELTA).total_seconds())
-            if (len(idx[0])==1):
-                index_t = idx[0][0]
-                indexes_t.append(int(index_t))
-                logging.debug("[TimeMultiPoint][find_time_index()] Found : " + str(array[index_t]))
-            else:
-                idx = np.where(X <= (TimeMultiPoint.TIME_DELTA).total_seconds())
-                for index in range(np.shape(idx)[1]):
-                    index_t = idx[0][index]
-                    indexes_t.append(int(index_t))
-                    logging.debug("[TimeMultiPoint][find_time_index()] Found : " + str(array[index_t]))
-
-            if not indexes_t:
+            if len(indexes_t) == 0:
                 raise ValueError("Proc n°"+str(self.rank)+" " + str(t) + " was not found. Maybe the TimeMultiPoint.TIME_DELTA (" + str(
                     TimeMultiPoint.TIME_DELTA) + ") is too small or the date is out the range.")
 
@@ -295,78 +321,108 @@ class TimeMultiPoint(MultiPoint):
         logging.debug("[TimeMultiPoint][find_time_index()] Found " + str(len(indexes_t)) + " candidate datetime(s)")
 
         # On retourne le tableau d'index
-        return np.array(np.unique(indexes_t))
+        return indexes_t
 
     def interpolate_all_times(self, values):
+        """Ramène en une seule opération les séries de toutes les point sur l'axe t cible global (target_global_axis_t).
+    @param values: un tableau [point,t] aligné sur l'axe t source global
+    @return: un tableau [t,point]."""
 
-        source_index = pandas.DatetimeIndex(self.read_axis_t(type="source_global"))
-        target_index = pandas.DatetimeIndex(self.read_axis_t(type="target_global"))
-
-        for index_x in range(0,self.get_nb_points()):
-
-            data = pandas.DataFrame({'point_'+str(index_x): pandas.Series(values[index_x], index=source_index)})
+        source_times = self.read_axis_t(type="source_global", timestamp=1)
+        target_times = self.read_axis_t(type="target_global", timestamp=1)
 
         # we process time record (drop duplicate...)
-        duplicates = np.where(data.index.duplicated() == True)[0]
-
-        count = np.shape(duplicates)[0]
+        count = len(source_times) - len(np.unique(source_times))
         if count > 0:
             logging.warning(
                 '[TimeMultiPoint] ' + str(count) + ' dates are duplicated. We drop them by keeping the first.')
             logging.debug("[TimeMultiPoint] current file= " + str(self.reader.filename))
-            logging.debug("[TimeMultiPoint] duplicates index=" + str(duplicates))
-            data = data.groupby(data.index).first()
-
-        # we sort by dates
-        data = data.sort_index()
 
-        if TimeMultiPoint.TIME_INTERPOLATION_METHOD == None:
-            data = data.reindex(target_index, fill_value=np.nan)
-
-        if TimeMultiPoint.TIME_INTERPOLATION_METHOD == "linear":
-            # Interpolate
-            tmp = data.reindex(target_index, fill_value=np.nan)
-            data = tmp.interpolate(method=TimeMultiPoint.TIME_INTERPOLATION_METHOD, axis=0)
-        else:
-            # Fill gap
-            data = data.reindex(target_index, method=TimeMultiPoint.TIME_INTERPOLATION_METHOD, fill_value=np.nan,
-                                tolerance=TimeMultiPoint.TIME_DELTA);
+        tolerance = None
+        if TimeMultiPoint.TIME_INTERPOLATION_METHOD == "nearest":
+            tolerance = TimeMultiPoint.TIME_DELTA.total_seconds()
 
-        return data.as_matrix()
+        return time_interpolation(source_times, target_times, np.transpose(values),
+                                  TimeMultiPoint.TIME_INTERPOLATION_METHOD, tolerance)
 
     def interpolate_time(self,date,indexes_t,layers):
+        """Interpole les valeurs des dates candidates à la date souhaitée, pour toutes les point à la fois.
+    @param date: date souhaitée
+    @param indexes_t: index des dates candidates (voir find_time_index())
+    @param layers: un tableau [candidat,point]
+    @return: un tableau [point]."""
+
+        targetTime = [(date - TimeMultiPoint.TIME_DATUM).total_seconds()]
+        rawTime = self.read_axis_t(type="source", timestamp=1)
+
+        return time_interpolation(rawTime[indexes_t], targetTime, layers, TimeMultiPoint.TIME_INTERPOLATION_METHOD)[0]
+
+    # Time series
+    def read_variable_timeseries(self, name, stations=None, t_slice=None):
+        """Retourne la série temporelle de la variable souhaitée pour plusieurs point. Les pas de temps source sont lus
+    en un seul appel au lecteur pour toutes les stations (voir MultiPointReader.read_variable_timeseries()) puis
+    ramenés sur l'axe t. Les séries lues pour toutes les stations sont conservées dans un cache
+    (TIMESERIES_CACHE_SIZE) : les écritures station par station ne relisent pas le fichier.
+    @param name: nom de la variable (ex: "sea_surface_temperature", "wind_speed_10m")
+    @param stations: index ou noms des point (par défaut tous les point)
+    @param t_slice: slice de l'axe t (par défaut toutes les dates)
+    @return: un tableau [t,point] ou, pour un vecteur, [t,composante,point]."""
+
+        if name in TimeMultiPoint.VECTOR_VARIABLES:
+            vector_name, operator = TimeMultiPoint.VECTOR_VARIABLES[name]
+            comp = self.read_variable_timeseries(vector_name, stations=stations, t_slice=t_slice)
+            return operator(comp[:, 0], comp[:, 1])
+
+        points = self.get_point_indexes(stations)
+        if t_slice is None:
+            t_slice = np.s_[0:self.get_t_size()]
+        t_slice = slice(*t_slice.indices(self.get_t_size()))
+
+        if TimeMultiPoint.TIMESERIES_CACHE_SIZE <= 0:
+            return self.read_timeseries(name, points, t_slice)
+
+        key = (name, t_slice.start, t_slice.stop, t_slice.step)
+        if key in self.timeseries_cache:
+            self.timeseries_cache.move_to_end(key)
+        else:
+            self.timeseries_cache[key] = self.read_timeseries(name, None, t_slice)
+            while len(self.timeseries_cache) > TimeMultiPoint.TIMESERIES_CACHE_SIZE:
+                self.timeseries_cache.popitem(last=False)
 
-        results = np.zeros([self.get_nb_points()])
-        results[:] = np.NAN
-
-        targetTime = [date.replace(tzinfo=timezone.utc).timestamp()]
-        rawTime = self.read_axis_t(type="source",timestamp=1)
+        return self.timeseries_cache[key][..., points]
 
-        candidateTimes = np.zeros([len(indexes_t)])
-        candidateValues = np.zeros([len(indexes_t)])
+    def read_timeseries(self, name, points, t_slice):
+        """Lit la série temporelle d'une variable du lecteur et la ramène sur l'axe t.
+    @param name: nom de la variable du lecteur
+    @param points: index des point (None pour tous les point)
+    @param t_slice: slice de l'axe t
+    @return: un tableau [t,point] ou [t,composante,point]."""
 
-        for x in range(0,self.get_nb_points()):
+        times = self.read_axis_t()[t_slice]
+        if len(times) == 0:
+            raise ValueError("t_slice " + str(t_slice) + " doesn't select any date.")
 
-            candidateValues[:] = np.nan
-            candidateTimes[:] = np.nan
+        target_times = self.read_axis_t(timestamp=1)[t_slice]
+        source_times = self.read_axis_t(type="source", timestamp=1)
 
-            for t in range(0, len(indexes_t)):
-                candidateTimes[t] = rawTime[indexes_t[t]]
-                candidateValues[t] = layers[t][x]
+        missing = np.flatnonzero(self.find_time_indices(target_times) < 0)
+        if len(missing) > 0:
+            raise ValueError("Proc n°" + str(self.rank) + " " + str(times[missing[0]]) + " was not found. Maybe the "
+                             "TimeMultiPoint.TIME_DELTA (" + str(TimeMultiPoint.TIME_DELTA) + ") is too small or the "
+                             "date is out the range.")
 
-            # We remove NaN values
-            nan_indexes = np.isnan(candidateValues)
-            finalCandidateTimes = candidateTimes[~nan_indexes]
-            finalCandidateValues = candidateValues[~nan_indexes]
+        # Les dates source candidates sont celles à TIME_DELTA près
+        delta = TimeMultiPoint.TIME_DELTA.total_seconds()
+        window = self.get_time_index().query_interval(np.min(target_times) - delta, np.max(target_times) + delta)
+        tmin = int(window[0])
+        tmax = int(window[-1]) + 1
 
-            if len(finalCandidateValues) > 1:
-                # We have more than 1 value, we interpole them
-                results[x] = time_1d_interpolation(finalCandidateTimes, targetTime, finalCandidateValues,TimeMultiPoint.TIME_INTERPOLATION_METHOD)
-            else:
-                # We take the only value
-                results[x] = candidateValues[0]
+        source_t_start = self.map_mpi[self.rank]["src_global_t"].start
+        data = self.reader.read_variable_timeseries(name, source_t_start + tmin, source_t_start + tmax, points)
 
-        return results
+        # Toutes les dates et toutes les point en une seule interpolation, limitée aux dates à TIME_DELTA près
+        return time_interpolation(source_times[tmin:tmax], target_times, data, TimeMultiPoint.TIME_INTERPOLATION_METHOD,
+                                  delta)
 
     # Scalar
     def read_variable_longitude_at_time(self, date):
@@ -374,7 +430,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_longitude_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -391,7 +447,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_latitude_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -413,7 +469,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_sea_surface_height_above_mean_sea_level_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -430,7 +486,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_sea_surface_height_above_geoid_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -447,7 +503,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_sea_water_column_thickness_at_time(
@@ -466,7 +522,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_sea_surface_density_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -483,7 +539,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_sea_water_turbidity_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -500,7 +556,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_sea_water_electrical_conductivity_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -516,11 +572,11 @@ class TimeMultiPoint(MultiPoint):
         index_t = self.find_time_index(date)
 
         data = np.zeros([2, self.get_nb_points()])
-        data[::] = np.NAN
+        data[::] = np.nan
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), 2, self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 comp = self.reader.read_variable_barotropic_sea_water_velocity_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -537,36 +593,15 @@ class TimeMultiPoint(MultiPoint):
 
     def read_variable_barotropic_sea_water_speed_at_time(self, date):
         comp = self.read_variable_barotropic_sea_water_velocity_at_time(date)
-
-        data = np.zeros([self.get_nb_points()])
-        data[::] = np.NAN
-
-        for index_x in range(0, self.get_nb_points()):
-            data[index_x] = math.sqrt(comp[0][index_x] ** 2 + comp[1][index_x] ** 2)
-
-        return data
+        return speed(comp[0], comp[1])
 
     def read_variable_barotropic_sea_water_from_direction_at_time(self, date):
         comp = self.read_variable_barotropic_sea_water_velocity_at_time(date)
-
-        data = np.zeros([self.get_nb_points()])
-        data[::] = np.NAN
-
-        for index_x in range(0, self.get_nb_points()):
-            data[index_x] = (270. - (math.degrees(math.atan2(comp[1][index_x], comp[0][index_x])))) % 360.0
-
-        return data
+        return from_direction(comp[0], comp[1])
 
     def read_variable_barotropic_sea_water_to_direction_at_time(self, date):
         comp = self.read_variable_barotropic_sea_water_velocity_at_time(date)
-
-        data = np.zeros([self.get_nb_points()])
-        data[::] = np.NAN
-
-        for index_x in range(0, self.get_nb_points()):
-            data[index_x] = (270. - (math.degrees(math.atan2(comp[1][index_x], comp[0][index_x]))) + 180.0 ) % 360.0
-
-        return data
+        return to_direction(comp[0], comp[1])
 
     #################
     # HYDRO
@@ -578,7 +613,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_sea_surface_temperature_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -595,7 +630,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_sea_surface_salinity_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -612,7 +647,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_sea_water_pressure_at_sea_water_surface_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -628,11 +663,11 @@ class TimeMultiPoint(MultiPoint):
         index_t = self.find_time_index(date)
 
         data = np.zeros([2, self.get_nb_points()])
-        data[::] = np.NAN
+        data[::] = np.nan
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), 2, self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 comp = self.reader.read_variable_sea_water_velocity_at_sea_water_surface_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -649,36 +684,15 @@ class TimeMultiPoint(MultiPoint):
 
     def read_variable_sea_water_speed_at_sea_water_surface_at_time(self, date):
         comp = self.read_variable_sea_water_velocity_at_sea_water_surface_at_time(date)
-
-        data = np.zeros([self.get_nb_points()])
-        data[::] = np.NAN
-
-        for index_x in range(0, self.get_nb_points()):
-            data[index_x] = math.sqrt(comp[0][index_x] ** 2 + comp[1][index_x] ** 2)
-
-        return data
+        return speed(comp[0], comp[1])
 
     def read_variable_sea_water_from_direction_at_sea_water_surface_at_time(self, date):
         comp = self.read_variable_sea_water_velocity_at_sea_water_surface_at_time(date)
-
-        data = np.zeros([self.get_nb_points()])
-        data[::] = np.NAN
-
-        for index_x in range(0, self.get_nb_points()):
-            data[index_x] = (270. - (math.degrees(math.atan2(comp[1][index_x], comp[0][index_x])))) % 360.0
-
-        return data
+        return from_direction(comp[0], comp[1])
 
     def read_variable_sea_water_to_direction_at_sea_water_surface_at_time(self, date):
         comp = self.read_variable_sea_water_velocity_at_sea_water_surface_at_time(date)
-
-        data = np.zeros([self.get_nb_points()])
-        data[::] = np.NAN
-
-        for index_x in range(0, self.get_nb_points()):
-            data[index_x] = (270. - (math.degrees(math.atan2(comp[1][index_x], comp[0][index_x]))) + 180.0 ) % 360.0
-
-        return data
+        return to_direction(comp[0], comp[1])
 
     #################
     # HYDRO
@@ -690,7 +704,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_sea_water_temperature_at_ground_level_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -707,7 +721,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_sea_water_salinity_at_ground_level_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -723,11 +737,11 @@ class TimeMultiPoint(MultiPoint):
         index_t = self.find_time_index(date)
 
         data = np.zeros([2, self.get_nb_points()])
-        data[::] = np.NAN
+        data[::] = np.nan
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), 2, self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 comp = self.reader.read_variable_sea_water_velocity_at_ground_level_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -744,36 +758,15 @@ class TimeMultiPoint(MultiPoint):
 
     def read_variable_sea_water_speed_at_ground_level_at_time(self, date):
         comp = self.read_variable_sea_water_velocity_at_ground_level_at_time(date)
-
-        data = np.zeros([self.get_nb_points()])
-        data[::] = np.NAN
-
-        for index_x in range(0, self.get_nb_points()):
-            data[index_x] = math.sqrt(comp[0][index_x] ** 2 + comp[1][index_x] ** 2)
-
-        return data
+        return speed(comp[0], comp[1])
 
     def read_variable_sea_water_from_direction_at_ground_level_at_time(self, date):
         comp = self.read_variable_sea_water_velocity_at_ground_level_at_time(date)
-
-        data = np.zeros([self.get_nb_points()])
-        data[::] = np.NAN
-
-        for index_x in range(0, self.get_nb_points()):
-            data[index_x] =  (270. - (math.degrees(math.atan2(comp[1][index_x], comp[0][index_x])))) % 360.0
-
-        return data
+        return from_direction(comp[0], comp[1])
 
     def read_variable_sea_water_to_direction_at_ground_level_at_time(self, date):
         comp = self.read_variable_sea_water_velocity_at_ground_level_at_time(date)
-
-        data = np.zeros([self.get_nb_points()])
-        data[::] = np.NAN
-
-        for index_x in range(0, self.get_nb_points()):
-            data[index_x] = (270. - (math.degrees(math.atan2(comp[1][index_x], comp[0][index_x]))) + 180.0 ) % 360.0
-
-        return data
+        return to_direction(comp[0], comp[1])
 
     #################
     # WAVES
@@ -785,7 +778,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_sea_surface_wave_significant_height_at_time(
@@ -804,7 +797,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_sea_surface_wave_mean_period_at_time(
@@ -823,7 +816,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_sea_surface_wave_to_direction_at_time(
@@ -857,7 +850,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_water_volume_transport_into_sea_water_from_rivers_at_time(
@@ -880,7 +873,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_surface_air_pressure_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -897,7 +890,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_sea_surface_air_pressure_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -914,7 +907,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_surface_downward_sensible_heat_flux_at_time(
@@ -933,7 +926,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_rainfall_amount_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -949,11 +942,11 @@ class TimeMultiPoint(MultiPoint):
         index_t = self.find_time_index(date)
 
         data = np.zeros([2, self.get_nb_points()])
-        data[::] = np.NAN
+        data[::] = np.nan
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), 2, self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 comp = self.reader.read_variable_wind_stress_at_time(
@@ -972,43 +965,22 @@ class TimeMultiPoint(MultiPoint):
 
     def read_variable_wind_stress_stress_at_time(self, date):
         comp = self.read_variable_wind_stress_at_time(date)
-
-        data = np.zeros([self.get_nb_points()])
-        data[::] = np.NAN
-
-        for index_x in range(0, self.get_nb_points()):
-            data[index_x] = math.sqrt(comp[0][index_x] ** 2 + comp[1][index_x] ** 2)
-
-        return data
+        return speed(comp[0], comp[1])
 
     def read_variable_wind_stress_from_direction_at_time(self, date):
         comp = self.read_variable_wind_stress_at_time(date)
-
-        data = np.zeros([self.get_nb_points()])
-        data[::] = np.NAN
-
-        for index_x in range(0, self.get_nb_points()):
-            data[index_x] = (270. - (math.degrees(math.atan2(comp[1][index_x], comp[0][index_x])))) % 360.0
-
-        return data
+        return from_direction(comp[0], comp[1])
 
     def read_variable_wind_stress_to_direction_at_time(self, date):
         comp = self.read_variable_wind_stress_at_time(date)
-
-        data = np.zeros([self.get_nb_points()])
-        data[::] = np.NAN
-
-        for index_x in range(0, self.get_nb_points()):
-            data[index_x] = (270. - (math.degrees(math.atan2(comp[1][index_x], comp[0][index_x]))) + 180.0 ) % 360.0
-
-        return data
+        return to_direction(comp[0], comp[1])
 
     def read_variable_surface_downward_sensible_heat_flux_at_time(self, date):
         index_t = self.find_time_index(date)
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_surface_downward_sensible_heat_flux_at_time(
@@ -1027,7 +999,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_surface_downward_latent_heat_flux_at_time(
@@ -1046,7 +1018,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_surface_air_temperature_at_time(
@@ -1065,7 +1037,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_dew_point_temperature_at_time(
@@ -1084,7 +1056,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_surface_downward_solar_radiation_at_time(
@@ -1103,7 +1075,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_surface_downward_thermal_radiation_at_time(
@@ -1122,7 +1094,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_surface_solar_radiation_at_time(
@@ -1141,7 +1113,7 @@ class TimeMultiPoint(MultiPoint):
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 layers[t] = self.reader.read_variable_surface_thermal_radiation_at_time(
@@ -1164,11 +1136,11 @@ class TimeMultiPoint(MultiPoint):
         index_t = self.find_time_index(date)
 
         data = np.zeros([2, self.get_nb_points()])
-        data[::] = np.NAN
+        data[::] = np.nan
 
         if len(index_t) > 1:
             layers = np.zeros([len(index_t), 2, self.get_nb_points()])
-            layers[::] = np.NAN
+            layers[::] = np.nan
 
             for t in range(0, len(index_t)):
                 comp = self.reader.read_variable_wind_10m_at_time(self.map_mpi[self.rank]["src_global_t"].start + index_t[t])
@@ -1185,36 +1157,15 @@ class TimeMultiPoint(MultiPoint):
 
     def read_variable_wind_speed_10m_at_time(self, date):
         comp = self.read_variable_wind_10m_at_time(date)
-
-        data = np.zeros([self.get_nb_points()])
-        data[::] = np.NAN
-
-        for index_x in range(0, self.get_nb_points()):
-            data[index_x] = math.sqrt(comp[0][index_x] ** 2 + comp[1][index_x] ** 2)
-
-        return data
+        return speed(comp[0], comp[1])
 
     def read_variable_wind_from_direction_10m_at_time(self, date):
         comp = self.read_variable_wind_10m_at_time(date)
-
-        data = np.zeros([self.get_nb_points()])
-        data[::] = np.NAN
-
-        for index_x in range(0, self.get_nb_points()):
-            data[index_x] = (270. - (math.degrees(math.atan2(comp[1][index_x], comp[0][index_x])))) % 360.0
-
-        return data
+        return from_direction(comp[0], comp[1])
 
     def read_variable_wind_to_direction_10m_at_time(self, date):
         comp = self.read_variable_wind_10m_at_time(date)
-
-        data = np.zeros([self.get_nb_points()])
-        data[::] = np.NAN
-
-        for index_x in range(0, self.get_nb_points()):
-            data[index_x] = (270. - (math.degrees(math.atan2(comp[1][index_x], comp[0][index_x])) + 180.0 )) % 360.0
-
-        return data
+        return to_direction(comp[0], comp[1])
 
     # TODO trouver une place propre pour ce qui suit
 
@@ -0,0 +1,226 @@
+#! /usr/bin/env python2.7
+# -*- coding: utf-8 -*-
+#
+# pySpatialETL is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# pySpatialETL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# Author : Fabien Rétif - fabien.retif@zoho.com
+#
+from __future__ import division, print_function, absolute_import
+
+import numpy as np
+
+from spatialetl.point.io.MultiPointReader import MultiPointReader
+from spatialetl.utils.SpatialIndex import get_spatial_index
+from spatialetl.utils.distance import distances_on_unit_sphere
+from spatialetl.utils.logger import logging
+
+
+class AbstractGridMultiPointReader(MultiPointReader):
+    """
+La classe AbstractGridMultiPointReader regroupe la recherche des point de grille les plus proches pour les lecteurs
+de point qui extraient des stations d'une grille (self.reader est un CoverageReader). Toutes les stations sont
+résolues en une seule requête sur l'index spatial de la grille, construit une seule fois par fichier de grille.
+
+Les stations proches sont ensuite regroupées : chaque groupe est lu en un seul hyperslab (l'emprise de ses stations)
+par pas de temps et par variable, puis les valeurs des stations sont extraites en mémoire (voir read_points()).
+"""
+
+    SOURCE_NAME = "source"
+    NEAREST_POINT_METHOD = "classic"
+    SPATIAL_INDEX_DIRECTORY = None
+    # Taille maximale (en nombre de mailles) de l'emprise d'un groupe de stations
+    MAX_GROUP_BOX_SIZE = 4096
+    # Nombre maximal de valeurs lues par appel au lecteur de grille lors de la lecture d'une série temporelle
+    MAX_BLOCK_SIZE = 10000000
+
+    def __init__(self, myFile):
+        MultiPointReader.__init__(self, myFile)
+        self.points_index = {}
+        self.point_groups = []
+
+    def find_points_coordinates(self, xy=None):
+        """Recherche les point de grille les plus proches de toutes les stations et remplit self.xy_coords,
+    self.xy_values et self.points_index."""
+
+        if self.reader is None:
+            raise (ValueError("CoverageReader is not initialized"))
+
+        source_xy_coords = np.asarray(self.source_xy_coords, dtype=np.float64)
+        nearest_x, nearest_y, nearest_lon, nearest_lat, dist = self.find_points_index(source_xy_coords[:, 0],
+                                                                                      source_xy_coords[:, 1],
+                                                                                      method=self.NEAREST_POINT_METHOD)
+
+        self.xy_coords[:, 0] = nearest_x
+        self.xy_coords[:, 1] = nearest_y
+        self.xy_values[:, 0] = nearest_lon
+        self.xy_values[:, 1] = nearest_lat
+        self.points_index = {}
+
+        for i in range(0, np.shape(self.xy_coords)[0]):
+            logging.info(str(
+                self.names[i]) + " nearest point in " + self.SOURCE_NAME + " is " + str(nearest_lon[i]) + " / " + str(
+                nearest_lat[i]) + " at " + str(round(dist[i], 4)) + " km")
+            self.meta_data = self.meta_data + "\n# " + str(
+                self.names[i]) + " : nearest point in " + self.SOURCE_NAME + " file is " + str(
+                round(dist[i], 4)) + " km from the target point"
+            logging.info("Nearest point (i,j) : " + str(nearest_x[i]) + " / " + str(nearest_y[i]))
+            self.points_index[self.names[i]] = (int(nearest_x[i]), int(nearest_y[i]))
+
+        self.point_groups = self.group_points(np.arange(np.shape(self.xy_coords)[0]))
+        logging.debug("[AbstractGridMultiPointReader] " + str(np.shape(self.xy_coords)[0]) + " points read in " + str(
+            len(self.point_groups)) + " hyperslab(s)")
+
+    def group_points(self, indexes):
+        """Regroupe les stations par proximité : le groupe est coupé en deux selon son plus grand côté (à la médiane)
+    tant que son emprise dépasse MAX_GROUP_BOX_SIZE mailles.
+    @param indexes: index des stations à regrouper
+    @return: une liste de groupes (index des stations, xmin, xmax, ymin, ymax)."""
+
+        x = self.xy_coords[indexes, 0]
+        y = self.xy_coords[indexes, 1]
+        xmin = int(np.min(x))
+        xmax = int(np.max(x)) + 1
+        ymin = int(np.min(y))
+        ymax = int(np.max(y)) + 1
+
+        if (xmax - xmin) * (ymax - ymin) <= self.MAX_GROUP_BOX_SIZE or len(indexes) == 1:
+            return [(indexes, xmin, xmax, ymin, ymax)]
+
+        if xmax - xmin >= ymax - ymin:
+            order = np.argsort(x, kind="stable")
+        else:
+            order = np.argsort(y, kind="stable")
+
+        middle = len(indexes) // 2
+        return self.group_points(indexes[order[:middle]]) + self.group_points(indexes[order[middle:]])
+
+    def read_points(self, function_name, *args, **kwargs):
+        """Appelle une fonction du lecteur de grille sur l'emprise de chaque groupe de stations et extrait les valeurs
+    des stations en mémoire.
+    @param function_name: nom de la fonction du lecteur de grille (ex: "read_variable_sea_surface_temperature_at_time").
+    La fonction est appelée avec args suivis de l'hyperslab xmin,xmax,ymin,ymax.
+    @param points: index des point (par défaut tous les point)
+    @return: un tableau [...,point] (ex: [point], [composante,point] ou [t,point])."""
+
+        if self.reader is None:
+            raise (ValueError("CoverageReader is not initialized"))
+
+        nb_points = np.shape(self.xy_coords)[0]
+        points = kwargs.get("points", None)
+        if points is None:
+            if len(self.point_groups) == 0:
+                self.point_groups = self.group_points(np.arange(nb_points))
+            groups = self.point_groups
+        else:
+            points = np.arange(nb_points)[points]
+            groups = self.group_points(points)
+
+        data = None
+        for indexes, xmin, xmax, ymin, ymax in groups:
+            block = getattr(self.reader, function_name)(*(args + (xmin, xmax, ymin, ymax)))
+            if isinstance(block, (list, tuple)):
+                block = np.ma.stack(block)
+            block = np.ma.filled(np.ma.asarray(block, dtype=np.float64), np.nan)
+
+            if data is None:
+                data = np.full(np.shape(block)[:-2] + (nb_points,), np.nan)
+            data[..., indexes] = block[..., self.xy_coords[indexes, 1] - ymin, self.xy_coords[indexes, 0] - xmin]
+
+        if points is not None:
+            return data[..., points]
+
+        return data
+
+    def read_variable_timeseries(self, name, tmin, tmax, points=None):
+        """Retourne la série temporelle de la variable souhaitée pour plusieurs point. Chaque groupe de stations est lu
+    en un seul hyperslab par bloc de pas de temps (voir MAX_BLOCK_SIZE).
+    @param name: nom de la variable (ex: "sea_surface_temperature")
+    @param tmin,tmax: index du temps
+    @param points: index des point (par défaut tous les point)
+    @return: un tableau [t,point] ou [t,composante,point] pour un vecteur."""
+
+        if tmax <= tmin:
+            raise ValueError("Time range [" + str(tmin) + "," + str(tmax) + "[ is empty.")
+
+        # L'emprise d'un groupe ne dépasse pas MAX_GROUP_BOX_SIZE mailles
+        nb_steps = max(1, self.MAX_BLOCK_SIZE // self.MAX_GROUP_BOX_SIZE)
+
+        series = []
+        for start in range(tmin, tmax, nb_steps):
+            series.append(self.read_points("read_variable_block", name, start, min(tmax, start + nb_steps),
+                                           points=points))
+
+        return np.concatenate(series)
+
+    def get_points_index(self):
+        """Retourne la correspondance station -> (i,j) dans la grille source.
+    @return: un dictionnaire {nom de la station : (index x, index y)}."""
+        return self.points_index
+
+    def find_points_index(self, target_lons, target_lats, method="classic", only_mask_value=True):
+        """Retourne en une seule requête les point de grille les plus proches des point donnés en paramètre.
+    @param target_lons: Tableau des coordonnées longitude des point
+    @param target_lats: Tableau des coordonnées latitude des point
+    @param method : Méthode de calcul. "classic" = On interroge l'index spatial de la grille,
+    "quick" = on recherche indépendamment le plus proche sur chaque axe (grille régulière uniquement).
+    @return: un tableau contenant
+     [0] : les index x des point les plus proches
+     [1] : les index y des point les plus proches
+     [2] : les coordonnées en longitude des point les plus proches
+     [3] : les coordonnées en latitude des point les plus proches
+     [4] : les distances des point les plus proches en kilomètre."""
+
+        target_lons = np.atleast_1d(np.asarray(target_lons, dtype=np.float64))
+        target_lats = np.atleast_1d(np.asarray(target_lats, dtype=np.float64))
+
+        if method == "classic":
+            return get_spatial_index(self.reader, only_mask_value=only_mask_value,
+                                     directory=AbstractGridMultiPointReader.SPATIAL_INDEX_DIRECTORY).query(target_lons,
+                                                                                                          target_lats)
+
+        elif method == "quick":
+
+            if self.reader.is_regular_grid():
+                x_size = self.reader.get_x_size()
+                y_size = self.reader.get_y_size()
+                lon = np.asarray(self.reader.read_axis_x(0, x_size, 0, y_size))
+                lat = np.asarray(self.reader.read_axis_y(0, x_size, 0, y_size))
+
+                # On cherche l'index le plus proche sur chaque axe
+                nearest_x_index = (np.abs(lon[np.newaxis, :] - target_lons[:, np.newaxis])).argmin(axis=1)
+                nearest_y_index = (np.abs(lat[np.newaxis, :] - target_lats[:, np.newaxis])).argmin(axis=1)
+
+                nearest_lon = lon[nearest_x_index]
+                nearest_lat = lat[nearest_y_index]
+
+                return [nearest_x_index, nearest_y_index, nearest_lon, nearest_lat,
+                        distances_on_unit_sphere(target_lons, target_lats, nearest_lon, nearest_lat)]
+
+            else:
+                raise NotImplementedError("Method " + str(method) + " is not implemented for non-regular grid.")
+
+        else:
+            raise RuntimeError("Method " + str(method) + " is not implemented yet.")
+
+    def find_point_index(self, target_lon, target_lat, method="classic", only_mask_value=True):
+        """Retourne le point le plus proche du point donné en paramètre.
+    @param target_lon: Coordonnée longitude du point
+    @param target_lat: Coordonnée latitude du point
+    @param method : Méthode de calcul (voir find_points_index()).
+    @return: un tableau contenant
+     [0] : l'index x du point le plus proche
+     [1] : l'index y du point le plus proche
+     [2] : la coordonnée en longitude du point le plus proche
+     [3] : la coordonnée en latitude point le plus proche
+     [4] : la distance du point le plus proche en kilomètre."""
+
+        return [value[0] for value in self.find_points_index([target_lon], [target_lat], method=method,
+                                                             only_mask_value=only_mask_value)]
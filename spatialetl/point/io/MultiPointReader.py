@@ -56,6 +56,34 @@ class MultiPointReader(object):
     def read_axis_t(self,tmin,tmax,timestamp):
         raise NotImplementedError(str(type(self)) + " don't have implemented the function 'read_axis_t()'.")
 
+    # Time series
+    def read_variable_timeseries(self, name, tmin, tmax, points=None):
+        """Retourne la série temporelle de la variable souhaitée pour plusieurs point.
+    Par défaut la série est construite à partir de read_variable_<name>_at_time() : chaque pas de temps est lu une
+    seule fois pour toutes les stations. Les lecteurs peuvent surcharger cette fonction pour lire la série en
+    quelques appels.
+    @param name: nom de la variable (ex: "sea_surface_temperature")
+    @param tmin,tmax: index du temps
+    @param points: index des point (par défaut tous les point)
+    @return: un tableau [t,point] ou [t,composante,point] pour un vecteur."""
+
+        function_name = "read_variable_" + str(name) + "_at_time"
+        if not hasattr(self, function_name):
+            raise ValueError("Unknown variable '" + str(name) + "'")
+
+        if tmax <= tmin:
+            raise ValueError("Time range [" + str(tmin) + "," + str(tmax) + "[ is empty.")
+
+        if points is None:
+            points = np.s_[:]
+
+        layers = []
+        for index_t in range(tmin, tmax):
+            layer = np.ma.filled(np.ma.asarray(getattr(self, function_name)(index_t), dtype=np.float64), np.nan)
+            layers.append(layer[..., points])
+
+        return np.stack(layers)
+
     # Variables
     def read_variable_point_names(self):
 
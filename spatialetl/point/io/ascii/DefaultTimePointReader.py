@@ -22,6 +22,7 @@ import pandas
 
 from spatialetl.point.TimeMultiPoint import TimeMultiPoint
 from spatialetl.point.io.MultiPointReader import MultiPointReader
+from spatialetl.utils.TimeAxis import TimeAxis
 from spatialetl.utils.logger import logging
 
 
@@ -82,11 +83,10 @@ class DefaultTimePointReader(MultiPointReader):
 
     def read_axis_t(self,timestamp=0):
 
-        result = self.data.index.to_pydatetime()
+        result = TimeAxis.from_datetime64(self.data.index.values)
 
         if timestamp == 1:
-            return [(t - TimeMultiPoint.TIME_DATUM).total_seconds() \
-                    for t in result];
+            return result.to_timestamps(TimeMultiPoint.TIME_DATUM)
         else:
             return result
 
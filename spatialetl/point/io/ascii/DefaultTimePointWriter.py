@@ -16,9 +16,7 @@
 from __future__ import division, print_function, absolute_import
 
 import os
-from datetime import datetime
 
-import numpy as np
 import pandas
 
 from spatialetl.point.TimeMultiPoint import TimeMultiPoint
@@ -37,11 +35,7 @@ class DefaultTimePointWriter(MultiPointWriter):
 
         self.index_x = index_point
 
-        axis_t = []
-        for time in self.points.read_axis_t(timestamp=1):
-            axis_t.append(datetime.utcfromtimestamp(time))
-
-        index = pandas.DatetimeIndex(axis_t)
+        index = pandas.DatetimeIndex(self.points.read_axis_t().to_datetime64())
         self.data = pandas.DataFrame(index=index)
         self.append = append
 
@@ -80,37 +74,11 @@ class DefaultTimePointWriter(MultiPointWriter):
 
     def write_variable_longitude(self):
         logging.info('[DefaultTimePointWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['longitude'])+'\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['longitude']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_longitude_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['longitude'] = data
+        self.data['longitude'] = self.points.read_variable_timeseries('longitude', stations=self.index_x)[:, 0]
 
     def write_variable_latitude(self):
         logging.info('[DefaultTimePointWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['latitude'])+'\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['latitude']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_latitude_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['latitude'] = data
+        self.data['latitude'] = self.points.read_variable_timeseries('latitude', stations=self.index_x)[:, 0]
 
     #################
     # HYDRO
@@ -120,127 +88,33 @@ class DefaultTimePointWriter(MultiPointWriter):
     def write_variable_bathymetry(self):
         logging.info(
             '[DefaultTimePointWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['bathymetry']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['bathymetry']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_bathymetry_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['bathymetry'] = data
+        self.data['bathymetry'] = self.points.read_variable_timeseries('bathymetry', stations=self.index_x)[:, 0]
 
     def write_variable_sea_surface_height_above_mean_sea_level(self):
         logging.info('[DefaultTimePointWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['sea_surface_height_above_mean_sea_level'])+'\'')
-
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_height_above_mean_sea_level']) + '\' at time \'' + str(
-                    time) + '\'')
-            data[time_index] = self.points.read_variable_sea_surface_height_above_mean_sea_level_at_time(time)[self.index_x]
-
-            time_index += 1
-
-        self.data['sea_surface_height_above_mean_sea_level'] = data
+        self.data['sea_surface_height_above_mean_sea_level'] = self.points.read_variable_timeseries('sea_surface_height_above_mean_sea_level', stations=self.index_x)[:, 0]
 
     def write_variable_sea_surface_height_above_geoid(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_surface_height_above_geoid']) + '\'')
-
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_height_above_geoid']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_surface_height_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['sea_surface_height_above_geoid'] = data
-
+        self.data['sea_surface_height_above_geoid'] = self.points.read_variable_timeseries('sea_surface_height_above_geoid', stations=self.index_x)[:, 0]
 
     def write_variable_sea_water_column_thickness(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_water_column_thickness']) + '\'')
-
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_column_thickness']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_water_column_thickness_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['sea_water_column_thickness'] = data
+        self.data['sea_water_column_thickness'] = self.points.read_variable_timeseries('sea_water_column_thickness', stations=self.index_x)[:, 0]
 
     def write_variable_barotropic_sea_water_speed(self):
         logging.info('[DefaultTimePointWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['barotropic_sea_water_speed'])+'\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['barotropic_sea_water_speed']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_barotropic_sea_water_speed_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['barotropic_sea_water_speed'] = data
+        self.data['barotropic_sea_water_speed'] = self.points.read_variable_timeseries('barotropic_sea_water_speed', stations=self.index_x)[:, 0]
 
     def write_variable_barotropic_sea_water_from_direction(self):
         logging.info('[DefaultTimePointWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['barotropic_sea_water_from_direction'])+'\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['barotropic_sea_water_from_direction']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_barotropic_sea_water_from_direction_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['barotropic_sea_water_from_direction'] = data
+        self.data['barotropic_sea_water_from_direction'] = self.points.read_variable_timeseries('barotropic_sea_water_from_direction', stations=self.index_x)[:, 0]
 
     def write_variable_barotropic_sea_water_to_direction(self):
         logging.info('[DefaultTimePointWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['barotropic_sea_water_to_direction'])+'\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['barotropic_sea_water_to_direction']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_barotropic_sea_water_to_direction_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['barotropic_sea_water_to_direction'] = data
+        self.data['barotropic_sea_water_to_direction'] = self.points.read_variable_timeseries('barotropic_sea_water_to_direction', stations=self.index_x)[:, 0]
 
 
     #################
@@ -250,163 +124,44 @@ class DefaultTimePointWriter(MultiPointWriter):
 
     def write_variable_sea_surface_temperature(self):
         logging.info('[DefaultTimePointWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['sea_surface_temperature'])+'\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_temperature']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_surface_temperature_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['sea_surface_temperature'] = data
+        self.data['sea_surface_temperature'] = self.points.read_variable_timeseries('sea_surface_temperature', stations=self.index_x)[:, 0]
 
     def write_variable_sea_surface_salinity(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_surface_salinity']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_salinity']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_surface_salinity_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['sea_surface_salinity'] = data
+        self.data['sea_surface_salinity'] = self.points.read_variable_timeseries('sea_surface_salinity', stations=self.index_x)[:, 0]
 
     def write_variable_sea_surface_density(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_surface_density']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_density']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_surface_density_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['sea_surface_density'] = data
+        self.data['sea_surface_density'] = self.points.read_variable_timeseries('sea_surface_density', stations=self.index_x)[:, 0]
 
     def write_variable_sea_water_pressure_at_sea_water_surface(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_water_pressure_at_sea_water_surface']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_pressure_at_sea_water_surface']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_water_pressure_at_sea_water_surface_at_time(time)[
-                    self.index_x]
-            time_index += 1
-
-        self.data['sea_water_pressure_at_sea_water_surface'] = data
+        self.data['sea_water_pressure_at_sea_water_surface'] = self.points.read_variable_timeseries('sea_water_pressure_at_sea_water_surface', stations=self.index_x)[:, 0]
 
     def write_variable_sea_water_speed_at_sea_water_surface(self):
         logging.info('[DefaultTimePointWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['sea_water_speed_at_sea_water_surface'])+'\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_speed_at_sea_water_surface']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_water_speed_at_sea_water_surface_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['sea_water_speed_at_sea_water_surface'] = data
+        self.data['sea_water_speed_at_sea_water_surface'] = self.points.read_variable_timeseries('sea_water_speed_at_sea_water_surface', stations=self.index_x)[:, 0]
 
     def write_variable_sea_water_from_direction_at_sea_water_surface(self):
         logging.info('[DefaultTimePointWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['sea_water_from_direction_at_sea_water_surface'])+'\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_from_direction_at_sea_water_surface']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_water_from_direction_at_sea_water_surface_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['sea_water_from_direction_at_sea_water_surface'] = data
+        self.data['sea_water_from_direction_at_sea_water_surface'] = self.points.read_variable_timeseries('sea_water_from_direction_at_sea_water_surface', stations=self.index_x)[:, 0]
 
     def write_variable_sea_water_to_direction_at_sea_water_surface(self):
         logging.info('[DefaultTimePointWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['sea_water_to_direction_at_sea_water_surface'])+'\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_to_direction_at_sea_water_surface']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_water_to_direction_at_sea_water_surface_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['sea_water_to_direction_at_sea_water_surface'] = data
+        self.data['sea_water_to_direction_at_sea_water_surface'] = self.points.read_variable_timeseries('sea_water_to_direction_at_sea_water_surface', stations=self.index_x)[:, 0]
 
     def write_variable_sea_water_turbidity(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_water_turbidity']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_turbidity']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_water_turbidity_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['sea_water_turbidity'] = data
+        self.data['sea_water_turbidity'] = self.points.read_variable_timeseries('sea_water_turbidity', stations=self.index_x)[:, 0]
 
     def write_variable_sea_water_electrical_conductivity(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_water_electrical_conductivity']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_electrical_conductivity']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_water_electrical_conductivity_at_time(time)[
-                    self.index_x]
-            time_index += 1
-
-        self.data['sea_water_electrical_conductivity'] = data
+        self.data['sea_water_electrical_conductivity'] = self.points.read_variable_timeseries('sea_water_electrical_conductivity', stations=self.index_x)[:, 0]
 
     #################
     # HYDRO
@@ -415,95 +170,27 @@ class DefaultTimePointWriter(MultiPointWriter):
 
     def write_variable_sea_water_temperature_at_ground_level(self):
         logging.info('[DefaultTimePointWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['sea_water_temperature_at_ground_level'])+'\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_temperature_at_ground_level']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_water_temperature_at_ground_level_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['sea_water_temperature_at_ground_level'] = data
+        self.data['sea_water_temperature_at_ground_level'] = self.points.read_variable_timeseries('sea_water_temperature_at_ground_level', stations=self.index_x)[:, 0]
 
     def write_variable_sea_water_salinity_at_ground_level(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_water_salinity_at_ground_level']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_salinity_at_ground_level']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_water_salinity_at_ground_level_at_time(time)[
-                    self.index_x]
-            time_index += 1
-
-        self.data['sea_water_salinity_at_ground_level'] = data
+        self.data['sea_water_salinity_at_ground_level'] = self.points.read_variable_timeseries('sea_water_salinity_at_ground_level', stations=self.index_x)[:, 0]
 
     def write_variable_sea_water_speed_at_ground_level(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_water_speed_at_ground_level']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_speed_at_ground_level']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_water_speed_at_ground_level_at_time(time)[
-                self.index_x]
-            time_index += 1
-
-        self.data['sea_water_speed_at_ground_level'] = data
+        self.data['sea_water_speed_at_ground_level'] = self.points.read_variable_timeseries('sea_water_speed_at_ground_level', stations=self.index_x)[:, 0]
 
     def write_variable_sea_water_from_direction_at_ground_level(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_water_from_direction_at_ground_level']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME[
-                        'sea_water_from_direction_at_ground_level']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_water_from_direction_at_ground_level_at_time(time)[
-                self.index_x]
-            time_index += 1
-
-        self.data['sea_water_from_direction_at_ground_level'] = data
+        self.data['sea_water_from_direction_at_ground_level'] = self.points.read_variable_timeseries('sea_water_from_direction_at_ground_level', stations=self.index_x)[:, 0]
 
     def write_variable_sea_water_to_direction_at_ground_level(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_water_to_direction_at_ground_level']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME[
-                        'sea_water_to_direction_at_ground_level']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_water_to_direction_at_ground_level_at_time(time)[
-                self.index_x]
-            time_index += 1
-
-        self.data['sea_water_to_direction_at_ground_level'] = data
+        self.data['sea_water_to_direction_at_ground_level'] = self.points.read_variable_timeseries('sea_water_to_direction_at_ground_level', stations=self.index_x)[:, 0]
 
     #################
     # HYDRO
@@ -518,73 +205,22 @@ class DefaultTimePointWriter(MultiPointWriter):
     def write_variable_sea_surface_wave_significant_height(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_surface_wave_significant_height']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_wave_significant_height']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_surface_wave_significant_height_at_time(time)[
-                    self.index_x]
-            time_index += 1
-
-        self.data['sea_surface_wave_significant_height'] = data
+        self.data['sea_surface_wave_significant_height'] = self.points.read_variable_timeseries('sea_surface_wave_significant_height', stations=self.index_x)[:, 0]
 
     def write_variable_sea_surface_wave_mean_period(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_surface_wave_mean_period']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_wave_mean_period']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_surface_wave_mean_period_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['sea_surface_wave_mean_period'] = data
+        self.data['sea_surface_wave_mean_period'] = self.points.read_variable_timeseries('sea_surface_wave_mean_period', stations=self.index_x)[:, 0]
 
     def write_variable_sea_surface_wave_from_direction(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_surface_wave_from_direction']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_wave_from_direction']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_surface_wave_from_direction_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['sea_surface_wave_from_direction'] = data
+        self.data['sea_surface_wave_from_direction'] = self.points.read_variable_timeseries('sea_surface_wave_from_direction', stations=self.index_x)[:, 0]
 
     def write_variable_sea_surface_wave_to_direction(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_surface_wave_to_direction']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_wave_to_direction']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_surface_wave_to_direction_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['sea_surface_wave_to_direction'] = data
+        self.data['sea_surface_wave_to_direction'] = self.points.read_variable_timeseries('sea_surface_wave_to_direction', stations=self.index_x)[:, 0]
 
     #################
     # WAVES
@@ -603,21 +239,7 @@ class DefaultTimePointWriter(MultiPointWriter):
 
     def write_variable_water_volume_transport_into_sea_water_from_rivers(self):
         logging.info('[DefaultTimePointWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['water_volume_transport_into_sea_water_from_rivers'])+'\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['water_volume_transport_into_sea_water_from_rivers']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_water_volume_transport_into_sea_water_from_rivers_at_time(time)[
-                self.index_x]
-            time_index += 1
-
-        self.data['water_volume_transport_into_sea_water_from_rivers'] = data
+        self.data['water_volume_transport_into_sea_water_from_rivers'] = self.points.read_variable_timeseries('water_volume_transport_into_sea_water_from_rivers', stations=self.index_x)[:, 0]
 
     #################
     # METEO
@@ -627,263 +249,79 @@ class DefaultTimePointWriter(MultiPointWriter):
     def write_variable_surface_air_pressure(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['surface_air_pressure']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['surface_air_pressure']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_surface_air_pressure_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['surface_air_pressure'] = data
+        self.data['surface_air_pressure'] = self.points.read_variable_timeseries('surface_air_pressure', stations=self.index_x)[:, 0]
 
     def write_variable_sea_surface_air_pressure(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_surface_air_pressure']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_air_pressure']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_sea_surface_air_pressure_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['surface_air_pressure'] = data
+        self.data['surface_air_pressure'] = self.points.read_variable_timeseries('sea_surface_air_pressure', stations=self.index_x)[:, 0]
 
     def write_variable_rainfall_amount(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['rainfall_amount']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['rainfall_amount']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_rainfall_amount_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['rainfall_amount'] = data
+        self.data['rainfall_amount'] = self.points.read_variable_timeseries('rainfall_amount', stations=self.index_x)[:, 0]
 
     def write_variable_surface_downward_sensible_heat_flux(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['surface_downward_sensible_heat_flux']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['surface_downward_sensible_heat_flux']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_surface_downward_sensible_heat_flux_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['surface_downward_sensible_heat_flux'] = data
+        self.data['surface_downward_sensible_heat_flux'] = self.points.read_variable_timeseries('surface_downward_sensible_heat_flux', stations=self.index_x)[:, 0]
 
     def write_variable_surface_downward_latent_heat_flux(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['surface_downward_latent_heat_flux']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['surface_downward_latent_heat_flux']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_surface_downward_latent_heat_flux_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['surface_downward_latent_heat_flux'] = data
+        self.data['surface_downward_latent_heat_flux'] = self.points.read_variable_timeseries('surface_downward_latent_heat_flux', stations=self.index_x)[:, 0]
 
     def write_variable_surface_air_temperature(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['surface_air_temperature']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['surface_air_temperature']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_surface_air_temperature_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['surface_air_temperature'] = data
+        self.data['surface_air_temperature'] = self.points.read_variable_timeseries('surface_air_temperature', stations=self.index_x)[:, 0]
 
     def write_variable_dew_point_temperature(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['dew_point_temperature']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['dew_point_temperature']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_dew_point_temperature_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['dew_point_temperature'] = data
+        self.data['dew_point_temperature'] = self.points.read_variable_timeseries('dew_point_temperature', stations=self.index_x)[:, 0]
 
     def write_variable_surface_downward_solar_radiation(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['surface_downward_solar_radiation']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['surface_downward_solar_radiation']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_surface_downward_solar_radiation_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['surface_downward_solar_radiation'] = data
+        self.data['surface_downward_solar_radiation'] = self.points.read_variable_timeseries('surface_downward_solar_radiation', stations=self.index_x)[:, 0]
 
     def write_variable_surface_downward_thermal_radiation(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['surface_downward_thermal_radiation']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['surface_downward_thermal_radiation']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_surface_downward_thermal_radiation_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['surface_downward_thermal_radiation'] = data
+        self.data['surface_downward_thermal_radiation'] = self.points.read_variable_timeseries('surface_downward_thermal_radiation', stations=self.index_x)[:, 0]
 
     def write_variable_surface_solar_radiation(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['surface_solar_radiation']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['surface_solar_radiation']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_surface_solar_radiation_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['surface_solar_radiation'] = data
+        self.data['surface_solar_radiation'] = self.points.read_variable_timeseries('surface_solar_radiation', stations=self.index_x)[:, 0]
 
     def write_variable_surface_thermal_radiation(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['surface_thermal_radiation']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['surface_thermal_radiation']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_surface_thermal_radiation_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['surface_thermal_radiation'] = data
+        self.data['surface_thermal_radiation'] = self.points.read_variable_timeseries('surface_thermal_radiation', stations=self.index_x)[:, 0]
 
     def write_variable_wind_stress(self):
         logging.info(
             "[DefaultTimePointWriter] Writing variable 'Wind Stress'")
-        data_u = np.zeros([self.points.get_t_size()])
-        data_v = np.zeros([self.points.get_t_size()])
-        data_u[:] = np.nan
-        data_v[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'Wind Stress\' at time \'' + str(
-                    time) + '\'')
-
-            data = self.points.read_variable_wind_stress_at_time(time)
-            data_u[time_index] = data[0][self.index_x]
-            data_v[time_index] = data[1][self.index_x]
-            time_index += 1
-
-        self.data['eastward_wind_stress'] = data_u
-        self.data['northward_wind_stress'] = data_v
+        data = self.points.read_variable_timeseries('wind_stress', stations=self.index_x)
+        self.data['eastward_wind_stress'] = data[:, 0, 0]
+        self.data['northward_wind_stress'] = data[:, 1, 0]
 
     def write_variable_wind_stress_stress(self):
         logging.info(
             '[DefaultTimePointWriter] Writing variable \'' + str(VariableDefinition.LONG_NAME['wind_stress_stress']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['wind_stress_stress']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_wind_stress_stress_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['wind_stress_stress'] = data
+        self.data['wind_stress_stress'] = self.points.read_variable_timeseries('wind_stress_stress', stations=self.index_x)[:, 0]
 
     def write_variable_wind_stress_from_direction(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['wind_stress_from_direction']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['wind_stress_from_direction']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_wind_stress_from_direction_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['wind_stress_from_direction'] = data
+        self.data['wind_stress_from_direction'] = self.points.read_variable_timeseries('wind_stress_from_direction', stations=self.index_x)[:, 0]
 
     def write_variable_wind_stress_to_direction(self):
         logging.info('[DefaultTimePointWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['wind_stress_to_direction']) + '\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['wind_stress_to_direction']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_wind_stress_to_direction_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['wind_stress_to_direction'] = data
+        self.data['wind_stress_to_direction'] = self.points.read_variable_timeseries('wind_stress_to_direction', stations=self.index_x)[:, 0]
 
     #################
     # METEO
@@ -892,54 +330,15 @@ class DefaultTimePointWriter(MultiPointWriter):
 
     def write_variable_wind_speed_10m(self):
         logging.info('[DefaultTimePointWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['wind_speed_10m'])+'\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['wind_speed_10m']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_wind_speed_10m_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['wind_speed_10m'] = data
+        self.data['wind_speed_10m'] = self.points.read_variable_timeseries('wind_speed_10m', stations=self.index_x)[:, 0]
 
     def write_variable_wind_from_direction_10m(self):
         logging.info('[DefaultTimePointWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['wind_from_direction_10m'])+'\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['wind_from_direction_10m']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_wind_from_direction_10m_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['wind_from_direction_10m'] = data
+        self.data['wind_from_direction_10m'] = self.points.read_variable_timeseries('wind_from_direction_10m', stations=self.index_x)[:, 0]
 
     def write_variable_wind_to_direction_10m(self):
         logging.info('[DefaultTimePointWriter] Writing variable \''+str(VariableDefinition.LONG_NAME['wind_to_direction_10m'])+'\'')
-        data = np.zeros([self.points.get_t_size()])
-        data[:] = np.nan
-        time_index = 0
-        for time in self.points.read_axis_t():
-
-            logging.info(
-                '[DefaultTimePointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['wind_to_direction_10m']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            data[time_index] = self.points.read_variable_wind_to_direction_10m_at_time(time)[self.index_x]
-            time_index += 1
-
-        self.data['wind_to_direction_10m'] = data
+        self.data['wind_to_direction_10m'] = self.points.read_variable_timeseries('wind_to_direction_10m', stations=self.index_x)[:, 0]
 
 
 
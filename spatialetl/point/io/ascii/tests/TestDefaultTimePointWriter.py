@@ -0,0 +1,65 @@
+import sys
+sys.path = ['/work/sciences/pySpatialETL'] + sys.path
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+import pandas
+
+from spatialetl.point.TimeMultiPoint import TimeMultiPoint
+from spatialetl.point.io.ascii.DefaultTimePointWriter import DefaultTimePointWriter
+from spatialetl.point.io.netcdf.symphonie.v293.SYMPHONIEReader import SYMPHONIEReader
+
+
+class TestDefaultTimePointWriter(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.reader = SYMPHONIEReader("../../../../coverage/io/netcdf/symphonie/v293/tests/resources/grid.nc",
+                                      "../../../../coverage/io/netcdf/symphonie/v293/tests/resources/2014*",
+                                      [[0.05, 0.05], [0.1, 0.12], [0.15, 0.02]], names=["A", "B", "C"])
+        self.points = TimeMultiPoint(self.reader)
+
+    def tearDown(self):
+        self.reader.close()
+        shutil.rmtree(self.directory)
+
+    def read_file(self, filename):
+        return pandas.read_csv(filename, sep='\t', comment='#', header=None, index_col=0, parse_dates=True)
+
+    def test_write(self):
+        filename = os.path.join(self.directory, "B.dat")
+        writer = DefaultTimePointWriter(self.points, 1, filename)
+        writer.write_variable_sea_surface_height_above_mean_sea_level()
+        writer.write_variable_sea_surface_temperature()
+        writer.close()
+
+        with open(filename, "r") as file:
+            header = [line for line in file if line.startswith("#")]
+        self.assertIn("# Station : B \n", header)
+        self.assertTrue(header[-2].startswith("# Column 3: sea_surface_temperature"))
+
+        candidate = self.read_file(filename)
+        np.testing.assert_array_equal(self.points.read_axis_t().to_datetime64(),
+                                      candidate.index.values.astype("datetime64[s]"))
+        np.testing.assert_almost_equal(
+            self.points.read_variable_timeseries("sea_surface_height_above_mean_sea_level", stations=1)[:, 0],
+            candidate[1].values)
+        np.testing.assert_almost_equal(self.points.read_variable_timeseries("sea_surface_temperature", stations=1)[:, 0],
+                                       candidate[2].values)
+
+    def test_append(self):
+        filename = os.path.join(self.directory, "A.dat")
+        for append in [False, True]:
+            writer = DefaultTimePointWriter(self.points, 0, filename, append=append)
+            writer.write_variable_sea_surface_height_above_mean_sea_level()
+            writer.close()
+
+        candidate = self.read_file(filename)
+        expected_value = self.points.read_variable_timeseries("sea_surface_height_above_mean_sea_level", stations=0)
+        self.assertEqual(2 * self.points.get_t_size(), len(candidate))
+        np.testing.assert_almost_equal(np.concatenate((expected_value[:, 0], expected_value[:, 0])),
+                                       candidate[1].values)
@@ -82,9 +82,7 @@ class DefaultWriter(MultiPointWriter):
             times.axis = 'T'
             times.conventions = "UTC time"
 
-            times[self.points.map_mpi[self.points.rank]["dst_global_t"]] = date2num(self.points.read_axis_t(),
-                                                                                      units=times.units,
-                                                                                      calendar=times.calendar)
+            times[self.points.map_mpi[self.points.rank]["dst_global_t"]] = self.points.read_axis_t().to_num(times.units, times.calendar)
 
         if (isinstance(self.points, LevelMultiPoint) or isinstance(self.points, TimeLevelMultiPoint)):
 
@@ -146,16 +144,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_surface_height_above_mean_sea_level']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_height_above_mean_sea_level']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1,
-            :] = self.points.read_variable_sea_surface_height_above_mean_sea_level_at_time(time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('sea_surface_height_above_mean_sea_level')
 
     def write_variable_water_volume_transport_into_sea_water_from_rivers(self):
         var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['water_volume_transport_into_sea_water_from_rivers'], float32, (
@@ -167,15 +156,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['water_volume_transport_into_sea_water_from_rivers']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['water_volume_transport_into_sea_water_from_rivers']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1, :] = self.points.read_variable_water_volume_transport_into_sea_water_from_rivers_at_time(time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('water_volume_transport_into_sea_water_from_rivers')
 
     def write_variable_barotropic_sea_water_speed(self):
         var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['barotropic_sea_water_speed'], float32, (
@@ -188,14 +169,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['barotropic_sea_water_speed']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['barotropic_sea_water_speed']) + '\' at time \'' + str(time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1, :] = self.points.read_variable_barotropic_sea_water_speed_at_time(time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('barotropic_sea_water_speed')
 
     def write_variable_barotropic_sea_water_from_direction(self):
         var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['barotropic_sea_water_from_direction'],
@@ -209,16 +183,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['barotropic_sea_water_from_direction']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultTimeMultiPointWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['barotropic_sea_water_from_direction']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1, :] = self.points.read_variable_barotropic_sea_water_from_direction_at_time(
-                time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('barotropic_sea_water_from_direction')
 
     def write_variable_barotropic_sea_water_to_direction(self):
         var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['barotropic_sea_water_to_direction'], float32,
@@ -232,16 +197,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['barotropic_sea_water_to_direction']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['barotropic_sea_water_to_direction']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1, :] = self.points.read_variable_barotropic_sea_water_to_direction_at_time(
-                time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('barotropic_sea_water_to_direction')
 
     #################
     # HYDRO
@@ -259,14 +215,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_surface_temperature']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_temperature']) + '\' at time \'' + str(time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1, :] = self.points.read_variable_sea_surface_temperature_at_time(time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('sea_surface_temperature')
 
     def write_variable_sea_surface_salinity(self):
         var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_surface_salinity'], float32, (
@@ -279,15 +228,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_surface_salinity']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_surface_salinity']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1, :] = self.points.read_variable_sea_surface_salinity_at_time(time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('sea_surface_salinity')
 
     def write_variable_sea_water_pressure_at_sea_water_surface(self):
         var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_water_pressure_at_sea_water_surface'],
@@ -301,16 +242,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_water_pressure_at_sea_water_surface']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_pressure_at_sea_water_surface']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1,
-            :] = self.points.read_variable_sea_water_pressure_at_sea_water_surface_at_time(time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('sea_water_pressure_at_sea_water_surface')
 
     def write_variable_sea_water_speed_at_sea_water_surface(self):
         var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_water_speed_at_sea_water_surface'], float32, (
@@ -323,15 +255,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_water_speed_at_sea_water_surface']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_speed_at_sea_water_surface']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1, :] = self.points.read_variable_sea_water_speed_at_sea_water_surface_at_time(time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('sea_water_speed_at_sea_water_surface')
 
     def write_variable_sea_water_from_direction_at_sea_water_surface(self):
         var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_water_from_direction_at_sea_water_surface'],
@@ -345,17 +269,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_water_from_direction_at_sea_water_surface']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_from_direction_at_sea_water_surface']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1,
-            :] = self.points.read_variable_sea_water_from_direction_at_sea_water_surface_at_time(
-                time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('sea_water_from_direction_at_sea_water_surface')
 
     def write_variable_sea_water_to_direction_at_sea_water_surface(self):
         var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_water_to_direction_at_sea_water_surface'],
@@ -370,16 +284,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_water_to_direction_at_sea_water_surface']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_to_direction_at_sea_water_surface']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1, :] = self.points.read_variable_sea_water_to_direction_at_sea_water_surface_at_time(
-                time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('sea_water_to_direction_at_sea_water_surface')
 
     #################
     # HYDRO
@@ -396,14 +301,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_water_temperature_at_ground_level']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_temperature_at_ground_level']) + '\' at time \'' + str(time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1, :] = self.points.read_variable_sea_water_temperature_at_ground_level_at_time(time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('sea_water_temperature_at_ground_level')
 
     def write_variable_sea_water_salinity_at_ground_level(self):
         var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_water_salinity_at_ground_level'],
@@ -417,16 +315,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_water_salinity_at_ground_level']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_salinity_at_ground_level']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1, :] = self.points.read_variable_sea_water_salinity_at_ground_level_at_time(
-                time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('sea_water_salinity_at_ground_level')
 
     def write_variable_sea_water_speed_at_ground_level(self):
         var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_water_speed_at_ground_level'], float32, (
@@ -439,15 +328,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_water_speed_at_ground_level']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_speed_at_ground_level']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1, :] = self.points.read_variable_sea_water_speed_at_ground_level_at_time(time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('sea_water_speed_at_ground_level')
 
     def write_variable_sea_water_from_direction_at_ground_level(self):
         var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_water_from_direction_at_ground_level'],
@@ -461,17 +342,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_water_from_direction_at_ground_level']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_from_direction_at_ground_level']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1,
-            :] = self.points.read_variable_sea_water_from_direction_at_ground_level_at_time(
-                time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('sea_water_from_direction_at_ground_level')
 
     def write_variable_sea_water_to_direction_at_ground_level(self):
         var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['sea_water_to_direction_at_ground_level'],
@@ -486,16 +357,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['sea_water_to_direction_at_ground_level']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['sea_water_to_direction_at_ground_level']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1, :] = self.points.read_variable_sea_water_to_direction_at_ground_level_at_time(
-                time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('sea_water_to_direction_at_ground_level')
 
     #################
     # HYDRO
@@ -705,14 +567,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['rainfall_amount']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['rainfall_amount']) + '\' at time \'' + str(time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1, :] = self.points.read_variable_rainfall_amount_at_time(time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('rainfall_amount')
 
     def write_variable_surface_air_pressure(self):
         var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['surface_air_pressure'], float32, (
@@ -725,14 +580,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['surface_air_pressure']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['surface_air_pressure']) + '\' at time \'' + str(time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1, :] = self.points.read_variable_surface_air_pressure_at_time(time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('surface_air_pressure')
 
     #################
     # METEO
@@ -750,14 +598,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['wind_speed_10m']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['wind_speed_10m']) + '\' at time \'' + str(time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1, :] = self.points.read_variable_wind_speed_10m_at_time(time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('wind_speed_10m')
 
     def write_variable_wind_from_direction_10m(self):
         var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['wind_from_direction_10m'], float32, (
@@ -770,14 +611,7 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['wind_from_direction_10m']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['wind_from_direction_10m']) + '\' at time \'' + str(time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1, :] = self.points.read_variable_wind_from_direction_10m_at_time(time)
-            time_index += 1
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('wind_from_direction_10m')
 
     def write_variable_wind_to_direction_10m(self):
         var = self.ncfile.createVariable(VariableDefinition.VARIABLE_NAME['wind_to_direction_10m'], float32, (
@@ -790,12 +624,4 @@ class DefaultWriter(MultiPointWriter):
         logging.info('[DefaultWriter] Writing variable \'' + str(
             VariableDefinition.LONG_NAME['wind_to_direction_10m']) + '\'')
 
-        time_index = 0
-        for time in self.points.read_axis_t():
-            logging.info(
-                '[DefaultWriter] Writing variable \'' + str(
-                    VariableDefinition.LONG_NAME['wind_to_direction_10m']) + '\' at time \'' + str(
-                    time) + '\'')
-
-            var[self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index:self.points.map_mpi[self.points.rank]["dst_global_t"].start+time_index+1, :] = self.points.read_variable_wind_to_direction_10m_at_time(time)
-            time_index += 1
\ No newline at end of file
+        var[self.points.map_mpi[self.points.rank]["dst_global_t"], :] = self.points.read_variable_timeseries('wind_to_direction_10m')
@@ -18,15 +18,17 @@ from __future__ import division, print_function, absolute_import
 import numpy as np
 
 from spatialetl.coverage.io.netcdf.mefoc.MEFOCReader import MEFOCReader as CovReader
-from spatialetl.point.io.MultiPointReader import MultiPointReader
-from spatialetl.utils.distance import distance_on_unit_sphere
+from spatialetl.point.io.AbstractGridMultiPointReader import AbstractGridMultiPointReader
 from spatialetl.utils.logger import logging
 
 
-class MEFOCReader(MultiPointReader):
+class MEFOCReader(AbstractGridMultiPointReader):
+
+    SOURCE_NAME = "MEFOC"
+    NEAREST_POINT_METHOD = "quick"
 
     def __init__(self, myFile, xy, names=None):
-        MultiPointReader.__init__(self, myFile);
+        AbstractGridMultiPointReader.__init__(self, myFile);
         self.reader = CovReader(self.filename)
 
         self.source_xy_coords = []
@@ -61,112 +63,9 @@ class MEFOCReader(MultiPointReader):
 
         self.find_points_coordinates(xy)
 
-    def find_points_coordinates(self, xy):
-
-        if self.reader is None:
-            raise (ValueError("CoverageReader is not initialized"))
-
-        for i in range(0, np.shape(self.xy_coords)[0]):
-            nearestPoint = self.find_point_index(self.source_xy_coords[i][0], self.source_xy_coords[i][1])
-            logging.info(str(
-                self.names[i]) + " nearest point is " + str(nearestPoint[2]) + " / " + str(
-                nearestPoint[3]) + " at " + str(
-                round(nearestPoint[4], 4)) + " km")
-            self.meta_data = self.meta_data + "\n# " + str(
-                self.names[i]) + " : nearest point in SYMPHONIE file is " + str(
-                round(nearestPoint[4], 4)) + " km from the target point"
-            logging.info("Nearest point (i,j) : " + str(nearestPoint[0]) + " / " + str(nearestPoint[1]))
-            self.xy_coords[i] = [nearestPoint[0], nearestPoint[1]]
-            self.xy_values[i] = [nearestPoint[2], nearestPoint[3]]
-
     def close(self):
         self.reader.close()
 
-    def find_point_index(self, target_lon, target_lat, method="quick", only_mask_value=True):
-        """Retourne le point le plus proche du point donné en paramètre.
-    @param target_lon: Coordonnée longitude du point
-    @param target_lat: Coordonnée latitude du point
-    @param method : Méthode de calcul. "Classic" = On parcourt toute la grille à la recherche du plus prêt.
-    @return: un tableau contenant
-     [0] : l'index x du point le plus proche
-     [1] : l'index y du point le plus proche
-     [2] : la coordonnée en longitude du point le plus proche
-     [3] : la coordonnée en latitude point le plus proche
-     [4] : la distance du point le plus proche en kilomètre."""
-        x_size = self.reader.get_x_size()
-        y_size = self.reader.get_y_size()
-        lon = self.reader.read_axis_x(0, x_size, 0, y_size)
-        lat = self.reader.read_axis_y(0, x_size, 0, y_size)
-
-        try:
-            mask = self.reader.read_variable_2D_sea_binary_mask(0, x_size, 0, y_size)
-        except NotImplementedError:
-            logging.warning("No 2D sea binary mask found")
-            # mask = np.ones([self.source_global_y_size, self.source_global_x_size])
-            only_mask_value = False
-
-        dist = np.zeros([y_size, x_size])
-        dist[:] = 100000
-
-        if method == "classic":
-            for x in range(0, x_size):
-                for y in range(0, y_size):
-
-                    if only_mask_value:
-                        if (mask[y, x] == 1):  # =Terre
-                            if self.reader.is_regular_grid():
-                                dist[y, x] = distance_on_unit_sphere(target_lon, target_lat, lon[x], lat[y])
-                            else:
-                                dist[y, x] = distance_on_unit_sphere(target_lon, target_lat, lon[y, x], lat[y, x])
-                    else:
-                        if self.reader.is_regular_grid():
-                            dist[y, x] = distance_on_unit_sphere(target_lon, target_lat, lon[x], lat[y])
-                        else:
-                            dist[y, x] = distance_on_unit_sphere(target_lon, target_lat, lon[y, x], lat[y, x])
-
-            nearest_y_index, nearest_x_index = np.where(dist == np.min(dist))
-
-            if len(nearest_y_index) == 0 or len(nearest_x_index) == 0:
-                raise RuntimeError("No nearest point found.")
-
-            nearest_x_index = nearest_x_index[0]
-            nearest_y_index = nearest_y_index[0]
-            min_dist = dist[nearest_y_index, nearest_x_index]
-
-            if self.reader.is_regular_grid():
-                nearest_lon = lon[nearest_x_index]
-                nearest_lat = lat[nearest_y_index]
-            else:
-                nearest_lon = lon[nearest_y_index, nearest_x_index]
-                nearest_lat = lat[nearest_y_index, nearest_x_index]
-
-            return [nearest_x_index, nearest_y_index, nearest_lon, nearest_lat, min_dist]
-
-        elif method == "quick":
-
-            if self.is_regular_grid():
-
-                # Longitude : on cherche l'index le plus proche
-                array = np.asarray(lon)
-                nearest_x_index = (np.abs(array - target_lon)).argmin()
-
-                # Latitude : on cherche l'index le plus proche
-                array = np.asarray(lat)
-                nearest_y_index = (np.abs(array - target_lat)).argmin()
-
-                nearest_lon = lon[nearest_x_index]
-                nearest_lat = lat[nearest_y_index]
-
-                min_dist = distance_on_unit_sphere(target_lon, target_lat, nearest_lon, nearest_lat)
-
-                return [nearest_x_index, nearest_y_index, nearest_lon, nearest_lat, min_dist]
-
-            else:
-                raise NotImplementedError("Method " + str(method) + " is not implemented for regular grid.")
-
-        else:
-            raise RuntimeError("Method " + str(method) + " is not implemented yet.")
-
     def is_regular_grid(self):
         return True
 
@@ -195,172 +94,32 @@ class MEFOCReader(MultiPointReader):
     # 2D
     #################
     def read_variable_bathymetry(self):
-        data = np.zeros([self.nbPoints])
-        data[:] = np.nan
-
-        for index_x in range(0, self.nbPoints):
-            data[index_x] = self.reader.read_variable_bathymetry(self.xy_coords[index_x][0],
-                                                                 self.xy_coords[index_x][0] + 1,
-                                                                 self.xy_coords[index_x][1],
-                                                                 self.xy_coords[index_x][1] + 1)
-
-        return data
+        return self.read_points("read_variable_bathymetry")
 
     def read_variable_sea_surface_height_above_mean_sea_level_at_time(self, index_t):
-
-        data = np.zeros([self.nbPoints])
-        data[:] = np.nan
-
-        for index_x in range(0, self.nbPoints):
-            data[index_x] = self.reader.read_variable_sea_surface_height_above_mean_sea_level_at_time(index_t,
-                                                                                         self.xy_coords[
-                                                                                             index_x][0],
-                                                                                         self.xy_coords[
-                                                                                             index_x][
-                                                                                             0] + 1,
-                                                                                         self.xy_coords[
-                                                                                             index_x][1],
-                                                                                         self.xy_coords[
-                                                                                             index_x][
-                                                                                             1] + 1)
-
-        return data
+        return self.read_points("read_variable_sea_surface_height_above_mean_sea_level_at_time", index_t)
 
     def read_variable_sea_water_column_thickness_at_time(self, index_t):
-
-        data = np.zeros([self.nbPoints])
-        data[:] = np.nan
-
-        for index_x in range(0, self.nbPoints):
-            data[index_x] = self.reader.read_variable_sea_water_column_thickness_at_time(index_t,
-                                                                                        self.xy_coords[
-                                                                                            index_x][0],
-                                                                                        self.xy_coords[
-                                                                                            index_x][
-                                                                                            0] + 1,
-                                                                                        self.xy_coords[
-                                                                                            index_x][1],
-                                                                                        self.xy_coords[
-                                                                                            index_x][
-                                                                                            1] + 1)
-
-        return data
+        return self.read_points("read_variable_sea_water_column_thickness_at_time", index_t)
 
     def read_variable_barotropic_sea_water_velocity_at_time(self, index_t):
-        data = np.zeros([2, self.nbPoints])
-        data[:] = np.nan
-
-        for index_x in range(0, self.nbPoints):
-            data[0][index_x] = \
-                self.reader.read_variable_barotropic_sea_water_velocity_at_time(index_t, self.xy_coords[index_x][0],
-                                                                                self.xy_coords[index_x][0] + 1,
-                                                                                self.xy_coords[index_x][1],
-                                                                                self.xy_coords[index_x][1] + 1)[0]
-            data[1][index_x] = \
-                self.reader.read_variable_barotropic_sea_water_velocity_at_time(index_t, self.xy_coords[index_x][0],
-                                                                                self.xy_coords[index_x][0] + 1,
-                                                                                self.xy_coords[index_x][1],
-                                                                                self.xy_coords[index_x][1] + 1)[1]
-
-        return data
+        return self.read_points("read_variable_barotropic_sea_water_velocity_at_time", index_t)
 
     #################
     # WAVES
     # Sea Surface
     #################
     def read_variable_sea_surface_wave_significant_height_at_time(self, index_t):
-
-        data = np.zeros([self.nbPoints])
-        data[:] = np.nan
-
-        for index_x in range(0, self.nbPoints):
-            data[index_x] = self.reader.read_variable_sea_surface_wave_significant_height_at_time(index_t,
-                                                                                                  self.xy_coords[
-                                                                                                      index_x][0],
-                                                                                                  self.xy_coords[
-                                                                                                      index_x][
-                                                                                                      0] + 1,
-                                                                                                  self.xy_coords[
-                                                                                                      index_x][1],
-                                                                                                  self.xy_coords[
-                                                                                                      index_x][
-                                                                                                      1] + 1)
-
-        return data
+        return self.read_points("read_variable_sea_surface_wave_significant_height_at_time", index_t)
 
     def read_variable_sea_surface_wave_mean_period_at_time(self, index_t):
-
-        data = np.zeros([self.nbPoints])
-        data[:] = np.nan
-
-        for index_x in range(0, self.nbPoints):
-            data[index_x] = self.reader.read_variable_sea_surface_wave_mean_period_at_time(index_t,
-                                                                                           self.xy_coords[
-                                                                                               index_x][0],
-                                                                                           self.xy_coords[
-                                                                                               index_x][
-                                                                                               0] + 1,
-                                                                                           self.xy_coords[
-                                                                                               index_x][1],
-                                                                                           self.xy_coords[
-                                                                                               index_x][
-                                                                                               1] + 1)
-
-        return data
+        return self.read_points("read_variable_sea_surface_wave_mean_period_at_time", index_t)
 
     def read_variable_wind_10m_at_time(self, index_t):
-
-        data = np.zeros([2, self.nbPoints])
-        data[:] = np.nan
-
-        for index_x in range(0, self.nbPoints):
-            data[0][index_x] = self.reader.read_variable_wind_10m_at_time(index_t, self.xy_coords[index_x][0],
-                                                                          self.xy_coords[index_x][0] + 1,
-                                                                          self.xy_coords[index_x][1],
-                                                                          self.xy_coords[index_x][1] + 1)[0]
-            data[1][index_x] = self.reader.read_variable_wind_10m_at_time(index_t, self.xy_coords[index_x][0],
-                                                                          self.xy_coords[index_x][0] + 1,
-                                                                          self.xy_coords[index_x][1],
-                                                                          self.xy_coords[index_x][1] + 1)[1]
-
-        return data
+        return self.read_points("read_variable_wind_10m_at_time", index_t)
 
     def read_variable_surface_air_pressure_at_time(self, index_t):
-
-        data = np.zeros([self.nbPoints])
-        data[:] = np.nan
-
-        for index_x in range(0, self.nbPoints):
-            data[index_x] = self.reader.read_variable_surface_air_pressure_at_time(index_t,
-                                                                                   self.xy_coords[
-                                                                                       index_x][0],
-                                                                                   self.xy_coords[
-                                                                                       index_x][
-                                                                                       0] + 1,
-                                                                                   self.xy_coords[
-                                                                                       index_x][1],
-                                                                                   self.xy_coords[
-                                                                                       index_x][
-                                                                                       1] + 1)
-
-        return data
+        return self.read_points("read_variable_surface_air_pressure_at_time", index_t)
 
     def read_variable_rainfall_amount_at_time(self, index_t):
-
-        data = np.zeros([self.nbPoints])
-        data[:] = np.nan
-
-        for index_x in range(0, self.nbPoints):
-            data[index_x] = self.reader.read_variable_rainfall_amount_at_time(index_t,
-                                                                              self.xy_coords[
-                                                                                  index_x][0],
-                                                                              self.xy_coords[
-                                                                                  index_x][
-                                                                                  0] + 1,
-                                                                              self.xy_coords[
-                                                                                  index_x][1],
-                                                                              self.xy_coords[
-                                                                                  index_x][
-                                                                                  1] + 1)
-
-        return data
+        return self.read_points("read_variable_rainfall_amount_at_time", index_t)
@@ -0,0 +1,71 @@
+import sys
+sys.path = ['/work/sciences/pySpatialETL'] + sys.path
+
+from unittest import TestCase
+
+import numpy as np
+
+from spatialetl.point.TimeMultiPoint import TimeMultiPoint
+from spatialetl.point.io.netcdf.symphonie.v293.SYMPHONIEReader import SYMPHONIEReader
+
+
+class TestTimeMultiPoint(TestCase):
+
+    VARIABLES = ["sea_surface_height_above_mean_sea_level", "sea_surface_temperature",
+                 "sea_water_temperature_at_ground_level"]
+
+    def setUp(self):
+        self.reader = SYMPHONIEReader("../../coverage/io/netcdf/symphonie/v293/tests/resources/grid.nc",
+                                      "../../coverage/io/netcdf/symphonie/v293/tests/resources/2014*",
+                                      [[0.05, 0.05], [0.1, 0.12], [0.15, 0.02]], names=["A", "B", "C"])
+        self.points = TimeMultiPoint(self.reader)
+
+    def tearDown(self):
+        self.reader.close()
+
+    def test_read_variable_timeseries(self):
+        for name in TestTimeMultiPoint.VARIABLES:
+            # La série temporelle doit être identique à la lecture date par date
+            expected_value = np.stack([getattr(self.points, "read_variable_" + name + "_at_time")(date)
+                                       for date in self.points.read_axis_t()])
+            candidate_value = self.points.read_variable_timeseries(name)
+            self.assertEqual((self.points.get_t_size(), self.points.get_nb_points()), np.shape(candidate_value), name)
+            np.testing.assert_array_equal(expected_value, candidate_value, err_msg=name)
+
+            # Sélection des stations (index ou nom) et des dates
+            np.testing.assert_array_equal(expected_value[:, [1]],
+                                          self.points.read_variable_timeseries(name, stations=1), err_msg=name)
+            np.testing.assert_array_equal(expected_value[:, [2, 0]],
+                                          self.points.read_variable_timeseries(name, stations=["C", "A"]),
+                                          err_msg=name)
+            np.testing.assert_array_equal(expected_value[1:3],
+                                          self.points.read_variable_timeseries(name, t_slice=np.s_[1:3]),
+                                          err_msg=name)
+
+    def test_read_timeseries(self):
+        name = "sea_surface_height_above_mean_sea_level"
+        expected_value = self.points.read_variable_timeseries(name)
+
+        candidate_value = self.points.read_timeseries(name, None, np.s_[0:self.points.get_t_size()])
+        np.testing.assert_array_equal(expected_value, candidate_value)
+
+        candidate_value = self.points.read_timeseries(name, [2], np.s_[1:2])
+        np.testing.assert_array_equal(expected_value[1:2, [2]], candidate_value)
+
+        with self.assertRaises(ValueError):
+            self.points.read_timeseries(name, None, np.s_[2:1])
+
+    def test_timeseries_cache(self):
+        name = "sea_surface_temperature"
+        expected_value = self.points.read_variable_timeseries(name)
+
+        cache_size = TimeMultiPoint.TIMESERIES_CACHE_SIZE
+        try:
+            TimeMultiPoint.TIMESERIES_CACHE_SIZE = 0
+            np.testing.assert_array_equal(expected_value, self.points.read_variable_timeseries(name))
+            np.testing.assert_array_equal(expected_value[:, [1]],
+                                          self.points.read_variable_timeseries(name, stations=1))
+        finally:
+            TimeMultiPoint.TIMESERIES_CACHE_SIZE = cache_size
+
+        self.assertEqual(1, len(self.points.timeseries_cache))
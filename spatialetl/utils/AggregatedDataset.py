@@ -0,0 +1,247 @@
+#! /usr/bin/env python2.7
+# -*- coding: utf-8 -*-
+#
+# pySpatialETL is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# pySpatialETL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# Author : Fabien Rétif - fabien.retif@zoho.com
+#
+from __future__ import division, print_function, absolute_import
+
+import glob
+import os
+from collections import OrderedDict
+
+import numpy as np
+from netCDF4 import Dataset, date2num, num2date
+
+from spatialetl.utils.FileHandlePool import FILE_HANDLES
+from spatialetl.utils.FileTimeIndex import FileTimeIndex, get_cache_directory, get_index_filename
+from spatialetl.utils.logger import logging
+
+
+class AggregatedDataset(object):
+    """
+La classe AggregatedDataset remplace netCDF4.MFDataset : elle agrège virtuellement plusieurs fichiers NetCDF le long
+de leur dimension temporelle (la dimension illimitée du premier fichier, sinon 'time').
+
+Seul le premier fichier est ouvert à la construction. La taille de la dimension d'agrégation et les valeurs de sa
+variable de coordonnée sont lues une seule fois par fichier et enregistrées dans un index
+(AggregatedDataset.INDEX_FILENAME) placé dans AggregatedDataset.INDEX_DIRECTORY, par défaut le répertoire de cache
+de l'utilisateur : les répertoires des données ne sont jamais modifiés. Si INDEX_DIRECTORY vaut None, l'index n'est
+pas enregistré. Les fichiers sont ensuite ouverts à la demande, dans le pool des fichiers ouverts (FILE_HANDLES) : la
+lecture d'un pas de temps n'ouvre que le fichier qui le contient.
+
+Contrairement à MFDataset, tous les formats NetCDF sont acceptés (NETCDF4 compris).
+
+@param files: motif (glob) ou liste des fichiers
+@param aggdim: nom de la dimension d'agrégation. Si None, la dimension illimitée du premier fichier.
+"""
+    USE_INDEX = True
+    INDEX_FILENAME = ".aggregation_index.json"
+    INDEX_DIRECTORY = get_cache_directory()
+
+    def __init__(self, files, aggdim=None):
+        if isinstance(files, str):
+            files = sorted(glob.glob(files))
+
+        if len(files) == 0:
+            raise ValueError("AggregatedDataset: no files to aggregate")
+
+        self.files = list(files)
+        self.master_key, self.master = FILE_HANDLES.acquire(self.files[0], Dataset)
+
+        if aggdim is None:
+            aggdim = "time"
+            for name, dimension in self.master.dimensions.items():
+                if dimension.isunlimited():
+                    aggdim = name
+                    break
+
+        if aggdim not in self.master.dimensions:
+            raise ValueError("AggregatedDataset: dimension '" + str(aggdim) + "' not found in " + str(self.files[0]))
+
+        self.aggdim = aggdim
+        self.read_index()
+
+        self.variables = OrderedDict()
+        for name, variable in self.master.variables.items():
+            if len(variable.dimensions) > 0 and variable.dimensions[0] == self.aggdim:
+                self.variables[name] = AggregatedVariable(self, name, variable)
+            else:
+                self.variables[name] = variable
+
+    def read_index(self):
+        """Lit (index) ou calcule la taille de la dimension d'agrégation de chaque fichier et les valeurs de sa
+    variable de coordonnée, exprimées dans les unités du premier fichier."""
+        index = FileTimeIndex(None)
+        directories = set([os.path.dirname(os.path.abspath(file)) for file in self.files])
+        if AggregatedDataset.USE_INDEX and AggregatedDataset.INDEX_DIRECTORY is not None and len(directories) == 1:
+            directory = directories.pop()
+            index = FileTimeIndex(get_index_filename(directory, AggregatedDataset.INDEX_FILENAME,
+                                                     AggregatedDataset.INDEX_DIRECTORY), directory)
+
+        coordinate = self.master.variables.get(self.aggdim)
+        units = getattr(coordinate, "units", None)
+        calendar = getattr(coordinate, "calendar", "standard")
+
+        lengths = []
+        values = []
+        for file in self.files:
+            entry = index.get_entry(file)
+            if entry is None or entry.get("aggdim") != self.aggdim:
+                entry = self.read_file_records(file)
+                index.set_entry(file, **entry)
+
+            lengths.append(entry["length"])
+            if entry["values"] is not None:
+                file_values = np.asarray(entry["values"], dtype=np.float64)
+                if units is not None and entry["units"] is not None and entry["units"] != units:
+                    file_values = date2num(num2date(file_values, units=entry["units"], calendar=calendar),
+                                           units=units, calendar=calendar)
+                values.append(file_values)
+
+        index.save()
+
+        self.offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+        self.coordinate_values = None
+        if coordinate is not None and len(values) == len(self.files):
+            self.coordinate_values = np.concatenate(values).astype(coordinate.dtype)
+
+    def read_file_records(self, file):
+        """Lit la taille de la dimension d'agrégation et les valeurs de sa variable de coordonnée dans un fichier.
+    @param file: chemin du fichier
+    @return: un dictionnaire {aggdim, length, units, values}."""
+        key, ncfile = FILE_HANDLES.acquire(file, Dataset)
+        try:
+            if self.aggdim not in ncfile.dimensions:
+                raise ValueError("AggregatedDataset: dimension '" + str(self.aggdim) + "' not found in " + str(file))
+
+            entry = {"aggdim": self.aggdim, "length": len(ncfile.dimensions[self.aggdim]), "units": None,
+                     "values": None}
+            if self.aggdim in ncfile.variables:
+                coordinate = ncfile.variables[self.aggdim]
+                entry["units"] = getattr(coordinate, "units", None)
+                entry["values"] = np.ma.filled(coordinate[:], fill_value=np.nan).astype(np.float64).tolist()
+
+            logging.debug("[AggregatedDataset] " + str(file) + " indexed")
+            return entry
+        finally:
+            FILE_HANDLES.release(key)
+
+    def get_t_size(self):
+        return int(self.offsets[-1])
+
+    def locate(self, index):
+        """Retourne le fichier contenant un index de la dimension d'agrégation.
+    @param index: index global
+    @return: (index du fichier, index dans le fichier)"""
+        file_index = int(np.searchsorted(self.offsets, index, side="right")) - 1
+        return file_index, int(index - self.offsets[file_index])
+
+    def close(self):
+        if self.master is not None:
+            FILE_HANDLES.release(self.master_key)
+            self.master = None
+
+
+class AggregatedVariable(object):
+    """
+La classe AggregatedVariable est une variable d'un AggregatedDataset dont la première dimension est la dimension
+d'agrégation. Les attributs sont ceux de la variable du premier fichier. La lecture (var[t], var[tmin:tmax,...], ...)
+n'ouvre que les fichiers contenant les pas de temps demandés.
+
+@param dataset: AggregatedDataset
+@param name: nom de la variable
+@param variable: variable du premier fichier
+"""
+
+    def __init__(self, dataset, name, variable):
+        self.dataset = dataset
+        self.name = name
+        self.variable = variable
+        self.dimensions = variable.dimensions
+        self.dtype = variable.dtype
+        self.ndim = variable.ndim
+        self.shape = (dataset.get_t_size(),) + tuple(variable.shape[1:])
+
+    def __getattr__(self, name):
+        if name in ("dataset", "variable"):
+            raise AttributeError(name)
+        return getattr(self.variable, name)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+
+        if any(item is Ellipsis for item in key):
+            position = [item is Ellipsis for item in key].index(True)
+            key = key[:position] + (slice(None),) * (self.ndim - len(key) + 1) + key[position + 1:]
+
+        first = key[0]
+        rest = key[1:]
+
+        if self.name == self.dataset.aggdim and self.dataset.coordinate_values is not None:
+            return self.dataset.coordinate_values[key]
+
+        if isinstance(first, (int, np.integer)):
+            index = int(first)
+            if index < 0:
+                index = index + self.shape[0]
+            if index < 0 or index >= self.shape[0]:
+                raise IndexError("index " + str(first) + " is out of bounds for axis 0 with size " + str(
+                    self.shape[0]))
+            file_index, local_index = self.dataset.locate(index)
+            return self.read_file(file_index, (local_index,) + rest)
+
+        if isinstance(first, slice):
+            indexes = np.arange(self.shape[0])[first]
+        else:
+            indexes = np.asarray(first)
+            if indexes.dtype == bool:
+                indexes = np.nonzero(indexes)[0]
+            indexes = np.where(indexes < 0, indexes + self.shape[0], indexes).astype(np.int64)
+
+        if len(indexes) == 0:
+            return np.ma.masked_array(np.empty((0,) + np.shape(self.variable[(slice(0, 0),) + rest])[1:],
+                                               dtype=self.dtype))
+
+        # On regroupe les index par fichier
+        file_indexes = np.searchsorted(self.dataset.offsets, indexes, side="right") - 1
+        boundaries = np.flatnonzero(np.diff(file_indexes)) + 1
+        parts = []
+        for group in np.split(np.arange(len(indexes)), boundaries):
+            file_index = file_indexes[group[0]]
+            local = indexes[group] - self.dataset.offsets[file_index]
+            if len(local) > 1 and np.all(np.diff(local) == local[1] - local[0]) and local[1] - local[0] > 0:
+                local_key = slice(int(local[0]), int(local[-1]) + 1, int(local[1] - local[0]))
+            elif len(local) == 1:
+                local_key = slice(int(local[0]), int(local[0]) + 1)
+            else:
+                local_key = local
+            parts.append(self.read_file(file_index, (local_key,) + rest))
+
+        if len(parts) == 1:
+            return parts[0]
+        return np.ma.concatenate(parts, axis=0)
+
+    def read_file(self, file_index, key):
+        """Lit la variable dans un des fichiers agrégés.
+    @param file_index: index du fichier
+    @param key: sélection dans le fichier
+    @return: les valeurs lues."""
+        handle_key, ncfile = FILE_HANDLES.acquire(self.dataset.files[file_index], Dataset)
+        try:
+            return ncfile.variables[self.name][key]
+        finally:
+            FILE_HANDLES.release(handle_key)
@@ -0,0 +1,143 @@
+#! /usr/bin/env python2.7
+# -*- coding: utf-8 -*-
+#
+# pySpatialETL is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# pySpatialETL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# Author : Fabien Rétif - fabien.retif@zoho.com
+#
+from __future__ import division, print_function, absolute_import
+
+import os
+from collections import OrderedDict
+
+from spatialetl.utils.logger import logging
+
+
+def close_handle(handle):
+    """Ferme un fichier ouvert (Dataset NetCDF : close(), GDAL >= 3.8 : Close()). Pour les versions de GDAL sans
+    Close(), le fichier est fermé lorsque sa dernière référence est supprimée."""
+    if hasattr(handle, "close"):
+        handle.close()
+    elif hasattr(handle, "Close"):
+        handle.Close()
+
+
+class FileHandlePool(object):
+    """
+La classe FileHandlePool conserve un nombre borné de fichiers ouverts (NetCDF, GDAL, ...) partagés entre tous les
+lecteurs. Un fichier déjà ouvert par un lecteur (ou récemment utilisé) est réutilisé au lieu d'être rouvert.
+
+Chaque lecteur prend un fichier avec acquire() et le rend avec release(). Un fichier rendu reste ouvert dans le
+pool jusqu'à ce qu'il soit évincé (le moins récemment utilisé) lorsque le nombre de fichiers ouverts dépasse la
+capacité. Un fichier encore utilisé par un lecteur n'est jamais fermé : le pool peut alors dépasser temporairement
+sa capacité.
+
+Les fichiers sont indexés par (chemin absolu, date de modification) : un fichier réécrit est rouvert.
+
+@param capacity: nombre maximal de fichiers ouverts
+"""
+    CAPACITY = 32
+
+    def __init__(self, capacity=None):
+        if capacity is None:
+            capacity = FileHandlePool.CAPACITY
+        if capacity < 1:
+            raise ValueError("FileHandlePool capacity must be greater than 0")
+
+        self.capacity = capacity
+        self.handles = OrderedDict()
+        self.opens = 0
+        self.hits = 0
+        self.evictions = 0
+
+    def get_key(self, filename):
+        """Retourne la clé d'un fichier dans le pool.
+    @param filename: chemin du fichier
+    @return: (chemin absolu, date de modification)"""
+        filename = os.path.abspath(filename)
+        try:
+            return (filename, os.path.getmtime(filename))
+        except OSError:
+            return (filename, None)
+
+    def acquire(self, filename, opener, closer=close_handle):
+        """Retourne le fichier ouvert, depuis le pool ou en l'ouvrant avec opener.
+    @param filename: chemin du fichier
+    @param opener: fonction d'ouverture appelée avec le chemin du fichier (ex : netCDF4.Dataset, gdal.Open)
+    @param closer: fonction de fermeture appelée avec le fichier lors de son éviction
+    @return: (clé, fichier ouvert). La clé est à donner à release()."""
+        key = self.get_key(filename)
+
+        if key in self.handles:
+            self.hits = self.hits + 1
+            self.handles.move_to_end(key)
+        else:
+            self.opens = self.opens + 1
+            self.handles[key] = {"handle": opener(filename), "closer": closer, "users": 0}
+
+        entry = self.handles[key]
+        entry["users"] = entry["users"] + 1
+        self.evict()
+
+        return key, entry["handle"]
+
+    def release(self, key):
+        """Rend un fichier pris avec acquire(). Le fichier reste ouvert dans le pool.
+    @param key: clé retournée par acquire()"""
+        if key in self.handles:
+            entry = self.handles[key]
+            entry["users"] = max(0, entry["users"] - 1)
+            self.evict()
+
+    def evict(self):
+        """Ferme les fichiers inutilisés les moins récemment utilisés jusqu'à revenir à la capacité du pool."""
+        for key in list(self.handles.keys()):
+            if len(self.handles) <= self.capacity:
+                return
+
+            if self.handles[key]["users"] == 0:
+                self.close_entry(key)
+                self.evictions = self.evictions + 1
+
+    def close_entry(self, key):
+        entry = self.handles.pop(key)
+        try:
+            entry["closer"](entry["handle"])
+        except Exception as ex:
+            logging.warning("[FileHandlePool] Unable to close " + str(key[0]) + ": " + str(ex))
+
+    def set_capacity(self, capacity):
+        """Modifie le nombre maximal de fichiers ouverts.
+    @param capacity: nombre maximal de fichiers ouverts"""
+        if capacity < 1:
+            raise ValueError("FileHandlePool capacity must be greater than 0")
+
+        self.capacity = capacity
+        self.evict()
+
+    def clear(self):
+        """Ferme tous les fichiers inutilisés du pool."""
+        for key in list(self.handles.keys()):
+            if self.handles[key]["users"] == 0:
+                self.close_entry(key)
+
+    def get_statistics(self):
+        """Retourne les statistiques du pool.
+    @return: un dictionnaire {opens, hits, evictions, size, capacity}."""
+        return {"opens": self.opens,
+                "hits": self.hits,
+                "evictions": self.evictions,
+                "size": len(self.handles),
+                "capacity": self.capacity}
+
+
+# Pool des fichiers ouverts partagé entre les lecteurs
+FILE_HANDLES = FileHandlePool()
@@ -0,0 +1,174 @@
+#! /usr/bin/env python2.7
+# -*- coding: utf-8 -*-
+#
+# pySpatialETL is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# pySpatialETL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# Author : Fabien Rétif - fabien.retif@zoho.com
+#
+from __future__ import division, print_function, absolute_import
+
+import hashlib
+import json
+import os
+
+import cftime
+
+from spatialetl.utils.logger import logging
+from spatialetl.utils.path import path_leaf
+
+
+class FileTimeIndex(object):
+    """
+La classe FileTimeIndex est un index (fichier JSON) des dates contenues dans chacun des fichiers d'un répertoire. Les dates d'un fichier sont réutilisées tant que sa taille et sa date de
+modification n'ont pas changé : chaque fichier est vérifié (os.stat) à chaque lecture, y compris les fichiers réécrits
+ou complétés sur place (simulation en cours). Seuls les fichiers ajoutés ou modifiés sont donc relus. Les entrées des
+fichiers supprimés sont retirées de l'index lors de son enregistrement.
+D'autres informations par fichier peuvent être enregistrées avec get_entry() et set_entry().
+
+Les dates sont enregistrées en secondes depuis TIME_UNITS dans le calendrier de la variable time du fichier et
+reconstruites avec cftime.num2date.
+
+@param filename: chemin de l'index. Si None, l'index est désactivé.
+@param directory: répertoire des fichiers indexés. Si None, le répertoire de l'index.
+"""
+    VERSION = 3
+    TIME_UNITS = "seconds since 1970-01-01 00:00:00"
+
+    def __init__(self, filename, directory=None):
+        self.filename = filename
+        self.files = {}
+        self.modified = False
+
+        if filename is None:
+            return
+
+        if directory is None:
+            directory = os.path.dirname(filename)
+        self.directory = directory
+
+        if os.path.isfile(filename):
+            try:
+                with open(filename, "r") as index_file:
+                    index = json.load(index_file)
+
+                if index.get("version") == FileTimeIndex.VERSION:
+                    self.files = index["files"]
+            except (IOError, OSError, ValueError, KeyError) as ex:
+                logging.warning("[FileTimeIndex] Unable to read the time index " + str(filename) + ": " + str(ex))
+                self.files = {}
+
+    def get_entry(self, file):
+        """Retourne l'entrée d'un fichier enregistrée dans l'index.
+    @param file: chemin du fichier
+    @return: un dictionnaire ou None si le fichier n'est pas dans l'index ou s'il a été modifié."""
+        if self.filename is None:
+            return None
+
+        entry = self.files.get(os.path.basename(file))
+        if entry is None:
+            return None
+
+        stat = os.stat(file)
+        if stat.st_size != entry["size"] or stat.st_mtime != entry["mtime"]:
+            return None
+
+        return entry
+
+    def set_entry(self, file, **values):
+        """Enregistre l'entrée d'un fichier dans l'index (les valeurs doivent pouvoir être écrites en JSON).
+    @param file: chemin du fichier
+    @param values: valeurs associées au fichier."""
+        if self.filename is None:
+            return
+
+        stat = os.stat(file)
+        entry = {"size": stat.st_size, "mtime": stat.st_mtime}
+        entry.update(values)
+        self.files[os.path.basename(file)] = entry
+        self.modified = True
+
+    def get_times(self, file):
+        """Retourne les dates d'un fichier enregistrées dans l'index.
+    @param file: chemin du fichier
+    @return: la liste des dates ou None si le fichier n'est pas dans l'index ou s'il a été modifié."""
+        entry = self.get_entry(file)
+        if entry is None or "times" not in entry:
+            return None
+
+        return list(cftime.num2date(entry["times"], units=FileTimeIndex.TIME_UNITS, calendar=entry["calendar"]))
+
+    def set_times(self, file, times, calendar="standard"):
+        """Enregistre les dates d'un fichier dans l'index.
+    @param file: chemin du fichier
+    @param times: liste des dates
+    @param calendar: calendrier des dates (attribut calendar de la variable time du fichier)."""
+        if len(times) == 0:
+            return
+
+        self.set_entry(file, calendar=calendar,
+                       times=[float(value) for value in cftime.date2num(list(times), units=FileTimeIndex.TIME_UNITS,
+                                                                        calendar=calendar)])
+
+    def save(self):
+        """Retire les entrées des fichiers supprimés puis enregistre l'index sur disque s'il a été modifié. Un index
+    vide n'est pas écrit."""
+        if self.filename is None:
+            return
+
+        for name in list(self.files.keys()):
+            if not os.path.isfile(os.path.join(self.directory, name)):
+                del self.files[name]
+                self.modified = True
+
+        if len(self.files) == 0 or not self.modified:
+            return
+
+        try:
+            index_directory = os.path.dirname(self.filename)
+            if index_directory != "" and not os.path.isdir(index_directory):
+                os.makedirs(index_directory)
+
+            with open(self.filename, "w") as index_file:
+                json.dump({"version": FileTimeIndex.VERSION, "files": self.files}, index_file)
+
+            self.modified = False
+            logging.debug("[FileTimeIndex] Time index saved in " + str(self.filename))
+        except (IOError, OSError) as ex:
+            logging.warning("[FileTimeIndex] Unable to save the time index " + str(self.filename) + ": " + str(ex))
+
+
+def get_cache_directory():
+    """
+    Retourne le répertoire de cache de pySpatialETL ($XDG_CACHE_HOME/pySpatialETL, par défaut
+    ~/.cache/pySpatialETL).
+
+    @return: le chemin du répertoire (il n'est pas créé).
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "pySpatialETL")
+
+
+def get_index_filename(directory, filename, index_directory=None):
+    """
+    Retourne le chemin de l'index des fichiers d'un répertoire. Si index_directory est renseigné, l'index y est
+    enregistré sous un nom propre au répertoire des données. Sinon, il est enregistré dans le répertoire des données.
+
+    @param directory: répertoire des fichiers indexés
+    @param filename: nom de l'index
+    @param index_directory: répertoire des index (optionnel)
+    @return: le chemin de l'index.
+    """
+    directory = os.path.abspath(directory)
+    if index_directory is None:
+        return os.path.join(directory, filename)
+
+    return os.path.join(index_directory, path_leaf(directory) + "_" + hashlib.md5(
+        directory.encode("utf-8")).hexdigest()[:12] + "_" + filename.lstrip("."))
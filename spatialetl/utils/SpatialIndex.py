@@ -0,0 +1,239 @@
+#! /usr/bin/env python2.7
+# -*- coding: utf-8 -*-
+#
+# pySpatialETL is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# pySpatialETL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# Author : Fabien Rétif - fabien.retif@zoho.com
+#
+from __future__ import division, print_function, absolute_import
+
+import glob
+import os
+from collections import OrderedDict
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from spatialetl.utils.distance import distances_on_unit_sphere
+from spatialetl.utils.logger import logging
+from spatialetl.utils.path import path_leaf
+
+# Index partagés entre les lecteurs, indexés par (fichier, date de modification, hyperslab, masque). Les index les
+# moins récemment utilisés sont évincés au delà de SPATIAL_INDEXES_SIZE index.
+SPATIAL_INDEXES = OrderedDict()
+SPATIAL_INDEXES_SIZE = 16
+
+
+def lonlat_to_xyz(lon, lat):
+    """
+    Convertit des coordonnées longitude/latitude (en degrés) en coordonnées cartésiennes
+    sur la sphère unité.
+
+    @param lon: tableau des longitudes
+    @param lat: tableau des latitudes
+    @return: un tableau [n,3] des coordonnées (x,y,z).
+    """
+    lon = np.radians(np.asarray(lon, dtype=np.float64))
+    lat = np.radians(np.asarray(lat, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+class SpatialIndex(object):
+    """
+La classe SpatialIndex est un index spatial (KD-tree sur les coordonnées 3D de la sphère unité) des points d'une
+grille horizontale. Il permet de retrouver en une seule requête vectorisée le point de grille le plus proche de
+milliers de points cibles. L'index fonctionne pour les grilles régulières (axes [x] et [y]) et non-régulières
+(axes [y,x]).
+
+@param lon: axe x de la grille (longitude) : [x] ou [y,x]
+@param lat: axe y de la grille (latitude) : [y] ou [y,x]
+@param mask: masque terre/mer [y,x] optionnel. Seuls les points valant 1 (mer) sont indexés.
+"""
+
+    def __init__(self, lon, lat, mask=None):
+
+        lon = np.ma.filled(np.ma.asarray(lon, dtype=np.float64), fill_value=np.nan)
+        lat = np.ma.filled(np.ma.asarray(lat, dtype=np.float64), fill_value=np.nan)
+
+        self.regular_grid = lon.ndim == 1 and lat.ndim == 1
+
+        if self.regular_grid:
+            lon, lat = np.meshgrid(lon, lat)
+
+        if np.shape(lon) != np.shape(lat):
+            raise ValueError("Longitude axis and latitude axis don't have the same shape.")
+
+        self.y_size, self.x_size = np.shape(lon)
+
+        valid = np.isfinite(lon) & np.isfinite(lat)
+        if mask is not None:
+            mask = np.ma.filled(np.ma.asarray(mask, dtype=np.float64), fill_value=np.nan)
+            if np.shape(mask) != np.shape(lon):
+                raise ValueError("Mask shape " + str(np.shape(mask)) + " doesn't match grid shape " + str(
+                    np.shape(lon)))
+            valid &= (mask == 1)
+
+        self.y_index, self.x_index = np.nonzero(valid)
+        self.lon = lon[self.y_index, self.x_index]
+        self.lat = lat[self.y_index, self.x_index]
+
+        if len(self.lon) == 0:
+            raise ValueError("No valid grid point to index.")
+
+        logging.debug("[SpatialIndex] Indexing " + str(len(self.lon)) + " grid points")
+        self.tree = cKDTree(lonlat_to_xyz(self.lon, self.lat))
+
+    def get_nb_points(self):
+        return len(self.lon)
+
+    def query(self, target_lon, target_lat):
+        """Retourne les points de la grille les plus proches des points cibles.
+    @param target_lon: tableau des longitudes cibles
+    @param target_lat: tableau des latitudes cibles
+    @return: un tableau contenant
+     [0] : les index x des points les plus proches
+     [1] : les index y des points les plus proches
+     [2] : les coordonnées en longitude des points les plus proches
+     [3] : les coordonnées en latitude des points les plus proches
+     [4] : les distances des points les plus proches en kilomètre."""
+
+        target_lon = np.atleast_1d(np.asarray(target_lon, dtype=np.float64))
+        target_lat = np.atleast_1d(np.asarray(target_lat, dtype=np.float64))
+
+        if np.shape(target_lon) != np.shape(target_lat):
+            raise ValueError("Longitude and latitude arrays don't have the same shape.")
+
+        chord, nearest = self.tree.query(lonlat_to_xyz(target_lon, target_lat))
+
+        nearest_lon = self.lon[nearest]
+        nearest_lat = self.lat[nearest]
+
+        return [self.x_index[nearest], self.y_index[nearest], nearest_lon, nearest_lat,
+                distances_on_unit_sphere(target_lon, target_lat, nearest_lon, nearest_lat)]
+
+    def save(self, filename):
+        """Enregistre l'index dans un fichier numpy (.npz) pour être réutilisé lors d'un prochain traitement.
+    @param filename: chemin du fichier."""
+        np.savez(filename, x_index=self.x_index, y_index=self.y_index, lon=self.lon, lat=self.lat,
+                 shape=np.array([self.y_size, self.x_size]), regular_grid=np.array(self.regular_grid))
+
+    @staticmethod
+    def load(filename):
+        """Relit un index enregistré par save().
+    @param filename: chemin du fichier.
+    @return: un SpatialIndex."""
+        with np.load(filename) as archive:
+            index = SpatialIndex.__new__(SpatialIndex)
+            index.x_index = archive["x_index"]
+            index.y_index = archive["y_index"]
+            index.lon = archive["lon"]
+            index.lat = archive["lat"]
+            index.y_size, index.x_size = [int(v) for v in archive["shape"]]
+            index.regular_grid = bool(archive["regular_grid"])
+
+        index.tree = cKDTree(lonlat_to_xyz(index.lon, index.lat))
+        return index
+
+
+def file_signature(filename):
+    """
+    Retourne la date de modification d'un fichier ou, pour un motif (glob), la date de modification la plus
+    récente des fichiers correspondants.
+
+    @param filename: chemin ou motif du fichier
+    @return: la date de modification en seconde (0 si aucun fichier n'est trouvé).
+    """
+    if os.path.exists(filename):
+        return os.path.getmtime(filename)
+
+    files = glob.glob(filename) + glob.glob(filename + ".nc")
+    if len(files) == 0:
+        return 0
+    return max([os.path.getmtime(file) for file in files])
+
+
+def get_spatial_index(reader, xmin=None, xmax=None, ymin=None, ymax=None, only_mask_value=True, directory=None):
+    """
+    Retourne l'index spatial de la grille d'un CoverageReader. L'index est construit une seule fois par fichier de
+    grille (identifié par son chemin et sa date de modification) puis partagé par tous les lecteurs. Si le fichier de
+    grille n'est pas identifiable (lecteur sans fichier ou fichier introuvable), l'index n'est pas partagé. Si directory
+    est renseigné, l'index est aussi enregistré sur disque et relu lors des traitements suivants.
+
+    @param reader: CoverageReader de la grille
+    @param xmin,xmax,ymin,ymax: hyperslab de la grille à indexer (par défaut toute la grille)
+    @param only_mask_value: si vrai, seuls les point de mer (masque = 1) sont indexés.
+    @param directory: répertoire de persistance des index (optionnel)
+    @return: un SpatialIndex.
+    """
+    if xmin is None:
+        xmin = 0
+    if xmax is None:
+        xmax = reader.get_x_size()
+    if ymin is None:
+        ymin = 0
+    if ymax is None:
+        ymax = reader.get_y_size()
+
+    key = None
+    if reader.filename is not None:
+        filename = os.path.abspath(reader.filename)
+        signature = file_signature(filename)
+        if signature != 0:
+            key = (filename, signature, xmin, xmax, ymin, ymax, only_mask_value)
+
+    if key in SPATIAL_INDEXES:
+        SPATIAL_INDEXES.move_to_end(key)
+        return SPATIAL_INDEXES[key]
+
+    persisted_file = None
+    if directory is not None and key is not None:
+        persisted_file = os.path.join(directory, "spatial_index_" + path_leaf(filename).replace("*", "") + "_" + str(
+            int(key[1])) + "_" + str(ymin) + "-" + str(ymax) + "_" + str(xmin) + "-" + str(xmax) + "_" + str(
+            int(only_mask_value)) + ".npz")
+
+        if os.path.isfile(persisted_file):
+            logging.debug("[SpatialIndex] Loading spatial index from " + str(persisted_file))
+            return cache_spatial_index(key, SpatialIndex.load(persisted_file))
+
+    mask = None
+    if only_mask_value:
+        try:
+            mask = reader.read_variable_2D_sea_binary_mask(xmin, xmax, ymin, ymax)
+        except NotImplementedError:
+            logging.warning("No 2D sea binary mask found")
+
+    index = SpatialIndex(reader.read_axis_x(xmin, xmax, ymin, ymax),
+                         reader.read_axis_y(xmin, xmax, ymin, ymax),
+                         mask)
+
+    if persisted_file is not None:
+        index.save(persisted_file)
+
+    if key is None:
+        return index
+
+    return cache_spatial_index(key, index)
+
+
+def cache_spatial_index(key, index):
+    """
+    Enregistre un index dans le cache partagé et évince les index les moins récemment utilisés.
+
+    @param key: clé de l'index
+    @param index: SpatialIndex
+    @return: l'index.
+    """
+    SPATIAL_INDEXES[key] = index
+    while len(SPATIAL_INDEXES) > SPATIAL_INDEXES_SIZE:
+        SPATIAL_INDEXES.popitem(last=False)
+
+    return index
@@ -0,0 +1,216 @@
+#! /usr/bin/env python2.7
+# -*- coding: utf-8 -*-
+#
+# pySpatialETL is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# pySpatialETL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# Author : Fabien Rétif - fabien.retif@zoho.com
+#
+from __future__ import division, print_function, absolute_import
+
+from datetime import datetime
+
+import cftime
+import numpy as np
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_UNITS = "seconds since 1970-01-01 00:00:00"
+
+# Calendriers pour lesquels les dates d'un TimeAxis peuvent être converties sans passer par cftime
+STANDARD_CALENDARS = ("standard", "gregorian")
+
+# Durée en secondes des unités de temps CF
+UNIT_SECONDS = {
+    "seconds": 1, "second": 1, "secs": 1, "sec": 1, "s": 1,
+    "minutes": 60, "minute": 60, "mins": 60, "min": 60,
+    "hours": 3600, "hour": 3600, "hrs": 3600, "hr": 3600, "h": 3600,
+    "days": 86400, "day": 86400, "d": 86400
+}
+
+
+def to_timestamps(times, datum=EPOCH):
+    """
+    Convertit des dates en secondes depuis une date de référence.
+
+    @param times: un TimeAxis, une date ou un tableau de dates (datetime, cftime, datetime64) ou de secondes
+    @param datum: date de référence (datetime)
+    @return: un tableau [t] de secondes (float64).
+    """
+    if isinstance(times, TimeAxis):
+        return times.to_timestamps(datum)
+
+    array = np.asarray(times)
+    if np.issubdtype(array.dtype, np.number):
+        return np.atleast_1d(array.astype(np.float64))
+
+    if np.issubdtype(array.dtype, np.datetime64):
+        return np.atleast_1d((array - np.datetime64(datum)) / np.timedelta64(1, "s")).astype(np.float64)
+
+    return np.asarray([(t - datum).total_seconds() for t in np.atleast_1d(array).tolist()], dtype=np.float64)
+
+
+def get_units_origin(units, calendar):
+    """
+    Décode des unités de temps CF ("<unité> since <date>").
+
+    @param units: unités de temps
+    @param calendar: calendrier
+    @return: (durée de l'unité en secondes, origine en secondes depuis le 1970-01-01) ou None si l'unité n'a pas
+    une durée fixe (mois, années...).
+    """
+    name, since, origin = units.partition(" since ")
+    factor = UNIT_SECONDS.get(name.strip().lower())
+    if not since or factor is None:
+        return None
+
+    return factor, float(cftime.date2num(cftime.num2date(0, units, calendar), EPOCH_UNITS, calendar))
+
+
+class TimeAxis(object):
+    """
+La classe TimeAxis est un axe temporel compact : les dates sont des secondes entières depuis le 1970-01-01 00:00:00
+(tableau int64, vu comme datetime64[s]) dans le calendrier de l'axe. Les lecteurs, les couvertures et les écrivains
+travaillent directement sur ces tableaux : les dates cftime ne sont créées qu'à la demande, quand on lit un élément de
+l'axe ou qu'on le parcourt.
+
+Un TimeAxis se comporte comme une liste de dates : len(axe), axe[i] (une date cftime), axe[i:j] (un TimeAxis) et
+itération sur les dates.
+
+@param seconds: secondes depuis le 1970-01-01 00:00:00 [t]
+@param calendar: calendrier CF des dates (standard, gregorian, julian, noleap, 360_day...)
+"""
+
+    def __init__(self, seconds, calendar="standard"):
+        seconds = np.asarray(seconds)
+        if seconds.dtype != np.int64:
+            seconds = np.round(seconds.astype(np.float64)).astype(np.int64)
+
+        self.seconds = np.reshape(seconds, (-1,))
+        self.seconds.flags.writeable = False
+        self.calendar = calendar
+
+    @staticmethod
+    def from_num(values, units, calendar="standard"):
+        """Construit un axe à partir des valeurs numériques d'une variable de temps CF, sans créer de date quand
+    l'unité a une durée fixe. Les dates sont tronquées à la seconde.
+    @param values: valeurs [t]
+    @param units: unités ("<unité> since <date>")
+    @param calendar: calendrier
+    @return: un TimeAxis."""
+        calendar = calendar or "standard"
+        values = np.ma.filled(np.ma.asarray(values, dtype=np.float64), np.nan)
+
+        units_origin = get_units_origin(units, calendar)
+        if units_origin is None:
+            seconds = np.asarray(cftime.date2num(cftime.num2date(values, units, calendar), EPOCH_UNITS, calendar),
+                                 dtype=np.float64)
+        else:
+            factor, origin = units_origin
+            seconds = origin + values * factor
+
+        # Arrondi à la microseconde comme cftime, puis troncature à la seconde
+        return TimeAxis(np.floor(np.round(seconds * 1e6) / 1e6), calendar)
+
+    @staticmethod
+    def from_dates(dates, calendar=None):
+        """Construit un axe à partir d'une liste de dates.
+    @param dates: un TimeAxis ou une liste de dates (datetime, cftime, datetime64)
+    @param calendar: calendrier. Si None, celui des dates (standard pour les datetime).
+    @return: un TimeAxis."""
+        if isinstance(dates, TimeAxis):
+            return dates
+
+        array = np.asarray(dates)
+        if np.issubdtype(array.dtype, np.datetime64):
+            return TimeAxis.from_datetime64(array)
+
+        dates = np.ravel(array).tolist()
+        if calendar is None:
+            calendar = (getattr(dates[0], "calendar", "") if len(dates) > 0 else "") or "standard"
+
+        if len(dates) == 0:
+            return TimeAxis(np.empty(0, dtype=np.int64), calendar)
+
+        return TimeAxis(np.asarray(cftime.date2num(dates, EPOCH_UNITS, calendar), dtype=np.float64), calendar)
+
+    @staticmethod
+    def from_datetime64(values):
+        """Construit un axe du calendrier standard à partir d'un tableau datetime64 (ex : pandas.date_range().values).
+    @param values: tableau datetime64 [t]
+    @return: un TimeAxis."""
+        return TimeAxis(np.asarray(values).astype("datetime64[s]").astype(np.int64), "standard")
+
+    # Sequence
+    def __len__(self):
+        return len(self.seconds)
+
+    @property
+    def shape(self):
+        return np.shape(self.seconds)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return self.to_date(self.seconds[key])
+        return TimeAxis(self.seconds[key], self.calendar)
+
+    def __iter__(self):
+        return iter(self.to_dates())
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.to_dates(), dtype=dtype if dtype is not None else object)
+
+    def __repr__(self):
+        if self.calendar in STANDARD_CALENDARS:
+            dates = str(self.to_datetime64())
+        else:
+            dates = str([str(date) for date in self.to_dates()])
+        return "TimeAxis(" + dates + ", calendar='" + str(self.calendar) + "')"
+
+    # Conversions
+    def to_date(self, seconds):
+        """Convertit une valeur de l'axe en date.
+    @param seconds: secondes depuis le 1970-01-01
+    @return: une date cftime."""
+        return cftime.num2date(int(seconds), EPOCH_UNITS, self.calendar)
+
+    def to_dates(self):
+        """Convertit l'axe en dates.
+    @return: une liste de dates cftime."""
+        if len(self.seconds) == 0:
+            return []
+        return list(cftime.num2date(self.seconds, EPOCH_UNITS, self.calendar))
+
+    def to_datetime64(self):
+        """Retourne l'axe en datetime64[s] (sans conversion pour les calendriers standard).
+    @return: un tableau datetime64[s] [t]."""
+        return self.seconds.astype("datetime64[s]")
+
+    def to_timestamps(self, datum=EPOCH):
+        """Retourne l'axe en secondes depuis une date de référence.
+    @param datum: date de référence (datetime)
+    @return: un tableau float64 [t]."""
+        return self.seconds.astype(np.float64) - (datum - EPOCH).total_seconds()
+
+    def to_num(self, units, calendar=None):
+        """Retourne l'axe dans les unités d'une variable de temps CF (remplace netCDF4.date2num()).
+    @param units: unités ("<unité> since <date>")
+    @param calendar: calendrier de la variable. Si None, celui de l'axe.
+    @return: un tableau float64 [t]."""
+        calendar = calendar or self.calendar
+
+        units_origin = None
+        if calendar == self.calendar or (calendar in STANDARD_CALENDARS and self.calendar in STANDARD_CALENDARS):
+            units_origin = get_units_origin(units, calendar)
+
+        if units_origin is None:
+            return np.asarray(cftime.date2num(self.to_dates(), units, calendar), dtype=np.float64)
+
+        factor, origin = units_origin
+        return (self.seconds.astype(np.float64) - origin) / factor
@@ -0,0 +1,68 @@
+#! /usr/bin/env python2.7
+# -*- coding: utf-8 -*-
+#
+# pySpatialETL is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# pySpatialETL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# Author : Fabien Rétif - fabien.retif@zoho.com
+#
+from __future__ import division, print_function, absolute_import
+
+import numpy as np
+
+
+class TimeIndex(object):
+    """
+La classe TimeIndex est un index d'un axe temporel (secondes depuis une date de référence). Les dates sont triées une
+seule fois à la construction : chaque recherche est ensuite une recherche dichotomique (searchsorted), en une seule
+requête vectorisée pour plusieurs dates. L'axe n'a pas besoin d'être trié.
+
+@param timestamps: axe t en secondes [t]
+"""
+
+    def __init__(self, timestamps):
+        self.timestamps = np.asarray(timestamps, dtype=np.float64)
+        self.order = np.argsort(self.timestamps, kind="stable")
+        self.sorted_timestamps = self.timestamps[self.order]
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def query(self, targets):
+        """Retourne en une seule requête les dates les plus proches des dates données en paramètre. En cas d'égalité,
+    la date la plus ancienne est retenue.
+    @param targets: tableau des dates cibles en secondes
+    @return: un tableau contenant
+     [0] : les index des dates les plus proches (-1 si l'axe est vide)
+     [1] : les écarts en secondes avec les dates les plus proches."""
+
+        targets = np.atleast_1d(np.asarray(targets, dtype=np.float64))
+        size = len(self.sorted_timestamps)
+        if size == 0:
+            return np.full(np.shape(targets), -1, dtype=np.int64), np.full(np.shape(targets), np.inf)
+
+        right = np.minimum(np.searchsorted(self.sorted_timestamps, targets, side="left"), size - 1)
+        left = np.maximum(right - 1, 0)
+
+        left_distances = np.abs(targets - self.sorted_timestamps[left])
+        right_distances = np.abs(self.sorted_timestamps[right] - targets)
+
+        nearest = np.where(right_distances < left_distances, right, left)
+        return self.order[nearest].astype(np.int64), np.minimum(left_distances, right_distances)
+
+    def query_interval(self, start, stop):
+        """Retourne les index des dates comprises dans l'intervalle [start, stop].
+    @param start: début de l'intervalle en secondes
+    @param stop: fin de l'intervalle en secondes
+    @return: un tableau d'index trié."""
+
+        first = np.searchsorted(self.sorted_timestamps, start, side="left")
+        last = np.searchsorted(self.sorted_timestamps, stop, side="right")
+        return np.sort(self.order[first:last]).astype(np.int64)
@@ -44,9 +44,7 @@ class TIFFReader ():
         if self.x is None:
             width = self.file.RasterXSize
 
-            self.x = np.zeros([width])
-            for x in range(0,width):
-                self.x[x] = self.pixel2coord(x,0)[0]
+            self.x = self.pixel2coord(np.arange(width), 0)[0]
             #print self.x
 
         return self.x
@@ -55,9 +53,7 @@ class TIFFReader ():
         if self.y is None:
             height = self.file.RasterYSize
 
-            self.y = np.zeros([height])
-            for y in range(0,height):
-                self.y[y] = self.pixel2coord(0,y)[1]
+            self.y = self.pixel2coord(0, np.arange(height))[1]
             #print self.y
 
         return self.y
@@ -88,7 +84,7 @@ class TIFFReader ():
     def pixel2coord(self,y, x):
         # unravel GDAL affine transform parameters
         c, a, b, f, d, e = self.file.GetGeoTransform()
-        """Returns global coordinates to pixel center using base-0 raster index"""
+        """Returns global coordinates to pixel center using base-0 raster index (scalars or numpy arrays)"""
         xp = a * y + b * x + a * 0.5 + b * 0.5 + c
         yp = d * y + e * x + d * 0.5 + e * 0.5 + f
         return(xp, yp)
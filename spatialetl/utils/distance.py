@@ -17,6 +17,10 @@ from __future__ import division, print_function, absolute_import
 
 import math
 
+import numpy as np
+
+EARTH_RADIUS = 6373 # km
+
 
 def distance_on_unit_sphere(long1, lat1, long2, lat2):
     """
@@ -60,4 +64,27 @@ def distance_on_unit_sphere(long1, lat1, long2, lat2):
 
     # Remember to multiply arc by the radius of the earth
     # in your favorite set of units to get length.
-    return arc * 6373
\ No newline at end of file
+    return arc * EARTH_RADIUS
+
+def distances_on_unit_sphere(long1, lat1, long2, lat2):
+    """
+    Version vectorisée de distance_on_unit_sphere : calcule la distance en kilomètre entre
+    les point de deux tableaux de coordonnées longitude, latitude.
+
+    @param long1: Coordonnées X des point 1.
+    @param lat1: Coordonnées Y des point 1.
+    @param long2: Coordonnées X des point 2.
+    @param lat2: Coordonnées Y des point 2.
+    @return:  un tableau des distances en kilomètre.
+    """
+    degrees_to_radians = math.pi / 180.0
+
+    phi1 = (90.0 - np.asarray(lat1, dtype=np.float64)) * degrees_to_radians
+    phi2 = (90.0 - np.asarray(lat2, dtype=np.float64)) * degrees_to_radians
+    theta1 = np.asarray(long1, dtype=np.float64) * degrees_to_radians
+    theta2 = np.asarray(long2, dtype=np.float64) * degrees_to_radians
+
+    cos = (np.sin(phi1) * np.sin(phi2) * np.cos(theta1 - theta2) +
+           np.cos(phi1) * np.cos(phi2))
+
+    return np.arccos(np.clip(cos, -1.0, 1.0)) * EARTH_RADIUS
\ No newline at end of file
@@ -0,0 +1,73 @@
+import sys
+sys.path = ['/work/sciences/pySpatialETL'] + sys.path
+
+import glob
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+from netCDF4 import Dataset
+
+from spatialetl.utils.AggregatedDataset import AggregatedDataset
+
+
+class TestAggregatedDataset(TestCase):
+
+    def setUp(self):
+        self.files = sorted(glob.glob("../../coverage/io/netcdf/symphonie/v293/tests/resources/2014*.nc"))
+        self.data_files = sorted(os.listdir(os.path.dirname(self.files[0])))
+        self.default_index_directory = AggregatedDataset.INDEX_DIRECTORY
+        self.index_directory = tempfile.mkdtemp()
+        AggregatedDataset.INDEX_DIRECTORY = self.index_directory
+
+    def tearDown(self):
+        AggregatedDataset.INDEX_DIRECTORY = self.default_index_directory
+        shutil.rmtree(self.index_directory)
+
+    def test_read_second_file(self):
+        dataset = AggregatedDataset(self.files)
+        try:
+            self.assertEqual(len(self.files), dataset.get_t_size())
+
+            expected_file = Dataset(self.files[1], 'r')
+            try:
+                # L'index 1 est le premier pas de temps du deuxième fichier
+                np.testing.assert_array_equal(expected_file.variables["time"][0], dataset.variables["time"][1])
+                np.testing.assert_array_equal(expected_file.variables["ssh_w"][0, 2:9, 1:7],
+                                              dataset.variables["ssh_w"][1, 2:9, 1:7])
+                np.testing.assert_array_equal(expected_file.variables["tem"][0:1, 3:8],
+                                              dataset.variables["tem"][1:2, 3:8])
+            finally:
+                expected_file.close()
+
+            stacked = np.ma.concatenate([Dataset(file, 'r').variables["ssh_w"][:, 0:5, 0:5] for file in self.files])
+            np.testing.assert_array_equal(stacked, dataset.variables["ssh_w"][:, 0:5, 0:5])
+        finally:
+            dataset.close()
+
+    def test_index_directory(self):
+        AggregatedDataset(self.files).close()
+
+        self.assertEqual(1, len(os.listdir(self.index_directory)))
+        # Le répertoire des données n'est pas modifié
+        self.assertEqual(self.data_files, sorted(os.listdir(os.path.dirname(self.files[0]))))
+
+        # Le deuxième jeu de données est construit à partir de l'index
+        dataset = AggregatedDataset(self.files)
+        try:
+            self.assertEqual(len(self.files), dataset.get_t_size())
+        finally:
+            dataset.close()
+
+    def test_without_index(self):
+        AggregatedDataset.INDEX_DIRECTORY = None
+        dataset = AggregatedDataset(self.files)
+        try:
+            self.assertEqual(len(self.files), dataset.get_t_size())
+        finally:
+            dataset.close()
+
+        self.assertEqual([], os.listdir(self.index_directory))
+        self.assertEqual(self.data_files, sorted(os.listdir(os.path.dirname(self.files[0]))))
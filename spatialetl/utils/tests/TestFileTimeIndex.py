@@ -0,0 +1,113 @@
+import sys
+sys.path = ['/work/sciences/pySpatialETL'] + sys.path
+
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from unittest import TestCase
+
+import cftime
+
+from spatialetl.utils.FileTimeIndex import FileTimeIndex, get_index_filename
+
+
+class TestFileTimeIndex(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.index_directory = tempfile.mkdtemp()
+        self.index_filename = get_index_filename(self.directory, ".time_index.json", self.index_directory)
+        self.files = [self.create_file("file_" + str(i) + ".nc", "data " + str(i)) for i in range(0, 3)]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        shutil.rmtree(self.index_directory)
+
+    def create_file(self, name, content):
+        filename = os.path.join(self.directory, name)
+        with open(filename, "w") as file:
+            file.write(content)
+        return filename
+
+    def get_times(self, index):
+        return [datetime(2014, 1, 1 + index, hour, 0, 0) for hour in range(0, 3)]
+
+    def build_index(self):
+        """Construit l'index comme un lecteur : les fichiers absents ou modifiés sont relus.
+    @return: l'index et la liste des fichiers relus."""
+        index = FileTimeIndex(self.index_filename, self.directory)
+        read = []
+        for i, file in enumerate(self.files):
+            if index.get_times(file) is None:
+                index.set_times(file, self.get_times(i))
+                read.append(file)
+        index.save()
+        return index, read
+
+    def test_cold_and_warm(self):
+        index, read = self.build_index()
+        self.assertEqual(self.files, read)
+        self.assertTrue(os.path.isfile(self.index_filename))
+        # L'index n'est pas écrit dans le répertoire des données
+        self.assertEqual(self.files, [os.path.join(self.directory, name) for name in sorted(os.listdir(self.directory))])
+
+        index, read = self.build_index()
+        self.assertEqual([], read)
+        self.assertFalse(index.modified)
+        for i, file in enumerate(self.files):
+            self.assertEqual([str(date) for date in self.get_times(i)], [str(date) for date in index.get_times(file)])
+
+    def test_modified_in_place(self):
+        self.build_index()
+        directory_mtime = os.path.getmtime(self.directory)
+
+        # Fichier complété sur place : la date du répertoire ne change pas
+        with open(self.files[1], "a") as file:
+            file.write(" appended")
+        os.utime(self.directory, (directory_mtime, directory_mtime))
+        index, read = self.build_index()
+        self.assertEqual([self.files[1]], read)
+
+        # Fichier réécrit avec la même taille
+        stat = os.stat(self.files[2])
+        with open(self.files[2], "w") as file:
+            file.write("data X")
+        os.utime(self.files[2], (stat.st_atime, stat.st_mtime + 10))
+        os.utime(self.directory, (directory_mtime, directory_mtime))
+        index, read = self.build_index()
+        self.assertEqual([self.files[2]], read)
+
+    def test_added_and_removed_files(self):
+        self.build_index()
+
+        self.files.append(self.create_file("file_3.nc", "data 3"))
+        index, read = self.build_index()
+        self.assertEqual([self.files[3]], read)
+
+        os.remove(self.files[0])
+        self.files = self.files[1:]
+        index, read = self.build_index()
+        self.assertEqual([], read)
+        with open(self.index_filename, "r") as file:
+            self.assertEqual(["file_1.nc", "file_2.nc", "file_3.nc"], sorted(json.load(file)["files"].keys()))
+
+    def test_calendar(self):
+        dates = [cftime.Datetime360Day(2014, 2, 30, 12, 0, 0)]
+        index = FileTimeIndex(self.index_filename, self.directory)
+        index.set_times(self.files[0], dates, "360_day")
+        index.save()
+
+        index = FileTimeIndex(self.index_filename, self.directory)
+        self.assertEqual([str(date) for date in dates], [str(date) for date in index.get_times(self.files[0])])
+
+    def test_disabled(self):
+        index = FileTimeIndex(None)
+        index.set_times(self.files[0], self.get_times(0))
+        self.assertIsNone(index.get_times(self.files[0]))
+        index.save()
+
+        # Un index vide n'est pas écrit
+        FileTimeIndex(self.index_filename, self.directory).save()
+        self.assertFalse(os.path.exists(self.index_filename))
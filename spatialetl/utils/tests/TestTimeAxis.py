@@ -0,0 +1,115 @@
+import sys
+sys.path = ['/work/sciences/pySpatialETL'] + sys.path
+
+from datetime import datetime
+from unittest import TestCase
+
+import cftime
+import numpy as np
+
+from spatialetl.utils.TimeAxis import EPOCH_UNITS, TimeAxis, to_timestamps
+
+
+class TestTimeAxis(TestCase):
+
+    def test_from_num_to_num(self):
+        values = np.array([0., 1.5, 36., 24. * 365 * 3 + 0.25])
+        for calendar in ["standard", "gregorian", "julian", "noleap", "360_day"]:
+            for units in ["hours since 2000-01-01 00:00:00", "minutes since 1899-12-30 06:00:00"]:
+                candidate = TimeAxis.from_num(values, units, calendar)
+                self.assertEqual(calendar, candidate.calendar)
+                self.assertEqual(np.int64, candidate.seconds.dtype)
+
+                expected_value = cftime.date2num(cftime.num2date(values, units, calendar), EPOCH_UNITS, calendar)
+                np.testing.assert_array_equal(expected_value, candidate.seconds, err_msg=calendar + " " + units)
+                np.testing.assert_almost_equal(values, candidate.to_num(units), err_msg=calendar + " " + units)
+                self.assertEqual([str(date) for date in cftime.num2date(values, units, calendar)],
+                                 [str(date) for date in candidate], calendar + " " + units)
+
+        # Unités sans durée fixe : conversion par cftime
+        values = np.array([0., 1., 13.])
+        candidate = TimeAxis.from_num(values, "months since 2000-01-01 00:00:00", "360_day")
+        self.assertEqual(["2000-01-01 00:00:00", "2000-02-01 00:00:00", "2001-02-01 00:00:00"],
+                         [str(date) for date in candidate])
+        np.testing.assert_almost_equal(values, candidate.to_num("months since 2000-01-01 00:00:00"))
+        np.testing.assert_almost_equal([0., 30., 390.], candidate.to_num("days since 2000-01-01 00:00:00"))
+
+        # Valeurs masquées et troncature à la seconde
+        candidate = TimeAxis.from_num(np.ma.masked_array([0.5, 10.25]), "seconds since 2014-01-01 00:00:00")
+        np.testing.assert_array_equal([1388534400, 1388534410], candidate.seconds)
+
+        # Calendrier standard converti dans un autre calendrier
+        candidate = TimeAxis.from_num([0., 1.], "days since 2014-01-01 00:00:00")
+        np.testing.assert_almost_equal([0., 1.], candidate.to_num("days since 2014-01-01 00:00:00", "gregorian"))
+        np.testing.assert_almost_equal(
+            cftime.date2num(cftime.num2date([0., 1.], "days since 2014-01-01 00:00:00"),
+                            "days since 2014-01-01 00:00:00", "julian"),
+            candidate.to_num("days since 2014-01-01 00:00:00", "julian"))
+
+    def test_from_dates(self):
+        expected_value = np.array([1388577600, 1388579767, 1388664000], dtype=np.int64)
+
+        candidate = TimeAxis.from_dates([datetime(2014, 1, 1, 12, 0, 0), datetime(2014, 1, 1, 12, 36, 7),
+                                         datetime(2014, 1, 2, 12, 0, 0)])
+        self.assertEqual("standard", candidate.calendar)
+        np.testing.assert_array_equal(expected_value, candidate.seconds)
+
+        candidate = TimeAxis.from_dates(np.array(["2014-01-01T12:00:00", "2014-01-01T12:36:07", "2014-01-02T12:00:00"],
+                                                 dtype="datetime64[ns]"))
+        self.assertEqual("standard", candidate.calendar)
+        np.testing.assert_array_equal(expected_value, candidate.seconds)
+
+        candidate = TimeAxis.from_dates(cftime.num2date(expected_value, EPOCH_UNITS, "gregorian"))
+        np.testing.assert_array_equal(expected_value, candidate.seconds)
+
+        dates = [cftime.DatetimeJulian(2014, 1, 1, 12, 0, 0), cftime.DatetimeJulian(2012, 2, 29, 0, 0, 0)]
+        candidate = TimeAxis.from_dates(dates)
+        self.assertEqual("julian", candidate.calendar)
+        self.assertEqual([str(date) for date in dates], [str(date) for date in candidate])
+        np.testing.assert_array_equal(cftime.date2num(dates, EPOCH_UNITS, "julian"), candidate.seconds)
+
+        dates = [cftime.Datetime360Day(2014, 2, 30, 0, 0, 0)]
+        candidate = TimeAxis.from_dates(dates)
+        self.assertEqual("360_day", candidate.calendar)
+        self.assertEqual([str(date) for date in dates], [str(date) for date in candidate])
+
+        # Un TimeAxis n'est pas recopié
+        self.assertIs(candidate, TimeAxis.from_dates(candidate))
+
+        candidate = TimeAxis.from_dates([])
+        self.assertEqual(0, len(candidate))
+        self.assertEqual([], list(candidate))
+
+    def test_sequence(self):
+        axis = TimeAxis([1388577600, 1388579767, 1388581212, 1388664000])
+
+        self.assertEqual(4, len(axis))
+        self.assertEqual((4,), axis.shape)
+        self.assertFalse(axis.seconds.flags.writeable)
+
+        # Un index entier retourne une date
+        for index in [1, np.int64(1), -3]:
+            candidate = axis[index]
+            self.assertNotIsInstance(candidate, TimeAxis)
+            self.assertEqual((2014, 1, 1, 12, 36, 7), (candidate.year, candidate.month, candidate.day,
+                                                       candidate.hour, candidate.minute, candidate.second))
+
+        # Une tranche ou une liste d'index retourne un TimeAxis du même calendrier
+        for index, expected_value in [(np.s_[1:3], [1388579767, 1388581212]), (np.s_[::-2], [1388664000, 1388579767]),
+                                      ([0, 3], [1388577600, 1388664000]),
+                                      (np.array([False, True, False, True]), [1388579767, 1388664000])]:
+            candidate = axis[index]
+            self.assertIsInstance(candidate, TimeAxis)
+            self.assertEqual(axis.calendar, candidate.calendar)
+            np.testing.assert_array_equal(expected_value, candidate.seconds)
+
+        julian_axis = TimeAxis(axis.seconds, "julian")
+        self.assertEqual("julian", julian_axis[0:2].calendar)
+        self.assertEqual("julian", julian_axis[0].calendar)
+
+        self.assertEqual([str(date) for date in axis.to_dates()], [str(date) for date in axis])
+        self.assertEqual((4,), np.shape(np.asarray(axis)))
+        np.testing.assert_array_equal(axis.seconds.astype("datetime64[s]"), axis.to_datetime64())
+        np.testing.assert_array_equal(axis.seconds - 1388534400., axis.to_timestamps(datetime(2014, 1, 1)))
+        np.testing.assert_array_equal(axis.to_timestamps(datetime(2014, 1, 1)), to_timestamps(axis, datetime(2014, 1, 1)))
+        np.testing.assert_array_equal(axis.seconds, to_timestamps(list(axis)))
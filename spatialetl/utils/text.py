@@ -0,0 +1,60 @@
+#! /usr/bin/env python2.7
+# -*- coding: utf-8 -*-
+#
+# pySpatialETL is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# pySpatialETL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# Author : Fabien Rétif - fabien.retif@zoho.com
+#
+from __future__ import division, print_function, absolute_import
+
+from itertools import chain
+
+import numpy as np
+
+CHUNK_LINES = 1000000
+
+
+def write_columns(file, columns, separator="\t", end="\n", formats=None, chunk_lines=CHUNK_LINES):
+    """
+    Écrit des colonnes de valeurs dans un fichier texte, une ligne par valeur de colonne
+    (ex : fichiers XYZ). Les lignes sont mises en forme par blocs de chunk_lines lignes en
+    une seule opération. Les valeurs masquées sont écrites nan.
+
+    @param file: fichier texte ouvert en écriture
+    @param columns: liste des colonnes (tableaux de même taille, aplatis dans l'ordre C)
+    @param separator: séparateur des colonnes
+    @param end: fin de ligne
+    @param formats: liste des formats des colonnes (ex : ["%.6f", "%.6f", "%.2f"]). Si None, chaque
+    valeur est écrite comme str(valeur). Un format fixe est environ trois fois plus rapide.
+    @param chunk_lines: nombre de lignes mises en forme à la fois
+    """
+    columns = [np.ravel(np.ma.filled(column.astype(np.float64), np.nan)) if np.ma.isMaskedArray(column)
+               else np.ravel(column) for column in columns]
+    if len(columns) == 0 or len(columns[0]) == 0:
+        return
+
+    if formats is None:
+        # str() d'un float32 est plus court que celui du float Python correspondant
+        formats = ["%s" if column.dtype == np.float32 else "%r" for column in columns]
+    if len(formats) != len(columns):
+        raise ValueError("write_columns: one format per column is required")
+
+    converters = [(lambda values: values.astype(str)) if column.dtype == np.float32 and format == "%s"
+                  else (lambda values: values) for column, format in zip(columns, formats)]
+
+    line = separator.join(formats) + end
+    nb_lines = len(columns[0])
+
+    for start in range(0, nb_lines, chunk_lines):
+        stop = min(start + chunk_lines, nb_lines)
+        values = tuple(chain.from_iterable(zip(*[converter(column[start:stop]).tolist()
+                                                 for converter, column in zip(converters, columns)])))
+        file.write((line * (stop - start)) % values)